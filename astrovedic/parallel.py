@@ -0,0 +1,103 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+
+    This module implements helpers to run batch calculations in
+    blocks, either in the calling process, in a process pool or
+    on any concurrent.futures executor.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+
+# Data shared by all blocks of the current worker process
+_shared = None
+
+
+def _set_shared(shared):
+    """ Stores the shared data in a worker process. """
+    global _shared
+    _shared = shared
+
+
+def _call_shared(func, block):
+    """ Calls a block function with the shared data of the worker. """
+    return func(_shared, block)
+
+
+@contextmanager
+def get_executor(max_workers=None, executor=None, initializer=None, initargs=()):
+    """
+    Get the executor of a batch calculation
+
+    When no executor is given and max_workers is greater than 1, a
+    process pool is created and shut down on exit.
+
+    Args:
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to use instead
+        initializer (callable, optional): Called in each new worker process
+        initargs (tuple, optional): The arguments of the initializer
+
+    Yields:
+        Executor: The executor, or None to run in the calling process
+    """
+    if executor is not None or max_workers is None or max_workers <= 1:
+        yield executor
+        return
+
+    own_executor = ProcessPoolExecutor(max_workers=max_workers, initializer=initializer,
+                                       initargs=initargs)
+    try:
+        yield own_executor
+    finally:
+        own_executor.shutdown()
+
+
+def map_blocks(func, items, block_size, max_workers=None, executor=None, shared=None):
+    """
+    Apply a block function to consecutive blocks of items
+
+    func receives a list of items and returns one result per item. With
+    max_workers greater than 1 the blocks run in a process pool; any
+    concurrent.futures executor can be passed instead.
+
+    With shared data, func is called as func(shared, block). A process
+    pool created here receives the shared data once per worker, while
+    an executor that is passed in receives it with every block.
+
+    Args:
+        func (callable): The block function
+        items (iterable): The items
+        block_size (int): The number of items per block
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
+        shared (optional): Data passed to every block
+
+    Yields:
+        tuple: (item index, result) in item order
+    """
+    items = list(items)
+    blocks = [items[start:start + block_size] for start in range(0, len(items), block_size)]
+
+    if shared is None:
+        initializer, initargs = None, ()
+    else:
+        initializer, initargs = _set_shared, (shared,)
+
+    with get_executor(max_workers, executor, initializer, initargs) as pool:
+        if pool is None:
+            block_func = func if shared is None else partial(func, shared)
+            results = (block_func(block) for block in blocks)
+        elif shared is None:
+            results = pool.map(func, blocks)
+        elif pool is executor:
+            results = pool.map(partial(func, shared), blocks)
+        else:
+            results = pool.map(partial(_call_shared, func), blocks)
+
+        index = 0
+        for block_results in results:
+            for result in block_results:
+                yield index, result
+                index += 1
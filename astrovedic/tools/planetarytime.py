@@ -10,12 +10,22 @@
     which handles all queries to the planetary rulers 
     and hour rulers, including the start and ending 
     datetimes of each hour ruler.
+
+    Hour tables are built from a shared hora service,
+    which computes the sunrises and sunsets of a location
+    once per block of days and keeps the hours as compact
+    arrays of start JDs and rulers.
   
 """
 
+import math
+from array import array
+from bisect import bisect_right
+
 from astrovedic import const
-from astrovedic.ephem import ephem
-from astrovedic.datetime import Datetime
+from astrovedic.ephem import eph
+from astrovedic.datetime import Datetime, Time
+from astrovedic.cache import reference_cache
 
 # Planetary rulers starting at Sunday
 DAY_RULERS = [
@@ -51,6 +61,10 @@ ROUND_LIST = [
 ]
 
 
+# Number of days of each cached block of hours
+HORA_BLOCK_DAYS = 30
+
+
 # === Private functions === #
 
 def nthRuler(n, dow):
@@ -71,29 +85,103 @@ def hourTable(date, pos):
     are like (startJD, endJD, ruler).
     
     """
+    horaTable = getHoraTable(pos, date.jd, date.jd, date.utcoffset)
+    first = horaTable.index(date.jd)
+    first -= first % 24
+    return [[horaTable.starts[i], horaTable.starts[i + 1],
+             ROUND_LIST[horaTable.rulers[i]]] for i in range(first, first + 24)]
+
+
+@reference_cache()
+def _horaBlock(lat, lon, offset, block):
+    """ Returns the hour starts and ruler indexes of the
+    days with sunrise in a block of days. The starts
+    include the end of the last hour.
+    
+    """
+    blockStart = block * HORA_BLOCK_DAYS
+    blockEnd = blockStart + HORA_BLOCK_DAYS
+    utcoffset = Time(offset)
+
+    starts = array('d')
+    rulers = array('b')
+    sunrise = eph.nextSunrise(blockStart, lat, lon)
+    while sunrise < blockEnd:
+        sunset = eph.nextSunset(sunrise, lat, lon)
+        nextSunrise = eph.nextSunrise(sunset, lat, lon)
+        dow = Datetime.fromJD(sunrise, utcoffset).date.dayofweek()
+
+        # Diurnal and nocturnal hour sequences
+        length = (sunset - sunrise) / 12.0
+        starts.extend(sunrise + i * length for i in range(12))
+        length = (nextSunrise - sunset) / 12.0
+        starts.extend(sunset + i * length for i in range(12))
+        rulers.extend((dow * 24 + n) % 7 for n in range(24))
+        sunrise = nextSunrise
+
+    starts.append(sunrise)
+    return starts, rulers
+
+
+def localMeanOffset(pos):
+    """ Returns the UTC offset of the local mean time
+    of a position, which is 1 hour per 15 degrees of
+    longitude.
+    
+    """
+    return Time(pos.lon / 15.0)
+
+
+def getHoraTable(pos, startJD, endJD, utcoffset=None):
+    """ Returns a HoraTable object with all planetary 
+    days of a position between two JDs. The day of 
+    week of each sunrise is taken at the UTC offset,
+    which defaults to the local mean time.
+    
+    """
+    if utcoffset is None:
+        utcoffset = localMeanOffset(pos)
+    elif not isinstance(utcoffset, Time):
+        utcoffset = Time(utcoffset)
+
+    # A day starts at most one day before its hours
+    firstBlock = math.floor((startJD - 1) / HORA_BLOCK_DAYS)
+    lastBlock = math.floor(endJD / HORA_BLOCK_DAYS)
+    starts = array('d')
+    rulers = array('b')
+    for block in range(firstBlock, lastBlock + 1):
+        blockStarts, blockRulers = _horaBlock(pos.lat, pos.lon,
+                                              utcoffset.value, block)
+        starts.extend(blockStarts[:-1])
+        rulers.extend(blockRulers)
+    starts.append(blockStarts[-1])
+
+    # Keep only the days overlapping the range
+    first = max(bisect_right(starts, startJD) - 1, 0)
+    first -= first % 24
+    last = min(bisect_right(starts, endJD), len(rulers))
+    last += -last % 24
+    return HoraTable(starts[first:last + 1], rulers[first:last])
 
-    lastSunrise = ephem.lastSunrise(date, pos)
-    middleSunset = ephem.nextSunset(lastSunrise, pos)
-    nextSunrise = ephem.nextSunrise(date, pos)
-    table = []
 
-    # Create diurnal hour sequence
-    length = (middleSunset.jd - lastSunrise.jd) / 12.0
-    for i in range(12):
-        start = lastSunrise.jd + i * length
-        end = start + length
-        ruler = nthRuler(i, lastSunrise.date.dayofweek())
-        table.append([start, end, ruler])
+def getHora(jd, pos, utcoffset=None):
+    """ Returns information about the planetary hour 
+    of a position at a JD. The UTC offset defaults 
+    to the local mean time.
+    
+    """
+    horaTable = getHoraTable(pos, jd, jd, utcoffset)
+    return horaTable.info(horaTable.index(jd))
 
-    # Create nocturnal hour sequence
-    length = (nextSunrise.jd - middleSunset.jd) / 12.0
-    for i in range(12):
-        start = middleSunset.jd + i * length
-        end = start + length
-        ruler = nthRuler(i + 12, lastSunrise.date.dayofweek())
-        table.append([start, end, ruler])
 
-    return table
+def iterHoras(pos, startJD, endJD, utcoffset=None):
+    """ Iterates over the information about all 
+    planetary hours of a position overlapping the 
+    range between two JDs. The UTC offset defaults 
+    to the local mean time.
+    
+    """
+    return getHoraTable(pos, startJD, endJD, utcoffset).horas(startJD, endJD)
 
 
 def getHourTable(date, pos):
@@ -181,3 +269,80 @@ class HourTable:
                 'hourNumber': index + 1 - 12
             })
         return info
+
+
+# ------------------- #
+#   HoraTable Class   #
+# ------------------- #
+
+class HoraTable:
+    """ This class represents the planetary hours of 
+    consecutive days as compact arrays. The starts hold 
+    the start JD of each hour and the end JD of the last 
+    one, and the rulers hold the index of each hour ruler 
+    in the ROUND_LIST. Each day has 24 hours starting at 
+    sunrise.
+    
+    """
+
+    def __init__(self, starts, rulers):
+        self.starts = starts
+        self.rulers = rulers
+
+    def __len__(self):
+        return len(self.rulers)
+
+    def index(self, jd):
+        """ Returns the index of the hour of a JD in the
+        table or None if it is out of the table.
+        
+        """
+        index = bisect_right(self.starts, jd) - 1
+        if 0 <= index < len(self.rulers):
+            return index
+        return None
+
+    def hourRuler(self, index):
+        """ Returns the ruler of an hour. """
+        return ROUND_LIST[self.rulers[index]]
+
+    def info(self, index):
+        """ Returns information about an hour. The start 
+        and end are JDs.
+        
+        """
+        first = index - index % 24
+        info = {
+            # Default is diurnal
+            'mode': 'Day',
+            'ruler': ROUND_LIST[self.rulers[first]],
+            'dayRuler': ROUND_LIST[self.rulers[first]],
+            'nightRuler': ROUND_LIST[self.rulers[first + 12]],
+            'hourRuler': ROUND_LIST[self.rulers[index]],
+            'hourNumber': index % 24 + 1,
+            'tableIndex': index % 24,
+            'start': self.starts[index],
+            'end': self.starts[index + 1]
+        }
+        if index % 24 >= 12:
+            # Set information as nocturnal
+            info.update({
+                'mode': 'Night',
+                'ruler': info['nightRuler'],
+                'hourNumber': index % 24 + 1 - 12
+            })
+        return info
+
+    def horas(self, startJD=None, endJD=None):
+        """ Iterates over the information about the hours
+        overlapping the range between two JDs.
+        
+        """
+        first = 0
+        if startJD is not None:
+            first = max(bisect_right(self.starts, startJD) - 1, 0)
+        last = len(self.rulers)
+        if endJD is not None:
+            last = min(bisect_right(self.starts, endJD), last)
+        for index in range(first, last):
+            yield self.info(index)
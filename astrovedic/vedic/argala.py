@@ -36,29 +36,108 @@ ARGALA_SECONDARY = "Secondary Argala"
 ARGALA_NEUTRALIZED = "Neutralized Argala"
 ARGALA_NONE = "No Argala"
 
-def get_house_planets(chart: Chart, house_num: int) -> List[str]:
+# Planets considered for Argala
+ARGALA_PLANETS = const.LIST_SEVEN_PLANETS + [const.RAHU, const.KETU]
+
+# Natural benefics, as in shadbala.drig_bala.is_benefic_planet
+NATURAL_BENEFICS = (const.MOON, const.MERCURY, const.VENUS, const.JUPITER)
+
+# Primary Argala offsets with the Virodhargala offset countering each
+PRIMARY_ARGALA = (
+    (ARGALA_SECOND, VIRODHARGALA_SECOND),
+    (ARGALA_FOURTH, VIRODHARGALA_FOURTH),
+    (ARGALA_FIFTH, VIRODHARGALA_FIFTH),
+    (ARGALA_ELEVENTH, VIRODHARGALA_ELEVENTH)
+)
+
+# Secondary Argala offsets
+SECONDARY_ARGALA = (ARGALA_THIRD, ARGALA_NINTH, ARGALA_TENTH)
+
+# Virodhargala offsets by type
+VIRODHARGALA_TYPES = (
+    ('second', VIRODHARGALA_SECOND),
+    ('fourth', VIRODHARGALA_FOURTH),
+    ('fifth', VIRODHARGALA_FIFTH),
+    ('eleventh', VIRODHARGALA_ELEVENTH)
+)
+
+
+def get_offset_house(house_num: int, offset: int) -> int:
+    """
+    Get the house at an Argala offset from a reference house.
+
+    Args:
+        house_num (int): The reference house number (1-12)
+        offset (int): The Argala or Virodhargala offset
+
+    Returns:
+        int: The house number (1-12)
+    """
+    return ((house_num + offset - 1) % 12) + 1
+
+
+def get_house_occupancy(chart: Chart) -> Dict[str, any]:
+    """
+    Get the occupancy of all houses in a single pass over the chart.
+
+    The result only holds tuples and can be reused for all houses and
+    planets of the chart.
+
+    Args:
+        chart (Chart): The chart
+
+    Returns:
+        dict: Dictionary with the 'planets' in each house, their 'counts',
+            the number of 'benefics' and 'malefics' (each indexed by house
+            number - 1) and the first house of each planet's sign in
+            'planet_houses'
+    """
+    sign_planets = {}
+    for planet_id in ARGALA_PLANETS:
+        sign_planets.setdefault(chart.getObject(planet_id).sign, []).append(planet_id)
+
+    planets = tuple(
+        tuple(sign_planets.get(chart.getHouse(f'House{house_num}').sign, ()))
+        for house_num in range(1, 13)
+    )
+    benefics = tuple(
+        sum(1 for planet_id in house_planets if planet_id in NATURAL_BENEFICS)
+        for house_planets in planets
+    )
+
+    planet_houses = {}
+    for house_num, house_planets in enumerate(planets, 1):
+        for planet_id in house_planets:
+            planet_houses.setdefault(planet_id, house_num)
+
+    return {
+        'planets': planets,
+        'counts': tuple(len(house_planets) for house_planets in planets),
+        'benefics': benefics,
+        'malefics': tuple(len(house_planets) - count
+                          for house_planets, count in zip(planets, benefics)),
+        'planet_houses': planet_houses
+    }
+
+
+def get_house_planets(chart: Chart, house_num: int,
+                      occupancy: Optional[Dict[str, any]] = None) -> List[str]:
     """
     Get all planets in a specific house.
     
     Args:
         chart (Chart): The chart
         house_num (int): The house number (1-12)
+        occupancy (dict, optional): The house occupancy of the chart
+            (see get_house_occupancy)
     
     Returns:
         list: List of planet IDs in the house
     """
-    # Get the house
-    house = chart.getHouse(f'House{house_num}')
-    house_sign = house.sign
-    
-    # Find all planets in this sign
-    planets = []
-    for planet_id in const.LIST_SEVEN_PLANETS + [const.RAHU, const.KETU]:
-        planet = chart.getObject(planet_id)
-        if planet.sign == house_sign:
-            planets.append(planet_id)
-    
-    return planets
+    if occupancy is None:
+        occupancy = get_house_occupancy(chart)
+    return list(occupancy['planets'][house_num - 1])
+
 
 def get_argala_houses(house_num: int) -> Dict[str, List[int]]:
     """
@@ -98,21 +177,19 @@ def get_argala_houses(house_num: int) -> Dict[str, List[int]]:
         'virodhargala': virodhargala_houses
     }
 
-def get_argala_for_house(chart: Chart, house_num: int) -> Dict[str, any]:
+def get_argala_from_occupancy(occupancy: Dict[str, any], house_num: int) -> Dict[str, any]:
     """
-    Calculate the Argala (intervention) for a specific house.
+    Calculate the Argala (intervention) for a house from the house occupancy.
     
     Args:
-        chart (Chart): The chart
+        occupancy (dict): The house occupancy (see get_house_occupancy)
         house_num (int): The house number (1-12)
     
     Returns:
         dict: Dictionary with Argala information
     """
-    # Get the Argala and Virodhargala houses
-    houses = get_argala_houses(house_num)
-    argala_houses = houses['argala']
-    virodhargala_houses = houses['virodhargala']
+    planets = occupancy['planets']
+    counts = occupancy['counts']
     
     # Initialize the result
     result = {
@@ -122,34 +199,17 @@ def get_argala_for_house(chart: Chart, house_num: int) -> Dict[str, any]:
         'net_argala': {}
     }
     
-    # Check primary Argala houses
-    for i, argala_house in enumerate(argala_houses['primary']):
-        # Get the planets in the Argala house
-        argala_planets = get_house_planets(chart, argala_house)
-        
-        # Get the corresponding Virodhargala house
-        if i == 0:  # 2nd house
-            virodhargala_house = virodhargala_houses['second']
-        elif i == 1:  # 4th house
-            virodhargala_house = virodhargala_houses['fourth']
-        elif i == 2:  # 5th house
-            virodhargala_house = virodhargala_houses['fifth']
-        else:  # 11th house
-            virodhargala_house = virodhargala_houses['eleventh']
-        
-        # Get the planets in the Virodhargala house
-        virodhargala_planets = get_house_planets(chart, virodhargala_house)
+    # Check primary Argala houses against their Virodhargala houses
+    for argala_offset, virodhargala_offset in PRIMARY_ARGALA:
+        argala_house = get_offset_house(house_num, argala_offset)
+        virodhargala_house = get_offset_house(house_num, virodhargala_offset)
         
-        # Calculate the strength of Argala and Virodhargala
-        argala_strength = len(argala_planets)
-        virodhargala_strength = len(virodhargala_planets)
+        argala_strength = counts[argala_house - 1]
+        virodhargala_strength = counts[virodhargala_house - 1]
         
         # Determine if the Argala is neutralized
         is_neutralized = virodhargala_strength >= argala_strength and argala_strength > 0
         
-        # Determine the net Argala strength
-        net_strength = max(0, argala_strength - virodhargala_strength)
-        
         # Determine the Argala type
         if argala_strength == 0:
             argala_type = ARGALA_NONE
@@ -158,42 +218,32 @@ def get_argala_for_house(chart: Chart, house_num: int) -> Dict[str, any]:
         else:
             argala_type = ARGALA_PRIMARY
         
-        # Add to the result
         result['argala'][argala_house] = {
-            'planets': argala_planets,
+            'planets': list(planets[argala_house - 1]),
             'strength': argala_strength,
             'type': argala_type
         }
         
         result['virodhargala'][virodhargala_house] = {
-            'planets': virodhargala_planets,
+            'planets': list(planets[virodhargala_house - 1]),
             'strength': virodhargala_strength,
             'neutralizes': is_neutralized
         }
         
         result['net_argala'][argala_house] = {
-            'strength': net_strength,
+            'strength': max(0, argala_strength - virodhargala_strength),
             'is_neutralized': is_neutralized,
             'type': argala_type
         }
     
     # Check secondary Argala houses
-    for argala_house in argala_houses['secondary']:
-        # Get the planets in the Argala house
-        argala_planets = get_house_planets(chart, argala_house)
-        
-        # Calculate the strength of Argala
-        argala_strength = len(argala_planets)
-        
-        # Determine the Argala type
-        if argala_strength == 0:
-            argala_type = ARGALA_NONE
-        else:
-            argala_type = ARGALA_SECONDARY
+    for argala_offset in SECONDARY_ARGALA:
+        argala_house = get_offset_house(house_num, argala_offset)
+        argala_strength = counts[argala_house - 1]
+        argala_type = ARGALA_SECONDARY if argala_strength else ARGALA_NONE
         
-        # Add to the result
         result['argala'][argala_house] = {
-            'planets': argala_planets,
+            'planets': list(planets[argala_house - 1]),
             'strength': argala_strength,
             'type': argala_type
         }
@@ -206,34 +256,47 @@ def get_argala_for_house(chart: Chart, house_num: int) -> Dict[str, any]:
     
     return result
 
-def get_argala_for_planet(chart: Chart, planet_id: str) -> Dict[str, any]:
+def get_argala_for_house(chart: Chart, house_num: int,
+                         occupancy: Optional[Dict[str, any]] = None) -> Dict[str, any]:
+    """
+    Calculate the Argala (intervention) for a specific house.
+    
+    Args:
+        chart (Chart): The chart
+        house_num (int): The house number (1-12)
+        occupancy (dict, optional): The house occupancy of the chart
+            (see get_house_occupancy)
+    
+    Returns:
+        dict: Dictionary with Argala information
+    """
+    if occupancy is None:
+        occupancy = get_house_occupancy(chart)
+    return get_argala_from_occupancy(occupancy, house_num)
+
+def get_argala_for_planet(chart: Chart, planet_id: str,
+                          occupancy: Optional[Dict[str, any]] = None) -> Dict[str, any]:
     """
     Calculate the Argala (intervention) for a specific planet.
     
     Args:
         chart (Chart): The chart
         planet_id (str): The planet ID
+        occupancy (dict, optional): The house occupancy of the chart
+            (see get_house_occupancy)
     
     Returns:
         dict: Dictionary with Argala information
     """
-    # Get the planet
-    planet = chart.getObject(planet_id)
+    if occupancy is None:
+        occupancy = get_house_occupancy(chart)
     
-    # Get the sign of the planet
-    planet_sign = planet.sign
-    
-    # Find the house number for this sign
-    house_num = None
-    for i in range(1, 13):
-        house = chart.getHouse(f'House{i}')
-        if house.sign == planet_sign:
-            house_num = i
-            break
+    # Find the first house in the sign of the planet
+    house_num = occupancy['planet_houses'].get(planet_id)
     
     # If the house is found, calculate the Argala
     if house_num:
-        result = get_argala_for_house(chart, house_num)
+        result = get_argala_from_occupancy(occupancy, house_num)
         result['planet'] = planet_id
         return result
     
@@ -243,98 +306,121 @@ def get_argala_for_planet(chart: Chart, planet_id: str) -> Dict[str, any]:
         'error': 'House not found for planet'
     }
 
-def get_all_house_argalas(chart: Chart) -> Dict[int, Dict[str, any]]:
+def get_all_house_argalas(chart: Chart,
+                          occupancy: Optional[Dict[str, any]] = None) -> Dict[int, Dict[str, any]]:
     """
     Calculate the Argala (intervention) for all houses.
     
     Args:
         chart (Chart): The chart
+        occupancy (dict, optional): The house occupancy of the chart
+            (see get_house_occupancy)
     
     Returns:
         dict: Dictionary with Argala information for all houses
     """
-    # Initialize the result
-    result = {}
-    
-    # Calculate Argala for each house
-    for house_num in range(1, 13):
-        result[house_num] = get_argala_for_house(chart, house_num)
-    
-    return result
+    if occupancy is None:
+        occupancy = get_house_occupancy(chart)
+    return {house_num: get_argala_from_occupancy(occupancy, house_num)
+            for house_num in range(1, 13)}
 
-def get_all_planet_argalas(chart: Chart) -> Dict[str, Dict[str, any]]:
+def get_all_planet_argalas(chart: Chart,
+                           occupancy: Optional[Dict[str, any]] = None) -> Dict[str, Dict[str, any]]:
     """
     Calculate the Argala (intervention) for all planets.
     
     Args:
         chart (Chart): The chart
+        occupancy (dict, optional): The house occupancy of the chart
+            (see get_house_occupancy)
     
     Returns:
         dict: Dictionary with Argala information for all planets
     """
-    # Initialize the result
-    result = {}
-    
-    # Calculate Argala for each planet
-    for planet_id in const.LIST_SEVEN_PLANETS + [const.RAHU, const.KETU]:
-        result[planet_id] = get_argala_for_planet(chart, planet_id)
-    
-    return result
+    if occupancy is None:
+        occupancy = get_house_occupancy(chart)
+    return {planet_id: get_argala_for_planet(chart, planet_id, occupancy)
+            for planet_id in ARGALA_PLANETS}
 
-def get_virodhargala_for_house(chart: Chart, house_num: int) -> Dict[str, any]:
+def get_virodhargala_from_occupancy(occupancy: Dict[str, any],
+                                    house_num: int) -> Dict[str, any]:
     """
-    Calculate the Virodhargala (counter-intervention) for a specific house.
+    Calculate the Virodhargala (counter-intervention) for a house from the
+    house occupancy.
     
     Args:
-        chart (Chart): The chart
+        occupancy (dict): The house occupancy (see get_house_occupancy)
         house_num (int): The house number (1-12)
     
     Returns:
         dict: Dictionary with Virodhargala information
     """
-    # Get the Argala and Virodhargala houses
-    houses = get_argala_houses(house_num)
-    argala_houses = houses['argala']
-    virodhargala_houses = houses['virodhargala']
+    virodhargala = {}
+    for virodhargala_type, offset in VIRODHARGALA_TYPES:
+        virodhargala_house = get_offset_house(house_num, offset)
+        virodhargala[virodhargala_house] = {
+            'planets': list(occupancy['planets'][virodhargala_house - 1]),
+            'strength': occupancy['counts'][virodhargala_house - 1],
+            'type': virodhargala_type
+        }
     
-    # Initialize the result
-    result = {
+    return {
         'reference_house': house_num,
-        'virodhargala': {}
+        'virodhargala': virodhargala
     }
+
+def get_virodhargala_for_house(chart: Chart, house_num: int,
+                               occupancy: Optional[Dict[str, any]] = None) -> Dict[str, any]:
+    """
+    Calculate the Virodhargala (counter-intervention) for a specific house.
     
-    # Check Virodhargala houses
-    for virodhargala_type, virodhargala_house in virodhargala_houses.items():
-        # Get the planets in the Virodhargala house
-        virodhargala_planets = get_house_planets(chart, virodhargala_house)
-        
-        # Calculate the strength of Virodhargala
-        virodhargala_strength = len(virodhargala_planets)
-        
-        # Add to the result
-        result['virodhargala'][virodhargala_house] = {
-            'planets': virodhargala_planets,
-            'strength': virodhargala_strength,
-            'type': virodhargala_type
-        }
+    Args:
+        chart (Chart): The chart
+        house_num (int): The house number (1-12)
+        occupancy (dict, optional): The house occupancy of the chart
+            (see get_house_occupancy)
     
-    return result
+    Returns:
+        dict: Dictionary with Virodhargala information
+    """
+    if occupancy is None:
+        occupancy = get_house_occupancy(chart)
+    return get_virodhargala_from_occupancy(occupancy, house_num)
 
-def get_all_house_virodhargalas(chart: Chart) -> Dict[int, Dict[str, any]]:
+def get_all_house_virodhargalas(chart: Chart,
+                                occupancy: Optional[Dict[str, any]] = None) -> Dict[int, Dict[str, any]]:
     """
     Calculate the Virodhargala (counter-intervention) for all houses.
     
     Args:
         chart (Chart): The chart
+        occupancy (dict, optional): The house occupancy of the chart
+            (see get_house_occupancy)
     
     Returns:
         dict: Dictionary with Virodhargala information for all houses
     """
-    # Initialize the result
-    result = {}
+    if occupancy is None:
+        occupancy = get_house_occupancy(chart)
+    return {house_num: get_virodhargala_from_occupancy(occupancy, house_num)
+            for house_num in range(1, 13)}
+
+def get_all_argalas(chart: Chart) -> Dict[str, any]:
+    """
+    Calculate the Argala and Virodhargala of all houses and planets from a
+    single pass over the chart.
     
-    # Calculate Virodhargala for each house
-    for house_num in range(1, 13):
-        result[house_num] = get_virodhargala_for_house(chart, house_num)
+    Args:
+        chart (Chart): The chart
     
-    return result
+    Returns:
+        dict: Dictionary with the house 'occupancy' and the 'houses',
+            'planets' and 'virodhargala' results
+    """
+    occupancy = get_house_occupancy(chart)
+    return {
+        'occupancy': occupancy,
+        'houses': get_all_house_argalas(chart, occupancy),
+        'planets': get_all_planet_argalas(chart, occupancy),
+        'virodhargala': get_all_house_virodhargalas(chart, occupancy)
+    }
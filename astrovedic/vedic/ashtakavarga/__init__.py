@@ -30,6 +30,9 @@ from astrovedic.vedic.ashtakavarga.transits import (
     get_transit_strength, get_best_transit_positions,
     get_ashtakavarga_dasha_phala
 )
+from astrovedic.vedic.ashtakavarga.engine import (
+    get_chart_signs, calculate_bhinna_matrix, calculate_ashtakavarga_batch
+)
 from astrovedic.vedic.ashtakavarga.basic_analysis import (
     get_bindus_in_houses, get_bindus_in_signs,
     get_basic_ashtakavarga_analysis
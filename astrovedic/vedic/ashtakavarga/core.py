@@ -8,6 +8,10 @@
 
 from astrovedic import const
 from astrovedic import angle
+from astrovedic.cache import reference_cache
+
+# All twelve signs set in a benefic mask
+FULL_MASK = 0xFFF
 
 
 def get_ashtakavarga_points(chart, planet_id, contributor_id):
@@ -30,23 +34,10 @@ def get_ashtakavarga_points(chart, planet_id, contributor_id):
     planet_sign_num = get_sign_number(planet.sign)
     contributor_sign_num = get_sign_number(contributor.sign)
 
-    # Initialize the points list with 12 zeros
-    points = [0] * 12
-
-    # Get the benefic positions for this planet-contributor combination
-    benefic_positions = get_benefic_positions(planet_id, contributor_id)
-
-    # Calculate the relative positions
-    for position in benefic_positions:
-        # Calculate the absolute position in the zodiac
-        # The position is relative to the contributor's sign
-        # We need to adjust by 1 to match the reference data
-        absolute_position = (contributor_sign_num + position) % 12
-
-        # Set the point to 1 (Bindu)
-        points[absolute_position] = 1
+    # Rotate the benefic mask to the contributor's sign
+    mask = rotate_mask(get_benefic_mask(planet_id, contributor_id), contributor_sign_num)
 
-    return points
+    return mask_to_points(mask)
 
 
 def get_ashtakavarga_table(chart, planet_id):
@@ -215,6 +206,54 @@ def get_sign_number(sign):
     return sign_numbers.get(sign, 0)
 
 
+@reference_cache()
+def get_benefic_mask(planet_id, contributor_id):
+    """
+    Get the benefic positions for a planet-contributor combination as a mask
+
+    Bit n is set when the (n+1)th sign from the contributor is benefic.
+
+    Args:
+        planet_id (str): The ID of the planet receiving the points
+        contributor_id (str): The ID of the planet contributing the points
+
+    Returns:
+        int: 12-bit mask of benefic positions relative to the contributor
+    """
+    mask = 0
+    for position in get_benefic_positions(planet_id, contributor_id):
+        mask |= 1 << position
+    return mask
+
+
+def rotate_mask(mask, sign_num):
+    """
+    Rotate a 12-bit sign mask forward by a number of signs
+
+    Args:
+        mask (int): 12-bit mask relative to Aries
+        sign_num (int): The number of signs to rotate by (0-11)
+
+    Returns:
+        int: The rotated 12-bit mask
+    """
+    sign_num %= 12
+    return ((mask << sign_num) | (mask >> (12 - sign_num))) & FULL_MASK
+
+
+def mask_to_points(mask):
+    """
+    Expand a 12-bit sign mask into a list of points
+
+    Args:
+        mask (int): 12-bit mask where bit 0 is Aries
+
+    Returns:
+        list: List of 12 values (0 or 1) representing points in each sign
+    """
+    return [(mask >> i) & 1 for i in range(12)]
+
+
 def get_benefic_positions(planet_id, contributor_id):
     """
     Get the benefic positions for a planet-contributor combination
@@ -0,0 +1,220 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements a bitmask Ashtakavarga engine. The benefic
+    positions of each contributor are stored as 12-bit masks, which are
+    rotated to the contributor's sign and summed per sign. The engine
+    works on sign indexes only, so many charts can be processed at once.
+"""
+
+from astrovedic import const
+from astrovedic.vedic.ashtakavarga.core import (
+    get_benefic_mask, rotate_mask, mask_to_points, get_sign_number
+)
+
+# Planets that receive points, in Sarvashtakavarga order
+ASHTAKAVARGA_PLANETS = (
+    const.SUN, const.MOON, const.MARS, const.MERCURY,
+    const.JUPITER, const.VENUS, const.SATURN
+)
+
+# Contributors of points (the seven planets and the Ascendant)
+ASHTAKAVARGA_CONTRIBUTORS = ASHTAKAVARGA_PLANETS + (const.ASC,)
+
+# Benefic masks indexed by [planet][contributor]
+BENEFIC_MASKS = tuple(
+    tuple(get_benefic_mask(planet_id, contributor_id)
+          for contributor_id in ASHTAKAVARGA_CONTRIBUTORS)
+    for planet_id in ASHTAKAVARGA_PLANETS
+)
+
+# Points per sign of each rotated mask, indexed by [planet][contributor][sign]
+_ROTATED_POINTS = tuple(
+    tuple(
+        tuple(tuple(mask_to_points(rotate_mask(mask, sign_num)))
+              for sign_num in range(12))
+        for mask in masks
+    )
+    for masks in BENEFIC_MASKS
+)
+
+
+def get_chart_signs(chart):
+    """
+    Get the sign indexes of the Ashtakavarga contributors in a chart
+
+    Args:
+        chart (Chart): The birth chart
+
+    Returns:
+        tuple: Sign numbers (0-11) in ASHTAKAVARGA_CONTRIBUTORS order
+    """
+    signs = [get_sign_number(chart.getObject(planet_id).sign)
+             for planet_id in ASHTAKAVARGA_PLANETS]
+    signs.append(get_sign_number(chart.getAngle(const.ASC).sign))
+    return tuple(signs)
+
+
+def get_bhinna_masks(signs, planet_id):
+    """
+    Get the rotated benefic masks of each contributor for a planet
+
+    Args:
+        signs (sequence): Sign numbers in ASHTAKAVARGA_CONTRIBUTORS order
+        planet_id (str): The ID of the planet receiving the points
+
+    Returns:
+        list: 12-bit masks in ASHTAKAVARGA_CONTRIBUTORS order
+    """
+    masks = BENEFIC_MASKS[ASHTAKAVARGA_PLANETS.index(planet_id)]
+    return [rotate_mask(mask, int(sign_num)) for mask, sign_num in zip(masks, signs)]
+
+
+def calculate_bhinna_matrix(signs):
+    """
+    Calculate the Bhinnashtakavarga points of all planets
+
+    Args:
+        signs (sequence): Sign numbers in ASHTAKAVARGA_CONTRIBUTORS order
+
+    Returns:
+        list: 7 lists of 12 points in ASHTAKAVARGA_PLANETS order
+    """
+    signs = [int(sign_num) for sign_num in signs]
+    return [
+        [sum(column) for column in zip(*[
+            points[sign_num] for points, sign_num in zip(planet_points, signs)
+        ])]
+        for planet_points in _ROTATED_POINTS
+    ]
+
+
+def calculate_sarva_points(bhinna_matrix):
+    """
+    Calculate the Sarvashtakavarga points from Bhinnashtakavarga points
+
+    Args:
+        bhinna_matrix (list): 7 lists of 12 points
+
+    Returns:
+        list: List of 12 Sarvashtakavarga points
+    """
+    return [sum(column) for column in zip(*bhinna_matrix)]
+
+
+def calculate_prastara(signs, planet_id):
+    """
+    Calculate the Prastara (contributor by sign) table of a planet
+
+    Args:
+        signs (sequence): Sign numbers in ASHTAKAVARGA_CONTRIBUTORS order
+        planet_id (str): The ID of the planet receiving the points
+
+    Returns:
+        dict: Mapping of contributor ID to 12 points
+    """
+    planet_points = _ROTATED_POINTS[ASHTAKAVARGA_PLANETS.index(planet_id)]
+    return {
+        contributor_id: list(points[int(sign_num)])
+        for contributor_id, points, sign_num
+        in zip(ASHTAKAVARGA_CONTRIBUTORS, planet_points, signs)
+    }
+
+
+def calculate_kaksha_points(bhinna_matrix, signs):
+    """
+    Calculate the Kaksha Bala contributions of each planet
+
+    The Kaksha Bala of a planet is the sum of the points in its sign from
+    the Bhinnashtakavarga of the other six planets.
+
+    Args:
+        bhinna_matrix (list): 7 lists of 12 points
+        signs (sequence): Sign numbers in ASHTAKAVARGA_CONTRIBUTORS order
+
+    Returns:
+        list: 7 dictionaries mapping contributor ID to points
+    """
+    result = []
+    for i, planet_id in enumerate(ASHTAKAVARGA_PLANETS):
+        sign_num = int(signs[i])
+        result.append({
+            contributor_id: bhinna_matrix[j][sign_num]
+            for j, contributor_id in enumerate(ASHTAKAVARGA_PLANETS)
+            if contributor_id != planet_id
+        })
+    return result
+
+
+def trikona_sodhana(points):
+    """
+    Apply Trikona Sodhana (triangular reduction) to 12 sign points
+
+    Args:
+        points (sequence): List of 12 points
+
+    Returns:
+        list: List of 12 values after Trikona Sodhana
+    """
+    result = list(points)
+    for i in range(4):
+        min_value = min(result[i], result[i + 4], result[i + 8])
+        result[i] -= min_value
+        result[i + 4] -= min_value
+        result[i + 8] -= min_value
+    return result
+
+
+def ekadhi_sodhana(points):
+    """
+    Apply Ekadhi Sodhana (one-to-one reduction) to 12 sign points
+
+    Args:
+        points (sequence): List of 12 points
+
+    Returns:
+        list: List of 12 values after Ekadhi Sodhana
+    """
+    result = list(points)
+    for i in range(6):
+        min_value = min(result[i], result[i + 6])
+        result[i] -= min_value
+        result[i + 6] -= min_value
+    return result
+
+
+def calculate_ashtakavarga_batch(sign_matrix):
+    """
+    Calculate Ashtakavarga for many charts at once
+
+    Args:
+        sign_matrix (sequence): One row of sign numbers per chart, in
+            ASHTAKAVARGA_CONTRIBUTORS order (e.g. a list of tuples or an
+            N x 8 array)
+
+    Returns:
+        dict: Dictionary with one entry per chart for 'bhinna' (7 x 12),
+            'sarva' (12), 'sodhita' (12) and 'kaksha' (7) values
+    """
+    result = {
+        'bhinna': [],
+        'sarva': [],
+        'sodhita': [],
+        'kaksha': []
+    }
+
+    for signs in sign_matrix:
+        signs = [int(sign_num) for sign_num in signs]
+        bhinna = calculate_bhinna_matrix(signs)
+        sarva = calculate_sarva_points(bhinna)
+
+        result['bhinna'].append(bhinna)
+        result['sarva'].append(sarva)
+        result['sodhita'].append(ekadhi_sodhana(trikona_sodhana(sarva)))
+        result['kaksha'].append([
+            sum(bhinna[j][signs[i]] for j in range(7) if j != i)
+            for i in range(7)
+        ])
+
+    return result
@@ -7,11 +7,13 @@
 """
 
 from astrovedic import const
-from astrovedic.vedic.ashtakavarga.bhinna import get_benefic_points
 from astrovedic.vedic.ashtakavarga.core import get_sign_number
+from astrovedic.vedic.ashtakavarga.engine import (
+    ASHTAKAVARGA_PLANETS, get_chart_signs, calculate_bhinna_matrix
+)
 
 
-def calculate_kaksha_bala(chart, planet_id):
+def calculate_kaksha_bala(chart, planet_id, bhinna_matrix=None):
     """
     Calculate Kaksha Bala (zodiacal strength) for a planet
     
@@ -21,20 +23,21 @@ def calculate_kaksha_bala(chart, planet_id):
     Args:
         chart (Chart): The birth chart
         planet_id (str): The ID of the planet to analyze
+        bhinna_matrix (list, optional): Precomputed Bhinnashtakavarga points
+            in ASHTAKAVARGA_PLANETS order
     
     Returns:
         dict: Dictionary with Kaksha Bala information
     """
+    if bhinna_matrix is None:
+        bhinna_matrix = calculate_bhinna_matrix(get_chart_signs(chart))
+    
     # Get the planet from the chart
     planet = chart.getObject(planet_id)
     
     # Get the sign number (0-11)
     sign_num = get_sign_number(planet.sign)
     
-    # List of planets used in Ashtakavarga
-    planets = [const.SUN, const.MOON, const.MARS, const.MERCURY,
-              const.JUPITER, const.VENUS, const.SATURN]
-    
     # Initialize the result
     result = {
         'planet': planet_id,
@@ -44,14 +47,11 @@ def calculate_kaksha_bala(chart, planet_id):
     }
     
     # Calculate the contribution from each planet's Ashtakavarga
-    for contributor_id in planets:
+    for contributor_id, benefic_points in zip(ASHTAKAVARGA_PLANETS, bhinna_matrix):
         # Skip the planet itself
         if contributor_id == planet_id:
             continue
         
-        # Get the benefic points
-        benefic_points = get_benefic_points(chart, contributor_id)
-        
         # Get the contribution at the planet's sign
         contribution = benefic_points[sign_num]
         
@@ -87,16 +87,15 @@ def get_kaksha_strengths(chart):
     Returns:
         dict: Dictionary with Kaksha Bala information for all planets
     """
-    # List of planets used in Ashtakavarga
-    planets = [const.SUN, const.MOON, const.MARS, const.MERCURY,
-              const.JUPITER, const.VENUS, const.SATURN]
+    # Calculate Bhinnashtakavarga once for all planets
+    bhinna_matrix = calculate_bhinna_matrix(get_chart_signs(chart))
     
     # Initialize the result
     result = {}
     
     # Calculate Kaksha Bala for each planet
-    for planet_id in planets:
-        result[planet_id] = calculate_kaksha_bala(chart, planet_id)
+    for planet_id in ASHTAKAVARGA_PLANETS:
+        result[planet_id] = calculate_kaksha_bala(chart, planet_id, bhinna_matrix)
     
     return result
 
@@ -115,9 +114,8 @@ def get_kaksha_bala_at_sign(chart, sign):
     # Get the sign number (0-11)
     sign_num = get_sign_number(sign)
     
-    # List of planets used in Ashtakavarga
-    planets = [const.SUN, const.MOON, const.MARS, const.MERCURY,
-              const.JUPITER, const.VENUS, const.SATURN]
+    # Calculate Bhinnashtakavarga for all planets
+    bhinna_matrix = calculate_bhinna_matrix(get_chart_signs(chart))
     
     # Initialize the result
     result = {
@@ -127,10 +125,7 @@ def get_kaksha_bala_at_sign(chart, sign):
     }
     
     # Calculate the contribution from each planet's Ashtakavarga
-    for planet_id in planets:
-        # Get the benefic points
-        benefic_points = get_benefic_points(chart, planet_id)
-        
+    for planet_id, benefic_points in zip(ASHTAKAVARGA_PLANETS, bhinna_matrix):
         # Get the contribution at the sign
         contribution = benefic_points[sign_num]
         
@@ -7,7 +7,11 @@
 """
 
 from astrovedic import const
-from astrovedic.vedic.ashtakavarga.bhinna import calculate_bhinnashtakavarga
+from astrovedic.vedic.ashtakavarga.engine import (
+    ASHTAKAVARGA_PLANETS, ASHTAKAVARGA_CONTRIBUTORS, get_chart_signs,
+    calculate_bhinna_matrix, calculate_sarva_points, calculate_prastara,
+    trikona_sodhana, ekadhi_sodhana
+)
 
 
 def calculate_sarvashtakavarga(chart):
@@ -20,31 +24,14 @@ def calculate_sarvashtakavarga(chart):
     Returns:
         dict: Dictionary with Sarvashtakavarga information
     """
-    # List of planets used in Ashtakavarga
-    planets = [const.SUN, const.MOON, const.MARS, const.MERCURY,
-              const.JUPITER, const.VENUS, const.SATURN]
+    # Calculate Bhinnashtakavarga for all planets from the sign indexes
+    bhinna_matrix = calculate_bhinna_matrix(get_chart_signs(chart))
 
-    # Initialize the result
-    result = {
-        'points': [0] * 12,
-        'planet_contributions': {}
+    return {
+        'points': calculate_sarva_points(bhinna_matrix),
+        'planet_contributions': dict(zip(ASHTAKAVARGA_PLANETS, bhinna_matrix))
     }
 
-    # Calculate Bhinnashtakavarga for each planet and add to the total
-    for planet_id in planets:
-        bhinna = calculate_bhinnashtakavarga(chart, planet_id)
-
-        # Add to the total
-        for i in range(12):
-            result['points'][i] += bhinna['points'][i]
-
-        # Add to the planet contributions
-        result['planet_contributions'][planet_id] = bhinna['points']
-
-    # No manual adjustments needed
-
-    return result
-
 
 def get_trikona_sodhana(sarva_points):
     """
@@ -59,25 +46,7 @@ def get_trikona_sodhana(sarva_points):
     Returns:
         list: List of 12 values after Trikona Sodhana
     """
-    # Initialize the result with a copy of the original points
-    result = sarva_points.copy()
-
-    # Apply Trikona Sodhana for each triangular relationship
-    for i in range(4):
-        # Get the three signs in this triangular relationship
-        sign1 = i
-        sign2 = (i + 4) % 12
-        sign3 = (i + 8) % 12
-
-        # Find the minimum value among the three signs
-        min_value = min(result[sign1], result[sign2], result[sign3])
-
-        # Subtract the minimum value from all three signs
-        result[sign1] -= min_value
-        result[sign2] -= min_value
-        result[sign3] -= min_value
-
-    return result
+    return trikona_sodhana(sarva_points)
 
 
 def get_ekadhi_sodhana(sarva_points):
@@ -93,23 +62,7 @@ def get_ekadhi_sodhana(sarva_points):
     Returns:
         list: List of 12 values after Ekadhi Sodhana
     """
-    # Initialize the result with a copy of the original points
-    result = sarva_points.copy()
-
-    # Apply Ekadhi Sodhana for each pair of opposite signs
-    for i in range(6):
-        # Get the two signs in this opposite relationship
-        sign1 = i
-        sign2 = (i + 6) % 12
-
-        # Find the minimum value between the two signs
-        min_value = min(result[sign1], result[sign2])
-
-        # Subtract the minimum value from both signs
-        result[sign1] -= min_value
-        result[sign2] -= min_value
-
-    return result
+    return ekadhi_sodhana(sarva_points)
 
 
 def get_sodhita_sarvashtakavarga(sarva_points):
@@ -147,32 +100,25 @@ def get_prastara_ashtakavarga(chart):
     Returns:
         dict: Dictionary with Prastara Ashtakavarga information
     """
-    # List of planets used in Ashtakavarga
-    planets = [const.SUN, const.MOON, const.MARS, const.MERCURY,
-              const.JUPITER, const.VENUS, const.SATURN]
-
-    # List of contributors
-    contributors = [const.SUN, const.MOON, const.MARS, const.MERCURY,
-                   const.JUPITER, const.VENUS, const.SATURN, const.ASC]
+    # Get the sign indexes of the contributors
+    signs = get_chart_signs(chart)
+    bhinna_matrix = calculate_bhinna_matrix(signs)
 
     # Initialize the result
     result = {
         'signs': [const.ARIES, const.TAURUS, const.GEMINI, const.CANCER,
                  const.LEO, const.VIRGO, const.LIBRA, const.SCORPIO,
                  const.SAGITTARIUS, const.CAPRICORN, const.AQUARIUS, const.PISCES],
-        'planets': planets,
-        'contributors': contributors,
+        'planets': list(ASHTAKAVARGA_PLANETS),
+        'contributors': list(ASHTAKAVARGA_CONTRIBUTORS),
         'data': {}
     }
 
-    # Calculate Bhinnashtakavarga for each planet
-    for planet_id in planets:
-        bhinna = calculate_bhinnashtakavarga(chart, planet_id)
-
-        # Add to the data
+    # Add the points and contributions of each planet
+    for planet_id, points in zip(ASHTAKAVARGA_PLANETS, bhinna_matrix):
         result['data'][planet_id] = {
-            'points': bhinna['points'],
-            'contributors': bhinna['contributors']
+            'points': points,
+            'contributors': calculate_prastara(signs, planet_id)
         }
 
     return result
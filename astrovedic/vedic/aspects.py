@@ -273,20 +273,152 @@ def get_rashi_drishti_strength(from_sign, to_sign):
     return aspect_info
 
 
-def get_planet_aspects(chart, planet_id):
+def _get_graha_drishti_row(planet_id):
+    """ Returns the (strength, type) of a planet's aspect by house distance - 1. """
+    return tuple((info['strength'], info['type'])
+                 for info in (get_graha_drishti_strength(planet_id, 0.0, distance * 30.0)
+                              for distance in range(12)))
+
+
+# Graha Drishti (strength, type) of each planet, indexed by house distance - 1
+GRAHA_DRISHTI = {planet_id: _get_graha_drishti_row(planet_id)
+                 for planet_id in const.LIST_OBJECTS_VEDIC}
+
+# Graha Drishti of any other object (7th house aspect only)
+DEFAULT_GRAHA_DRISHTI = _get_graha_drishti_row(None)
+
+# Rashi Drishti (strength, type), indexed by the from and to sign indices
+RASHI_DRISHTI = tuple(
+    tuple((info['strength'], info['type'])
+          for info in (get_rashi_drishti_strength(from_sign, to_sign)
+                       for to_sign in const.LIST_SIGNS))
+    for from_sign in const.LIST_SIGNS
+)
+
+
+def get_drishti_matrix(chart, objects=None):
+    """
+    Get the Graha Drishti matrices of a chart
+
+    The matrices are computed once per chart and can be passed to the
+    functions that accept a 'drishti' argument, so every aspect between
+    the objects and onto the houses is only evaluated once.
+
+    Args:
+        chart (Chart): The chart
+        objects (list, optional): The IDs of the objects, defaults to
+            const.LIST_OBJECTS_VEDIC
+
+    Returns:
+        dict: Dictionary with the 'objects', their 'index', the object x
+            object 'house_distance', 'strength' and 'type' matrices (rows
+            cast, columns receive), the object x house 'house_strength' and
+            'house_type' matrices (columns are houses 1-12) and the static
+            12 x 12 'rashi' table
+    """
+    if objects is None:
+        objects = const.LIST_OBJECTS_VEDIC
+    objects = list(objects)
+    lons = [chart.getObject(obj).lon for obj in objects]
+    house_lons = [chart.getHouse(f'House{num}').lon for num in range(1, 13)]
+
+    distances = []
+    strengths = []
+    types = []
+    house_strengths = []
+    house_types = []
+    for obj, lon in zip(objects, lons):
+        row = GRAHA_DRISHTI.get(obj, DEFAULT_GRAHA_DRISHTI)
+
+        distance_row = [int(angle.distance(lon, other_lon) / 30) % 12 for other_lon in lons]
+        distances.append([distance + 1 for distance in distance_row])
+        strengths.append([row[distance][0] for distance in distance_row])
+        types.append([row[distance][1] for distance in distance_row])
+
+        house_row = [row[int(angle.distance(lon, house_lon) / 30) % 12] for house_lon in house_lons]
+        house_strengths.append([strength for strength, _ in house_row])
+        house_types.append([aspect_type for _, aspect_type in house_row])
+
+    return {
+        'objects': objects,
+        'index': {obj: i for i, obj in enumerate(objects)},
+        'house_distance': distances,
+        'strength': strengths,
+        'type': types,
+        'house_strength': house_strengths,
+        'house_type': house_types,
+        'rashi': RASHI_DRISHTI
+    }
+
+
+def get_matrix_aspects(drishti, planet_id, received=False):
+    """
+    Get the aspects cast or received by a planet from a drishti matrix
+
+    Args:
+        drishti (dict): The matrices from get_drishti_matrix
+        planet_id (str): The ID of the planet
+        received (bool, optional): Get the aspects received instead of cast
+
+    Returns:
+        list: List of aspects, as returned by get_planet_aspects
+    """
+    objects = drishti['objects']
+    i = drishti['index'][planet_id]
+
+    aspects = []
+    for j, other_id in enumerate(objects):
+        if other_id == planet_id:
+            continue
+        from_i, to_i = (j, i) if received else (i, j)
+        strength = drishti['strength'][from_i][to_i]
+        if strength:
+            aspects.append({
+                'from_planet': objects[from_i],
+                'to_planet': objects[to_i],
+                'strength': strength,
+                'type': drishti['type'][from_i][to_i],
+                'house_distance': drishti['house_distance'][from_i][to_i]
+            })
+
+    return aspects
+
+
+def get_house_aspects_received(drishti, house_num):
+    """
+    Get the objects aspecting a house cusp from a drishti matrix
+
+    Args:
+        drishti (dict): The matrices from get_drishti_matrix
+        house_num (int): The house number (1-12)
+
+    Returns:
+        list: List of (object ID, strength, type) tuples
+    """
+    column = house_num - 1
+    return [(obj, drishti['house_strength'][i][column], drishti['house_type'][i][column])
+            for i, obj in enumerate(drishti['objects'])
+            if drishti['house_strength'][i][column]]
+
+
+def get_planet_aspects(chart, planet_id, drishti=None):
     """
     Get all aspects cast by a planet in a chart
-    
+
     Args:
         chart (Chart): The chart
         planet_id (str): The ID of the planet
-    
+        drishti (dict, optional): Precomputed matrices from get_drishti_matrix
+
     Returns:
         list: List of aspects cast by the planet
     """
+    if drishti is not None:
+        return get_matrix_aspects(drishti, planet_id)
+
     # Get the planet
     planet = chart.getObject(planet_id)
-    
+
     # Initialize the list of aspects
     aspects = []
     
@@ -311,17 +443,21 @@ def get_planet_aspects(chart, planet_id):
     return aspects
 
 
-def get_planet_aspects_received(chart, planet_id):
+def get_planet_aspects_received(chart, planet_id, drishti=None):
     """
     Get all aspects received by a planet in a chart
     
     Args:
         chart (Chart): The chart
         planet_id (str): The ID of the planet
+        drishti (dict, optional): Precomputed matrices from get_drishti_matrix
     
     Returns:
         list: List of aspects received by the planet
     """
+    if drishti is not None:
+        return get_matrix_aspects(drishti, planet_id, received=True)
+
     # Get the planet
     planet = chart.getObject(planet_id)
     
@@ -411,16 +547,30 @@ def get_sign_aspects_received(sign):
     return aspects
 
 
-def get_all_aspects(chart):
+# Rashi Drishti cast and received by each sign, which do not depend on the chart
+SIGN_ASPECTS = {
+    sign: {
+        'aspects_cast': get_sign_aspects(sign),
+        'aspects_received': get_sign_aspects_received(sign)
+    }
+    for sign in const.LIST_SIGNS
+}
+
+
+def get_all_aspects(chart, drishti=None):
     """
     Get all Vedic aspects in a chart
     
     Args:
         chart (Chart): The chart
+        drishti (dict, optional): Precomputed matrices from get_drishti_matrix
     
     Returns:
         dict: Dictionary with all aspects
     """
+    if drishti is None:
+        drishti = get_drishti_matrix(chart)
+
     # Initialize the result
     result = {
         'planet_aspects': {},
@@ -430,15 +580,15 @@ def get_all_aspects(chart):
     # Get aspects for each planet
     for planet_id in const.LIST_OBJECTS_VEDIC:
         result['planet_aspects'][planet_id] = {
-            'aspects_cast': get_planet_aspects(chart, planet_id),
-            'aspects_received': get_planet_aspects_received(chart, planet_id)
+            'aspects_cast': get_planet_aspects(chart, planet_id, drishti),
+            'aspects_received': get_planet_aspects_received(chart, planet_id, drishti)
         }
     
-    # Get aspects for each sign
-    for sign in const.LIST_SIGNS:
+    # Copy the static aspects of each sign
+    for sign, aspects in SIGN_ASPECTS.items():
         result['sign_aspects'][sign] = {
-            'aspects_cast': get_sign_aspects(sign),
-            'aspects_received': get_sign_aspects_received(sign)
+            key: [dict(aspect) for aspect in sign_aspects]
+            for key, sign_aspects in aspects.items()
         }
     
     return result
@@ -6,8 +6,10 @@
     for Vedic astrology.
 """
 
+from bisect import bisect_right
 from typing import Dict, List, Optional, Tuple, Union
 from astrovedic import const
+from astrovedic import angle
 from astrovedic.chart import Chart
 from astrovedic.object import GenericObject
 
@@ -31,6 +33,172 @@ LAJJITADI_BURNING = "Burning"         # Kshudita (Burning)
 LAJJITADI_AGITATED = "Agitated"       # Trashita (Agitated)
 LAJJITADI_SEEKING = "Seeking"         # Mushita (Seeking)
 
+# Baladi Avastha and strength by degree in the sign
+BALADI_LIMITS = (6, 12, 18, 24)
+BALADI_STATES = (
+    (BALADI_INFANT, 60),   # Moderate strength
+    (BALADI_YOUTH, 80),    # Good strength
+    (BALADI_ADULT, 100),   # Full strength
+    (BALADI_OLD, 50),      # Reduced strength
+    (BALADI_DEAD, 20)      # Very weak
+)
+
+# Jagradadi Avastha and strength by degree in the sign
+JAGRADADI_LIMITS = (10, 20)
+JAGRADADI_STATES = (
+    (JAGRADADI_AWAKE, 100),     # Full strength
+    (JAGRADADI_DREAMING, 60),   # Moderate strength
+    (JAGRADADI_SLEEPING, 30)    # Weak
+)
+
+# Sign lordships used by the Lajjitadi Avastha
+LAJJITADI_SIGN_LORDS = {
+    const.ARIES: const.MARS,
+    const.TAURUS: const.VENUS,
+    const.GEMINI: const.MERCURY,
+    const.CANCER: const.MOON,
+    const.LEO: const.SUN,
+    const.VIRGO: const.MERCURY,
+    const.LIBRA: const.VENUS,
+    const.SCORPIO: const.MARS,
+    const.SAGITTARIUS: const.JUPITER,
+    const.CAPRICORN: const.SATURN,
+    const.AQUARIUS: const.SATURN,
+    const.PISCES: const.JUPITER
+}
+
+# Exaltation signs used by the Lajjitadi Avastha
+LAJJITADI_EXALTATION = {
+    const.SUN: const.ARIES,
+    const.MOON: const.TAURUS,
+    const.MERCURY: const.VIRGO,
+    const.VENUS: const.PISCES,
+    const.MARS: const.CAPRICORN,
+    const.JUPITER: const.CANCER,
+    const.SATURN: const.LIBRA,
+    const.RAHU: const.TAURUS,
+    const.KETU: const.SCORPIO
+}
+
+# Debilitation signs used by the Lajjitadi Avastha (opposite to exaltation)
+LAJJITADI_DEBILITATION = {
+    const.SUN: const.LIBRA,
+    const.MOON: const.SCORPIO,
+    const.MERCURY: const.PISCES,
+    const.VENUS: const.VIRGO,
+    const.MARS: const.CANCER,
+    const.JUPITER: const.CAPRICORN,
+    const.SATURN: const.ARIES,
+    const.RAHU: const.SCORPIO,
+    const.KETU: const.TAURUS
+}
+
+# Planetary friendships used by the Lajjitadi Avastha
+# This is a simplified version; in reality, friendships are more complex
+LAJJITADI_FRIENDS = {
+    const.SUN: [const.MOON, const.MARS, const.JUPITER],
+    const.MOON: [const.SUN, const.MERCURY],
+    const.MERCURY: [const.SUN, const.VENUS],
+    const.VENUS: [const.MERCURY, const.SATURN],
+    const.MARS: [const.SUN, const.MOON, const.JUPITER],
+    const.JUPITER: [const.SUN, const.MOON, const.MARS],
+    const.SATURN: [const.MERCURY, const.VENUS],
+    const.RAHU: [const.VENUS, const.SATURN],
+    const.KETU: [const.MARS, const.VENUS]
+}
+
+# Planetary enemies used by the Lajjitadi Avastha (simplified)
+LAJJITADI_ENEMIES = {
+    const.SUN: [const.SATURN, const.VENUS],
+    const.MOON: [const.SATURN],
+    const.MERCURY: [const.MOON],
+    const.VENUS: [const.SUN, const.MOON],
+    const.MARS: [const.MERCURY],
+    const.JUPITER: [const.MERCURY, const.VENUS],
+    const.SATURN: [const.SUN, const.MOON, const.MARS],
+    const.RAHU: [const.SUN, const.MOON],
+    const.KETU: [const.SUN, const.MOON]
+}
+
+# Combustion orbs used by the Lajjitadi Avastha
+LAJJITADI_COMBUSTION_ORBS = {
+    const.MOON: 12,
+    const.MERCURY: 14,
+    const.VENUS: 10,
+    const.MARS: 17,
+    const.JUPITER: 11,
+    const.SATURN: 15,
+    const.RAHU: 9,
+    const.KETU: 9
+}
+
+def get_baladi_state(sign_lon: float) -> Tuple[str, int]:
+    """
+    Get the Baladi Avastha and its strength from the degree in the sign.
+    
+    Args:
+        sign_lon (float): The longitude in the sign (0-30 degrees)
+    
+    Returns:
+        tuple: (avastha, strength)
+    """
+    return BALADI_STATES[bisect_right(BALADI_LIMITS, sign_lon)]
+
+def get_jagradadi_state(sign_lon: float) -> Tuple[str, int]:
+    """
+    Get the Jagradadi Avastha and its strength from the degree in the sign.
+    
+    Args:
+        sign_lon (float): The longitude in the sign (0-30 degrees)
+    
+    Returns:
+        tuple: (avastha, strength)
+    """
+    return JAGRADADI_STATES[bisect_right(JAGRADADI_LIMITS, sign_lon)]
+
+def get_lajjitadi_state(planet_id: str, sign: str, is_combust: bool) -> Tuple[str, int]:
+    """
+    Get the Lajjitadi Avastha and its strength of a planet in a sign.
+    
+    Args:
+        planet_id (str): The ID of the planet
+        sign (str): The sign of the planet
+        is_combust (bool): Whether the planet is combust
+    
+    Returns:
+        tuple: (avastha, strength)
+    """
+    sign_lord = LAJJITADI_SIGN_LORDS.get(sign)
+    
+    if is_combust:
+        return LAJJITADI_AGITATED, 20  # Very weak
+    elif sign == LAJJITADI_EXALTATION.get(planet_id):
+        return LAJJITADI_EXALTED, 100  # Full strength
+    elif sign == LAJJITADI_DEBILITATION.get(planet_id):
+        return LAJJITADI_ASHAMED, 10  # Extremely weak
+    elif planet_id == sign_lord:
+        return LAJJITADI_DELIGHTED, 90  # Very strong
+    elif sign_lord in LAJJITADI_ENEMIES.get(planet_id, []):
+        return LAJJITADI_BURNING, 30  # Weak
+    elif sign_lord in LAJJITADI_FRIENDS.get(planet_id, []):
+        return LAJJITADI_SEEKING, 70  # Strong
+    else:
+        # Default to Seeking if no other condition is met
+        return LAJJITADI_SEEKING, 50  # Moderate
+
+def is_lajjitadi_combust(planet_id: str, orb: float) -> bool:
+    """
+    Check if a planet is combust for the Lajjitadi Avastha.
+    
+    Args:
+        planet_id (str): The ID of the planet
+        orb (float): The distance of the planet from the Sun
+    
+    Returns:
+        bool: True if the planet is combust
+    """
+    return planet_id != const.SUN and orb <= LAJJITADI_COMBUSTION_ORBS.get(planet_id, 10)
+
 def get_baladi_avastha(chart: Chart, planet_id: str) -> Dict[str, any]:
     """
     Calculate the Baladi Avastha (five-fold state) of a planet.
@@ -56,21 +224,7 @@ def get_baladi_avastha(chart: Chart, planet_id: str) -> Dict[str, any]:
     sign_lon = planet.lon % 30
     
     # Determine the Baladi Avastha
-    if sign_lon < 6:
-        avastha = BALADI_INFANT
-        strength = 60  # Moderate strength
-    elif sign_lon < 12:
-        avastha = BALADI_YOUTH
-        strength = 80  # Good strength
-    elif sign_lon < 18:
-        avastha = BALADI_ADULT
-        strength = 100  # Full strength
-    elif sign_lon < 24:
-        avastha = BALADI_OLD
-        strength = 50  # Reduced strength
-    else:
-        avastha = BALADI_DEAD
-        strength = 20  # Very weak
+    avastha, strength = get_baladi_state(sign_lon)
     
     return {
         'avastha': avastha,
@@ -101,15 +255,7 @@ def get_jagradadi_avastha(chart: Chart, planet_id: str) -> Dict[str, any]:
     sign_lon = planet.lon % 30
     
     # Determine the Jagradadi Avastha
-    if sign_lon < 10:
-        avastha = JAGRADADI_AWAKE
-        strength = 100  # Full strength
-    elif sign_lon < 20:
-        avastha = JAGRADADI_DREAMING
-        strength = 60   # Moderate strength
-    else:
-        avastha = JAGRADADI_SLEEPING
-        strength = 30   # Weak
+    avastha, strength = get_jagradadi_state(sign_lon)
     
     return {
         'avastha': avastha,
@@ -142,121 +288,14 @@ def get_lajjitadi_avastha(chart: Chart, planet_id: str) -> Dict[str, any]:
     # Get the planet's sign
     sign = planet.sign
     
-    # Define sign lordships
-    sign_lords = {
-        const.ARIES: const.MARS,
-        const.TAURUS: const.VENUS,
-        const.GEMINI: const.MERCURY,
-        const.CANCER: const.MOON,
-        const.LEO: const.SUN,
-        const.VIRGO: const.MERCURY,
-        const.LIBRA: const.VENUS,
-        const.SCORPIO: const.MARS,
-        const.SAGITTARIUS: const.JUPITER,
-        const.CAPRICORN: const.SATURN,
-        const.AQUARIUS: const.SATURN,
-        const.PISCES: const.JUPITER
-    }
-    
-    # Define exaltation signs
-    exaltation_signs = {
-        const.SUN: const.ARIES,
-        const.MOON: const.TAURUS,
-        const.MERCURY: const.VIRGO,
-        const.VENUS: const.PISCES,
-        const.MARS: const.CAPRICORN,
-        const.JUPITER: const.CANCER,
-        const.SATURN: const.LIBRA,
-        const.RAHU: const.TAURUS,
-        const.KETU: const.SCORPIO
-    }
-    
-    # Define debilitation signs (opposite to exaltation)
-    debilitation_signs = {
-        const.SUN: const.LIBRA,
-        const.MOON: const.SCORPIO,
-        const.MERCURY: const.PISCES,
-        const.VENUS: const.VIRGO,
-        const.MARS: const.CANCER,
-        const.JUPITER: const.CAPRICORN,
-        const.SATURN: const.ARIES,
-        const.RAHU: const.SCORPIO,
-        const.KETU: const.TAURUS
-    }
-    
-    # Define planetary friendships
-    # This is a simplified version; in reality, friendships are more complex
-    friends = {
-        const.SUN: [const.MOON, const.MARS, const.JUPITER],
-        const.MOON: [const.SUN, const.MERCURY],
-        const.MERCURY: [const.SUN, const.VENUS],
-        const.VENUS: [const.MERCURY, const.SATURN],
-        const.MARS: [const.SUN, const.MOON, const.JUPITER],
-        const.JUPITER: [const.SUN, const.MOON, const.MARS],
-        const.SATURN: [const.MERCURY, const.VENUS],
-        const.RAHU: [const.VENUS, const.SATURN],
-        const.KETU: [const.MARS, const.VENUS]
-    }
-    
-    # Define planetary enemies (simplified)
-    enemies = {
-        const.SUN: [const.SATURN, const.VENUS],
-        const.MOON: [const.SATURN],
-        const.MERCURY: [const.MOON],
-        const.VENUS: [const.SUN, const.MOON],
-        const.MARS: [const.MERCURY],
-        const.JUPITER: [const.MERCURY, const.VENUS],
-        const.SATURN: [const.SUN, const.MOON, const.MARS],
-        const.RAHU: [const.SUN, const.MOON],
-        const.KETU: [const.SUN, const.MOON]
-    }
-    
-    # Get the sign lord
-    sign_lord = sign_lords.get(sign)
-    
     # Check if the planet is combust
     # For this, we need to check the distance from the Sun
     sun = chart.getObject(const.SUN)
-    from astrovedic import angle
     orb = abs(angle.closestdistance(planet.lon, sun.lon))
-    
-    # Define combustion orbs for each planet
-    combustion_orbs = {
-        const.MOON: 12,
-        const.MERCURY: 14,
-        const.VENUS: 10,
-        const.MARS: 17,
-        const.JUPITER: 11,
-        const.SATURN: 15,
-        const.RAHU: 9,
-        const.KETU: 9
-    }
-    
-    is_combust = planet_id != const.SUN and orb <= combustion_orbs.get(planet_id, 10)
+    is_combust = is_lajjitadi_combust(planet_id, orb)
     
     # Determine the Lajjitadi Avastha
-    if is_combust:
-        avastha = LAJJITADI_AGITATED
-        strength = 20  # Very weak
-    elif sign == exaltation_signs.get(planet_id):
-        avastha = LAJJITADI_EXALTED
-        strength = 100  # Full strength
-    elif sign == debilitation_signs.get(planet_id):
-        avastha = LAJJITADI_ASHAMED
-        strength = 10  # Extremely weak
-    elif planet_id == sign_lord:
-        avastha = LAJJITADI_DELIGHTED
-        strength = 90  # Very strong
-    elif sign_lord in enemies.get(planet_id, []):
-        avastha = LAJJITADI_BURNING
-        strength = 30  # Weak
-    elif sign_lord in friends.get(planet_id, []):
-        avastha = LAJJITADI_SEEKING
-        strength = 70  # Strong
-    else:
-        # Default to Seeking if no other condition is met
-        avastha = LAJJITADI_SEEKING
-        strength = 50  # Moderate
+    avastha, strength = get_lajjitadi_state(planet_id, sign, is_combust)
     
     return {
         'avastha': avastha,
@@ -282,27 +321,43 @@ def get_all_avasthas(chart: Chart, planet_id: str) -> Dict[str, Dict[str, any]]:
         'lajjitadi': get_lajjitadi_avastha(chart, planet_id)
     }
 
-def get_all_planets_avasthas(chart: Chart) -> Dict[str, Dict[str, Dict[str, any]]]:
+def get_all_planets_avasthas(chart: Chart,
+                             states: Optional[Dict[str, tuple]] = None) -> Dict[str, Dict[str, Dict[str, any]]]:
     """
     Calculate all Avasthas (states) for all planets in a chart.
     
     Args:
         chart (Chart): The chart
+        states (dict, optional): The planet states of the chart
+            (see planet_states.get_planet_states)
     
     Returns:
         dict: Dictionary with all Avastha information for all planets
     """
-    # List of planets to calculate Avasthas for
-    planets = [
-        const.SUN, const.MOON, const.MERCURY, const.VENUS,
-        const.MARS, const.JUPITER, const.SATURN, const.RAHU, const.KETU
-    ]
+    # Compute the states of all planets in one pass
+    if states is None:
+        from astrovedic.vedic.planet_states import get_planet_states
+        states = get_planet_states(chart)
     
-    # Initialize the result
     result = {}
-    
-    # Calculate Avasthas for each planet
-    for planet_id in planets:
-        result[planet_id] = get_all_avasthas(chart, planet_id)
+    for i, planet_id in enumerate(states['planets']):
+        result[planet_id] = {
+            'baladi': {
+                'avastha': states['baladi'][i],
+                'strength': states['baladi_strength'][i],
+                'sign_longitude': states['sign_lons'][i]
+            },
+            'jagradadi': {
+                'avastha': states['jagradadi'][i],
+                'strength': states['jagradadi_strength'][i],
+                'sign_longitude': states['sign_lons'][i]
+            },
+            'lajjitadi': {
+                'avastha': states['lajjitadi'][i],
+                'strength': states['lajjitadi_strength'][i],
+                'sign': const.LIST_SIGNS[states['signs'][i]],
+                'is_combust': states['lajjitadi_combust'][i]
+            }
+        }
     
     return result
@@ -4,13 +4,30 @@
 
     This module implements Bhava Chalita chart calculations
     for Vedic astrology.
+
+    The twelve house cusps are rotated once into ascending order, so
+    the house of every planet is found with a binary search. Charts are
+    reduced to their Ascendant and planet longitudes, which allows many
+    charts and time series at one location to be placed at once.
 """
 
+from bisect import bisect_right
 from typing import Dict, List, Optional, Tuple, Union
 from astrovedic import const
 from astrovedic import angle
 from astrovedic.chart import Chart
+from astrovedic.datetime import Datetime
 from astrovedic.object import GenericObject
+from astrovedic.parallel import map_blocks
+
+# Planets placed in the Bhava Chalita houses (traditional planets only)
+CHALITA_PLANETS = const.LIST_SEVEN_PLANETS + [const.RAHU, const.KETU]
+
+# Default number of charts evaluated per task
+DEFAULT_BLOCK_SIZE = 256
+
+# Default number of timeline samples calculated per task
+DEFAULT_TIMELINE_BLOCK_SIZE = 24
 
 def is_in_range(lon: float, start_lon: float, end_lon: float) -> bool:
     """
@@ -36,6 +53,163 @@ def is_in_range(lon: float, start_lon: float, end_lon: float) -> bool:
     # If the range crosses 0 degrees
     return start_lon <= lon or lon < end_lon
 
+def get_chalita_cusps(asc_lon: float) -> Tuple[float, ...]:
+    """
+    Calculate the Bhava Chalita house cusps.
+
+    Each house is exactly 30 degrees, starting from the Ascendant degree.
+
+    Args:
+        asc_lon (float): The longitude of the first house
+
+    Returns:
+        tuple: The cusp longitudes of houses 1-12
+    """
+    return tuple(angle.norm(asc_lon + (i * 30)) for i in range(12))
+
+def get_sorted_cusps(cusps: Tuple[float, ...]) -> Tuple[Tuple[float, ...], int]:
+    """
+    Rotate the house cusps into ascending order.
+
+    Args:
+        cusps (tuple): The cusp longitudes of houses 1-12
+
+    Returns:
+        tuple: (sorted cusps, index of the house of the first sorted cusp)
+    """
+    first = cusps.index(min(cusps))
+    return cusps[first:] + cusps[:first], first
+
+def get_chalita_houses(cusps: Tuple[float, ...], lons: List[float]) -> Tuple[int, ...]:
+    """
+    Find the Bhava Chalita houses of many longitudes.
+
+    A longitude belongs to the house from its cusp (inclusive) to the
+    next cusp (exclusive), as in is_in_range.
+
+    Args:
+        cusps (tuple): The cusp longitudes of houses 1-12
+        lons (list): The longitudes to place
+
+    Returns:
+        tuple: The house number (1-12) of each longitude
+    """
+    sorted_cusps, first = get_sorted_cusps(cusps)
+    return tuple((first + bisect_right(sorted_cusps, angle.norm(lon)) - 1) % 12 + 1
+                 for lon in lons)
+
+def get_chalita_facts(chart: Chart) -> Dict[str, any]:
+    """
+    Get the longitudes used by the Bhava Chalita chart.
+
+    Args:
+        chart (Chart): The chart
+
+    Returns:
+        dict: Dictionary with the 'asc' (House1 longitude) and the 'lons'
+            of the planets in CHALITA_PLANETS order
+    """
+    return {
+        'asc': chart.getHouse('House1').lon,
+        'lons': tuple(chart.getObject(planet_id).lon for planet_id in CHALITA_PLANETS)
+    }
+
+def evaluate_bhava_chalita(facts: Dict[str, any]) -> Dict[str, tuple]:
+    """
+    Place the planets of a chart in the Bhava Chalita houses.
+
+    Args:
+        facts (dict): The chart facts (see get_chalita_facts)
+
+    Returns:
+        dict: Dictionary with the 'cusps' of houses 1-12 and the
+            'houses' of the planets in CHALITA_PLANETS order
+    """
+    cusps = get_chalita_cusps(facts['asc'])
+    return {
+        'cusps': cusps,
+        'houses': get_chalita_houses(cusps, facts['lons'])
+    }
+
+def _evaluate_block(facts: List[Dict[str, any]]) -> List[Dict[str, tuple]]:
+    """ Returns the Bhava Chalita placements of a block of charts. """
+    return [evaluate_bhava_chalita(chart_facts) for chart_facts in facts]
+
+def iter_bhava_chalita(facts: List[Dict[str, any]], block_size: int = DEFAULT_BLOCK_SIZE,
+                       max_workers: Optional[int] = None, executor=None):
+    """
+    Place the planets of many charts in the Bhava Chalita houses.
+
+    Charts are placed in blocks with map_blocks.
+
+    Args:
+        facts (list): The facts of all charts (see get_chalita_facts)
+        block_size (int): The number of charts per block
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
+
+    Yields:
+        tuple: (chart index, placement) in chart order, where placement
+            is the result of evaluate_bhava_chalita
+    """
+    return map_blocks(_evaluate_block, facts, block_size, max_workers=max_workers,
+                      executor=executor)
+
+def _evaluate_times(location: Tuple, jds: List[float]) -> List[Dict[str, tuple]]:
+    """ Returns the Bhava Chalita placements of the charts at a block of times. """
+    pos, hsys, mode = location
+    return [evaluate_bhava_chalita(get_chalita_facts(
+                Chart(Datetime.fromJD(jd, '+00:00'), pos, hsys=hsys, mode=mode)))
+            for jd in jds]
+
+def get_bhava_chalita_timeline(pos, start_jd: float, end_jd: float, step: float = 1 / 24,
+                               hsys: str = const.HOUSES_DEFAULT, mode: str = const.AY_LAHIRI,
+                               max_workers: Optional[int] = None,
+                               executor=None) -> List[Dict[str, any]]:
+    """
+    Calculate the Bhava Chalita placements at a location over time.
+
+    The charts are sampled every step from the start to the end Julian
+    day, and consecutive samples with the same placements are merged,
+    so changes are resolved to the step. The charts of the samples are
+    calculated in blocks with map_blocks.
+
+    Args:
+        pos (GeoPos): The location
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        step (float): The sampling step in days
+        hsys (str): The house system of the charts
+        mode (str): Ayanamsa mode of the charts
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
+
+    Returns:
+        list: Periods with their 'start' and 'end' Julian days, the
+            'start_cusp' of the first house at the start and the
+            'houses' of each planet
+    """
+    jds = [start_jd + i * step for i in range(int((end_jd - start_jd) / step + 1e-9) + 1)]
+    placements = map_blocks(_evaluate_times, jds, DEFAULT_TIMELINE_BLOCK_SIZE,
+                            max_workers=max_workers, executor=executor,
+                            shared=(pos, hsys, mode))
+
+    periods = []
+    for index, placement in placements:
+        houses = dict(zip(CHALITA_PLANETS, placement['houses']))
+        if periods and periods[-1]['houses'] == houses:
+            continue
+        if periods:
+            periods[-1]['end'] = jds[index]
+        periods.append({
+            'start': jds[index],
+            'end': end_jd,
+            'start_cusp': placement['cusps'][0],
+            'houses': houses
+        })
+
+    return periods
+
 def get_bhava_chalita_chart(chart: Chart) -> Dict[str, any]:
     """
     Calculate the Bhava Chalita chart.
@@ -49,59 +223,28 @@ def get_bhava_chalita_chart(chart: Chart) -> Dict[str, any]:
     Returns:
         dict: Dictionary with Bhava Chalita chart information
     """
-    # Get the Ascendant degree (House1 longitude)
-    asc_lon = chart.getHouse('House1').lon
-
-    # Calculate the house cusps
-    house_cusps = []
-    for i in range(12):
-        cusp_lon = angle.norm(asc_lon + (i * 30))
-        house_cusps.append(cusp_lon)
+    # Place all planets at once
+    placement = evaluate_bhava_chalita(get_chalita_facts(chart))
 
     # Create the Bhava Chalita houses
     houses = {}
-    for i in range(12):
-        house_num = i + 1
-
-        # Get the house cusp longitude
-        cusp_lon = house_cusps[i]
-
-        # Determine the sign of the house cusp
-        sign_num = int(cusp_lon / 30)
-        sign = const.LIST_SIGNS[sign_num]
-
-        # Create the house
-        houses[house_num] = {
+    for i, cusp_lon in enumerate(placement['cusps']):
+        houses[i + 1] = {
             'cusp': cusp_lon,
-            'sign': sign,
+            'sign': const.LIST_SIGNS[int(cusp_lon / 30)],
             'sign_longitude': cusp_lon % 30
         }
 
     # Determine which planets are in which houses
-    planets_in_houses = {}
-    for house_num, house_info in houses.items():
-        planets_in_houses[house_num] = []
-
-        # Get the house cusp longitude
-        cusp_lon = house_info['cusp']
-
-        # Get the next house cusp longitude
-        next_house_num = (house_num % 12) + 1
-        next_cusp_lon = houses[next_house_num]['cusp']
-
-        # Check each planet (traditional planets only)
-        for planet_id in const.LIST_SEVEN_PLANETS + [const.RAHU, const.KETU]:
-            planet = chart.getObject(planet_id)
-            planet_lon = planet.lon
-
-            # Check if the planet is in this house
-            if is_in_range(planet_lon, cusp_lon, next_cusp_lon):
-                planets_in_houses[house_num].append({
-                    'id': planet_id,
-                    'longitude': planet_lon,
-                    'sign': planet.sign,
-                    'sign_longitude': planet_lon % 30
-                })
+    planets_in_houses = {house_num: [] for house_num in houses}
+    for planet_id, house_num in zip(CHALITA_PLANETS, placement['houses']):
+        planet = chart.getObject(planet_id)
+        planets_in_houses[house_num].append({
+            'id': planet_id,
+            'longitude': planet.lon,
+            'sign': planet.sign,
+            'sign_longitude': planet.lon % 30
+        })
 
     return {
         'houses': houses,
@@ -119,24 +262,16 @@ def get_bhava_chalita_house_for_planet(chart: Chart, planet_id: str) -> int:
     Returns:
         int: The house number (1-12)
     """
-    # Get the Bhava Chalita chart
-    bhava_chalita = get_bhava_chalita_chart(chart)
-
     # Get the planet's longitude
     planet = chart.getObject(planet_id)
     planet_lon = planet.lon
-
-    # Check each house
-    for house_num, planets in bhava_chalita['planets_in_houses'].items():
-        for planet_info in planets:
-            if planet_info['id'] == planet_id:
-                return house_num
-
-    # If the planet is not found in any house (which should not happen),
-    # determine the house based on the planet's longitude
     asc_lon = chart.getHouse('House1').lon
 
-    # Calculate the house number based on the planet's longitude
+    # Place the planets of the Bhava Chalita chart
+    if planet_id in CHALITA_PLANETS:
+        return get_chalita_houses(get_chalita_cusps(asc_lon), [planet_lon])[0]
+
+    # Calculate the house number of other objects based on their longitude
     # The house number is determined by the number of 30-degree segments
     # from the Ascendant degree
     house_num = int(angle.distance(asc_lon, planet_lon) / 30) + 1
@@ -206,9 +341,6 @@ def get_bhava_chalita_house_strength(chart: Chart, house_num: int) -> Dict[str,
     Returns:
         dict: Dictionary with house strength information
     """
-    # Get the Bhava Chalita chart (not used directly, but needed for consistency)
-    _ = get_bhava_chalita_chart(chart)
-
     # Get the house lord
     house_lord = get_bhava_chalita_house_lord(chart, house_num)
 
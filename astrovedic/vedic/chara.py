@@ -9,7 +9,12 @@
 from astrovedic import const
 from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
-from datetime import datetime, timedelta
+from astrovedic.vedic.dasha_engine import (
+    DashaSystem, DashaTimeline, years_to_days, add_years_to_date,
+    date_converter, get_current_period, format_current_dasha,
+    current_dasha_info
+)
+from datetime import datetime
 from typing import Dict, Optional, Any, List, Tuple
 
 # Chara Dasha periods (in years) for each sign
@@ -32,6 +37,9 @@ CHARA_PERIODS = {
 # Total years in Chara Dasha cycle
 TOTAL_CHARA_YEARS = sum(CHARA_PERIODS.values())  # 78 years
 
+# Chara Dasha system table (signs in zodiacal order)
+CHARA_DASHA = DashaSystem('Chara', const.LIST_SIGNS, CHARA_PERIODS, key='sign')
+
 def get_sign_sequence_from_lagna(lagna_sign: str) -> List[str]:
     """
     Get the sequence of signs starting from the lagna sign
@@ -42,23 +50,8 @@ def get_sign_sequence_from_lagna(lagna_sign: str) -> List[str]:
     Returns:
         list: List of signs in sequence from lagna
     """
-    # List of all signs in zodiacal order
-    all_signs = [
-        const.ARIES, const.TAURUS, const.GEMINI, const.CANCER,
-        const.LEO, const.VIRGO, const.LIBRA, const.SCORPIO,
-        const.SAGITTARIUS, const.CAPRICORN, const.AQUARIUS, const.PISCES
-    ]
-    
-    # Find the index of the lagna sign
-    lagna_index = all_signs.index(lagna_sign)
-    
-    # Create the sequence starting from lagna
-    sign_sequence = []
-    for i in range(12):
-        idx = (lagna_index + i) % 12
-        sign_sequence.append(all_signs[idx])
-    
-    return sign_sequence
+    order = CHARA_DASHA.order(CHARA_DASHA.index(lagna_sign))
+    return [CHARA_DASHA.sequence[idx] for idx in order]
 
 def calculate_chara_dasha_balance(lagna_longitude: float) -> Tuple[str, float]:
     """
@@ -72,12 +65,7 @@ def calculate_chara_dasha_balance(lagna_longitude: float) -> Tuple[str, float]:
     """
     # Determine the lagna sign
     sign_index = int(lagna_longitude / 30)
-    all_signs = [
-        const.ARIES, const.TAURUS, const.GEMINI, const.CANCER,
-        const.LEO, const.VIRGO, const.LIBRA, const.SCORPIO,
-        const.SAGITTARIUS, const.CAPRICORN, const.AQUARIUS, const.PISCES
-    ]
-    lagna_sign = all_signs[sign_index]
+    lagna_sign = const.LIST_SIGNS[sign_index]
     
     # Calculate position within sign (0-30 degrees)
     pos_in_sign = lagna_longitude % 30
@@ -101,41 +89,8 @@ def get_chara_dasha_sequence(lagna_longitude: float) -> List[Dict[str, Any]]:
     Returns:
         list: List of dictionaries with Chara Dasha information
     """
-    # Determine the lagna sign
-    sign_index = int(lagna_longitude / 30)
-    all_signs = [
-        const.ARIES, const.TAURUS, const.GEMINI, const.CANCER,
-        const.LEO, const.VIRGO, const.LIBRA, const.SCORPIO,
-        const.SAGITTARIUS, const.CAPRICORN, const.AQUARIUS, const.PISCES
-    ]
-    lagna_sign = all_signs[sign_index]
-    
-    # Calculate the balance of the current Chara Dasha
     current_sign, balance = calculate_chara_dasha_balance(lagna_longitude)
-    
-    # Get the sequence of signs from lagna
-    sign_sequence = get_sign_sequence_from_lagna(lagna_sign)
-    
-    # Create the sequence of Chara Dashas
-    chara_sequence = []
-    
-    # Add the current Chara Dasha with its balance
-    chara_sequence.append({
-        'sign': current_sign,
-        'years': balance
-    })
-    
-    # Add the remaining Chara Dashas in sequence
-    current_sign_index = sign_sequence.index(current_sign)
-    for i in range(1, 12):
-        idx = (current_sign_index + i) % 12
-        sign = sign_sequence[idx]
-        chara_sequence.append({
-            'sign': sign,
-            'years': CHARA_PERIODS[sign]
-        })
-    
-    return chara_sequence
+    return CHARA_DASHA.sequence_info(CHARA_DASHA.index(current_sign), balance)
 
 def get_chara_antardasha_sequence(mahadasha_sign: str, mahadasha_years: float) -> List[Dict[str, Any]]:
     """
@@ -148,49 +103,21 @@ def get_chara_antardasha_sequence(mahadasha_sign: str, mahadasha_years: float) -
     Returns:
         list: List of dictionaries with Antardasha information
     """
-    # Get the sequence of signs from the mahadasha sign
-    sign_sequence = get_sign_sequence_from_lagna(mahadasha_sign)
-    
-    # Create the sequence of Antardashas
-    antardasha_sequence = []
-    
-    # Add all Antardashas in sequence
-    for sign in sign_sequence:
-        # Calculate the duration of the Antardasha
-        years = (CHARA_PERIODS[sign] / TOTAL_CHARA_YEARS) * mahadasha_years
-        
-        antardasha_sequence.append({
-            'sign': sign,
-            'years': years
-        })
-    
-    return antardasha_sequence
-
-def years_to_days(years: float) -> float:
-    """
-    Convert years to days
-
-    Args:
-        years (float): Number of years
+    return CHARA_DASHA.subperiod_info(mahadasha_sign, mahadasha_years)
 
-    Returns:
-        float: Number of days
+def get_chara_timeline(birth_jd: float, lagna_longitude: float) -> DashaTimeline:
     """
-    return years * 365.25
-
-def add_years_to_date(date: datetime, years: float) -> datetime:
-    """
-    Add a number of years to a date
+    Get the Chara Mahadasha timeline with lazily expanded sub-periods
 
     Args:
-        date (datetime): The starting date
-        years (float): Number of years to add
+        birth_jd (float): The Julian Day of birth
+        lagna_longitude (float): The Lagna's longitude in degrees (0-360)
 
     Returns:
-        datetime: The resulting date
+        DashaTimeline: The Mahadasha timeline
     """
-    days = years_to_days(years)
-    return date + timedelta(days=days)
+    current_sign, balance = calculate_chara_dasha_balance(lagna_longitude)
+    return CHARA_DASHA.timeline(birth_jd, CHARA_DASHA.index(current_sign), balance)
 
 def calculate_chara_dasha_periods(birth_date: datetime, lagna_longitude: float) -> Dict[str, Any]:
     """
@@ -205,66 +132,13 @@ def calculate_chara_dasha_periods(birth_date: datetime, lagna_longitude: float)
     """
     # Convert flatlib Datetime to Python datetime if needed
     if isinstance(birth_date, Datetime):
-        # Create a Python datetime from the components
-        date_parts = str(birth_date.date).strip('<>').split('/')
-        time_parts = str(birth_date.time).strip('<>').split(':')
-        
-        year = int(date_parts[0])
-        month = int(date_parts[1])
-        day = int(date_parts[2])
-        hour = int(time_parts[0])
-        minute = int(time_parts[1])
-        
-        birth_dt = datetime(year, month, day, hour, minute)
+        birth_dt = birth_date.to_datetime()
     else:
         birth_dt = birth_date
     
-    # Get the Chara Dasha sequence
-    chara_sequence = get_chara_dasha_sequence(lagna_longitude)
-    
-    # Calculate start and end dates for each Mahadasha
-    current_date = birth_dt
-    mahadashas = []
-    
-    for mahadasha in chara_sequence:
-        sign = mahadasha['sign']
-        years = mahadasha['years']
-        
-        start_date = current_date
-        end_date = add_years_to_date(start_date, years)
-        
-        # Get Antardashas for this Mahadasha
-        antardasha_sequence = get_chara_antardasha_sequence(sign, years)
-        antardashas = []
-        
-        # Calculate start and end dates for each Antardasha
-        antardasha_date = start_date
-        
-        for antardasha in antardasha_sequence:
-            ad_sign = antardasha['sign']
-            ad_years = antardasha['years']
-            
-            ad_start_date = antardasha_date
-            ad_end_date = add_years_to_date(ad_start_date, ad_years)
-            
-            antardashas.append({
-                'sign': ad_sign,
-                'start_date': ad_start_date,
-                'end_date': ad_end_date,
-                'years': ad_years
-            })
-            
-            antardasha_date = ad_end_date
-        
-        mahadashas.append({
-            'sign': sign,
-            'start_date': start_date,
-            'end_date': end_date,
-            'years': years,
-            'antardashas': antardashas
-        })
-        
-        current_date = end_date
+    # Build the timeline relative to birth and materialize two levels
+    timeline = get_chara_timeline(0.0, lagna_longitude)
+    mahadashas = timeline.to_list(date_converter(birth_dt, 0.0), depth=2)
     
     return {
         'mahadashas': mahadashas,
@@ -286,37 +160,7 @@ def get_current_chara_dasha(dasha_periods: Dict[str, Any], date: Optional[dateti
     if date is None:
         date = datetime.now()
     
-    # Find the current Mahadasha
-    current_mahadasha = None
-    for mahadasha in dasha_periods['mahadashas']:
-        if mahadasha['start_date'] <= date < mahadasha['end_date']:
-            current_mahadasha = mahadasha
-            break
-    
-    if not current_mahadasha:
-        return None
-    
-    # Find the current Antardasha
-    current_antardasha = None
-    for antardasha in current_mahadasha['antardashas']:
-        if antardasha['start_date'] <= date < antardasha['end_date']:
-            current_antardasha = antardasha
-            break
-    
-    if not current_antardasha:
-        return {
-            'mahadasha': current_mahadasha,
-            'antardasha': None
-        }
-    
-    return {
-        'mahadasha': current_mahadasha,
-        'antardasha': current_antardasha,
-        'mahadasha_start': current_mahadasha['start_date'],
-        'mahadasha_end': current_mahadasha['end_date'],
-        'antardasha_start': current_antardasha['start_date'],
-        'antardasha_end': current_antardasha['end_date']
-    }
+    return format_current_dasha(get_current_period(dasha_periods, date))
 
 def get_dasha_balance(chart: Chart) -> float:
     """
@@ -363,13 +207,11 @@ def get_current_dasha(chart: Chart, date: Optional[Datetime] = None) -> Optional
 
     target_date = date if date else chart.date
 
-    # Calculate all dasha periods starting from birth
-    all_periods = calculate_chara_dasha_periods(chart.date.to_datetime(), asc.lon)
-    
-    # Find the specific dasha for the target date
-    current_dasha_info = get_current_chara_dasha(all_periods, target_date.to_datetime())
+    # Only the running Mahadasha is expanded
+    timeline = get_chara_timeline(chart.date.jd, asc.lon)
+    to_date = date_converter(chart.date.to_datetime(), chart.date.jd)
 
-    return current_dasha_info
+    return current_dasha_info(timeline, target_date.jd, to_date)
 
 def get_mahadasha(chart: Chart, date: Optional[Datetime] = None) -> Optional[Dict[str, Any]]:
     """
@@ -39,6 +39,62 @@ DEEP_COMBUSTION_ORBS = {
     const.KETU: 3
 }
 
+# Combustion orbs (degrees) of retrograde planets, which are closer to the Sun
+RETROGRADE_COMBUSTION_ORBS = {
+    const.MERCURY: 12,  # Reduced from 14 as it's closer when retrograde
+    const.VENUS: 8      # Reduced from 10 as it's closer when retrograde
+}
+
+def is_planet_retrograde(planet) -> bool:
+    """
+    Check if a planet is retrograde
+
+    Args:
+        planet (GenericObject): The planet
+
+    Returns:
+        bool: True if the planet is retrograde (Moon nodes are never)
+    """
+    # Check if the planet has the isRetrograde method (Moon nodes don't have it)
+    return hasattr(planet, 'isRetrograde') and planet.isRetrograde()
+
+def get_combustion_orb(planet_id: str, is_retrograde: bool = False) -> float:
+    """
+    Get the combustion orb of a planet
+
+    Args:
+        planet_id (str): The ID of the planet
+        is_retrograde (bool): Whether the planet is retrograde
+
+    Returns:
+        float: The combustion orb in degrees
+    """
+    # Retrograde planets have a slightly different orb for combustion
+    if is_retrograde and planet_id in RETROGRADE_COMBUSTION_ORBS:
+        return RETROGRADE_COMBUSTION_ORBS[planet_id]
+    return COMBUSTION_ORBS.get(planet_id, 10)
+
+def get_strength_reduction(orb: float, combustion_orb: float, deep_combustion_orb: float) -> float:
+    """
+    Get the strength reduction (0-100%) of a planet at an orb from the Sun
+
+    Args:
+        orb (float): The distance of the planet from the Sun
+        combustion_orb (float): The combustion orb of the planet
+        deep_combustion_orb (float): The deep combustion orb of the planet
+
+    Returns:
+        float: The strength reduction
+    """
+    # The closer to the Sun, the greater the reduction
+    if orb <= combustion_orb:
+        if orb <= deep_combustion_orb:
+            # Deep combustion causes severe strength reduction
+            return float(100 - ((orb / deep_combustion_orb) * 50))
+        # Regular combustion causes moderate strength reduction
+        return float(50 - ((orb - deep_combustion_orb) / (combustion_orb - deep_combustion_orb) * 50))
+    return 0.0
+
 def is_combust(chart: Chart, planet_id: str) -> bool:
     """
     Check if a planet is combust (too close to the Sun)
@@ -61,18 +117,8 @@ def is_combust(chart: Chart, planet_id: str) -> bool:
     # Calculate the orb
     orb = abs(angle.closestdistance(planet.lon, sun.lon))
 
-    # Adjust combustion orb for retrograde planets
-    combustion_orbs = COMBUSTION_ORBS.copy()
-    # Check if the planet has the isRetrograde method (Moon nodes don't have it)
-    if hasattr(planet, 'isRetrograde') and planet.isRetrograde():
-        # Retrograde planets have a slightly different orb for combustion
-        if planet_id == const.MERCURY:
-            combustion_orbs[const.MERCURY] = 12  # Reduced from 14 as it's closer when retrograde
-        elif planet_id == const.VENUS:
-            combustion_orbs[const.VENUS] = 8     # Reduced from 10 as it's closer when retrograde
-
     # Check if the planet is combust
-    return orb <= combustion_orbs.get(planet_id, 10)
+    return orb <= get_combustion_orb(planet_id, is_planet_retrograde(planet))
 
 def is_deeply_combust(chart: Chart, planet_id: str) -> bool:
     """
@@ -128,51 +174,31 @@ def get_combustion_details(chart: Chart, planet_id: str) -> Dict[str, any]:
     # Calculate the orb
     orb = abs(angle.closestdistance(planet.lon, sun.lon))
 
-    # Adjust combustion orb for retrograde planets
-    combustion_orbs = COMBUSTION_ORBS.copy()
-    # Check if the planet has the isRetrograde method (Moon nodes don't have it)
-    if hasattr(planet, 'isRetrograde') and planet.isRetrograde():
-        # Retrograde planets have a slightly different orb for combustion
-        if planet_id == const.MERCURY:
-            combustion_orbs[const.MERCURY] = 12  # Reduced from 14 as it's closer when retrograde
-        elif planet_id == const.VENUS:
-            combustion_orbs[const.VENUS] = 8     # Reduced from 10 as it's closer when retrograde
-
     # Get the combustion orb for this planet
-    combustion_orb = combustion_orbs.get(planet_id, 10)
+    combustion_orb = get_combustion_orb(planet_id, is_planet_retrograde(planet))
     deep_combustion_orb = DEEP_COMBUSTION_ORBS.get(planet_id, 3)
 
     # Check if the planet is combust or deeply combust
     is_combust_status = orb <= combustion_orb
     is_deeply_combust_status = orb <= deep_combustion_orb
 
-    # Calculate strength reduction (0-100%)
-    # The closer to the Sun, the greater the reduction
-    if is_combust_status:
-        if is_deeply_combust_status:
-            # Deep combustion causes severe strength reduction
-            strength_reduction = float(100 - ((orb / deep_combustion_orb) * 50))
-        else:
-            # Regular combustion causes moderate strength reduction
-            strength_reduction = float(50 - ((orb - deep_combustion_orb) / (combustion_orb - deep_combustion_orb) * 50))
-    else:
-        strength_reduction = 0.0
-
     return {
         'is_combust': is_combust_status,
         'is_deeply_combust': is_deeply_combust_status,
         'orb': orb,
         'combustion_orb': combustion_orb,
         'deep_combustion_orb': deep_combustion_orb,
-        'strength_reduction': strength_reduction
+        'strength_reduction': get_strength_reduction(orb, combustion_orb, deep_combustion_orb)
     }
 
-def get_all_combustion_details(chart: Chart) -> Dict[str, Dict[str, any]]:
+def get_all_combustion_details(chart: Chart, states: Optional[Dict[str, tuple]] = None) -> Dict[str, Dict[str, any]]:
     """
     Get combustion details for all planets in a chart
 
     Args:
         chart (Chart): The chart
+        states (dict, optional): The planet states of the chart
+            (see planet_states.get_planet_states)
 
     Returns:
         dict: Dictionary with combustion details for all planets
@@ -183,6 +209,16 @@ def get_all_combustion_details(chart: Chart) -> Dict[str, Dict[str, any]]:
         const.JUPITER, const.SATURN, const.RAHU, const.KETU
     ]
 
+    # Read the details from the planet states when given
+    if states is not None:
+        columns = ('is_combust', 'is_deeply_combust', 'orb', 'combustion_orb',
+                   'deep_combustion_orb', 'strength_reduction')
+        return {
+            planet_id: {column: states[column][states['planets'].index(planet_id)]
+                        for column in columns}
+            for planet_id in planets
+        }
+
     # Initialize the result
     result = {}
 
@@ -17,6 +17,11 @@ from astrovedic.vedic.compatibility.core import (
     get_compatibility_description, get_compatibility_report
 )
 
+from astrovedic.vedic.compatibility.batch import (
+    get_compatibility_features, get_compatibility_features_batch,
+    calculate_pair_compatibility, iter_compatibility_rows, get_top_matches
+)
+
 from astrovedic.vedic.compatibility.kuta import (
     get_varna_kuta, get_vashya_kuta, get_tara_kuta,
     get_yoni_kuta, get_graha_maitri_kuta, get_gana_kuta,
@@ -0,0 +1,275 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements batch compatibility analysis for many charts.
+    The chart specific parts of the compatibility score (Moon pada, Doshas,
+    current Dasha lord and Navamsa data) are extracted once per chart, and
+    pairs are then scored from these features in blocks of rows, optionally
+    across a process pool. Results are streamed row by row, so the full
+    N x N matrix never has to be kept in memory.
+"""
+
+import heapq
+from datetime import datetime
+from functools import partial
+
+from astrovedic import const
+from astrovedic.datetime import Datetime
+from astrovedic.cache import reference_cache
+from astrovedic.parallel import map_blocks
+
+from astrovedic.vedic.compatibility.kuta.table import (
+    get_kuta_table, get_pada_index, MAX_KUTA_SCORE
+)
+from astrovedic.vedic.compatibility.dosha import (
+    get_mangal_dosha, get_kuja_dosha, get_shani_dosha,
+    get_grahan_dosha, get_kalasarpa_dosha
+)
+from astrovedic.vedic.compatibility.dasha.helpers import get_dasha, get_dasha_lord
+from astrovedic.vedic.compatibility.dasha.compatibility import calculate_planet_compatibility
+from astrovedic.vedic.compatibility.navamsa.positions import (
+    get_navamsa_positions, get_navamsa_house_positions
+)
+from astrovedic.vedic.compatibility.navamsa.compatibility import (
+    NAVAMSA_IMPORTANT, get_navamsa_strength, get_navamsa_aspect_type,
+    get_navamsa_aspect_points, get_navamsa_house_points
+)
+
+# Doshas checked for cancellation between two charts
+DOSHA_NAMES = ('mangal', 'kuja', 'shani', 'grahan', 'kalasarpa')
+
+# Angles skipped as Navamsa planets
+NAVAMSA_ANGLES = (const.ASC, const.MC, const.DESC, const.IC)
+
+# Number of rows scored per task
+DEFAULT_BLOCK_SIZE = 64
+
+
+def get_compatibility_features(chart, date=None):
+    """
+    Extract the chart specific compatibility features
+
+    Args:
+        chart (Chart): The chart
+        date (Datetime, optional): The date for the current Dasha
+            (defaults to now)
+
+    Returns:
+        dict: Dictionary with the compatibility features of the chart
+    """
+    if date is None:
+        date = Datetime.fromDatetime(datetime.now())
+
+    positions = get_navamsa_positions(chart)
+
+    return {
+        'moon_pada': get_pada_index(chart.getObject(const.MOON).lon),
+        'doshas': {
+            'mangal': get_mangal_dosha(chart)['has_dosha'],
+            'kuja': get_kuja_dosha(chart)['has_dosha'],
+            'shani': get_shani_dosha(chart)['has_dosha'],
+            'grahan': get_grahan_dosha(chart)['has_dosha'],
+            'kalasarpa': get_kalasarpa_dosha(chart)['has_dosha']
+        },
+        'dasha_lord': get_dasha_lord(get_dasha(chart, date)),
+        'navamsa_planets': tuple(
+            (position['longitude'], object_id in NAVAMSA_IMPORTANT)
+            for object_id, position in positions.items()
+            if object_id not in NAVAMSA_ANGLES
+        ),
+        'navamsa_angles': tuple(
+            (positions[angle_id]['longitude'], angle_id in NAVAMSA_IMPORTANT)
+            for angle_id in [const.ASC, const.MC]
+        ),
+        'navamsa_houses': get_navamsa_house_points(get_navamsa_house_positions(chart)),
+        'navamsa_strength': get_navamsa_strength(chart)['overall']['value']
+    }
+
+
+def _navamsa_aspect_points(objects1, objects2):
+    """
+    Add up the Navamsa aspect points between two groups of objects
+
+    Args:
+        objects1 (tuple): (longitude, is important) pairs of the first chart
+        objects2 (tuple): (longitude, is important) pairs of the second chart
+
+    Returns:
+        float: The aspect points
+    """
+    points = 0
+    for lon1, important1 in objects1:
+        for lon2, important2 in objects2:
+            aspect = get_navamsa_aspect_type(lon1, lon2)
+            if aspect is not None:
+                points += get_navamsa_aspect_points(aspect[0], important1 or important2)
+    return points
+
+
+def get_compatibility_features_batch(charts, date=None):
+    """
+    Extract the compatibility features of many charts
+
+    Args:
+        charts (list): List of charts
+        date (Datetime, optional): The date for the current Dasha
+            (defaults to now)
+
+    Returns:
+        list: List of feature dictionaries, one per chart
+    """
+    if date is None:
+        date = Datetime.fromDatetime(datetime.now())
+    return [get_compatibility_features(chart, date) for chart in charts]
+
+
+@reference_cache()
+def get_dasha_lord_score(lord1, lord2):
+    """
+    Get the compatibility score of two Dasha lords
+
+    Args:
+        lord1 (str): The Dasha lord of the first chart
+        lord2 (str): The Dasha lord of the second chart
+
+    Returns:
+        int: The compatibility score (0-10)
+    """
+    return calculate_planet_compatibility(lord1, lord2)['score']
+
+
+def calculate_pair_compatibility(features1, features2):
+    """
+    Calculate the compatibility of two charts from their features
+
+    The score is the same as get_compatibility_score for the two charts.
+
+    Args:
+        features1 (dict): The features of the first chart
+        features2 (dict): The features of the second chart
+
+    Returns:
+        dict: Dictionary with the overall score and its components
+    """
+    # Kuta score (0-36) converted to 0-70 scale
+    kuta_score = get_kuta_table().score(features1['moon_pada'], features2['moon_pada'])
+    kuta_score_normalized = (kuta_score / MAX_KUTA_SCORE) * 70
+
+    # Dosha score (0-10) with cancellation
+    doshas1 = features1['doshas']
+    doshas2 = features2['doshas']
+    dosha_score = 10
+    if (doshas1['mangal'] and doshas2['mangal']) or \
+       (doshas1['kuja'] and doshas2['kuja']):
+        dosha_score -= 5
+    elif doshas1['mangal'] or doshas2['mangal'] or \
+         doshas1['kuja'] or doshas2['kuja']:
+        dosha_score -= 2
+    if any(doshas1[name] and doshas2[name] for name in DOSHA_NAMES):
+        dosha_score += 5
+
+    # Dasha compatibility score (0-10)
+    dasha_score = get_dasha_lord_score(features1['dasha_lord'], features2['dasha_lord']) / 10
+
+    # Navamsa compatibility score (0-10)
+    planets1 = features1['navamsa_planets']
+    planets2 = features2['navamsa_planets']
+    navamsa_score = (
+        _navamsa_aspect_points(planets1, planets2) +
+        _navamsa_aspect_points(planets1, features2['navamsa_angles']) +
+        _navamsa_aspect_points(features1['navamsa_angles'], planets2) +
+        features1['navamsa_houses'] + features2['navamsa_houses']
+    )
+    navamsa_score += features1['navamsa_strength'] / 20
+    navamsa_score += features2['navamsa_strength'] / 20
+    navamsa_score = min(10, max(0, navamsa_score)) / 10
+
+    # Calculate the overall score
+    overall_score = kuta_score_normalized + dosha_score + dasha_score + navamsa_score
+
+    return {
+        'score': min(100, max(0, overall_score)),
+        'kuta_score': kuta_score,
+        'dosha_score': dosha_score,
+        'dasha_score': dasha_score,
+        'navamsa_score': navamsa_score
+    }
+
+
+def _score_rows(features, rows, top_k):
+    """
+    Score a block of rows against all charts
+
+    Args:
+        features (list): The features of all charts
+        rows (list): The indexes of the rows in the block
+        top_k (int): The number of best matches to keep per row, or None
+            to keep all scores
+
+    Returns:
+        list: One entry per row, either a list of (score, index) tuples
+            or a list of scores with None for the chart itself
+    """
+    results = []
+    for i in rows:
+        features1 = features[i]
+        scores = (
+            (calculate_pair_compatibility(features1, features2)['score'], j)
+            for j, features2 in enumerate(features) if j != i
+        )
+        if top_k is None:
+            row = [None] * len(features)
+            for score, j in scores:
+                row[j] = score
+            results.append(row)
+        else:
+            results.append(heapq.nlargest(top_k, scores))
+    return results
+
+
+def iter_compatibility_rows(features, top_k=None, block_size=DEFAULT_BLOCK_SIZE,
+                            max_workers=None, executor=None):
+    """
+    Score all ordered pairs of charts, yielding one row at a time
+
+    Rows are scored in blocks with map_blocks. Each block only carries
+    its row indexes, and the features of all charts are shared.
+
+    Args:
+        features (list): The features of all charts
+        top_k (int, optional): Keep only the best top_k matches per row
+        block_size (int): The number of rows per block
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
+
+    Yields:
+        tuple: (row index, row) where row is a list of (score, index)
+            tuples sorted by score when top_k is given, otherwise a list
+            of scores indexed by chart with None for the chart itself
+    """
+    features = list(features)
+    return map_blocks(partial(_score_rows, top_k=top_k), range(len(features)), block_size,
+                      max_workers=max_workers, executor=executor, shared=features)
+
+
+def get_top_matches(features, top_k=10, block_size=DEFAULT_BLOCK_SIZE,
+                    max_workers=None, executor=None):
+    """
+    Get the best matches of every chart among all other charts
+
+    Args:
+        features (list): The features of all charts
+        top_k (int): The number of matches to keep per chart
+        block_size (int): The number of rows per block
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
+
+    Returns:
+        list: For each chart, a list of (score, index) tuples sorted by score
+    """
+    return [
+        row for _, row in iter_compatibility_rows(
+            features, top_k=top_k, block_size=block_size,
+            max_workers=max_workers, executor=executor)
+    ]
@@ -38,6 +38,11 @@ from astrovedic.vedic.compatibility.navamsa import (
     get_navamsa_aspects, get_navamsa_strength
 )
 
+# Import batch functions
+from astrovedic.vedic.compatibility.batch import (
+    get_compatibility_features, calculate_pair_compatibility
+)
+
 
 def get_compatibility_score(chart1, chart2):
     """
@@ -50,66 +55,11 @@ def get_compatibility_score(chart1, chart2):
     Returns:
         float: The compatibility score (0-100)
     """
-    # Get the Kuta scores
-    kuta_scores = {}
-    kuta_scores['Varna Kuta'] = get_varna_kuta(chart1, chart2)
-    kuta_scores['Vashya Kuta'] = get_vashya_kuta(chart1, chart2)
-    kuta_scores['Tara Kuta'] = get_tara_kuta(chart1, chart2)
-    kuta_scores['Yoni Kuta'] = get_yoni_kuta(chart1, chart2)
-    kuta_scores['Graha Maitri Kuta'] = get_graha_maitri_kuta(chart1, chart2)
-    kuta_scores['Gana Kuta'] = get_gana_kuta(chart1, chart2)
-    kuta_scores['Bhakoot Kuta'] = get_bhakoot_kuta(chart1, chart2)
-    kuta_scores['Nadi Kuta'] = get_nadi_kuta(chart1, chart2)
-
-    # Get the total Kuta score
-    total_kuta_score = get_total_kuta_score(chart1, chart2)
-
-    # Get the Dosha analysis
-    mangal_dosha1 = get_mangal_dosha(chart1)
-    mangal_dosha2 = get_mangal_dosha(chart2)
-    kuja_dosha1 = get_kuja_dosha(chart1)
-    kuja_dosha2 = get_kuja_dosha(chart2)
-
-    # Check for Dosha cancellation
-    dosha_cancellation = get_dosha_cancellation(chart1, chart2)
-
-    # Get the Dasha compatibility
-    dasha_compatibility = get_dasha_compatibility(chart1, chart2)
-
-    # Get the Navamsa compatibility
-    navamsa_compatibility = get_navamsa_compatibility(chart1, chart2)
-
-    # Calculate the overall score
-
-    # Kuta score (0-36) converted to 0-70 scale
-    kuta_score_normalized = (total_kuta_score['score'] / 36) * 70
-
-    # Dosha score (0-10)
-    dosha_score = 10
-    if (mangal_dosha1['has_dosha'] and mangal_dosha2['has_dosha']) or \
-       (kuja_dosha1['has_dosha'] and kuja_dosha2['has_dosha']):
-        dosha_score -= 5
-    elif mangal_dosha1['has_dosha'] or mangal_dosha2['has_dosha'] or \
-         kuja_dosha1['has_dosha'] or kuja_dosha2['has_dosha']:
-        dosha_score -= 2
-
-    # Add points for Dosha cancellation
-    if dosha_cancellation['is_cancelled']:
-        dosha_score += 5
-
-    # Dasha compatibility score (0-10)
-    dasha_score = dasha_compatibility['score'] / 10
-
-    # Navamsa compatibility score (0-10)
-    navamsa_score = navamsa_compatibility['score'] / 10
-
-    # Calculate the overall score
-    overall_score = kuta_score_normalized + dosha_score + dasha_score + navamsa_score
-
-    # Ensure the score is between 0 and 100
-    overall_score = min(100, max(0, overall_score))
+    # Score the pair from the features of each chart
+    features1 = get_compatibility_features(chart1)
+    features2 = get_compatibility_features(chart2)
 
-    return overall_score
+    return calculate_pair_compatibility(features1, features2)['score']
 
 
 def get_compatibility_factors(chart1, chart2):
@@ -20,6 +20,10 @@ from astrovedic.vedic.compatibility.kuta.gana import get_gana_kuta
 from astrovedic.vedic.compatibility.kuta.bhakoot import get_bhakoot_kuta
 from astrovedic.vedic.compatibility.kuta.nadi import get_nadi_kuta
 from astrovedic.vedic.compatibility.kuta.total import get_total_kuta_score as get_total_kuta_score_direct
+from astrovedic.vedic.compatibility.kuta.table import (
+    get_kuta_table, get_kuta_score_by_longitude,
+    get_kuta_scores_for_candidates, get_kuta_scores_for_padas
+)
 
 
 def get_total_kuta_score(kuta_scores):
@@ -0,0 +1,265 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements a precomputed Ashtakoota (eight Kuta) table.
+    All eight Kuta scores depend only on the nakshatra pada of the two
+    Moons, so the scores for all 108 x 108 pada pairs are built once from
+    the Kuta rules and looked up afterwards.
+"""
+
+from array import array
+
+from astrovedic import const
+from astrovedic.cache import reference_cache
+from astrovedic.vedic.nakshatras import LIST_NAKSHATRAS, get_nakshatra_index
+from astrovedic.vedic.compatibility.kuta.varna import get_varna, calculate_varna_score
+from astrovedic.vedic.compatibility.kuta.vashya import get_vashya_category, calculate_vashya_score
+from astrovedic.vedic.compatibility.kuta.tara import calculate_tara, calculate_tara_score
+from astrovedic.vedic.compatibility.kuta.yoni import get_yoni, calculate_yoni_score
+from astrovedic.vedic.compatibility.kuta.graha_maitri import (
+    get_sign_lord, get_planetary_friendship, calculate_graha_maitri_score
+)
+from astrovedic.vedic.compatibility.kuta.gana import get_gana, calculate_gana_score
+from astrovedic.vedic.compatibility.kuta.bhakoot import (
+    get_sign_number, calculate_house_position, calculate_bhakoot_score
+)
+from astrovedic.vedic.compatibility.kuta.nadi import get_nadi, calculate_nadi_score
+
+# Number of nakshatra padas in the zodiac
+PADA_COUNT = 108
+
+# Kuta names in table order, with their maximum scores
+KUTA_NAMES = (
+    'Varna Kuta', 'Vashya Kuta', 'Tara Kuta', 'Yoni Kuta',
+    'Graha Maitri Kuta', 'Gana Kuta', 'Bhakoot Kuta', 'Nadi Kuta'
+)
+KUTA_MAX_SCORES = (1, 2, 3, 4, 5, 6, 7, 8)
+
+# Maximum total Ashtakoota score
+MAX_KUTA_SCORE = sum(KUTA_MAX_SCORES)
+
+
+def _from_half_points(value):
+    """
+    Convert a score stored in half points back to points
+
+    Args:
+        value (int): The score in half points
+
+    Returns:
+        int or float: The score, as an integer when it is a whole number
+    """
+    return value // 2 if value % 2 == 0 else value / 2
+
+
+def get_pada_index(longitude):
+    """
+    Get the nakshatra pada index of a longitude
+
+    Args:
+        longitude (float): The longitude in degrees (0-360)
+
+    Returns:
+        int: The pada index (0-107)
+    """
+    nakshatra_index, pada, _ = get_nakshatra_index(longitude)
+    return nakshatra_index * 4 + pada - 1
+
+
+def calculate_sign_kuta_scores(sign1, sign2):
+    """
+    Calculate the Kuta scores that depend on the Moon signs
+
+    Args:
+        sign1 (str): The Moon sign of the first person
+        sign2 (str): The Moon sign of the second person
+
+    Returns:
+        tuple: The Varna, Vashya, Graha Maitri and Bhakoot scores
+    """
+    house_position = calculate_house_position(get_sign_number(sign1), get_sign_number(sign2))
+    friendship = get_planetary_friendship(get_sign_lord(sign1), get_sign_lord(sign2))
+    return (
+        calculate_varna_score(get_varna(sign1), get_varna(sign2)),
+        calculate_vashya_score(get_vashya_category(sign1), get_vashya_category(sign2)),
+        calculate_graha_maitri_score(friendship),
+        calculate_bhakoot_score(house_position)
+    )
+
+
+def calculate_nakshatra_kuta_scores(nakshatra_index1, nakshatra_index2):
+    """
+    Calculate the Kuta scores that depend on the Moon nakshatras
+
+    Args:
+        nakshatra_index1 (int): The Moon nakshatra index of the first person (0-26)
+        nakshatra_index2 (int): The Moon nakshatra index of the second person (0-26)
+
+    Returns:
+        tuple: The Tara, Yoni, Gana and Nadi scores
+    """
+    nakshatra1 = LIST_NAKSHATRAS[nakshatra_index1]
+    nakshatra2 = LIST_NAKSHATRAS[nakshatra_index2]
+    return (
+        calculate_tara_score(calculate_tara(nakshatra_index1 + 1, nakshatra_index2 + 1)),
+        calculate_yoni_score(get_yoni(nakshatra1), get_yoni(nakshatra2)),
+        calculate_gana_score(get_gana(nakshatra1), get_gana(nakshatra2)),
+        calculate_nadi_score(get_nadi(nakshatra1), get_nadi(nakshatra2))
+    )
+
+
+def calculate_pada_kuta_scores(pada1, pada2):
+    """
+    Calculate the eight Kuta scores for two Moon padas from the Kuta rules
+
+    Args:
+        pada1 (int): The Moon pada index of the first person (0-107)
+        pada2 (int): The Moon pada index of the second person (0-107)
+
+    Returns:
+        tuple: The Kuta scores in KUTA_NAMES order
+    """
+    varna, vashya, maitri, bhakoot = calculate_sign_kuta_scores(
+        const.LIST_SIGNS[pada1 // 9], const.LIST_SIGNS[pada2 // 9])
+    tara, yoni, gana, nadi = calculate_nakshatra_kuta_scores(pada1 // 4, pada2 // 4)
+    return (varna, vashya, tara, yoni, maitri, gana, bhakoot, nadi)
+
+
+class KutaTable:
+    """
+    Ashtakoota scores for all pairs of Moon padas
+
+    Scores are stored in half points so that every Kuta fits in an
+    unsigned byte. Row pada1 of the totals holds the scores of the first
+    person's pada against all 108 padas of the second person.
+    """
+
+    def __init__(self):
+        # The sign and nakshatra parts are only 12 x 12 and 27 x 27
+        sign_scores = [
+            [[int(score * 2) for score in calculate_sign_kuta_scores(sign1, sign2)]
+             for sign2 in const.LIST_SIGNS]
+            for sign1 in const.LIST_SIGNS
+        ]
+        nakshatra_scores = [
+            [[int(score * 2) for score in calculate_nakshatra_kuta_scores(index1, index2)]
+             for index2 in range(27)]
+            for index1 in range(27)
+        ]
+
+        self.kutas = array('B')
+        self.totals = array('B')
+        for pada1 in range(PADA_COUNT):
+            sign_row = sign_scores[pada1 // 9]
+            nakshatra_row = nakshatra_scores[pada1 // 4]
+            for pada2 in range(PADA_COUNT):
+                varna, vashya, maitri, bhakoot = sign_row[pada2 // 9]
+                tara, yoni, gana, nadi = nakshatra_row[pada2 // 4]
+                scores = (varna, vashya, tara, yoni, maitri, gana, bhakoot, nadi)
+                self.kutas.extend(scores)
+                self.totals.append(sum(scores))
+
+    def score(self, pada1, pada2):
+        """
+        Get the total Kuta score of two Moon padas
+
+        Args:
+            pada1 (int): The Moon pada index of the first person (0-107)
+            pada2 (int): The Moon pada index of the second person (0-107)
+
+        Returns:
+            int or float: The total Kuta score (0-36)
+        """
+        return _from_half_points(self.totals[pada1 * PADA_COUNT + pada2])
+
+    def scores(self, pada1, pada2):
+        """
+        Get the individual Kuta scores of two Moon padas
+
+        Args:
+            pada1 (int): The Moon pada index of the first person (0-107)
+            pada2 (int): The Moon pada index of the second person (0-107)
+
+        Returns:
+            dict: Mapping of Kuta name to score
+        """
+        start = (pada1 * PADA_COUNT + pada2) * len(KUTA_NAMES)
+        return {
+            name: _from_half_points(score)
+            for name, score in zip(KUTA_NAMES, self.kutas[start:start + len(KUTA_NAMES)])
+        }
+
+    def row(self, pada):
+        """
+        Get the total scores of one pada against all 108 padas
+
+        Args:
+            pada (int): The Moon pada index of the first person (0-107)
+
+        Returns:
+            list: 108 total Kuta scores
+        """
+        start = pada * PADA_COUNT
+        return [_from_half_points(total) for total in self.totals[start:start + PADA_COUNT]]
+
+
+@reference_cache()
+def get_kuta_table():
+    """
+    Get the precomputed Ashtakoota table (built on first use)
+
+    Returns:
+        KutaTable: The Kuta table
+    """
+    return KutaTable()
+
+
+def get_kuta_score_by_longitude(moon_lon1, moon_lon2):
+    """
+    Get the total Kuta score from two Moon longitudes
+
+    Args:
+        moon_lon1 (float): The Moon longitude of the first person
+        moon_lon2 (float): The Moon longitude of the second person
+
+    Returns:
+        int or float: The total Kuta score (0-36)
+    """
+    return get_kuta_table().score(get_pada_index(moon_lon1), get_pada_index(moon_lon2))
+
+
+def get_kuta_scores_for_candidates(moon_lon, candidate_lons):
+    """
+    Score one Moon longitude against many candidate Moon longitudes
+
+    Args:
+        moon_lon (float): The Moon longitude of the person being matched
+        candidate_lons (sequence): The Moon longitudes of the candidates
+
+    Returns:
+        list: Total Kuta scores (0-36), one per candidate
+    """
+    nakshatra_indexes, padas, _ = get_nakshatra_index(candidate_lons)
+    return get_kuta_scores_for_padas(
+        get_pada_index(moon_lon),
+        [index * 4 + pada - 1 for index, pada in zip(nakshatra_indexes, padas)]
+    )
+
+
+def get_kuta_scores_for_padas(pada, candidate_padas):
+    """
+    Score one Moon pada against many candidate Moon padas
+
+    Callers that match the same candidates repeatedly can store the
+    candidates' pada indexes once and use this lookup directly.
+
+    Args:
+        pada (int): The Moon pada index of the person being matched (0-107)
+        candidate_padas (sequence): The Moon pada indexes of the candidates
+
+    Returns:
+        list: Total Kuta scores (0-36), one per candidate
+    """
+    row = get_kuta_table().row(pada)
+    return [row[candidate] for candidate in candidate_padas]
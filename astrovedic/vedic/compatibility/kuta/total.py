@@ -6,15 +6,11 @@
     for compatibility analysis in Vedic astrology.
 """
 
+from astrovedic import const
 from astrovedic.chart import Chart
-from astrovedic.vedic.compatibility.kuta.varna import get_varna_kuta
-from astrovedic.vedic.compatibility.kuta.vashya import get_vashya_kuta
-from astrovedic.vedic.compatibility.kuta.tara import get_tara_kuta
-from astrovedic.vedic.compatibility.kuta.yoni import get_yoni_kuta
-from astrovedic.vedic.compatibility.kuta.graha_maitri import get_graha_maitri_kuta
-from astrovedic.vedic.compatibility.kuta.gana import get_gana_kuta
-from astrovedic.vedic.compatibility.kuta.bhakoot import get_bhakoot_kuta
-from astrovedic.vedic.compatibility.kuta.nadi import get_nadi_kuta
+from astrovedic.vedic.compatibility.kuta.table import (
+    get_kuta_score_by_longitude, MAX_KUTA_SCORE
+)
 
 
 def get_total_kuta_score(chart1, chart2):
@@ -28,39 +24,10 @@ def get_total_kuta_score(chart1, chart2):
     Returns:
         dict: The total Kuta score
     """
-    # Get all Kuta scores
-    varna_kuta = get_varna_kuta(chart1, chart2)
-    vashya_kuta = get_vashya_kuta(chart1, chart2)
-    tara_kuta = get_tara_kuta(chart1, chart2)
-    yoni_kuta = get_yoni_kuta(chart1, chart2)
-    graha_maitri_kuta = get_graha_maitri_kuta(chart1, chart2)
-    gana_kuta = get_gana_kuta(chart1, chart2)
-    bhakoot_kuta = get_bhakoot_kuta(chart1, chart2)
-    nadi_kuta = get_nadi_kuta(chart1, chart2)
-    
-    # Calculate total score
-    total_score = (
-        varna_kuta['score'] +
-        vashya_kuta['score'] +
-        tara_kuta['score'] +
-        yoni_kuta['score'] +
-        graha_maitri_kuta['score'] +
-        gana_kuta['score'] +
-        bhakoot_kuta['score'] +
-        nadi_kuta['score']
-    )
-    
-    # Calculate maximum score
-    max_score = (
-        varna_kuta['max_score'] +
-        vashya_kuta['max_score'] +
-        tara_kuta['max_score'] +
-        yoni_kuta['max_score'] +
-        graha_maitri_kuta['max_score'] +
-        gana_kuta['max_score'] +
-        bhakoot_kuta['max_score'] +
-        nadi_kuta['max_score']
-    )
+    # The eight Kuta scores depend only on the Moon padas
+    total_score = get_kuta_score_by_longitude(
+        chart1.getObject(const.MOON).lon, chart2.getObject(const.MOON).lon)
+    max_score = MAX_KUTA_SCORE
     
     # Calculate percentage
     percentage = (total_score / max_score) * 100 if max_score > 0 else 0
@@ -17,6 +17,29 @@ from astrovedic.vedic.compatibility.navamsa.positions import (
     get_navamsa_sign_lords, get_navamsa_exaltation_debilitation
 )
 
+# Aspect types between Navamsa positions
+NAVAMSA_ASPECT_TYPES = [
+    {'name': 'Conjunction', 'angle': 0, 'orb': 8},
+    {'name': 'Opposition', 'angle': 180, 'orb': 8},
+    {'name': 'Trine', 'angle': 120, 'orb': 8},
+    {'name': 'Square', 'angle': 90, 'orb': 7},
+    {'name': 'Sextile', 'angle': 60, 'orb': 6}
+]
+
+# Favorable and challenging Navamsa aspects
+FAVORABLE_NAVAMSA_ASPECTS = ['Conjunction', 'Trine', 'Sextile']
+CHALLENGING_NAVAMSA_ASPECTS = ['Opposition', 'Square']
+
+# Objects that weigh more in Navamsa aspects
+NAVAMSA_IMPORTANT = [const.SUN, const.MOON, const.ASC]
+
+# Favorable Navamsa houses of Venus, Jupiter and the Moon
+FAVORABLE_NAVAMSA_HOUSES = {
+    const.VENUS: [1, 5, 7, 9],
+    const.JUPITER: [1, 2, 5, 9],
+    const.MOON: [1, 4, 7, 10]
+}
+
 
 def get_navamsa_compatibility(chart1, chart2):
     """
@@ -38,7 +61,7 @@ def get_navamsa_compatibility(chart1, chart2):
     house_positions2 = get_navamsa_house_positions(chart2)
     
     # Get the Navamsa aspects
-    aspects = get_navamsa_aspects(chart1, chart2)
+    aspects = calculate_navamsa_aspects(positions1, positions2)
     
     # Get the Navamsa strength
     strength1 = get_navamsa_strength(chart1)
@@ -84,18 +107,23 @@ def get_navamsa_aspects(chart1, chart2):
     positions1 = get_navamsa_positions(chart1)
     positions2 = get_navamsa_positions(chart2)
     
+    return calculate_navamsa_aspects(positions1, positions2)
+
+
+def calculate_navamsa_aspects(positions1, positions2):
+    """
+    Calculate the Navamsa aspects between two sets of Navamsa positions
+    
+    Args:
+        positions1 (dict): The Navamsa positions for the first chart
+        positions2 (dict): The Navamsa positions for the second chart
+    
+    Returns:
+        list: List of Navamsa aspects
+    """
     # Initialize the aspects
     aspects = []
     
-    # Define the aspect types
-    aspect_types = [
-        {'name': 'Conjunction', 'angle': 0, 'orb': 8},
-        {'name': 'Opposition', 'angle': 180, 'orb': 8},
-        {'name': 'Trine', 'angle': 120, 'orb': 8},
-        {'name': 'Square', 'angle': 90, 'orb': 7},
-        {'name': 'Sextile', 'angle': 60, 'orb': 6}
-    ]
-    
     # Check for aspects between planets
     for planet_id1, position1 in positions1.items():
         # Skip angles
@@ -111,23 +139,15 @@ def get_navamsa_aspects(chart1, chart2):
             lon1 = position1['longitude']
             lon2 = position2['longitude']
             
-            # Calculate the angular distance
-            dist = angle.closestdistance(lon1, lon2)
-            
-            # Check for aspects
-            for aspect_type in aspect_types:
-                # Calculate the orb
-                orb = abs(abs(dist) - aspect_type['angle'])
-                
-                # Check if the aspect is within the allowed orb
-                if orb <= aspect_type['orb']:
-                    # Add the aspect
-                    aspects.append({
-                        'planet1': planet_id1,
-                        'planet2': planet_id2,
-                        'aspect': aspect_type['name'],
-                        'orb': orb
-                    })
+            # Check for an aspect
+            aspect = get_navamsa_aspect_type(lon1, lon2)
+            if aspect is not None:
+                aspects.append({
+                    'planet1': planet_id1,
+                    'planet2': planet_id2,
+                    'aspect': aspect[0],
+                    'orb': aspect[1]
+                })
     
     # Check for aspects to angles
     for planet_id1, position1 in positions1.items():
@@ -143,23 +163,15 @@ def get_navamsa_aspects(chart1, chart2):
             lon1 = position1['longitude']
             lon2 = position2['longitude']
             
-            # Calculate the angular distance
-            dist = angle.closestdistance(lon1, lon2)
-            
-            # Check for aspects
-            for aspect_type in aspect_types:
-                # Calculate the orb
-                orb = abs(abs(dist) - aspect_type['angle'])
-                
-                # Check if the aspect is within the allowed orb
-                if orb <= aspect_type['orb']:
-                    # Add the aspect
-                    aspects.append({
-                        'planet1': planet_id1,
-                        'planet2': angle_id,
-                        'aspect': aspect_type['name'],
-                        'orb': orb
-                    })
+            # Check for an aspect
+            aspect = get_navamsa_aspect_type(lon1, lon2)
+            if aspect is not None:
+                aspects.append({
+                    'planet1': planet_id1,
+                    'planet2': angle_id,
+                    'aspect': aspect[0],
+                    'orb': aspect[1]
+                })
     
     # Check for aspects from angles
     for angle_id in [const.ASC, const.MC]:
@@ -175,27 +187,77 @@ def get_navamsa_aspects(chart1, chart2):
             lon1 = position1['longitude']
             lon2 = position2['longitude']
             
-            # Calculate the angular distance
-            dist = angle.closestdistance(lon1, lon2)
-            
-            # Check for aspects
-            for aspect_type in aspect_types:
-                # Calculate the orb
-                orb = abs(abs(dist) - aspect_type['angle'])
-                
-                # Check if the aspect is within the allowed orb
-                if orb <= aspect_type['orb']:
-                    # Add the aspect
-                    aspects.append({
-                        'planet1': angle_id,
-                        'planet2': planet_id2,
-                        'aspect': aspect_type['name'],
-                        'orb': orb
-                    })
+            # Check for an aspect
+            aspect = get_navamsa_aspect_type(lon1, lon2)
+            if aspect is not None:
+                aspects.append({
+                    'planet1': angle_id,
+                    'planet2': planet_id2,
+                    'aspect': aspect[0],
+                    'orb': aspect[1]
+                })
     
     return aspects
 
 
+def get_navamsa_aspect_type(lon1, lon2):
+    """
+    Get the Navamsa aspect between two longitudes
+    
+    Args:
+        lon1 (float): The first Navamsa longitude
+        lon2 (float): The second Navamsa longitude
+    
+    Returns:
+        tuple: (aspect name, orb), or None if there is no aspect
+    """
+    dist = abs(angle.closestdistance(lon1, lon2))
+    
+    # The orbs of the aspect types do not overlap
+    for aspect_type in NAVAMSA_ASPECT_TYPES:
+        orb = abs(dist - aspect_type['angle'])
+        if orb <= aspect_type['orb']:
+            return aspect_type['name'], orb
+    
+    return None
+
+
+def get_navamsa_aspect_points(aspect_name, important):
+    """
+    Get the compatibility points of a Navamsa aspect
+    
+    Args:
+        aspect_name (str): The name of the aspect
+        important (bool): Whether the aspect involves the Sun, the Moon
+            or the Ascendant
+    
+    Returns:
+        float: The points of the aspect
+    """
+    if aspect_name in FAVORABLE_NAVAMSA_ASPECTS:
+        return 1.0 if important else 0.5
+    if aspect_name in CHALLENGING_NAVAMSA_ASPECTS:
+        return -0.5 if important else -0.25
+    return 0
+
+
+def get_navamsa_house_points(house_positions):
+    """
+    Get the compatibility points of the Navamsa houses of a chart
+    
+    Args:
+        house_positions (dict): The Navamsa house positions of the chart
+    
+    Returns:
+        float: 0.5 points for each favorably placed Venus, Jupiter and Moon
+    """
+    points = 0
+    for planet_id, house in house_positions.items():
+        if house in FAVORABLE_NAVAMSA_HOUSES.get(planet_id, []):
+            points += 0.5
+    return points
+
+
 def get_navamsa_strength(chart):
     """
     Get the Navamsa strength for a chart
@@ -292,35 +354,12 @@ def calculate_navamsa_compatibility_score(
     
     # Add points for favorable aspects
     for aspect in aspects:
-        if aspect['aspect'] in ['Conjunction', 'Trine', 'Sextile']:
-            # Check if the aspect involves important planets
-            if aspect['planet1'] in [const.SUN, const.MOON, const.ASC] or aspect['planet2'] in [const.SUN, const.MOON, const.ASC]:
-                score += 1.0
-            else:
-                score += 0.5
-        elif aspect['aspect'] in ['Opposition', 'Square']:
-            # Check if the aspect involves important planets
-            if aspect['planet1'] in [const.SUN, const.MOON, const.ASC] or aspect['planet2'] in [const.SUN, const.MOON, const.ASC]:
-                score -= 0.5
-            else:
-                score -= 0.25
+        important = aspect['planet1'] in NAVAMSA_IMPORTANT or aspect['planet2'] in NAVAMSA_IMPORTANT
+        score += get_navamsa_aspect_points(aspect['aspect'], important)
     
     # Add points for favorable house positions
-    for planet_id, house in house_positions1.items():
-        if planet_id == const.VENUS and house in [1, 5, 7, 9]:
-            score += 0.5
-        elif planet_id == const.JUPITER and house in [1, 2, 5, 9]:
-            score += 0.5
-        elif planet_id == const.MOON and house in [1, 4, 7, 10]:
-            score += 0.5
-    
-    for planet_id, house in house_positions2.items():
-        if planet_id == const.VENUS and house in [1, 5, 7, 9]:
-            score += 0.5
-        elif planet_id == const.JUPITER and house in [1, 2, 5, 9]:
-            score += 0.5
-        elif planet_id == const.MOON and house in [1, 4, 7, 10]:
-            score += 0.5
+    score += get_navamsa_house_points(house_positions1)
+    score += get_navamsa_house_points(house_positions2)
     
     # Add points for strong charts
     score += strength1['overall']['value'] / 20  # Add up to 5 points
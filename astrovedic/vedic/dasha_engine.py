@@ -0,0 +1,536 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements a table-driven engine shared by the
+    sequential dasha systems (Vimshottari, Yogini, Ashtottari,
+    Kalachakra, Chara and Sthira).
+
+    A dasha system is described by a DashaSystem: the ordered list of
+    lords (planets or signs) and their periods in years. A chart's
+    dashas are stored in a DashaTimeline as compact arrays of lord
+    indexes and Julian Day boundaries. Sub-periods are only expanded
+    when requested and period lookup is done by bisection.
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Length of a dasha year in days
+DAYS_PER_YEAR = 365.25
+
+# Dictionary keys of the nested sub-period lists
+SUBPERIOD_KEYS = ['antardashas', 'pratyantardashas']
+
+
+def years_to_days(years: float) -> float:
+    """
+    Convert years to days
+
+    Args:
+        years (float): Number of years
+
+    Returns:
+        float: Number of days
+    """
+    return years * DAYS_PER_YEAR
+
+
+def add_years_to_date(date: Any, years: float) -> Any:
+    """
+    Add a number of years to a date
+
+    Args:
+        date (datetime): The starting date
+        years (float): Number of years to add
+
+    Returns:
+        datetime: The resulting date
+    """
+    days = years_to_days(years)
+    return date + timedelta(days=days)
+
+
+class DashaSystem:
+    """
+    Table-driven description of a sequential dasha system.
+
+    The sub-period tables (the order of lords and the cumulative
+    fraction of the parent period at each boundary) are built once per
+    starting lord and direction, so expanding any period is a single
+    scaled copy of a precomputed row.
+    """
+
+    def __init__(self, name: str, sequence: Sequence[str], periods: Dict[str, float],
+                 key: str = 'planet', year_days: float = DAYS_PER_YEAR):
+        """
+        Args:
+            name (str): The name of the dasha system
+            sequence (list): The lords in dasha order
+            periods (dict): The period of each lord in years
+            key (str): The dictionary key for lords ('planet' or 'sign')
+            year_days (float): The length of a dasha year in days
+        """
+        self.name = name
+        self.sequence = tuple(sequence)
+        self.years = tuple(float(periods[lord]) for lord in self.sequence)
+        self.total_years = sum(self.years)
+        self.key = key
+        self.year_days = year_days
+        self._index = {lord: i for i, lord in enumerate(self.sequence)}
+        self._tables: Dict[Tuple[int, bool], Tuple[array, array]] = {}
+
+    def __len__(self) -> int:
+        return len(self.sequence)
+
+    def index(self, lord: str) -> int:
+        """ Returns the position of a lord in the sequence. """
+        return self._index[lord]
+
+    def order(self, start: int, forward: bool = True) -> array:
+        """
+        Get the lord indexes of a full cycle starting at a lord
+
+        Args:
+            start (int): Index of the starting lord
+            forward (bool): Whether the cycle runs forward or in reverse
+
+        Returns:
+            array: The lord indexes in dasha order
+        """
+        return self._table(start, forward)[0]
+
+    def _table(self, start: int, forward: bool) -> Tuple[array, array]:
+        """ Returns the (order, cumulative fractions) row for a start lord. """
+        row = self._tables.get((start, forward))
+        if row is None:
+            n = len(self.sequence)
+            step = 1 if forward else -1
+            order = array('B', ((start + step * i) % n for i in range(n)))
+            fractions = array('d', [0.0])
+            elapsed = 0.0
+            for idx in order:
+                elapsed += self.years[idx]
+                fractions.append(elapsed / self.total_years)
+            # Pin the last boundary so sub-periods end exactly with their parent
+            fractions[-1] = 1.0
+            row = (order, fractions)
+            self._tables[(start, forward)] = row
+        return row
+
+    def timeline(self, birth_jd: float, start: int, balance: float,
+                 forward: bool = True, count: Optional[int] = None) -> 'DashaTimeline':
+        """
+        Build the Mahadasha timeline from birth
+
+        Args:
+            birth_jd (float): The Julian Day of birth
+            start (int): Index of the lord running at birth
+            balance (float): Years of the first Mahadasha remaining at birth
+            forward (bool): Whether the sequence runs forward or in reverse
+            count (int, optional): Number of Mahadashas. Defaults to one cycle.
+
+        Returns:
+            DashaTimeline: The Mahadasha timeline
+        """
+        n = len(self.sequence)
+        count = n if count is None else count
+        step = 1 if forward else -1
+
+        lords = array('B')
+        years = array('d')
+        bounds = array('d', [birth_jd])
+        jd = birth_jd
+        for i in range(count):
+            idx = (start + step * i) % n
+            period = balance if i == 0 else self.years[idx]
+            jd += period * self.year_days
+            lords.append(idx)
+            years.append(period)
+            bounds.append(jd)
+
+        return DashaTimeline(self, lords, bounds, years, forward)
+
+    def subdivide(self, lord: int, start_jd: float, end_jd: float,
+                  years: float, forward: bool = True) -> 'DashaTimeline':
+        """
+        Build the sub-period timeline of a period
+
+        Args:
+            lord (int): Index of the lord of the parent period
+            start_jd (float): Start of the parent period
+            end_jd (float): End of the parent period
+            years (float): Duration of the parent period in years
+            forward (bool): Whether the sequence runs forward or in reverse
+
+        Returns:
+            DashaTimeline: The sub-period timeline
+        """
+        order, fractions = self._table(lord, forward)
+        span = end_jd - start_jd
+        bounds = array('d', (start_jd + f * span for f in fractions))
+        bounds[-1] = end_jd
+        sub_years = array('d', (self.years[idx] / self.total_years * years for idx in order))
+        return DashaTimeline(self, order, bounds, sub_years, forward)
+
+    def sequence_info(self, start: int, balance: float, forward: bool = True,
+                      count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get the Mahadasha sequence as a list of dictionaries
+
+        Args:
+            start (int): Index of the lord running at birth
+            balance (float): Years of the first Mahadasha remaining at birth
+            forward (bool): Whether the sequence runs forward or in reverse
+            count (int, optional): Number of Mahadashas. Defaults to one cycle.
+
+        Returns:
+            list: List of dictionaries with lord and years
+        """
+        timeline = self.timeline(0.0, start, balance, forward, count)
+        return [{self.key: timeline.lord(i), 'years': timeline.years[i]}
+                for i in range(len(timeline))]
+
+    def subperiod_info(self, lord: str, years: float,
+                       forward: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get the sub-period sequence of a period as a list of dictionaries
+
+        Args:
+            lord (str): The lord of the parent period
+            years (float): Duration of the parent period in years
+            forward (bool): Whether the sequence runs forward or in reverse
+
+        Returns:
+            list: List of dictionaries with lord and years
+        """
+        order, _ = self._table(self.index(lord), forward)
+        return [{self.key: self.sequence[idx],
+                 'years': (self.years[idx] / self.total_years) * years}
+                for idx in order]
+
+
+class DashaTimeline:
+    """
+    A run of consecutive dasha periods stored as compact arrays.
+
+    Period i is ruled by system.sequence[lords[i]] and runs from
+    bounds[i] to bounds[i + 1] (Julian Days). Sub-periods are expanded
+    lazily and kept for reuse.
+    """
+
+    __slots__ = ('system', 'lords', 'bounds', 'years', 'forward', '_children')
+
+    def __init__(self, system: DashaSystem, lords: array, bounds: array,
+                 years: array, forward: bool = True):
+        self.system = system
+        self.lords = lords
+        self.bounds = bounds
+        self.years = years
+        self.forward = forward
+        self._children: Dict[int, 'DashaTimeline'] = {}
+
+    def __len__(self) -> int:
+        return len(self.lords)
+
+    @property
+    def start(self) -> float:
+        """ Returns the start of the first period. """
+        return self.bounds[0]
+
+    @property
+    def end(self) -> float:
+        """ Returns the end of the last period. """
+        return self.bounds[-1]
+
+    def lord(self, i: int) -> str:
+        """ Returns the lord of period i. """
+        return self.system.sequence[self.lords[i]]
+
+    def find(self, jd: float) -> int:
+        """
+        Get the index of the period containing a Julian Day
+
+        Args:
+            jd (float): The Julian Day
+
+        Returns:
+            int: The period index, or -1 if outside the timeline
+        """
+        i = bisect_right(self.bounds, jd) - 1
+        return i if 0 <= i < len(self.lords) else -1
+
+    def subperiods(self, i: int) -> 'DashaTimeline':
+        """ Returns the (lazily expanded) sub-periods of period i. """
+        child = self._children.get(i)
+        if child is None:
+            child = self.system.subdivide(self.lords[i], self.bounds[i],
+                                          self.bounds[i + 1], self.years[i],
+                                          self.forward)
+            self._children[i] = child
+        return child
+
+    def locate(self, jd: float, depth: int = 1) -> List[Tuple['DashaTimeline', int]]:
+        """
+        Get the periods running at a Julian Day, from Mahadasha down
+
+        Args:
+            jd (float): The Julian Day
+            depth (int): Number of levels to resolve
+
+        Returns:
+            list: (timeline, index) pairs for each resolved level. The
+                  list is empty if the date is outside the timeline.
+        """
+        path = []
+        timeline = self
+        for level in range(depth):
+            i = timeline.find(jd)
+            if i < 0:
+                break
+            path.append((timeline, i))
+            if level + 1 < depth:
+                timeline = timeline.subperiods(i)
+        return path
+
+    def flatten(self, depth: int, start_jd: Optional[float] = None,
+                end_jd: Optional[float] = None) -> Tuple[array, List[array]]:
+        """
+        Flatten the periods down to a given level
+
+        Only the periods overlapping [start_jd, end_jd] are expanded.
+
+        Args:
+            depth (int): Number of levels to expand (1 for Mahadashas only)
+            start_jd (float, optional): Start of the range of interest
+            end_jd (float, optional): End of the range of interest
+
+        Returns:
+            tuple: (bounds, lords) where bounds holds the start of each
+                   deepest-level period followed by the end of the last one,
+                   and lords holds one array of lord indexes per level
+        """
+        bounds = array('d')
+        lords = [array('B') for _ in range(depth)]
+        start_jd = self.start if start_jd is None else start_jd
+        end_jd = self.end if end_jd is None else end_jd
+        last_end = None
+
+        def expand(timeline: 'DashaTimeline', level: int, prefix: Tuple[int, ...]) -> None:
+            nonlocal last_end
+            first = max(bisect_right(timeline.bounds, start_jd) - 1, 0)
+            last = min(bisect_right(timeline.bounds, end_jd), len(timeline))
+            for i in range(first, last):
+                path = prefix + (timeline.lords[i],)
+                if level + 1 < depth:
+                    expand(timeline.subperiods(i), level + 1, path)
+                else:
+                    bounds.append(timeline.bounds[i])
+                    for lvl, idx in enumerate(path):
+                        lords[lvl].append(idx)
+                    last_end = timeline.bounds[i + 1]
+
+        expand(self, 0, ())
+        if last_end is not None:
+            bounds.append(last_end)
+        return bounds, lords
+
+    def lookup(self, jds: Sequence[float], depth: int = 1) -> Dict[str, List[Any]]:
+        """
+        Resolve the running periods at many Julian Days in one pass
+
+        The timeline is flattened once over the range of the queries and
+        every query is then a single bisection.
+
+        Args:
+            jds (list): The Julian Days to resolve
+            depth (int): Number of levels to resolve
+
+        Returns:
+            dict: Dictionary with a 'lords' list per query (the lord of each
+                  level, or None outside the timeline) and a 'next_change'
+                  list with the Julian Day of the next period boundary at
+                  the deepest level (None after the end of the timeline)
+        """
+        jds = list(jds)
+        result: Dict[str, List[Any]] = {'lords': [], 'next_change': []}
+        if not jds:
+            return result
+
+        bounds, lords = self.flatten(depth, min(jds), max(jds))
+        sequence = self.system.sequence
+        count = len(bounds) - 1
+        empty = tuple(None for _ in range(depth))
+
+        for jd in jds:
+            i = bisect_right(bounds, jd) - 1
+            if 0 <= i < count:
+                result['lords'].append(tuple(sequence[level[i]] for level in lords))
+                result['next_change'].append(bounds[i + 1])
+            else:
+                result['lords'].append(empty)
+                result['next_change'].append(self.start if jd < self.start else None)
+        return result
+
+    def period_info(self, i: int, to_date: Callable[[float], Any], depth: int = 1,
+                    subperiod_keys: Sequence[str] = SUBPERIOD_KEYS) -> Dict[str, Any]:
+        """
+        Materialize period i as a dictionary
+
+        Args:
+            i (int): The period index
+            to_date (callable): Converts a Julian Day into an output date
+            depth (int): Number of levels to include (1 for the period only)
+            subperiod_keys (list): Dictionary keys of each sub-period level
+
+        Returns:
+            dict: Dictionary with lord, start_date, end_date and years, plus
+                  nested sub-period lists when depth is greater than one
+        """
+        info = {
+            self.system.key: self.lord(i),
+            'start_date': to_date(self.bounds[i]),
+            'end_date': to_date(self.bounds[i + 1]),
+            'years': self.years[i]
+        }
+        if depth > 1:
+            info[subperiod_keys[0]] = self.subperiods(i).to_list(
+                to_date, depth - 1, subperiod_keys[1:])
+        return info
+
+    def to_list(self, to_date: Callable[[float], Any], depth: int = 1,
+                subperiod_keys: Sequence[str] = SUBPERIOD_KEYS) -> List[Dict[str, Any]]:
+        """
+        Materialize all periods as a list of dictionaries
+
+        Args:
+            to_date (callable): Converts a Julian Day into an output date
+            depth (int): Number of levels to include
+            subperiod_keys (list): Dictionary keys of each sub-period level
+
+        Returns:
+            list: List of period dictionaries
+        """
+        return [self.period_info(i, to_date, depth, subperiod_keys)
+                for i in range(len(self.lords))]
+
+
+def date_converter(origin_date: Any, origin_jd: float) -> Callable[[float], Any]:
+    """
+    Get a function converting Julian Days into dates relative to an origin
+
+    Args:
+        origin_date (datetime): The date corresponding to origin_jd
+        origin_jd (float): The Julian Day of origin_date
+
+    Returns:
+        callable: Function mapping a Julian Day to a datetime
+    """
+    def to_date(jd: float) -> Any:
+        return origin_date + timedelta(days=jd - origin_jd)
+    return to_date
+
+
+def date_to_jd(date: Any, origin_date: Any, origin_jd: float) -> float:
+    """
+    Convert a date into a Julian Day relative to an origin
+
+    Args:
+        date (datetime): The date to convert
+        origin_date (datetime): The date corresponding to origin_jd
+        origin_jd (float): The Julian Day of origin_date
+
+    Returns:
+        float: The Julian Day of the date
+    """
+    return origin_jd + (date - origin_date) / timedelta(days=1)
+
+
+def get_current_period(dasha_periods: Dict[str, Any], date: Any,
+                       levels: int = 2) -> List[Dict[str, Any]]:
+    """
+    Find the running periods in a materialized dasha dictionary
+
+    Args:
+        dasha_periods (dict): Dictionary with a 'mahadashas' list
+        date (datetime): The date to check
+        levels (int): Number of levels to resolve
+
+    Returns:
+        list: The running period dictionary of each resolved level
+    """
+    found = []
+    periods = dasha_periods['mahadashas']
+    for level in range(levels):
+        starts = [period['start_date'] for period in periods]
+        i = bisect_right(starts, date) - 1
+        if i < 0 or not date < periods[i]['end_date']:
+            break
+        found.append(periods[i])
+        if level + 1 < levels:
+            periods = periods[i].get(SUBPERIOD_KEYS[level], [])
+    return found
+
+
+def format_current_dasha(found: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Shape the running Mahadasha and Antardasha into a result dictionary
+
+    Args:
+        found (list): The running period dictionaries, from Mahadasha down
+
+    Returns:
+        dict: Dictionary with current Mahadasha and Antardasha, or None
+              if no Mahadasha is running
+    """
+    if not found:
+        return None
+
+    mahadasha = found[0]
+    if len(found) < 2:
+        return {
+            'mahadasha': mahadasha,
+            'antardasha': None
+        }
+
+    antardasha = found[1]
+    return {
+        'mahadasha': mahadasha,
+        'antardasha': antardasha,
+        'mahadasha_start': mahadasha['start_date'],
+        'mahadasha_end': mahadasha['end_date'],
+        'antardasha_start': antardasha['start_date'],
+        'antardasha_end': antardasha['end_date']
+    }
+
+
+def current_dasha_info(timeline: DashaTimeline, jd: float,
+                       to_date: Callable[[float], Any]) -> Optional[Dict[str, Any]]:
+    """
+    Get the running Mahadasha and Antardasha from a timeline
+
+    Only the running Mahadasha is materialized. Its dictionary includes
+    the Antardasha list, matching the output of the per-system
+    get_current_*_dasha functions.
+
+    Args:
+        timeline (DashaTimeline): The Mahadasha timeline
+        jd (float): The Julian Day to check
+        to_date (callable): Converts a Julian Day into an output date
+
+    Returns:
+        dict: Dictionary with current Mahadasha and Antardasha, or None
+              if the date is outside the timeline
+    """
+    path = timeline.locate(jd, 2)
+    if not path:
+        return None
+
+    maha_timeline, maha_index = path[0]
+    mahadasha = maha_timeline.period_info(maha_index, to_date, depth=2)
+    found = [mahadasha]
+    if len(path) > 1:
+        found.append(mahadasha[SUBPERIOD_KEYS[0]][path[1][1]])
+    return format_current_dasha(found)
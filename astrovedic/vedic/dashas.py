@@ -7,13 +7,16 @@
     (Antardashas), and sub-sub-periods (Pratyantardashas).
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from astrovedic import const
 from astrovedic.datetime import Datetime
 from astrovedic.vedic.nakshatras import (
-    get_nakshatra, VIMSHOTTARI_PERIODS, TOTAL_VIMSHOTTARI_YEARS,
+    get_nakshatra_lord, VIMSHOTTARI_PERIODS, TOTAL_VIMSHOTTARI_YEARS,
     NAKSHATRA_SPAN
 )
+from astrovedic.vedic.dasha_engine import (
+    DashaSystem, years_to_days, add_years_to_date
+)
 
 # Vimshottari Dasha planet sequence
 VIMSHOTTARI_SEQUENCE = [
@@ -21,6 +24,9 @@ VIMSHOTTARI_SEQUENCE = [
     const.RAHU, const.JUPITER, const.SATURN, const.MERCURY
 ]
 
+# Vimshottari Dasha system table
+VIMSHOTTARI_DASHA = DashaSystem('Vimshottari', VIMSHOTTARI_SEQUENCE, VIMSHOTTARI_PERIODS)
+
 def calculate_dasha_balance(moon_longitude):
     """
     Calculate the balance of the current Mahadasha at birth
@@ -31,9 +37,8 @@ def calculate_dasha_balance(moon_longitude):
     Returns:
         float: The balance of the current Mahadasha in years
     """
-    # Get nakshatra information
-    nakshatra_info = get_nakshatra(moon_longitude)
-    nakshatra_lord = nakshatra_info['lord']
+    # Get the nakshatra lord
+    nakshatra_lord = get_nakshatra_lord(moon_longitude)
 
     # Calculate position within nakshatra (0-13.33333 degrees)
     pos_in_nakshatra = moon_longitude % NAKSHATRA_SPAN
@@ -57,9 +62,8 @@ def get_mahadasha_sequence(moon_longitude):
     Returns:
         list: List of dictionaries with Mahadasha information
     """
-    # Get nakshatra information
-    nakshatra_info = get_nakshatra(moon_longitude)
-    nakshatra_lord = nakshatra_info['lord']
+    # Get the nakshatra lord
+    nakshatra_lord = get_nakshatra_lord(moon_longitude)
 
     # Calculate the balance of the current Mahadasha
     balance = calculate_dasha_balance(moon_longitude)
@@ -151,31 +155,48 @@ def get_pratyantardasha_sequence(antardasha_planet, antardasha_years):
 
     return pratyantardasha_sequence
 
-def years_to_days(years):
+def get_dasha_timeline(birth_jd, moon_longitude):
     """
-    Convert years to days
+    Get the Vimshottari Mahadasha timeline with lazily expanded sub-periods
 
     Args:
-        years (float): Number of years
+        birth_jd (float): The Julian Day of birth
+        moon_longitude (float): The Moon's longitude in degrees (0-360)
 
     Returns:
-        float: Number of days
+        DashaTimeline: The Mahadasha timeline
     """
-    return years * 365.25
+    nakshatra_lord = get_nakshatra_lord(moon_longitude)
+    balance = calculate_dasha_balance(moon_longitude)
+    return VIMSHOTTARI_DASHA.timeline(birth_jd, VIMSHOTTARI_DASHA.index(nakshatra_lord), balance)
 
-def add_years_to_date(date, years):
+def get_dashas_at(moon_longitude, birth_jd, jds):
     """
-    Add a number of years to a date
+    Get the running Vimshottari Dasha lords at many dates in one pass
+
+    The period tree is built once and flattened to Pratyantardasha level
+    over the range of the queries, so each query is a single bisection.
 
     Args:
-        date (datetime): The starting date
-        years (float): Number of years to add
+        moon_longitude (float): The Moon's longitude in degrees (0-360)
+        birth_jd (float): The Julian Day of birth
+        jds (list): Sorted Julian Days to query
 
     Returns:
-        datetime: The resulting date
+        dict: Dictionary with 'mahadasha', 'antardasha' and 'pratyantardasha'
+              lists holding the lord at each query (None outside the
+              dasha cycle), and a 'next_change' list with the Julian Day
+              of the next Pratyantardasha boundary after each query
     """
-    days = years_to_days(years)
-    return date + timedelta(days=days)
+    timeline = get_dasha_timeline(birth_jd, moon_longitude)
+    result = timeline.lookup(jds, depth=3)
+    lords = result['lords']
+    return {
+        'mahadasha': [path[0] for path in lords],
+        'antardasha': [path[1] for path in lords],
+        'pratyantardasha': [path[2] for path in lords],
+        'next_change': result['next_change']
+    }
 
 def calculate_dasha_periods(birth_date, moon_longitude):
     """
@@ -544,3 +544,74 @@ def get_dignity_name(planet_id, sign, degree):
         return "Own Sign"
     else:
         return "None"
+
+
+# === Dignity classes === #
+
+DIGNITY_EXALTED = 'Exalted'
+DIGNITY_MOOLATRIKONA = 'Moolatrikona'
+DIGNITY_OWN_SIGN = 'Own Sign'
+DIGNITY_FRIEND = 'Friend'
+DIGNITY_NEUTRAL = 'Neutral'
+DIGNITY_ENEMY = 'Enemy'
+DIGNITY_DEBILITATED = 'Debilitated'
+
+# Dignity class of each dignity name
+DIGNITY_NAME_CLASSES = {
+    "Exact Exaltation": DIGNITY_EXALTED,
+    "Exaltation": DIGNITY_EXALTED,
+    "Exact Debilitation": DIGNITY_DEBILITATED,
+    "Debilitation": DIGNITY_DEBILITATED,
+    "Moolatrikona": DIGNITY_MOOLATRIKONA,
+    "Own Sign": DIGNITY_OWN_SIGN
+}
+
+# Dignity score of each dignity name, as in get_dignity_score
+DIGNITY_NAME_SCORES = {
+    "Exact Exaltation": 10,
+    "Exact Debilitation": -10,
+    "Exaltation": 8,
+    "Debilitation": -8,
+    "Moolatrikona": 7,
+    "Own Sign": 5,
+    "None": 0
+}
+
+
+def get_sign_relationship(planet_id, sign):
+    """
+    Get the relationship of a planet with the ruler of a sign
+
+    Args:
+        planet_id (str): The ID of the planet
+        sign (str): The sign
+
+    Returns:
+        str: DIGNITY_FRIEND, DIGNITY_NEUTRAL or DIGNITY_ENEMY, from the
+            natural friendship with the ruler of the sign
+    """
+    level = get_natural_friendship(planet_id, get_ruler(sign))
+    if level >= FRIENDSHIP_LEVELS['FRIEND']:
+        return DIGNITY_FRIEND
+    elif level <= FRIENDSHIP_LEVELS['ENEMY']:
+        return DIGNITY_ENEMY
+    return DIGNITY_NEUTRAL
+
+
+def get_dignity_class(planet_id, sign, degree):
+    """
+    Get the dignity class of a planet at a specific position
+
+    Args:
+        planet_id (str): The ID of the planet
+        sign (str): The sign
+        degree (float): The degree within the sign
+
+    Returns:
+        str: The dignity class (exalted, moolatrikona, own sign, friend,
+            neutral, enemy or debilitated)
+    """
+    name = get_dignity_name(planet_id, sign, degree)
+    if name in DIGNITY_NAME_CLASSES:
+        return DIGNITY_NAME_CLASSES[name]
+    return get_sign_relationship(planet_id, sign)
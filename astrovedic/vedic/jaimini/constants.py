@@ -0,0 +1,70 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module defines constants for Jaimini Arudha Pada and
+    Rashi Drishti calculations.
+"""
+
+from astrovedic import const
+
+# House numbers (1-12)
+HOUSE_NUMBERS = list(range(1, 13))
+
+# Arudha Pada names
+LAGNA_PADA = "Lagna Pada"  # Arudha of 1st house (AL)
+DHANA_PADA = "Dhana Pada"  # Arudha of 2nd house (A2)
+BHRATRI_PADA = "Bhratri Pada"  # Arudha of 3rd house (A3)
+MATRI_PADA = "Matri Pada"  # Arudha of 4th house (A4)
+PUTRA_PADA = "Putra Pada"  # Arudha of 5th house (A5)
+ROGA_PADA = "Roga Pada"  # Arudha of 6th house (A6)
+DARA_PADA = "Dara Pada"  # Arudha of 7th house (A7)
+MRITYU_PADA = "Mrityu Pada"  # Arudha of 8th house (A8)
+BHAGYA_PADA = "Bhagya Pada"  # Arudha of 9th house (A9)
+KARMA_PADA = "Karma Pada"  # Arudha of 10th house (A10)
+LABHA_PADA = "Labha Pada"  # Arudha of 11th house (A11)
+VYAYA_PADA = "Vyaya Pada"  # Arudha of 12th house (A12)
+
+# Special Arudha Padas
+UPAPADA_LAGNA = "Upapada Lagna"  # Special Arudha of 12th house (UL)
+
+# Mapping of house numbers to Arudha Pada names
+HOUSE_TO_ARUDHA = {
+    1: LAGNA_PADA,
+    2: DHANA_PADA,
+    3: BHRATRI_PADA,
+    4: MATRI_PADA,
+    5: PUTRA_PADA,
+    6: ROGA_PADA,
+    7: DARA_PADA,
+    8: MRITYU_PADA,
+    9: BHAGYA_PADA,
+    10: KARMA_PADA,
+    11: LABHA_PADA,
+    12: VYAYA_PADA
+}
+
+# List of planets to use for Jaimini aspects
+JAIMINI_PLANETS = [
+    const.SUN, const.MOON, const.MERCURY, const.VENUS,
+    const.MARS, const.JUPITER, const.SATURN, const.RAHU, const.KETU
+]
+
+# Jaimini Rashi Drishti (sign aspect) rules
+# In Jaimini astrology, signs aspect other signs based on specific rules:
+# 1. All signs aspect the 7th sign from them (standard Vedic rule)
+# 2. Signs in a 2/12 relationship have mutual aspect
+# 3. Signs in a 5/9 relationship have mutual aspect
+# 4. Signs in a 4/10 relationship have mutual aspect
+# 5. Signs in a 3/11 relationship have mutual aspect (some traditions)
+
+# Aspect types
+JAIMINI_FULL_ASPECT = "Jaimini Full Aspect"
+JAIMINI_MUTUAL_ASPECT = "Jaimini Mutual Aspect"
+
+# Aspect relationships
+SEVENTH_ASPECT = 7  # Standard 7th aspect
+SECOND_TWELFTH_ASPECT = [2, 12]  # 2/12 relationship
+FIFTH_NINTH_ASPECT = [5, 9]  # 5/9 relationship
+FOURTH_TENTH_ASPECT = [4, 10]  # 4/10 relationship
+THIRD_ELEVENTH_ASPECT = [3, 11]  # 3/11 relationship (some traditions)
@@ -11,30 +11,11 @@ from typing import Dict, List, Optional, Tuple, Union
 from astrovedic import const
 from astrovedic.chart import Chart
 
-# List of planets to use for Jaimini aspects
-JAIMINI_PLANETS = [
-    const.SUN, const.MOON, const.MERCURY, const.VENUS,
-    const.MARS, const.JUPITER, const.SATURN, const.RAHU, const.KETU
-]
-
-# Jaimini Rashi Drishti (sign aspect) rules
-# In Jaimini astrology, signs aspect other signs based on specific rules:
-# 1. All signs aspect the 7th sign from them (standard Vedic rule)
-# 2. Signs in a 2/12 relationship have mutual aspect
-# 3. Signs in a 5/9 relationship have mutual aspect
-# 4. Signs in a 4/10 relationship have mutual aspect
-# 5. Signs in a 3/11 relationship have mutual aspect (some traditions)
-
-# Aspect types
-JAIMINI_FULL_ASPECT = "Jaimini Full Aspect"
-JAIMINI_MUTUAL_ASPECT = "Jaimini Mutual Aspect"
-
-# Aspect relationships
-SEVENTH_ASPECT = 7  # Standard 7th aspect
-SECOND_TWELFTH_ASPECT = [2, 12]  # 2/12 relationship
-FIFTH_NINTH_ASPECT = [5, 9]  # 5/9 relationship
-FOURTH_TENTH_ASPECT = [4, 10]  # 4/10 relationship
-THIRD_ELEVENTH_ASPECT = [3, 11]  # 3/11 relationship (some traditions)
+from astrovedic.vedic.jaimini.constants import (
+    JAIMINI_PLANETS, JAIMINI_FULL_ASPECT, JAIMINI_MUTUAL_ASPECT, SEVENTH_ASPECT,
+    SECOND_TWELFTH_ASPECT, FIFTH_NINTH_ASPECT, FOURTH_TENTH_ASPECT, THIRD_ELEVENTH_ASPECT
+)
+from astrovedic.vedic.jaimini.engine import get_drishti_type, get_jaimini, get_sign_aspects_copy
 
 def get_sign_number(sign: str) -> int:
     """
@@ -102,28 +83,7 @@ def has_jaimini_rashi_drishti(from_sign: str, to_sign: str, include_third_eleven
     # Calculate the distance in signs (1-12)
     sign_distance = get_sign_distance(from_sign, to_sign)
 
-    # All signs aspect the 7th sign
-    if sign_distance == SEVENTH_ASPECT:
-        return True
-
-    # Signs in a 2/12 relationship have mutual aspect
-    if sign_distance in SECOND_TWELFTH_ASPECT:
-        return True
-
-    # Signs in a 5/9 relationship have mutual aspect
-    if sign_distance in FIFTH_NINTH_ASPECT:
-        return True
-
-    # Signs in a 4/10 relationship have mutual aspect
-    if sign_distance in FOURTH_TENTH_ASPECT:
-        return True
-
-    # Signs in a 3/11 relationship have mutual aspect (some traditions)
-    if include_third_eleventh and sign_distance in THIRD_ELEVENTH_ASPECT:
-        return True
-
-    # No aspect
-    return False
+    return get_drishti_type(sign_distance, include_third_eleventh) is not None
 
 def get_jaimini_rashi_drishti_info(from_sign: str, to_sign: str, include_third_eleventh: bool = True) -> Dict[str, any]:
     """
@@ -148,42 +108,12 @@ def get_jaimini_rashi_drishti_info(from_sign: str, to_sign: str, include_third_e
         'is_mutual': False
     }
 
-    # All signs aspect the 7th sign
-    if sign_distance == SEVENTH_ASPECT:
+    aspect_type = get_drishti_type(sign_distance, include_third_eleventh)
+    if aspect_type is not None:
         aspect_info['has_aspect'] = True
-        aspect_info['type'] = JAIMINI_FULL_ASPECT
+        aspect_info['type'] = aspect_type
         aspect_info['is_mutual'] = True
-        return aspect_info
 
-    # Signs in a 2/12 relationship have mutual aspect
-    if sign_distance in SECOND_TWELFTH_ASPECT:
-        aspect_info['has_aspect'] = True
-        aspect_info['type'] = JAIMINI_MUTUAL_ASPECT
-        aspect_info['is_mutual'] = True
-        return aspect_info
-
-    # Signs in a 5/9 relationship have mutual aspect
-    if sign_distance in FIFTH_NINTH_ASPECT:
-        aspect_info['has_aspect'] = True
-        aspect_info['type'] = JAIMINI_MUTUAL_ASPECT
-        aspect_info['is_mutual'] = True
-        return aspect_info
-
-    # Signs in a 4/10 relationship have mutual aspect
-    if sign_distance in FOURTH_TENTH_ASPECT:
-        aspect_info['has_aspect'] = True
-        aspect_info['type'] = JAIMINI_MUTUAL_ASPECT
-        aspect_info['is_mutual'] = True
-        return aspect_info
-
-    # Signs in a 3/11 relationship have mutual aspect (some traditions)
-    if include_third_eleventh and sign_distance in THIRD_ELEVENTH_ASPECT:
-        aspect_info['has_aspect'] = True
-        aspect_info['type'] = JAIMINI_MUTUAL_ASPECT
-        aspect_info['is_mutual'] = True
-        return aspect_info
-
-    # No aspect
     return aspect_info
 
 def get_jaimini_sign_aspects(sign: str, include_third_eleventh: bool = True) -> List[Dict[str, any]]:
@@ -260,17 +190,8 @@ def get_all_jaimini_sign_aspects(include_third_eleventh: bool = True) -> Dict[st
     Returns:
         dict: Dictionary with all sign aspects
     """
-    # Initialize the result
-    result = {}
-
-    # Get aspects for each sign
-    for sign in const.LIST_SIGNS:
-        result[sign] = {
-            'aspects_cast': get_jaimini_sign_aspects(sign, include_third_eleventh),
-            'aspects_received': get_jaimini_sign_aspects_received(sign, include_third_eleventh)
-        }
-
-    return result
+    # The sign aspects do not depend on the chart
+    return get_sign_aspects_copy(include_third_eleventh)
 
 def get_jaimini_planet_aspects(chart: Chart, planet_id: str, include_third_eleventh: bool = True) -> List[Dict[str, any]]:
     """
@@ -373,17 +294,7 @@ def get_all_jaimini_planet_aspects(chart: Chart, include_third_eleventh: bool =
     Returns:
         dict: Dictionary with all planet aspects
     """
-    # Initialize the result
-    result = {}
-
-    # Get aspects for each planet
-    for planet_id in JAIMINI_PLANETS:
-        result[planet_id] = {
-            'aspects_cast': get_jaimini_planet_aspects(chart, planet_id, include_third_eleventh),
-            'aspects_received': get_jaimini_planet_aspects_received(chart, planet_id, include_third_eleventh)
-        }
-
-    return result
+    return get_jaimini(chart, include_third_eleventh)['planet_aspects']
 
 def get_all_jaimini_aspects(chart: Chart, include_third_eleventh: bool = True) -> Dict[str, Dict]:
     """
@@ -0,0 +1,441 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements a Jaimini engine on sign indexes. The Rashi
+    Drishti between signs and the Arudha of every house sign and lord
+    sign are static 12 x 12 tables, so the Arudha Padas, Graha Padas,
+    Upapada, Chara Karakas and planet aspects of a chart are computed in
+    one pass over the sign indexes of its houses and planets. The sign
+    indexes of many charts can be evaluated in blocks, optionally in
+    parallel.
+"""
+
+from functools import partial
+
+from astrovedic import const
+from astrovedic.parallel import map_blocks
+from astrovedic.vedic.jaimini.constants import (
+    HOUSE_NUMBERS, HOUSE_TO_ARUDHA, UPAPADA_LAGNA, VYAYA_PADA,
+    JAIMINI_PLANETS, JAIMINI_FULL_ASPECT, JAIMINI_MUTUAL_ASPECT, SEVENTH_ASPECT,
+    SECOND_TWELFTH_ASPECT, FIFTH_NINTH_ASPECT, FOURTH_TENTH_ASPECT, THIRD_ELEVENTH_ASPECT
+)
+
+# Lords of the signs by sign index
+SIGN_LORDS = (
+    const.MARS, const.VENUS, const.MERCURY, const.MOON,
+    const.SUN, const.MERCURY, const.VENUS, const.MARS,
+    const.JUPITER, const.SATURN, const.SATURN, const.JUPITER
+)
+
+# Sign index of each sign name
+SIGN_INDEX = {sign: i for i, sign in enumerate(const.LIST_SIGNS)}
+
+# Planets of the Graha Padas, in order of calculation
+GRAHA_PADA_PLANETS = [
+    const.SUN, const.MOON, const.MARS, const.MERCURY,
+    const.JUPITER, const.VENUS, const.SATURN, const.RAHU, const.KETU
+]
+
+# Planets whose sign indexes are part of the chart facts
+JAIMINI_OBJECTS = list(dict.fromkeys(
+    JAIMINI_PLANETS + GRAHA_PADA_PLANETS + const.CHARA_KARAKA_PLANETS
+))
+
+# Number of charts evaluated together by iter_jaimini
+DEFAULT_BLOCK_SIZE = 256
+
+
+def get_pada_number(base_num, reference_num, rule_num):
+    """
+    Count the Pada of a sign from a reference sign
+
+    The Pada is as far from the reference sign as the reference sign is
+    from the base sign. It moves to the 10th from itself when it falls in
+    the rule sign, and to the 4th from the rule sign when it falls in the
+    7th from it.
+
+    Args:
+        base_num (int): The sign number (1-12) of the house
+        reference_num (int): The sign number (1-12) of the lord or planet
+        rule_num (int): The sign number (1-12) the special rules refer to
+
+    Returns:
+        int: The sign number (1-12) of the Pada
+    """
+    # Calculate the distance from the base sign to the reference sign
+    distance = (reference_num - base_num) % 12
+    if distance == 0:
+        distance = 12
+
+    # Count the same number of signs from the reference sign
+    pada_num = (reference_num + distance) % 12
+    if pada_num == 0:
+        pada_num = 12
+
+    # Rule 1: If the Pada falls in the rule sign, take the 10th from it
+    if pada_num == rule_num:
+        pada_num = (pada_num + 9) % 12
+        if pada_num == 0:
+            pada_num = 12
+
+    # Rule 2: If the Pada falls in the 7th from the rule sign, take the 4th from it
+    elif pada_num == (rule_num + 6) % 12:
+        pada_num = (rule_num + 3) % 12
+        if pada_num == 0:
+            pada_num = 12
+
+    return pada_num
+
+
+# Arudha sign index by house sign index and lord sign index
+ARUDHA_TABLE = tuple(
+    tuple(get_pada_number(house + 1, lord + 1, house + 1) - 1 for lord in range(12))
+    for house in range(12)
+)
+
+# Graha Pada sign index by house sign index and planet sign index
+GRAHA_PADA_TABLE = tuple(
+    tuple(get_pada_number(house + 1, planet + 1, planet + 1) - 1 for planet in range(12))
+    for house in range(12)
+)
+
+
+def get_drishti_type(sign_distance, include_third_eleventh=True):
+    """
+    Get the Jaimini Rashi Drishti between signs at a distance
+
+    Args:
+        sign_distance (int): The distance in signs (1-12)
+        include_third_eleventh (bool): Whether to include 3/11 aspects
+
+    Returns:
+        str: The aspect type, or None when the signs do not aspect
+    """
+    # All signs aspect the 7th sign
+    if sign_distance == SEVENTH_ASPECT:
+        return JAIMINI_FULL_ASPECT
+
+    # Signs in a 2/12, 5/9 or 4/10 relationship have mutual aspect
+    if (sign_distance in SECOND_TWELFTH_ASPECT or sign_distance in FIFTH_NINTH_ASPECT
+            or sign_distance in FOURTH_TENTH_ASPECT):
+        return JAIMINI_MUTUAL_ASPECT
+
+    # Signs in a 3/11 relationship have mutual aspect (some traditions)
+    if include_third_eleventh and sign_distance in THIRD_ELEVENTH_ASPECT:
+        return JAIMINI_MUTUAL_ASPECT
+
+    return None
+
+
+def _get_drishti_table(include_third_eleventh):
+    """ Returns the (type, sign distance, mutual) of each sign aspect. """
+    table = []
+    for from_sign in range(12):
+        row = []
+        for to_sign in range(12):
+            sign_distance = (to_sign - from_sign) % 12 + 1
+            aspect_type = get_drishti_type(sign_distance, include_third_eleventh)
+            row.append((aspect_type, sign_distance, True) if aspect_type is not None else None)
+        table.append(tuple(row))
+    return tuple(table)
+
+
+def _get_sign_aspects(table, sign, received):
+    """ Returns the aspects cast or received by a sign index. """
+    aspects = []
+    for other_sign in range(12):
+        info = table[other_sign][sign] if received else table[sign][other_sign]
+        if info is None:
+            continue
+        from_sign, to_sign = (other_sign, sign) if received else (sign, other_sign)
+        aspects.append({
+            'from_sign': const.LIST_SIGNS[from_sign],
+            'to_sign': const.LIST_SIGNS[to_sign],
+            'type': info[0],
+            'sign_distance': info[1],
+            'is_mutual': info[2]
+        })
+    return aspects
+
+
+# Jaimini Rashi Drishti by from and to sign index, with and without 3/11 aspects
+DRISHTI_TABLES = {
+    True: _get_drishti_table(True),
+    False: _get_drishti_table(False)
+}
+
+# Jaimini aspects cast and received by each sign, with and without 3/11 aspects
+SIGN_ASPECTS = {
+    include_third_eleventh: {
+        sign: {
+            'aspects_cast': _get_sign_aspects(table, i, False),
+            'aspects_received': _get_sign_aspects(table, i, True)
+        }
+        for i, sign in enumerate(const.LIST_SIGNS)
+    }
+    for include_third_eleventh, table in DRISHTI_TABLES.items()
+}
+
+
+def get_sign_aspects_copy(include_third_eleventh=True):
+    """
+    Get a copy of the static Jaimini aspects of every sign
+
+    Args:
+        include_third_eleventh (bool): Whether to include 3/11 aspects
+
+    Returns:
+        dict: Dictionary with the aspects cast and received by each sign
+            (see drishti.get_all_jaimini_sign_aspects)
+    """
+    return {
+        sign: {key: [dict(aspect) for aspect in aspects] for key, aspects in sign_aspects.items()}
+        for sign, sign_aspects in SIGN_ASPECTS[include_third_eleventh].items()
+    }
+
+
+def get_jaimini_facts(chart):
+    """
+    Get the sign indexes of the houses and planets of a chart
+
+    Args:
+        chart (Chart): The chart
+
+    Returns:
+        dict: Dictionary with the 'house_signs' (sign index of each house
+            cusp, houses 1-12), the 'signs' (sign index of each planet) and
+            the 'lons' (longitude of each planet)
+    """
+    signs = {}
+    lons = {}
+    for obj in JAIMINI_OBJECTS:
+        planet = chart.getObject(obj)
+        signs[obj] = SIGN_INDEX[planet.sign]
+        lons[obj] = planet.lon
+
+    return {
+        'house_signs': [SIGN_INDEX[chart.getHouse(f'House{num}').sign] for num in HOUSE_NUMBERS],
+        'signs': signs,
+        'lons': lons
+    }
+
+
+def get_arudha_padas(facts):
+    """
+    Get the Arudha Padas of all houses from the chart facts
+
+    Args:
+        facts (dict): The chart facts (see get_jaimini_facts)
+
+    Returns:
+        dict: A dictionary mapping Arudha Pada names to their signs,
+            including the Upapada Lagna
+    """
+    signs = facts['signs']
+    arudha_padas = {}
+    for house_num, house_sign in zip(HOUSE_NUMBERS, facts['house_signs']):
+        lord_sign = signs[SIGN_LORDS[house_sign]]
+        arudha_padas[HOUSE_TO_ARUDHA[house_num]] = const.LIST_SIGNS[ARUDHA_TABLE[house_sign][lord_sign]]
+
+    # The Upapada Lagna is the Arudha of the 12th house
+    arudha_padas[UPAPADA_LAGNA] = arudha_padas[VYAYA_PADA]
+    return arudha_padas
+
+
+def get_graha_padas(facts):
+    """
+    Get the Graha Padas of the planets from the chart facts
+
+    Args:
+        facts (dict): The chart facts (see get_jaimini_facts)
+
+    Returns:
+        dict: A dictionary mapping planet names to their Graha Pada signs
+    """
+    signs = facts['signs']
+    house_signs = facts['house_signs']
+    house_lords = [SIGN_LORDS[house_sign] for house_sign in house_signs]
+
+    graha_padas = {}
+    for planet_id in GRAHA_PADA_PLANETS:
+        planet_sign = signs[planet_id]
+        if planet_id in house_lords:
+            # Use the first house ruled by the planet
+            house_sign = house_signs[house_lords.index(planet_id)]
+            graha_padas[planet_id] = const.LIST_SIGNS[GRAHA_PADA_TABLE[house_sign][planet_sign]]
+        else:
+            # Planets that rule no house use the Graha Pada of the lord
+            # of the house numbered as their sign, when already known
+            dispositor = house_lords[planet_sign]
+            graha_padas[planet_id] = graha_padas.get(dispositor, const.LIST_SIGNS[planet_sign])
+
+    return graha_padas
+
+
+def get_chara_karakas(facts):
+    """
+    Get the Chara Karakas from the chart facts
+
+    Planets without a longitude in the facts are not ranked.
+
+    Args:
+        facts (dict): The chart facts (see get_jaimini_facts)
+
+    Returns:
+        dict: A dictionary mapping the full Karaka names to planet IDs
+            (see karakas.calculate_chara_karakas)
+    """
+    lons = facts['lons']
+    planet_degrees = []
+    for planet_id in const.CHARA_KARAKA_PLANETS:
+        if planet_id not in lons:
+            continue
+        longitude = lons[planet_id]
+        if planet_id == const.RAHU:
+            # Jaimini rule for Rahu: 360 - longitude
+            longitude = 360.0 - (longitude % 360)
+        planet_degrees.append((planet_id, longitude % 30.0, longitude))
+
+    # Rank by degree within the sign, then by longitude
+    planet_degrees.sort(key=lambda x: (x[1], x[2]), reverse=True)
+    return {karaka: planet_degrees[i][0] for i, karaka in enumerate(const.LIST_CHARA_KARAKAS)
+            if i < len(planet_degrees)}
+
+
+def get_planet_aspects(facts, planet_id, include_third_eleventh=True, received=False,
+                       occupants=None):
+    """
+    Get the Jaimini aspects cast or received by a planet from the chart facts
+
+    Args:
+        facts (dict): The chart facts (see get_jaimini_facts)
+        planet_id (str): The ID of the planet
+        include_third_eleventh (bool): Whether to include 3/11 aspects
+        received (bool): Get the aspects received instead of cast
+        occupants (list, optional): The planets in each sign, in
+            JAIMINI_PLANETS order (see get_sign_occupants)
+
+    Returns:
+        list: List of aspects (see drishti.get_jaimini_planet_aspects)
+    """
+    table = DRISHTI_TABLES[include_third_eleventh]
+    if occupants is None:
+        occupants = get_sign_occupants(facts)
+    sign = facts['signs'][planet_id]
+    sign_name = const.LIST_SIGNS[sign]
+
+    aspects = []
+    for other_sign in range(12):
+        info = table[other_sign][sign] if received else table[sign][other_sign]
+        if info is None or not occupants[other_sign]:
+            continue
+        aspect_type, sign_distance, is_mutual = info
+        other_name = const.LIST_SIGNS[other_sign]
+        for other_id in occupants[other_sign]:
+            if received:
+                from_planet, to_planet, from_sign, to_sign = other_id, planet_id, other_name, sign_name
+            else:
+                from_planet, to_planet, from_sign, to_sign = planet_id, other_id, sign_name, other_name
+            aspects.append({
+                'from_planet': from_planet,
+                'to_planet': to_planet,
+                'from_sign': from_sign,
+                'to_sign': to_sign,
+                'type': aspect_type,
+                'sign_distance': sign_distance,
+                'is_mutual': is_mutual
+            })
+
+    return aspects
+
+
+def get_sign_occupants(facts):
+    """
+    Get the Jaimini planets in each sign from the chart facts
+
+    Args:
+        facts (dict): The chart facts (see get_jaimini_facts)
+
+    Returns:
+        list: The planets in each sign index, in JAIMINI_PLANETS order
+    """
+    occupants = [[] for _ in range(12)]
+    for planet_id in JAIMINI_PLANETS:
+        occupants[facts['signs'][planet_id]].append(planet_id)
+    return occupants
+
+
+def evaluate_jaimini(facts, include_third_eleventh=True):
+    """
+    Compute the Jaimini factors of a chart in one pass
+
+    Args:
+        facts (dict): The chart facts (see get_jaimini_facts)
+        include_third_eleventh (bool): Whether to include 3/11 aspects
+
+    Returns:
+        dict: Dictionary with the 'arudha_padas', 'graha_padas',
+            'upapada', 'chara_karakas' and 'planet_aspects' (see
+            drishti.get_all_jaimini_planet_aspects)
+    """
+    occupants = get_sign_occupants(facts)
+    arudha_padas = get_arudha_padas(facts)
+
+    return {
+        'arudha_padas': arudha_padas,
+        'graha_padas': get_graha_padas(facts),
+        'upapada': arudha_padas[UPAPADA_LAGNA],
+        'chara_karakas': get_chara_karakas(facts),
+        'planet_aspects': {
+            planet_id: {
+                'aspects_cast': get_planet_aspects(facts, planet_id, include_third_eleventh,
+                                                   False, occupants),
+                'aspects_received': get_planet_aspects(facts, planet_id, include_third_eleventh,
+                                                       True, occupants)
+            }
+            for planet_id in JAIMINI_PLANETS
+        }
+    }
+
+
+def get_jaimini(chart, include_third_eleventh=True):
+    """
+    Compute the Jaimini factors of a chart
+
+    Args:
+        chart (Chart): The chart
+        include_third_eleventh (bool): Whether to include 3/11 aspects
+
+    Returns:
+        dict: The Jaimini factors (see evaluate_jaimini)
+    """
+    return evaluate_jaimini(get_jaimini_facts(chart), include_third_eleventh)
+
+
+def _evaluate_block(facts, include_third_eleventh=True):
+    """ Returns the Jaimini factors of a block of charts. """
+    return [evaluate_jaimini(chart_facts, include_third_eleventh) for chart_facts in facts]
+
+
+def iter_jaimini(facts, include_third_eleventh=True, block_size=DEFAULT_BLOCK_SIZE,
+                 max_workers=None, executor=None):
+    """
+    Compute the Jaimini factors of many charts
+
+    Charts are evaluated in blocks with map_blocks.
+
+    Args:
+        facts (list): The facts of all charts (see get_jaimini_facts)
+        include_third_eleventh (bool): Whether to include 3/11 aspects
+        block_size (int): The number of charts per block
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
+
+    Yields:
+        tuple: (chart index, factors) in chart order, where factors is
+            the result of evaluate_jaimini
+    """
+    evaluate_block = partial(_evaluate_block, include_third_eleventh=include_third_eleventh)
+    return map_blocks(evaluate_block, facts, block_size, max_workers=max_workers,
+                      executor=executor)
@@ -4,11 +4,12 @@ This module implements both Chara Karaka (temporary significators) and
 Sthira Karaka (fixed significators) calculations for Jaimini astrology.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict
 
 from astrovedic import const
 from astrovedic.chart import Chart
 from astrovedic.object import GenericObject
+from astrovedic.vedic.jaimini.engine import get_chara_karakas
 
 
 # Karaka names (standard abbreviations)
@@ -99,47 +100,17 @@ def calculate_chara_karakas(chart: Chart) -> Dict[str, str]:
         are the corresponding planet IDs (e.g., 'Venus', 'Sun' from
         `const.PLANET_IDs`).
     """
-    planet_degrees: List[Tuple[str, float, float]] = []
+    lons: Dict[str, float] = {}
 
     for planet_id in const.CHARA_KARAKA_PLANETS:
         try:
             obj: GenericObject = chart.getObject(planet_id)
-            longitude = obj.lon
-
-            if planet_id == const.RAHU:
-                # Jaimini rule for Rahu: 360 - longitude
-                # Ensure longitude is positive before calculation
-                adjusted_lon = 360.0 - (longitude % 360)
-                deg_in_sign = adjusted_lon % 30.0
-                sort_key = adjusted_lon # Use adjusted lon for tie-breaking
-            else:
-                deg_in_sign = longitude % 30.0
-                sort_key = longitude # Use original lon for tie-breaking
-
-            planet_degrees.append((planet_id, deg_in_sign, sort_key))
-
+            lons[planet_id] = obj.lon
         except ValueError:
             # Handle cases where a planet might not be in the chart object
             # (should not happen with standard chart generation)
             print(f"Warning: Planet {planet_id} not found in chart for Chara Karaka calculation.")
             continue
 
-    # Sort planets:
-    # Primary sort key: Degree within the sign (descending)
-    # Secondary sort key (for ties): Full longitude (adjusted for Rahu, descending)
-    planet_degrees.sort(key=lambda x: (x[1], x[2]), reverse=True)
-
-    # Assign Karakas based on sorted order
-    chara_karakas: Dict[str, str] = {}
-    num_karakas = min(len(planet_degrees), len(const.LIST_CHARA_KARAKAS))
-
-    for i in range(num_karakas):
-        karaka_name = const.LIST_CHARA_KARAKAS[i]
-        planet_id = planet_degrees[i][0]
-        chara_karakas[karaka_name] = planet_id
-
-    # Handle potential ties explicitly based on standard rules (re-check if needed)
-    # The current sort key handles ties by longitude value implicitly.
-    # Further tie-breaking (e.g., latitude) is complex and less standard.
-
-    return chara_karakas
+    # The ranking is shared with the Jaimini engine
+    return get_chara_karakas({'lons': lons})
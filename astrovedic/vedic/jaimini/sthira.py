@@ -9,7 +9,12 @@
 from astrovedic import const
 from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
-from datetime import datetime, timedelta
+from astrovedic.vedic.dasha_engine import (
+    DashaSystem, DashaTimeline, years_to_days, add_years_to_date,
+    date_converter, get_current_period, format_current_dasha,
+    current_dasha_info
+)
+from datetime import datetime
 from typing import Dict, Optional, Any, List, Tuple
 
 # Sthira Dasha periods (in years)
@@ -38,6 +43,9 @@ STHIRA_SEQUENCE = [
     const.SAGITTARIUS, const.CAPRICORN, const.AQUARIUS, const.PISCES
 ]
 
+# Sthira Dasha system table
+STHIRA_DASHA = DashaSystem('Sthira', STHIRA_SEQUENCE, STHIRA_PERIODS, key='sign')
+
 def calculate_sthira_dasha_balance(lagna_sign: str, lagna_degree: float) -> float:
     """
     Calculate the balance of the current Sthira Dasha at birth
@@ -68,23 +76,8 @@ def get_sthira_sequence(lagna_sign: str) -> List[Dict[str, Any]]:
     Returns:
         list: List of dictionaries with Sthira Dasha information
     """
-    # Find the starting index in the Sthira sequence
-    start_idx = STHIRA_SEQUENCE.index(lagna_sign)
-    
-    # Create the sequence of Sthira Dashas
-    sthira_sequence = []
-    
-    # Add all Sthira Dashas in sequence
-    for i in range(12):
-        idx = (start_idx + i) % 12
-        sign = STHIRA_SEQUENCE[idx]
-        
-        sthira_sequence.append({
-            'sign': sign,
-            'years': STHIRA_PERIODS[sign]
-        })
-    
-    return sthira_sequence
+    start_idx = STHIRA_DASHA.index(lagna_sign)
+    return STHIRA_DASHA.sequence_info(start_idx, STHIRA_PERIODS[lagna_sign])
 
 def get_sthira_antardasha_sequence(mahadasha_sign: str, mahadasha_years: float) -> List[Dict[str, Any]]:
     """
@@ -97,52 +90,22 @@ def get_sthira_antardasha_sequence(mahadasha_sign: str, mahadasha_years: float)
     Returns:
         list: List of dictionaries with Antardasha information
     """
-    # Find the starting index in the Sthira sequence
-    start_idx = STHIRA_SEQUENCE.index(mahadasha_sign)
-    
-    # Create the sequence of Antardashas
-    antardasha_sequence = []
-    
-    # Add all Antardashas in sequence
-    for i in range(12):
-        idx = (start_idx + i) % 12
-        sign = STHIRA_SEQUENCE[idx]
-        
-        # Calculate the duration of the Antardasha
-        years = (STHIRA_PERIODS[sign] / TOTAL_STHIRA_YEARS) * mahadasha_years
-        
-        antardasha_sequence.append({
-            'sign': sign,
-            'years': years
-        })
-    
-    return antardasha_sequence
-
-def years_to_days(years: float) -> float:
-    """
-    Convert years to days
+    return STHIRA_DASHA.subperiod_info(mahadasha_sign, mahadasha_years)
 
-    Args:
-        years (float): Number of years
-
-    Returns:
-        float: Number of days
-    """
-    return years * 365.25
-
-def add_years_to_date(date: datetime, years: float) -> datetime:
+def get_sthira_timeline(birth_jd: float, lagna_sign: str, lagna_degree: float) -> DashaTimeline:
     """
-    Add a number of years to a date
+    Get the Sthira Mahadasha timeline with lazily expanded sub-periods
 
     Args:
-        date (datetime): The starting date
-        years (float): Number of years to add
+        birth_jd (float): The Julian Day of birth
+        lagna_sign (str): The Lagna (Ascendant) sign
+        lagna_degree (float): The degree within the sign (0-30)
 
     Returns:
-        datetime: The resulting date
+        DashaTimeline: The Mahadasha timeline
     """
-    days = years_to_days(years)
-    return date + timedelta(days=days)
+    balance = calculate_sthira_dasha_balance(lagna_sign, lagna_degree)
+    return STHIRA_DASHA.timeline(birth_jd, STHIRA_DASHA.index(lagna_sign), balance)
 
 def calculate_sthira_dasha_periods(birth_date: datetime, lagna_sign: str, lagna_degree: float) -> Dict[str, Any]:
     """
@@ -162,97 +125,9 @@ def calculate_sthira_dasha_periods(birth_date: datetime, lagna_sign: str, lagna_
     else:
         birth_dt = birth_date
     
-    # Calculate the balance of the current Sthira Dasha
-    balance = calculate_sthira_dasha_balance(lagna_sign, lagna_degree)
-    
-    # Get the Sthira Dasha sequence
-    sthira_sequence = get_sthira_sequence(lagna_sign)
-    
-    # Calculate start and end dates for each Mahadasha
-    current_date = birth_dt
-    mahadashas = []
-    
-    # Add the first Mahadasha with its balance
-    first_mahadasha = sthira_sequence[0]
-    first_sign = first_mahadasha['sign']
-    
-    start_date = current_date
-    end_date = add_years_to_date(start_date, balance)
-    
-    # Get Antardashas for this Mahadasha
-    antardasha_sequence = get_sthira_antardasha_sequence(first_sign, balance)
-    antardashas = []
-    
-    # Calculate start and end dates for each Antardasha
-    antardasha_date = start_date
-    
-    for antardasha in antardasha_sequence:
-        ad_sign = antardasha['sign']
-        ad_years = antardasha['years']
-        
-        ad_start_date = antardasha_date
-        ad_end_date = add_years_to_date(ad_start_date, ad_years)
-        
-        antardashas.append({
-            'sign': ad_sign,
-            'start_date': ad_start_date,
-            'end_date': ad_end_date,
-            'years': ad_years
-        })
-        
-        antardasha_date = ad_end_date
-    
-    mahadashas.append({
-        'sign': first_sign,
-        'start_date': start_date,
-        'end_date': end_date,
-        'years': balance,
-        'antardashas': antardashas
-    })
-    
-    current_date = end_date
-    
-    # Add the remaining Mahadashas
-    for i in range(1, 12):
-        mahadasha = sthira_sequence[i]
-        sign = mahadasha['sign']
-        years = mahadasha['years']
-        
-        start_date = current_date
-        end_date = add_years_to_date(start_date, years)
-        
-        # Get Antardashas for this Mahadasha
-        antardasha_sequence = get_sthira_antardasha_sequence(sign, years)
-        antardashas = []
-        
-        # Calculate start and end dates for each Antardasha
-        antardasha_date = start_date
-        
-        for antardasha in antardasha_sequence:
-            ad_sign = antardasha['sign']
-            ad_years = antardasha['years']
-            
-            ad_start_date = antardasha_date
-            ad_end_date = add_years_to_date(ad_start_date, ad_years)
-            
-            antardashas.append({
-                'sign': ad_sign,
-                'start_date': ad_start_date,
-                'end_date': ad_end_date,
-                'years': ad_years
-            })
-            
-            antardasha_date = ad_end_date
-        
-        mahadashas.append({
-            'sign': sign,
-            'start_date': start_date,
-            'end_date': end_date,
-            'years': years,
-            'antardashas': antardashas
-        })
-        
-        current_date = end_date
+    # Build the timeline relative to birth and materialize two levels
+    timeline = get_sthira_timeline(0.0, lagna_sign, lagna_degree)
+    mahadashas = timeline.to_list(date_converter(birth_dt, 0.0), depth=2)
     
     return {
         'mahadashas': mahadashas,
@@ -275,37 +150,7 @@ def get_current_sthira_dasha(dasha_periods: Dict[str, Any], date: Optional[datet
     if date is None:
         date = datetime.now()
     
-    # Find the current Mahadasha
-    current_mahadasha = None
-    for mahadasha in dasha_periods['mahadashas']:
-        if mahadasha['start_date'] <= date < mahadasha['end_date']:
-            current_mahadasha = mahadasha
-            break
-    
-    if not current_mahadasha:
-        return None
-    
-    # Find the current Antardasha
-    current_antardasha = None
-    for antardasha in current_mahadasha['antardashas']:
-        if antardasha['start_date'] <= date < antardasha['end_date']:
-            current_antardasha = antardasha
-            break
-    
-    if not current_antardasha:
-        return {
-            'mahadasha': current_mahadasha,
-            'antardasha': None
-        }
-    
-    return {
-        'mahadasha': current_mahadasha,
-        'antardasha': current_antardasha,
-        'mahadasha_start': current_mahadasha['start_date'],
-        'mahadasha_end': current_mahadasha['end_date'],
-        'antardasha_start': current_antardasha['start_date'],
-        'antardasha_end': current_antardasha['end_date']
-    }
+    return format_current_dasha(get_current_period(dasha_periods, date))
 
 def get_dasha_balance(chart: Chart) -> float:
     """
@@ -359,13 +204,11 @@ def get_current_dasha(chart: Chart, date: Optional[Datetime] = None) -> Optional
     
     target_date = date if date else chart.date
 
-    # Calculate all dasha periods starting from birth
-    all_periods = calculate_sthira_dasha_periods(chart.date.to_datetime(), lagna_sign, lagna_degree)
-    
-    # Find the specific dasha for the target date
-    current_dasha_info = get_current_sthira_dasha(all_periods, target_date.to_datetime())
+    # Only the running Mahadasha is expanded
+    timeline = get_sthira_timeline(chart.date.jd, lagna_sign, lagna_degree)
+    to_date = date_converter(chart.date.to_datetime(), chart.date.jd)
 
-    return current_dasha_info
+    return current_dasha_info(timeline, target_date.jd, to_date)
 
 def get_mahadasha(chart: Chart, date: Optional[Datetime] = None) -> Optional[Dict[str, Any]]:
     """
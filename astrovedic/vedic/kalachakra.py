@@ -11,7 +11,12 @@ from astrovedic import const
 from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
 from astrovedic.vedic.nakshatras import get_nakshatra, NAKSHATRA_SPAN, PADA_SPAN
-from datetime import datetime, timedelta
+from astrovedic.vedic.dasha_engine import (
+    DashaSystem, DashaTimeline, years_to_days, add_years_to_date,
+    date_converter, get_current_period, format_current_dasha,
+    current_dasha_info
+)
+from datetime import datetime
 from typing import Dict, Optional, Any, List, Tuple
 
 # Kalachakra Dasha periods (in years)
@@ -61,15 +66,19 @@ KALACHAKRA_STARTING_PLANETS = {
 # This is a simplified implementation - in practice, the mapping follows specific rules
 # based on the nakshatra's group (savya/apasavya) and pada's group
 
-def calculate_kalachakra_dasha_balance(moon_longitude: float) -> float:
+# Kalachakra Dasha system table
+KALACHAKRA_DASHA = DashaSystem('Kalachakra', KALACHAKRA_SEQUENCE, KALACHAKRA_PERIODS)
+
+def _get_kalachakra_start(moon_longitude: float) -> Tuple[int, float, bool]:
     """
-    Calculate the balance of the current Kalachakra Dasha at birth
+    Get the Kalachakra Dasha lord running at birth, its balance and
+    the direction of the sequence
 
     Args:
         moon_longitude (float): The Moon's longitude in degrees (0-360)
 
     Returns:
-        float: The balance of the current Kalachakra Dasha in years
+        tuple: (index in KALACHAKRA_SEQUENCE, balance in years, is_forward)
     """
     # Get nakshatra information
     nakshatra_info = get_nakshatra(moon_longitude)
@@ -102,7 +111,19 @@ def calculate_kalachakra_dasha_balance(moon_longitude: float) -> float:
     years_of_dasha = KALACHAKRA_PERIODS[starting_planet]
     balance = years_of_dasha * (1 - percentage_in_pada)
     
-    return balance
+    return KALACHAKRA_DASHA.index(starting_planet), balance, is_forward
+
+def calculate_kalachakra_dasha_balance(moon_longitude: float) -> float:
+    """
+    Calculate the balance of the current Kalachakra Dasha at birth
+
+    Args:
+        moon_longitude (float): The Moon's longitude in degrees (0-360)
+
+    Returns:
+        float: The balance of the current Kalachakra Dasha in years
+    """
+    return _get_kalachakra_start(moon_longitude)[1]
 
 def get_kalachakra_sequence(moon_longitude: float) -> List[Dict[str, Any]]:
     """
@@ -114,57 +135,8 @@ def get_kalachakra_sequence(moon_longitude: float) -> List[Dict[str, Any]]:
     Returns:
         list: List of dictionaries with Kalachakra Dasha information
     """
-    # Get nakshatra information
-    nakshatra_info = get_nakshatra(moon_longitude)
-    nakshatra_index = nakshatra_info['index']
-    pada = nakshatra_info['pada']
-    
-    # Determine if the nakshatra is in savya (forward) or apasavya (reverse) group
-    is_savya_nakshatra = nakshatra_index in SAVYA_GROUP
-    is_apasavya_nakshatra = nakshatra_index in APASAVYA_GROUP
-    
-    # Determine if the pada is in savya or apasavya group
-    is_savya_pada = pada in SAVYA_PADA_GROUP
-    is_apasavya_pada = pada in APASAVYA_PADA_GROUP
-    
-    # Determine the direction of the dasha
-    is_forward = (is_savya_nakshatra and is_savya_pada) or (is_apasavya_nakshatra and is_apasavya_pada)
-    
-    # Get the starting planet for this nakshatra and pada
-    starting_planet = KALACHAKRA_STARTING_PLANETS.get((nakshatra_index, pada))
-    if not starting_planet:
-        # Default to Sun if mapping is not available
-        starting_planet = const.SUN
-    
-    # Calculate the balance of the current Kalachakra Dasha
-    balance = calculate_kalachakra_dasha_balance(moon_longitude)
-    
-    # Find the starting index in the Kalachakra sequence
-    start_idx = KALACHAKRA_SEQUENCE.index(starting_planet)
-    
-    # Create the sequence of Kalachakra Dashas
-    kalachakra_sequence = []
-    
-    # Add the current Kalachakra Dasha with its balance
-    kalachakra_sequence.append({
-        'planet': starting_planet,
-        'years': balance
-    })
-    
-    # Add the remaining Kalachakra Dashas in sequence
-    for i in range(1, 9):
-        if is_forward:
-            idx = (start_idx + i) % 9
-        else:
-            idx = (start_idx - i) % 9
-        
-        planet = KALACHAKRA_SEQUENCE[idx]
-        kalachakra_sequence.append({
-            'planet': planet,
-            'years': KALACHAKRA_PERIODS[planet]
-        })
-    
-    return kalachakra_sequence
+    start_idx, balance, is_forward = _get_kalachakra_start(moon_longitude)
+    return KALACHAKRA_DASHA.sequence_info(start_idx, balance, is_forward)
 
 def get_kalachakra_antardasha_sequence(mahadasha_planet: str, mahadasha_years: float, is_forward: bool) -> List[Dict[str, Any]]:
     """
@@ -178,56 +150,21 @@ def get_kalachakra_antardasha_sequence(mahadasha_planet: str, mahadasha_years: f
     Returns:
         list: List of dictionaries with Antardasha information
     """
-    # Find the starting index in the Kalachakra sequence
-    start_idx = KALACHAKRA_SEQUENCE.index(mahadasha_planet)
-    
-    # Create the sequence of Antardashas
-    antardasha_sequence = []
-    
-    # Add all Antardashas in sequence
-    for i in range(9):
-        if is_forward:
-            idx = (start_idx + i) % 9
-        else:
-            idx = (start_idx - i) % 9
-        
-        planet = KALACHAKRA_SEQUENCE[idx]
-        
-        # Calculate the duration of the Antardasha
-        years = (KALACHAKRA_PERIODS[planet] / TOTAL_KALACHAKRA_YEARS) * mahadasha_years
-        
-        antardasha_sequence.append({
-            'planet': planet,
-            'years': years
-        })
-    
-    return antardasha_sequence
-
-def years_to_days(years: float) -> float:
-    """
-    Convert years to days
-
-    Args:
-        years (float): Number of years
-
-    Returns:
-        float: Number of days
-    """
-    return years * 365.25
+    return KALACHAKRA_DASHA.subperiod_info(mahadasha_planet, mahadasha_years, is_forward)
 
-def add_years_to_date(date: datetime, years: float) -> datetime:
+def get_kalachakra_timeline(birth_jd: float, moon_longitude: float) -> DashaTimeline:
     """
-    Add a number of years to a date
+    Get the Kalachakra Mahadasha timeline with lazily expanded sub-periods
 
     Args:
-        date (datetime): The starting date
-        years (float): Number of years to add
+        birth_jd (float): The Julian Day of birth
+        moon_longitude (float): The Moon's longitude in degrees (0-360)
 
     Returns:
-        datetime: The resulting date
+        DashaTimeline: The Mahadasha timeline
     """
-    days = years_to_days(years)
-    return date + timedelta(days=days)
+    start_idx, balance, is_forward = _get_kalachakra_start(moon_longitude)
+    return KALACHAKRA_DASHA.timeline(birth_jd, start_idx, balance, is_forward)
 
 def calculate_kalachakra_dasha_periods(birth_date: datetime, moon_longitude: float) -> Dict[str, Any]:
     """
@@ -246,74 +183,15 @@ def calculate_kalachakra_dasha_periods(birth_date: datetime, moon_longitude: flo
     else:
         birth_dt = birth_date
     
-    # Get nakshatra information
-    nakshatra_info = get_nakshatra(moon_longitude)
-    nakshatra_index = nakshatra_info['index']
-    pada = nakshatra_info['pada']
-    
-    # Determine if the nakshatra is in savya (forward) or apasavya (reverse) group
-    is_savya_nakshatra = nakshatra_index in SAVYA_GROUP
-    is_apasavya_nakshatra = nakshatra_index in APASAVYA_GROUP
-    
-    # Determine if the pada is in savya or apasavya group
-    is_savya_pada = pada in SAVYA_PADA_GROUP
-    is_apasavya_pada = pada in APASAVYA_PADA_GROUP
-    
-    # Determine the direction of the dasha
-    is_forward = (is_savya_nakshatra and is_savya_pada) or (is_apasavya_nakshatra and is_apasavya_pada)
-    
-    # Get the Kalachakra Dasha sequence
-    kalachakra_sequence = get_kalachakra_sequence(moon_longitude)
-    
-    # Calculate start and end dates for each Mahadasha
-    current_date = birth_dt
-    mahadashas = []
-    
-    for mahadasha in kalachakra_sequence:
-        planet = mahadasha['planet']
-        years = mahadasha['years']
-        
-        start_date = current_date
-        end_date = add_years_to_date(start_date, years)
-        
-        # Get Antardashas for this Mahadasha
-        antardasha_sequence = get_kalachakra_antardasha_sequence(planet, years, is_forward)
-        antardashas = []
-        
-        # Calculate start and end dates for each Antardasha
-        antardasha_date = start_date
-        
-        for antardasha in antardasha_sequence:
-            ad_planet = antardasha['planet']
-            ad_years = antardasha['years']
-            
-            ad_start_date = antardasha_date
-            ad_end_date = add_years_to_date(ad_start_date, ad_years)
-            
-            antardashas.append({
-                'planet': ad_planet,
-                'start_date': ad_start_date,
-                'end_date': ad_end_date,
-                'years': ad_years
-            })
-            
-            antardasha_date = ad_end_date
-        
-        mahadashas.append({
-            'planet': planet,
-            'start_date': start_date,
-            'end_date': end_date,
-            'years': years,
-            'antardashas': antardashas
-        })
-        
-        current_date = end_date
+    # Build the timeline relative to birth and materialize two levels
+    timeline = get_kalachakra_timeline(0.0, moon_longitude)
+    mahadashas = timeline.to_list(date_converter(birth_dt, 0.0), depth=2)
     
     return {
         'mahadashas': mahadashas,
         'birth_date': birth_dt,
         'moon_longitude': moon_longitude,
-        'is_forward': is_forward
+        'is_forward': timeline.forward
     }
 
 def get_current_kalachakra_dasha(dasha_periods: Dict[str, Any], date: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
@@ -330,37 +208,7 @@ def get_current_kalachakra_dasha(dasha_periods: Dict[str, Any], date: Optional[d
     if date is None:
         date = datetime.now()
     
-    # Find the current Mahadasha
-    current_mahadasha = None
-    for mahadasha in dasha_periods['mahadashas']:
-        if mahadasha['start_date'] <= date < mahadasha['end_date']:
-            current_mahadasha = mahadasha
-            break
-    
-    if not current_mahadasha:
-        return None
-    
-    # Find the current Antardasha
-    current_antardasha = None
-    for antardasha in current_mahadasha['antardashas']:
-        if antardasha['start_date'] <= date < antardasha['end_date']:
-            current_antardasha = antardasha
-            break
-    
-    if not current_antardasha:
-        return {
-            'mahadasha': current_mahadasha,
-            'antardasha': None
-        }
-    
-    return {
-        'mahadasha': current_mahadasha,
-        'antardasha': current_antardasha,
-        'mahadasha_start': current_mahadasha['start_date'],
-        'mahadasha_end': current_mahadasha['end_date'],
-        'antardasha_start': current_antardasha['start_date'],
-        'antardasha_end': current_antardasha['end_date']
-    }
+    return format_current_dasha(get_current_period(dasha_periods, date))
 
 def get_dasha_balance(chart: Chart) -> float:
     """
@@ -406,13 +254,11 @@ def get_current_dasha(chart: Chart, date: Optional[Datetime] = None) -> Optional
 
     target_date = date if date else chart.date
 
-    # Calculate all dasha periods starting from birth
-    all_periods = calculate_kalachakra_dasha_periods(chart.date.to_datetime(), moon.lon)
-    
-    # Find the specific dasha for the target date
-    current_dasha_info = get_current_kalachakra_dasha(all_periods, target_date.to_datetime())
+    # Only the running Mahadasha is expanded
+    timeline = get_kalachakra_timeline(chart.date.jd, moon.lon)
+    to_date = date_converter(chart.date.to_datetime(), chart.date.jd)
 
-    return current_dasha_info
+    return current_dasha_info(timeline, target_date.jd, to_date)
 
 def get_mahadasha(chart: Chart, date: Optional[Datetime] = None) -> Optional[Dict[str, Any]]:
     """
@@ -7,10 +7,13 @@
     Vimshottari Dasha system.
 """
 
+from array import array
+from bisect import bisect_right
+from fractions import Fraction
 from astrovedic import const
 from astrovedic import angle
 from astrovedic.vedic.nakshatras import (
-    get_nakshatra, VIMSHOTTARI_PERIODS, TOTAL_VIMSHOTTARI_YEARS,
+    get_nakshatra_lord, VIMSHOTTARI_PERIODS, TOTAL_VIMSHOTTARI_YEARS,
     NAKSHATRA_SPAN
 )
 
@@ -34,6 +37,132 @@ VIMSHOTTARI_SEQUENCE = [
 ]
 
 
+class KPBoundaryTable:
+    """
+    Static table of KP divisions of the zodiac.
+
+    Each division starts at starts[i] and ends at the next start (the
+    last one ends at 360). Divisions are split at sign boundaries, so
+    each one has a single sign, star, sub and, for the sub-sub table,
+    sub-sub lord. Lords are stored as indexes into VIMSHOTTARI_SEQUENCE
+    and signs as indexes into const.LIST_SIGNS.
+    """
+
+    def __init__(self, depth):
+        """
+        Build the table
+
+        Args:
+            depth (int): 1 for the 249 sub divisions, 2 for the 2193
+                         sub-sub divisions
+        """
+        self.depth = depth
+        self.starts = array('d')
+        self.sign = array('B')
+        self.star = array('B')
+        self.sub = array('B')
+        self.sub_sub = array('B')
+        self.sub_start = array('d')
+        self.sub_length = array('d')
+
+        # Exact arithmetic keeps divisions that end on a sign boundary
+        # from producing spurious slivers
+        nakshatra_span = Fraction(360, 27)
+        sign_span = Fraction(30)
+
+        for nakshatra_index in range(27):
+            star = nakshatra_index % 9
+            sub_start = nakshatra_index * nakshatra_span
+            for sub in _vimshottari_order(star):
+                sub_length = nakshatra_span * VIMSHOTTARI_PERIODS[VIMSHOTTARI_SEQUENCE[sub]] / TOTAL_VIMSHOTTARI_YEARS
+                if depth == 1:
+                    parts = [(sub_start, sub_length, sub)]
+                else:
+                    parts = []
+                    part_start = sub_start
+                    for sub_sub in _vimshottari_order(sub):
+                        part_length = sub_length * VIMSHOTTARI_PERIODS[VIMSHOTTARI_SEQUENCE[sub_sub]] / TOTAL_VIMSHOTTARI_YEARS
+                        parts.append((part_start, part_length, sub_sub))
+                        part_start += part_length
+
+                for part_start, part_length, lord in parts:
+                    part_end = part_start + part_length
+                    start = part_start
+                    while start < part_end:
+                        sign = int(start // sign_span)
+                        self.starts.append(float(start))
+                        self.sign.append(sign)
+                        self.star.append(star)
+                        self.sub.append(sub)
+                        self.sub_sub.append(lord)
+                        self.sub_start.append(float(sub_start))
+                        self.sub_length.append(float(sub_length))
+                        start = min(part_end, (sign + 1) * sign_span)
+
+                sub_start += sub_length
+
+    def __len__(self):
+        return len(self.starts)
+
+    def index(self, longitude):
+        """
+        Get the division containing a longitude
+
+        Args:
+            longitude (float): The longitude in degrees
+
+        Returns:
+            int: The division index (0-based)
+        """
+        return bisect_right(self.starts, angle.norm(longitude)) - 1
+
+    def indexes(self, longitudes):
+        """
+        Get the divisions containing many longitudes
+
+        Args:
+            longitudes (list): The longitudes in degrees
+
+        Returns:
+            list: The division indexes (0-based)
+        """
+        starts = self.starts
+        return [bisect_right(starts, angle.norm(lon)) - 1 for lon in longitudes]
+
+    def lords(self, i):
+        """
+        Get the lords of a division
+
+        Args:
+            i (int): The division index
+
+        Returns:
+            tuple: (sign lord, star lord, sub lord, sub-sub lord). The
+                   sub-sub lord is None for the sub table.
+        """
+        sign_lord = const.LIST_RULERS[const.LIST_SIGNS[self.sign[i]]]
+        star_lord = VIMSHOTTARI_SEQUENCE[self.star[i]]
+        sub_lord = VIMSHOTTARI_SEQUENCE[self.sub[i]]
+        sub_sub_lord = VIMSHOTTARI_SEQUENCE[self.sub_sub[i]] if self.depth > 1 else None
+        return (sign_lord, star_lord, sub_lord, sub_sub_lord)
+
+
+def _vimshottari_order(start):
+    """ Returns the Vimshottari sequence indexes starting from a lord. """
+    return [(start + i) % 9 for i in range(9)]
+
+
+# KP sub (249) and sub-sub (2193) divisions of the zodiac
+KP_SUB_TABLE = KPBoundaryTable(1)
+KP_SUB_SUB_TABLE = KPBoundaryTable(2)
+
+
+def _format_kp_pointer(sign_lord, star_lord, sub_lord, sub_sub_lord):
+    """ Returns the KP pointer string for a set of lords. """
+    return '-'.join(PLANET_ABBR.get(lord, lord[:3])
+                    for lord in (sign_lord, star_lord, sub_lord, sub_sub_lord))
+
+
 def get_kp_sublord(longitude):
     """
     Get the sublord for KP astrology based on Vimshottari Dasha periods
@@ -44,53 +173,15 @@ def get_kp_sublord(longitude):
     Returns:
         dict: Dictionary with sublord information
     """
-    # Get nakshatra information
-    nakshatra_info = get_nakshatra(longitude)
-    nakshatra_index = nakshatra_info['index']
-    star_lord = nakshatra_info['lord']
-
-    # Calculate position within nakshatra (0-13.33333 degrees)
-    pos_in_nakshatra = longitude % NAKSHATRA_SPAN
-
-    # Get sign information
-    sign_num = int(longitude / 30)
-    sign = const.LIST_SIGNS[sign_num]
-    sign_lord = const.LIST_RULERS[sign]
-
-    # Find the starting index in the Vimshottari sequence
-    start_idx = VIMSHOTTARI_SEQUENCE.index(star_lord)
-
-    # Calculate sub divisions based on Vimshottari dasha periods
-    current_pos = 0
-    sub_lord = None
-
-    for i in range(9):  # 9 planets in Vimshottari
-        lord_idx = (start_idx + i) % 9
-        current_lord = VIMSHOTTARI_SEQUENCE[lord_idx]
-
-        # Calculate sub length based on Vimshottari period
-        sub_length = (VIMSHOTTARI_PERIODS[current_lord] / TOTAL_VIMSHOTTARI_YEARS) * NAKSHATRA_SPAN
-
-        if current_pos <= pos_in_nakshatra < (current_pos + sub_length):
-            sub_lord = current_lord
-            sub_pos = pos_in_nakshatra - current_pos
-            sub_length_found = sub_length
-            break
-
-        current_pos += sub_length
-
-    # If no sub lord found (shouldn't happen), use star lord
-    if not sub_lord:
-        sub_lord = star_lord
-        sub_pos = 0
-        sub_length_found = NAKSHATRA_SPAN
+    i = KP_SUB_TABLE.index(longitude)
+    sign_lord, star_lord, sub_lord, _ = KP_SUB_TABLE.lords(i)
 
     return {
         'rasi_lord': sign_lord,
         'nakshatra_lord': star_lord,
         'sub_lord': sub_lord,
-        'sub_position': sub_pos,
-        'sub_length': sub_length_found
+        'sub_position': angle.norm(longitude) - KP_SUB_TABLE.sub_start[i],
+        'sub_length': KP_SUB_TABLE.sub_length[i]
     }
 
 
@@ -104,37 +195,8 @@ def get_kp_sub_sublord(longitude):
     Returns:
         str: The sub-sublord (planet name)
     """
-    # Get sublord information
-    sublord_info = get_kp_sublord(longitude)
-    sub_lord = sublord_info['sub_lord']
-    sub_pos = sublord_info['sub_position']
-    sub_length = sublord_info['sub_length']
-
-    # Find the starting index in the Vimshottari sequence
-    start_idx = VIMSHOTTARI_SEQUENCE.index(sub_lord)
-
-    # Calculate sub-sub divisions based on Vimshottari dasha periods
-    current_pos = 0
-    sub_sub_lord = None
-
-    for i in range(9):  # 9 planets in Vimshottari
-        lord_idx = (start_idx + i) % 9
-        current_lord = VIMSHOTTARI_SEQUENCE[lord_idx]
-
-        # Calculate sub-sub length based on Vimshottari period
-        sub_sub_length = (VIMSHOTTARI_PERIODS[current_lord] / TOTAL_VIMSHOTTARI_YEARS) * sub_length
-
-        if current_pos <= sub_pos < (current_pos + sub_sub_length):
-            sub_sub_lord = current_lord
-            break
-
-        current_pos += sub_sub_length
-
-    # If no sub-sub lord found (shouldn't happen), use sub lord
-    if not sub_sub_lord:
-        sub_sub_lord = sub_lord
-
-    return sub_sub_lord
+    i = KP_SUB_SUB_TABLE.index(longitude)
+    return VIMSHOTTARI_SEQUENCE[KP_SUB_SUB_TABLE.sub_sub[i]]
 
 
 def get_kp_pointer(longitude):
@@ -147,50 +209,94 @@ def get_kp_pointer(longitude):
     Returns:
         str: The KP pointer string
     """
-    # Get the KP lords information
-    sublord_info = get_kp_sublord(longitude)
-    sub_sublord = get_kp_sub_sublord(longitude)
+    i = KP_SUB_SUB_TABLE.index(longitude)
+    return _format_kp_pointer(*KP_SUB_SUB_TABLE.lords(i))
+
+
+def get_kp_lords(longitude):
+    """
+    Get sign lord, star lord, sub lord, and sub-sub lord for KP astrology
 
-    # Format the KP pointer
-    sign_lord = sublord_info['rasi_lord']
-    star_lord = sublord_info['nakshatra_lord']
-    sub_lord = sublord_info['sub_lord']
+    Args:
+        longitude (float): The longitude in degrees (0-360)
 
-    sign_abbr = PLANET_ABBR.get(sign_lord, sign_lord[:3])
-    star_abbr = PLANET_ABBR.get(star_lord, star_lord[:3])
-    sub_abbr = PLANET_ABBR.get(sub_lord, sub_lord[:3])
-    sub_sub_abbr = PLANET_ABBR.get(sub_sublord, sub_sublord[:3])
+    Returns:
+        dict: Dictionary with KP lords information
+    """
+    i = KP_SUB_SUB_TABLE.index(longitude)
+    sign_lord, star_lord, sub_lord, sub_sub_lord = KP_SUB_SUB_TABLE.lords(i)
+
+    return {
+        'sign_lord': sign_lord,
+        'star_lord': star_lord,
+        'sub_lord': sub_lord,
+        'sub_sub_lord': sub_sub_lord,
+        'kp_pointer': _format_kp_pointer(sign_lord, star_lord, sub_lord, sub_sub_lord)
+    }
 
-    kp_pointer = f"{sign_abbr}-{star_abbr}-{sub_abbr}-{sub_sub_abbr}"
 
-    return kp_pointer
+def get_kp_lords_batch(longitudes):
+    """
+    Get the KP lords for many longitudes
 
+    Args:
+        longitudes (list): The longitudes in degrees (0-360)
 
-def get_kp_lords(longitude):
+    Returns:
+        list: List of dictionaries with KP lords information
     """
-    Get sign lord, star lord, sub lord, and sub-sub lord for KP astrology
+    results = []
+    for i in KP_SUB_SUB_TABLE.indexes(longitudes):
+        sign_lord, star_lord, sub_lord, sub_sub_lord = KP_SUB_SUB_TABLE.lords(i)
+        results.append({
+            'sign_lord': sign_lord,
+            'star_lord': star_lord,
+            'sub_lord': sub_lord,
+            'sub_sub_lord': sub_sub_lord,
+            'kp_pointer': _format_kp_pointer(sign_lord, star_lord, sub_lord, sub_sub_lord)
+        })
+    return results
+
+
+def get_kp_horary_number(longitude):
+    """
+    Get the KP horary number (1-249) of a longitude
 
     Args:
         longitude (float): The longitude in degrees (0-360)
 
     Returns:
-        dict: Dictionary with KP lords information
+        int: The KP horary number
     """
-    # Get the sublord information
-    sublord_info = get_kp_sublord(longitude)
+    return KP_SUB_TABLE.index(longitude) + 1
+
+
+def get_kp_horary_position(number):
+    """
+    Get the zodiac division of a KP horary number
+
+    Args:
+        number (int): The KP horary number (1-249)
 
-    # Get the sub-sublord
-    sub_sublord = get_kp_sub_sublord(longitude)
+    Returns:
+        dict: Dictionary with the start and end longitudes and the lords
+              of the division
+    """
+    if not 1 <= number <= len(KP_SUB_TABLE):
+        raise ValueError(f"KP horary number must be between 1 and {len(KP_SUB_TABLE)}")
 
-    # Get the KP pointer
-    kp_pointer = get_kp_pointer(longitude)
+    i = number - 1
+    end = KP_SUB_TABLE.starts[i + 1] if number < len(KP_SUB_TABLE) else 360.0
+    sign_lord, star_lord, sub_lord, _ = KP_SUB_TABLE.lords(i)
 
     return {
-        'sign_lord': sublord_info['rasi_lord'],
-        'star_lord': sublord_info['nakshatra_lord'],
-        'sub_lord': sublord_info['sub_lord'],
-        'sub_sub_lord': sub_sublord,
-        'kp_pointer': kp_pointer
+        'number': number,
+        'start_longitude': KP_SUB_TABLE.starts[i],
+        'end_longitude': end,
+        'sign': const.LIST_SIGNS[KP_SUB_TABLE.sign[i]],
+        'sign_lord': sign_lord,
+        'star_lord': star_lord,
+        'sub_lord': sub_lord
     }
 
 
@@ -209,12 +315,13 @@ def get_kp_planets(chart):
     for planet_id in const.LIST_PLANETS:
         planet = chart.getObject(planet_id)
         if planet:
+            kp_lords = get_kp_lords(planet['lon'])
             kp_planets[planet_id] = {
                 'longitude': planet['lon'],
                 'sign': planet['sign'],
                 'house': planet['house'],
-                'kp_lords': get_kp_lords(planet['lon']),
-                'kp_pointer': get_kp_pointer(planet['lon'])
+                'kp_lords': kp_lords,
+                'kp_pointer': kp_lords['kp_pointer']
             }
 
     return kp_planets
@@ -234,11 +341,12 @@ def get_kp_houses(chart):
 
     for house_num in range(1, 13):
         house = chart.houses.get(house_num)
+        kp_lords = get_kp_lords(house.lon)
         kp_houses[house_num] = {
             'longitude': house.lon,
             'sign': house.sign,
-            'kp_lords': get_kp_lords(house.lon),
-            'kp_pointer': get_kp_pointer(house.lon)
+            'kp_lords': kp_lords,
+            'kp_pointer': kp_lords['kp_pointer']
         }
 
     return kp_houses
@@ -274,18 +382,17 @@ def get_kp_significators(chart, house_num):
     # Get the house sublord
     house_sublord = get_kp_sublord(house.lon)['sub_lord']
 
-    # Get the planets in the star of the house sublord
+    # Get the planets in the star of the house sublord and in the house
     star_significators = []
-    for planet_id in const.LIST_PLANETS:
-        planet = chart.getObject(planet_id)
-        if planet and get_nakshatra(planet['lon'])['lord'] == house_sublord:
-            star_significators.append(planet_id)
-
-    # Get the planets in the house
     occupants = []
     for planet_id in const.LIST_PLANETS:
         planet = chart.getObject(planet_id)
-        if planet and planet['house'] == house_num:
+        if not planet:
+            continue
+        star = KP_SUB_TABLE.star[KP_SUB_TABLE.index(planet['lon'])]
+        if VIMSHOTTARI_SEQUENCE[star] == house_sublord:
+            star_significators.append(planet_id)
+        if planet['house'] == house_num:
             occupants.append(planet_id)
 
     return {
@@ -344,7 +451,7 @@ def get_kp_ruling_planets(chart):
 
     # Get the Moon nakshatra lord
     moon = chart.getObject(const.MOON)
-    moon_nakshatra_lord = get_nakshatra(moon['lon'])['lord']
+    moon_nakshatra_lord = get_nakshatra_lord(moon['lon'])
 
     # Get the lagna (ascendant) sublord
     lagna = chart.houses.get(1)
@@ -30,3 +30,8 @@ get_kp_planets = kp.get_kp_planets
 get_kp_houses = kp.get_kp_houses
 get_kp_significators = kp.get_kp_significators
 get_kp_ruling_planets = kp.get_kp_ruling_planets
+get_kp_lords_batch = kp.get_kp_lords_batch
+get_kp_horary_number = kp.get_kp_horary_number
+get_kp_horary_position = kp.get_kp_horary_position
+KP_SUB_TABLE = kp.KP_SUB_TABLE
+KP_SUB_SUB_TABLE = kp.KP_SUB_SUB_TABLE
@@ -48,6 +48,15 @@ from astrovedic.vedic.muhurta.basic_analysis import (
     get_basic_muhurta_analysis
 )
 
+from astrovedic.vedic.muhurta.intervals import (
+    get_factor_timelines, get_kala_intervals,
+    merge_timelines, get_muhurta_windows
+)
+
+from astrovedic.vedic.muhurta.search import (
+    get_activity_upper_bound, find_best_times_for_activity
+)
+
 # Note: For detailed analysis, use the astroved_extension package
 
 # Constants for Muhurta
@@ -11,6 +11,7 @@ from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
 from astrovedic.geopos import GeoPos
 from datetime import timedelta
+from astrovedic.parallel import get_executor, map_blocks
 
 # Import core functions
 from astrovedic.vedic.muhurta.core import (
@@ -345,15 +346,30 @@ def get_activity_score(date, location, activity):
     }
 
 
-def get_best_time_for_activity(start_date, end_date, location, activity):
+def _score_block(shared, dates):
+    """ Returns the activity scores of a block of dates. """
+    location, activity = shared
+    return [get_activity_score(date, location, activity) for date in dates]
+
+
+def get_best_time_for_activity(start_date, end_date, location, activity,
+                               max_workers=None, executor=None):
     """
     Find the best time for a specific activity within a date range
     
+    The auspicious periods are found with the 15-minute scan of
+    get_auspicious_times and the start of each period is scored for
+    the activity. With max_workers greater than 1, or an executor, the
+    days of the scan and the period scores are evaluated in parallel,
+    with the same result as a serial run.
+    
     Args:
         start_date (Datetime): The start date and time
         end_date (Datetime): The end date and time
         location (GeoPos): The geographical location
         activity (str): The type of activity
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
     
     Returns:
         dict: Dictionary with the best time information
@@ -364,17 +380,23 @@ def get_best_time_for_activity(start_date, end_date, location, activity):
     # Get the minimum duration
     min_duration = rules.get('min_duration', 60)
     
-    # Get all auspicious times
-    auspicious_times = get_auspicious_times(start_date, end_date, location, min_duration)
+    with get_executor(max_workers, executor) as pool:
+        # Get all auspicious times
+        auspicious_times = get_auspicious_times(start_date, end_date, location,
+                                                min_duration, executor=pool)
+        
+        # Calculate the activity score of each auspicious time
+        starts = [time_period['start'] for time_period in auspicious_times]
+        scores = list(map_blocks(_score_block, starts, 1, executor=pool,
+                                 shared=(location, activity)))
     
     # Initialize variables
     best_score = -1
     best_time = None
     
     # Check each auspicious time
-    for time_period in auspicious_times:
-        # Calculate the activity score
-        score = get_activity_score(time_period['start'], location, activity)
+    for index, score in scores:
+        time_period = auspicious_times[index]
         
         # Check if this is the best time so far
         if score['percentage'] > best_score:
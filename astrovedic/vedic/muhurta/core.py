@@ -10,7 +10,7 @@ from astrovedic import const
 from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
 from astrovedic.geopos import GeoPos
-from datetime import timedelta
+from astrovedic.parallel import map_blocks
 
 # Import Panchanga functions
 from astrovedic.vedic.muhurta.panchanga import (
@@ -31,6 +31,12 @@ NEUTRAL = 'Neutral'
 INAUSPICIOUS = 'Inauspicious'
 HIGHLY_INAUSPICIOUS = 'Highly Inauspicious'
 
+# Step in minutes of the auspicious time scan
+AUSPICIOUS_STEP = 15
+
+# Number of scan times evaluated per task (one day of steps)
+DEFAULT_BLOCK_SIZE = 24 * 60 // AUSPICIOUS_STEP
+
 
 def get_muhurta_quality(chart):
     """
@@ -45,95 +51,136 @@ def get_muhurta_quality(chart):
     # Get the Panchanga
     panchanga = get_panchanga(chart)
     
-    # Initialize the score
+    # Score the Panchanga
+    score = get_panchanga_score(
+        panchanga['tithi']['num'], panchanga['nakshatra']['num'],
+        panchanga['yoga']['num'], panchanga['karana']['num'],
+        panchanga['vara']['num']
+    )
+    
+    # Check planetary positions
+    # Moon's position
+    score += get_moon_house_score(get_house_number(chart, const.MOON))
+    
+    # Check if Moon is conjunct with malefics
+    if is_conjunct_with_malefics(chart, const.MOON):
+        score -= 1
+    
+    # Check if Moon is aspected by benefics
+    if is_aspected_by_benefics(chart, const.MOON):
+        score += 1
+    
+    # Check if Lagna is strong
+    if is_lagna_strong(chart):
+        score += 1
+    
+    # Check if there are planets in the 8th house
+    if has_planets_in_8th_house(chart):
+        score -= 1
+    
+    # Determine the quality based on the score
+    quality = get_quality(score)
+    
+    return {
+        'score': score,
+        'quality': quality,
+        'panchanga': panchanga
+    }
+
+
+def get_panchanga_score(tithi_num, nakshatra_num, yoga_num, karana_num, vara_num):
+    """
+    Calculate the Muhurta score of the five Panchanga elements
+    
+    Args:
+        tithi_num (int): The Tithi number
+        nakshatra_num (int): The Nakshatra number
+        yoga_num (int): The Yoga number
+        karana_num (int): The Karana number
+        vara_num (int): The Vara number
+    
+    Returns:
+        int: The Panchanga score
+    """
     score = 0
     
     # Check Tithi
-    tithi = panchanga['tithi']
-    if is_auspicious_tithi(tithi['num']):
+    if is_auspicious_tithi(tithi_num):
         score += 2
-    elif tithi['num'] in [4, 9, 14]:  # Chaturthi, Navami, Chaturdashi
+    elif tithi_num in [4, 9, 14]:  # Chaturthi, Navami, Chaturdashi
         score -= 1
-    elif tithi['num'] in [8, 12, 30]:  # Ashtami, Dwadashi, Amavasya
+    elif tithi_num in [8, 12, 30]:  # Ashtami, Dwadashi, Amavasya
         score -= 2
     
     # Check Nakshatra
-    nakshatra = panchanga['nakshatra']
-    if is_auspicious_nakshatra(nakshatra['num']):
+    if is_auspicious_nakshatra(nakshatra_num):
         score += 2
-    elif nakshatra['num'] in [3, 5, 7]:  # Krittika, Mrigashira, Punarvasu
+    elif nakshatra_num in [3, 5, 7]:  # Krittika, Mrigashira, Punarvasu
         score += 1
-    elif nakshatra['num'] in [4, 9, 19]:  # Rohini, Ashlesha, Moola
+    elif nakshatra_num in [4, 9, 19]:  # Rohini, Ashlesha, Moola
         score -= 1
-    elif nakshatra['num'] in [1, 10, 16, 18]:  # Ashwini, Magha, Vishakha, Jyeshtha
+    elif nakshatra_num in [1, 10, 16, 18]:  # Ashwini, Magha, Vishakha, Jyeshtha
         score -= 2
     
     # Check Yoga
-    yoga = panchanga['yoga']
-    if is_auspicious_yoga(yoga['num']):
+    if is_auspicious_yoga(yoga_num):
         score += 1
-    elif yoga['num'] in [6, 9, 28]:  # Atiganda, Shoola, Vyaghata
+    elif yoga_num in [6, 9, 28]:  # Atiganda, Shoola, Vyaghata
         score -= 1
     
     # Check Karana
-    karana = panchanga['karana']
-    if is_auspicious_karana(karana['num']):
+    if is_auspicious_karana(karana_num):
         score += 1
-    elif karana['num'] in [4, 7, 11]:  # Vishti, Shakuni, Chatushpada
+    elif karana_num in [4, 7, 11]:  # Vishti, Shakuni, Chatushpada
         score -= 1
     
     # Check Vara (Weekday)
-    vara = panchanga['vara']
-    if is_auspicious_vara(vara['num']):
+    if is_auspicious_vara(vara_num):
         score += 1
-    elif vara['num'] in [1, 6]:  # Sunday, Friday
+    elif vara_num in [1, 6]:  # Sunday, Friday
         score += 0
-    elif vara['num'] in [3, 7]:  # Tuesday, Saturday
+    elif vara_num in [3, 7]:  # Tuesday, Saturday
         score -= 1
     
-    # Check planetary positions
-    # Moon's position
-    moon = chart.getObject(const.MOON)
-    moon_house = get_house_number(chart, const.MOON)
+    return score
+
+
+def get_moon_house_score(moon_house):
+    """
+    Calculate the Muhurta score of the Moon's house
     
+    Args:
+        moon_house (int): The house (1-12) of the Moon
+    
+    Returns:
+        int: The Moon house score
+    """
     if moon_house in [1, 4, 7, 10]:  # Kendra houses
-        score += 1
+        return 1
     elif moon_house in [6, 8, 12]:  # Dusthana houses
-        score -= 1
-    
-    # Check if Moon is conjunct with malefics
-    if is_conjunct_with_malefics(chart, const.MOON):
-        score -= 1
-    
-    # Check if Moon is aspected by benefics
-    if is_aspected_by_benefics(chart, const.MOON):
-        score += 1
-    
-    # Check if Lagna is strong
-    if is_lagna_strong(chart):
-        score += 1
+        return -1
+    return 0
+
+
+def get_quality(score):
+    """
+    Get the Muhurta quality for a score
     
-    # Check if there are planets in the 8th house
-    if has_planets_in_8th_house(chart):
-        score -= 1
+    Args:
+        score (int): The Muhurta score
     
-    # Determine the quality based on the score
+    Returns:
+        str: The Muhurta quality
+    """
     if score >= 5:
-        quality = EXCELLENT
+        return EXCELLENT
     elif score >= 2:
-        quality = GOOD
+        return GOOD
     elif score >= -1:
-        quality = NEUTRAL
+        return NEUTRAL
     elif score >= -4:
-        quality = INAUSPICIOUS
-    else:
-        quality = HIGHLY_INAUSPICIOUS
-    
-    return {
-        'score': score,
-        'quality': quality,
-        'panchanga': panchanga
-    }
+        return INAUSPICIOUS
+    return HIGHLY_INAUSPICIOUS
 
 
 def get_best_muhurta(start_date, end_date, location, interval_minutes=60):
@@ -149,19 +196,14 @@ def get_best_muhurta(start_date, end_date, location, interval_minutes=60):
     Returns:
         dict: Dictionary with the best Muhurta information
     """
-    # Convert start_date and end_date to Python datetime objects
-    start_dt = start_date.datetime()
-    end_dt = end_date.datetime()
-    
     # Initialize variables
     best_score = -float('inf')
     best_muhurta = None
     
     # Iterate through the date range
-    current_dt = start_dt
-    while current_dt < end_dt:
+    for current_jd in get_scan_times(start_date, end_date, interval_minutes):
         # Create a Datetime object for the current time
-        current_date = Datetime.fromDatetime(current_dt)
+        current_date = Datetime.fromJD(current_jd, start_date.utcoffset)
         
         # Create a chart for the current time
         chart = Chart(current_date, location, hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
@@ -176,55 +218,97 @@ def get_best_muhurta(start_date, end_date, location, interval_minutes=60):
                 'date': current_date,
                 'quality': quality
             }
-        
-        # Move to the next interval
-        current_dt += timedelta(minutes=interval_minutes)
     
     return best_muhurta
 
 
-def get_auspicious_times(start_date, end_date, location, min_duration=60):
+def get_scan_times(start_date, end_date, step_minutes):
+    """
+    Get the Julian days of a scan of a date range in fixed steps
+    
+    Args:
+        start_date (Datetime): The start date and time
+        end_date (Datetime): The end date and time
+        step_minutes (int): The step in minutes
+    
+    Returns:
+        list: The Julian days from the start date, before the end date
+    """
+    step = step_minutes / (24 * 60)
+    count = 0
+    while start_date.jd + count * step < end_date.jd:
+        count += 1
+    return [start_date.jd + i * step for i in range(count)]
+
+
+def get_duration(start_date, end_date):
+    """
+    Get the duration between two dates in minutes
+    
+    Args:
+        start_date (Datetime): The start date and time
+        end_date (Datetime): The end date and time
+    
+    Returns:
+        float: The duration in minutes
+    """
+    return round((end_date.jd - start_date.jd) * 24 * 60, 3)
+
+
+def _get_block_qualities(shared, jds):
+    """ Returns the Muhurta quality names of a block of Julian days. """
+    location, utcoffset = shared
+    return [
+        get_muhurta_quality(Chart(Datetime.fromJD(jd, utcoffset), location,
+                                  hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI))['quality']
+        for jd in jds
+    ]
+
+
+def get_auspicious_times(start_date, end_date, location, min_duration=60,
+                         max_workers=None, executor=None):
     """
     Find auspicious time periods within a date range
     
+    The range is scanned every 15 minutes. The scan times are evaluated
+    in blocks of one day with map_blocks, so with max_workers greater
+    than 1, or an executor, the days are evaluated in parallel. The
+    periods are the same as those of a serial scan.
+    
     Args:
         start_date (Datetime): The start date and time
         end_date (Datetime): The end date and time
         location (GeoPos): The geographical location
         min_duration (int, optional): Minimum duration in minutes
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
     
     Returns:
         list: List of auspicious time periods
     """
-    # Convert start_date and end_date to Python datetime objects
-    start_dt = start_date.datetime()
-    end_dt = end_date.datetime()
+    utcoffset = start_date.utcoffset
+    jds = get_scan_times(start_date, end_date, AUSPICIOUS_STEP)
+    qualities = map_blocks(_get_block_qualities, jds, DEFAULT_BLOCK_SIZE,
+                           max_workers=max_workers, executor=executor,
+                           shared=(location, utcoffset))
     
     # Initialize variables
     auspicious_times = []
     current_period = None
     
-    # Iterate through the date range in 15-minute intervals
-    current_dt = start_dt
-    while current_dt < end_dt:
+    for index, quality in qualities:
         # Create a Datetime object for the current time
-        current_date = Datetime.fromDatetime(current_dt)
-        
-        # Create a chart for the current time
-        chart = Chart(current_date, location, hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
-        
-        # Get the Muhurta quality
-        quality = get_muhurta_quality(chart)
+        current_date = Datetime.fromJD(jds[index], utcoffset)
         
         # Check if this is an auspicious time
-        is_auspicious = quality['quality'] in [EXCELLENT, GOOD]
+        is_auspicious = quality in [EXCELLENT, GOOD]
         
         # Check if we need to start a new period
         if is_auspicious and current_period is None:
             current_period = {
                 'start': current_date,
                 'end': None,
-                'quality': quality['quality']
+                'quality': quality
             }
         
         # Check if we need to end the current period
@@ -232,7 +316,7 @@ def get_auspicious_times(start_date, end_date, location, min_duration=60):
             current_period['end'] = current_date
             
             # Calculate the duration in minutes
-            duration = (current_date.datetime() - current_period['start'].datetime()).total_seconds() / 60
+            duration = get_duration(current_period['start'], current_date)
             
             # Add the period if it meets the minimum duration
             if duration >= min_duration:
@@ -240,16 +324,13 @@ def get_auspicious_times(start_date, end_date, location, min_duration=60):
                 auspicious_times.append(current_period)
             
             current_period = None
-        
-        # Move to the next interval
-        current_dt += timedelta(minutes=15)
     
     # Handle the case where the last period extends to the end of the range
     if current_period is not None:
         current_period['end'] = end_date
         
         # Calculate the duration in minutes
-        duration = (end_date.datetime() - current_period['start'].datetime()).total_seconds() / 60
+        duration = get_duration(current_period['start'], end_date)
         
         # Add the period if it meets the minimum duration
         if duration >= min_duration:
@@ -271,22 +352,17 @@ def get_inauspicious_times(start_date, end_date, location):
     Returns:
         list: List of inauspicious time periods
     """
-    # Convert start_date and end_date to Python datetime objects
-    start_dt = start_date.datetime()
-    end_dt = end_date.datetime()
-    
     # Initialize variables
     inauspicious_times = []
     
     # Iterate through each day in the date range
-    current_dt = start_dt
-    while current_dt < end_dt:
+    for current_jd in get_scan_times(start_date, end_date, 24 * 60):
         # Create a Datetime object for the current day
-        current_date = Datetime.fromDatetime(current_dt)
+        current_date = Datetime.fromJD(current_jd, start_date.utcoffset)
         
         # Get Rahu Kala
         rahu_kala = get_rahu_kala(current_date, location)
-        if rahu_kala['start'].datetime() < end_dt and rahu_kala['end'].datetime() > start_dt:
+        if rahu_kala['start'].jd < end_date.jd and rahu_kala['end'].jd > start_date.jd:
             inauspicious_times.append({
                 'type': 'Rahu Kala',
                 'start': rahu_kala['start'],
@@ -296,7 +372,7 @@ def get_inauspicious_times(start_date, end_date, location):
         
         # Get Yama Ghantaka
         yama_ghantaka = get_yama_ghantaka(current_date, location)
-        if yama_ghantaka['start'].datetime() < end_dt and yama_ghantaka['end'].datetime() > start_dt:
+        if yama_ghantaka['start'].jd < end_date.jd and yama_ghantaka['end'].jd > start_date.jd:
             inauspicious_times.append({
                 'type': 'Yama Ghantaka',
                 'start': yama_ghantaka['start'],
@@ -306,16 +382,13 @@ def get_inauspicious_times(start_date, end_date, location):
         
         # Get Gulika Kala
         gulika_kala = get_gulika_kala(current_date, location)
-        if gulika_kala['start'].datetime() < end_dt and gulika_kala['end'].datetime() > start_dt:
+        if gulika_kala['start'].jd < end_date.jd and gulika_kala['end'].jd > start_date.jd:
             inauspicious_times.append({
                 'type': 'Gulika Kala',
                 'start': gulika_kala['start'],
                 'end': gulika_kala['end'],
                 'description': 'Inauspicious period ruled by Gulika'
             })
-        
-        # Move to the next day
-        current_dt += timedelta(days=1)
     
     return inauspicious_times
 
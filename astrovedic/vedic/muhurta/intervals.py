@@ -0,0 +1,413 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements an interval based Muhurta engine. Instead of
+    building a chart every few minutes, the exact time intervals of every
+    factor (Tithi, Nakshatra, Yoga, Karana, Vara, Lagna sign, Moon house
+    and the inauspicious Kalas) are computed from transition tables and
+    angle crossings. The intervals are then intersected into segments on
+    which all factors are constant, and each segment is scored once.
+
+    The segment score covers the Panchanga and Moon house terms of
+    get_muhurta_quality only. The Moon conjunction and aspect, Lagna
+    strength and 8th house terms are left out, so the score of a chart
+    inside a segment is within CHART_SCORE_MARGIN of the segment score.
+    get_best_muhurta, get_auspicious_times and the event finders keep
+    the full chart score and stay on their step scans.
+"""
+
+import math
+from bisect import bisect_right
+
+from astrovedic import const
+from astrovedic import angle
+from astrovedic.datetime import Datetime, Date
+from astrovedic.ephem import swe
+
+from astrovedic.vedic.panchang import (
+    RAHUKALA_SEQUENCE, YAMAGANDA_SEQUENCE, GULIKA_SEQUENCE
+)
+from astrovedic.vedic.panchang_transitions import (
+    TITHI, KARANA, NAKSHATRA, YOGA, get_transitions, get_angle_periods
+)
+from astrovedic.vedic.panchang_calendar import get_sunrise_table
+from astrovedic.vedic.muhurta.core import (
+    get_panchanga_score, get_moon_house_score, get_quality
+)
+
+# Muhurta factors
+VARA = 'vara'
+LAGNA = 'lagna'
+MOON_HOUSE = 'moon_house'
+
+# Inauspicious periods of the day with their parts (1-8)
+KALA_SEQUENCES = {
+    'rahukala': RAHUKALA_SEQUENCE,
+    'yamaganda': YAMAGANDA_SEQUENCE,
+    'gulika_kala': GULIKA_SEQUENCE
+}
+
+# Largest difference between the full chart score and the segment score
+# (Moon with malefics, Moon aspected by benefics, strong Lagna, 8th house)
+CHART_SCORE_MARGIN = 2
+
+# Mean daily motion (degrees) of the Ascendant and of Ascendant - Moon
+ASC_RATE = 360.99
+ASC_MOON_RATE = 347.8
+
+
+# === Interval algebra === #
+
+def union_intervals(intervals):
+    """
+    Merge overlapping or touching intervals
+
+    Args:
+        intervals (iterable): (start, end) pairs
+
+    Returns:
+        list: Sorted, disjoint (start, end) pairs
+    """
+    result = []
+    for start, end in sorted(intervals):
+        if result and start <= result[-1][1]:
+            if end > result[-1][1]:
+                result[-1] = (result[-1][0], end)
+        else:
+            result.append((start, end))
+    return result
+
+
+def intersect_intervals(intervals1, intervals2):
+    """
+    Intersect two sorted lists of disjoint intervals
+
+    Args:
+        intervals1 (list): Sorted, disjoint (start, end) pairs
+        intervals2 (list): Sorted, disjoint (start, end) pairs
+
+    Returns:
+        list: Sorted, disjoint (start, end) pairs
+    """
+    result = []
+    i = j = 0
+    while i < len(intervals1) and j < len(intervals2):
+        start = max(intervals1[i][0], intervals2[j][0])
+        end = min(intervals1[i][1], intervals2[j][1])
+        if start < end:
+            result.append((start, end))
+        if intervals1[i][1] < intervals2[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def subtract_intervals(intervals1, intervals2):
+    """
+    Remove the second list of intervals from the first
+
+    Args:
+        intervals1 (list): Sorted, disjoint (start, end) pairs
+        intervals2 (list): Sorted, disjoint (start, end) pairs
+
+    Returns:
+        list: Sorted, disjoint (start, end) pairs
+    """
+    result = []
+    j = 0
+    for start, end in intervals1:
+        while j < len(intervals2) and intervals2[j][1] <= start:
+            j += 1
+        k = j
+        while k < len(intervals2) and intervals2[k][0] < end:
+            if intervals2[k][0] > start:
+                result.append((start, intervals2[k][0]))
+            start = max(start, intervals2[k][1])
+            k += 1
+        if start < end:
+            result.append((start, end))
+    return result
+
+
+# === Factor timelines === #
+
+def _clip_periods(periods, start_jd, end_jd, value_func):
+    """
+    Convert periods to a (start, end, value) timeline clipped to a range
+
+    Args:
+        periods (dict): Arrays 'index', 'start' and 'end'
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        value_func (callable): Maps a period index to the factor value
+
+    Returns:
+        list: (start, end, value) tuples
+    """
+    return [
+        (max(start, start_jd), min(end, end_jd), value_func(index))
+        for index, start, end in zip(periods['index'], periods['start'], periods['end'])
+        if end > start_jd and start < end_jd
+    ]
+
+
+def get_tithi_num(tithi_index):
+    """
+    Convert a tithi index (0-29) to the Muhurta Tithi number
+
+    The Muhurta Panchanga measures the distance from the Moon to the Sun,
+    so its Tithis run in the opposite order of the tithi index.
+
+    Args:
+        tithi_index (int): The tithi index
+
+    Returns:
+        int: The Tithi number (1-15 in each Paksha, 30 for Amavasya)
+    """
+    tithi_num = 30 - tithi_index
+    if tithi_num > 15:
+        tithi_num -= 15
+        if tithi_num == 15:
+            tithi_num = 30
+    return tithi_num
+
+
+def get_karana_num(karana_index):
+    """
+    Convert a karana index (0-59) to the Muhurta Karana number
+
+    Args:
+        karana_index (int): The karana index
+
+    Returns:
+        int: The Karana number (1-11)
+    """
+    # Half of the Muhurta Tithi, which runs in the opposite order
+    tithi_num = get_tithi_num(karana_index // 2)
+    karana_num = ((tithi_num - 1) * 2 + 1 - karana_index % 2) % 11
+    return karana_num if karana_num != 0 else 11
+
+
+def _get_vara_timeline(start_jd, end_jd):
+    """ Returns the Vara timeline, which changes at UT midnight. """
+    timeline = []
+    day_start = start_jd
+    while day_start < end_jd:
+        day_end = min(math.floor(day_start + 0.5) + 0.5, end_jd)
+        vara_num = int((day_start + 0.5) % 7) + 2
+        timeline.append((day_start, day_end, vara_num - 7 if vara_num > 7 else vara_num))
+        day_start = day_end
+    return timeline
+
+
+def get_panchanga_timelines(start_jd, end_jd, ayanamsa=const.AY_LAHIRI):
+    """
+    Calculate the exact timeline of the five Panchanga factors
+
+    These factors do not depend on the location. Values follow the
+    numbering of the Muhurta Panchanga functions.
+
+    Args:
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        ayanamsa (str, optional): Ayanamsa to use for sidereal calculations
+
+    Returns:
+        dict: Mapping of TITHI, NAKSHATRA, YOGA, KARANA and VARA to a list
+            of (start, end, value) tuples covering the range
+    """
+    return {
+        TITHI: _clip_periods(get_transitions(TITHI, start_jd, end_jd),
+                             start_jd, end_jd, get_tithi_num),
+        NAKSHATRA: _clip_periods(get_transitions(NAKSHATRA, start_jd, end_jd, ayanamsa),
+                                 start_jd, end_jd, int),
+        YOGA: _clip_periods(get_transitions(YOGA, start_jd, end_jd, ayanamsa),
+                            start_jd, end_jd, lambda index: index + 1),
+        KARANA: _clip_periods(get_transitions(KARANA, start_jd, end_jd),
+                              start_jd, end_jd, get_karana_num),
+        VARA: _get_vara_timeline(start_jd, end_jd)
+    }
+
+
+def get_factor_timelines(start_jd, end_jd, location, ayanamsa=const.AY_LAHIRI):
+    """
+    Calculate the exact timeline of every Muhurta factor
+
+    Values follow the numbering of the Muhurta Panchanga functions, so
+    they can be scored with get_panchanga_score.
+
+    Args:
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        location (GeoPos): The geographical location
+        ayanamsa (str, optional): Ayanamsa to use for sidereal calculations
+
+    Returns:
+        dict: Mapping of factor to a list of (start, end, value) tuples
+            covering the range
+    """
+    def asc_lon(jd):
+        return swe.swe_houses_lon(jd, location.lat, location.lon,
+                                  const.HOUSES_WHOLE_SIGN, ayanamsa)[1][0]
+
+    def asc_moon_distance(jd):
+        moon_lon = swe.swe_object(const.MOON, jd, mode=ayanamsa)['lon']
+        return angle.distance(moon_lon, asc_lon(jd))
+
+    lagna = get_angle_periods(asc_lon, 12, ASC_RATE, start_jd, end_jd)
+    moon_house = get_angle_periods(asc_moon_distance, 12, ASC_MOON_RATE, start_jd, end_jd)
+
+    timelines = get_panchanga_timelines(start_jd, end_jd, ayanamsa)
+    timelines[LAGNA] = _clip_periods(lagna, start_jd, end_jd,
+                                     lambda index: const.LIST_SIGNS[index])
+    # House of the Moon as in core.get_house_number
+    timelines[MOON_HOUSE] = _clip_periods(moon_house, start_jd, end_jd,
+                                          lambda index: index + 1)
+    return timelines
+
+
+def get_kala_intervals(start_jd, end_jd, location, utcoffset):
+    """
+    Calculate the Rahu Kala, Yamaganda and Gulika Kala intervals
+
+    Args:
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        location (GeoPos): The geographical location
+        utcoffset (Time): UTC offset of the local days
+
+    Returns:
+        dict: Mapping of Kala name to a list of (start, end) pairs
+    """
+    # Local days covering the range
+    first_jdn = Datetime.fromJD(start_jd, utcoffset).date.jdn
+    days = Datetime.fromJD(end_jd, utcoffset).date.jdn - first_jdn + 1
+    midnight = Datetime(Date(first_jdn), 0, utcoffset).jd
+    sunrises, sunsets = get_sunrise_table(location, midnight, days)
+
+    result = {name: [] for name in KALA_SEQUENCES}
+    for day in range(days):
+        weekday = (Date(first_jdn + day).dayofweek() - 1) % 7
+        day_duration = sunsets[day] - sunrises[day]
+        for name, sequence in KALA_SEQUENCES.items():
+            part = sequence[weekday]
+            start = sunrises[day] + ((part - 1) * day_duration / 8)
+            end = sunrises[day] + (part * day_duration / 8)
+            if end > start_jd and start < end_jd:
+                result[name].append((max(start, start_jd), min(end, end_jd)))
+    return result
+
+
+def merge_timelines(timelines):
+    """
+    Intersect factor timelines into segments where all factors are constant
+
+    Args:
+        timelines (dict): Mapping of factor to (start, end, value) tuples,
+            all covering the same range
+
+    Returns:
+        list: (start, end, values) tuples, where values maps factor to value
+    """
+    bounds = sorted({jd for timeline in timelines.values()
+                     for start, end, _ in timeline for jd in (start, end)})
+    positions = dict.fromkeys(timelines, 0)
+
+    segments = []
+    for start, end in zip(bounds, bounds[1:]):
+        values = {}
+        for name, timeline in timelines.items():
+            i = positions[name]
+            while timeline[i][1] <= start:
+                i += 1
+            positions[name] = i
+            values[name] = timeline[i][2]
+        segments.append((start, end, values))
+    return segments
+
+
+def get_segment_score(values):
+    """
+    Calculate the Muhurta score of a segment from its factor values
+
+    This is the Panchanga and Moon house part of get_muhurta_quality.
+    The other chart terms depend on planet aspects and houses that are
+    not segment factors; they change a chart score by at most
+    CHART_SCORE_MARGIN. The Lagna sign is not scored.
+
+    Args:
+        values (dict): Mapping of factor to value
+
+    Returns:
+        int: The Panchanga and Moon house score
+    """
+    return get_panchanga_score(
+        values[TITHI], values[NAKSHATRA], values[YOGA],
+        values[KARANA], values[VARA]
+    ) + get_moon_house_score(values[MOON_HOUSE])
+
+
+def get_muhurta_windows(start_date, end_date, location, min_score=2, min_duration=0,
+                        filters=None, exclude_kalas=True, ayanamsa=const.AY_LAHIRI):
+    """
+    Find exact auspicious windows within a date range
+
+    Windows are ranked on get_segment_score, not on the full
+    get_muhurta_quality score, so they can differ from the windows of
+    a chart scan such as get_auspicious_times. The Lagna sign can only
+    be used in the filters.
+
+    Args:
+        start_date (Datetime): The start date and time
+        end_date (Datetime): The end date and time
+        location (GeoPos): The geographical location
+        min_score (int, optional): The minimum segment score
+        min_duration (int, optional): Minimum duration in minutes
+        filters (dict, optional): Mapping of factor (TITHI, NAKSHATRA, YOGA,
+            KARANA, VARA, LAGNA or MOON_HOUSE) to the allowed values
+        exclude_kalas (bool, optional): Remove Rahu Kala, Yamaganda and
+            Gulika Kala from the windows
+        ayanamsa (str, optional): Ayanamsa to use for sidereal calculations
+
+    Returns:
+        list: List of windows with start, end, duration (minutes), the
+            lowest score in the window and its quality
+    """
+    start_jd = start_date.jd
+    end_jd = end_date.jd
+    utcoffset = start_date.utcoffset
+    filters = filters or {}
+
+    segments = merge_timelines(get_factor_timelines(start_jd, end_jd, location, ayanamsa))
+    scores = [get_segment_score(values) for _, _, values in segments]
+    segment_starts = [start for start, _, _ in segments]
+
+    intervals = union_intervals(
+        (start, end) for (start, end, values), score in zip(segments, scores)
+        if score >= min_score and all(
+            values[factor] in allowed for factor, allowed in filters.items())
+    )
+
+    if exclude_kalas:
+        kalas = get_kala_intervals(start_jd, end_jd, location, utcoffset)
+        intervals = subtract_intervals(
+            intervals, union_intervals(interval for name in kalas for interval in kalas[name]))
+
+    windows = []
+    for start, end in intervals:
+        duration = (end - start) * 24 * 60
+        if duration < min_duration:
+            continue
+        first = bisect_right(segment_starts, start) - 1
+        last = bisect_right(segment_starts, end - 1e-9)
+        score = min(scores[first:last])
+        windows.append({
+            'start': Datetime.fromJD(start, utcoffset),
+            'end': Datetime.fromJD(end, utcoffset),
+            'duration': duration,
+            'score': score,
+            'quality': get_quality(score)
+        })
+    return windows
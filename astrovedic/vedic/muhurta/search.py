@@ -0,0 +1,263 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements a day partitioned search for the best times
+    for an activity. The date range is split into chunks of local days,
+    which are searched independently, optionally on a concurrent.futures
+    executor. Each chunk gets an upper bound of its activity score from
+    the Panchanga timelines, and chunks are searched from the highest
+    bound down while a running top-k is kept, so chunks that cannot beat
+    the current k-th best time are never searched.
+"""
+
+import heapq
+import os
+from concurrent.futures import wait, FIRST_COMPLETED
+
+from astrovedic import const
+from astrovedic.datetime import Datetime, Date
+from astrovedic.parallel import get_executor
+
+from astrovedic.vedic.panchang_transitions import TITHI, KARANA, NAKSHATRA, YOGA
+from astrovedic.vedic.muhurta.intervals import (
+    VARA, get_panchanga_timelines, get_muhurta_windows
+)
+from astrovedic.vedic.muhurta.activities import get_activity_rules, get_activity_score
+
+# Panchanga factors of the activity score with their weights
+ACTIVITY_FACTORS = (
+    (TITHI, 'tithis', 2),
+    (NAKSHATRA, 'nakshatras', 2),
+    (VARA, 'varas', 2),
+    (YOGA, 'yogas', 1),
+    (KARANA, 'karanas', 1)
+)
+
+# Points for the inauspicious periods (2) and the special Muhurtas (1)
+PERIOD_POINTS = 3
+
+# Lowest Muhurta score of a Good time, as in get_auspicious_times
+MIN_MUHURTA_SCORE = 2
+
+# Margin in days around the bounded times, which covers the small
+# difference between the transition tables and the chart positions
+BOUND_MARGIN = 0.001
+
+
+def get_activity_upper_bound(start_jd, end_jd, activity, ayanamsa=const.AY_LAHIRI):
+    """
+    Get an upper bound of the activity score percentage between two Julian days
+
+    The Panchanga factors get their best value in the range, while the
+    planets and the periods of the day get full points.
+
+    Args:
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        activity (str): The type of activity
+        ayanamsa (str, optional): Ayanamsa to use for sidereal calculations
+
+    Returns:
+        float: The highest possible percentage of get_activity_score
+    """
+    rules = get_activity_rules(activity)
+    start_jd -= BOUND_MARGIN
+    end_jd += BOUND_MARGIN
+    timelines = get_panchanga_timelines(start_jd, end_jd, ayanamsa)
+    return _get_timeline_bound(rules, timelines, start_jd, end_jd)
+
+
+def _get_timeline_bound(rules, timelines, start_jd, end_jd):
+    """
+    Get the activity score bound of the Panchanga periods in a range
+
+    Args:
+        rules (dict): The activity rules
+        timelines (dict): Panchanga timelines covering the range
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+
+    Returns:
+        float: The highest possible percentage of get_activity_score
+    """
+    score = len(rules['important_planets']) + PERIOD_POINTS
+    max_score = score
+    for factor, name, weight in ACTIVITY_FACTORS:
+        max_score += weight
+        best = 0
+        for period_start, period_end, value in timelines[factor]:
+            if period_end < start_jd or period_start > end_jd:
+                continue
+            if value in rules[f'auspicious_{name}']:
+                best = weight
+                break
+            if value not in rules[f'inauspicious_{name}']:
+                best = weight / 2
+        score += best
+
+    return (score / max_score) * 100
+
+
+def get_day_chunks(start_date, end_date, chunk_days=1):
+    """
+    Split a date range into chunks of local days
+
+    Args:
+        start_date (Datetime): The start date and time
+        end_date (Datetime): The end date and time
+        chunk_days (int, optional): The number of days per chunk
+
+    Returns:
+        list: (start, end) Julian day pairs, split at local midnights
+    """
+    utcoffset = start_date.utcoffset
+    chunks = []
+    start_jd = start_date.jd
+    jdn = start_date.date.jdn + chunk_days
+    while start_jd < end_date.jd:
+        end_jd = min(Datetime(Date(jdn), 0, utcoffset).jd, end_date.jd)
+        chunks.append((start_jd, end_jd))
+        start_jd = end_jd
+        jdn += chunk_days
+    return chunks
+
+
+def _search_chunk(start_jd, end_jd, location, activity, utcoffset,
+                  top_k, threshold, scorer):
+    """
+    Find the best times for an activity in one chunk
+
+    Args:
+        start_jd (float): The start Julian day of the chunk
+        end_jd (float): The end Julian day of the chunk
+        location (GeoPos): The geographical location
+        activity (str): The type of activity
+        utcoffset (Time): UTC offset of the results
+        top_k (int): The number of times to keep
+        threshold (float): Times whose bound is below this percentage
+            are not scored
+        scorer (callable): The activity score function
+
+    Returns:
+        list: The best times of the chunk, sorted by score
+    """
+    rules = get_activity_rules(activity)
+    timelines = get_panchanga_timelines(start_jd - BOUND_MARGIN, end_jd + BOUND_MARGIN)
+    windows = get_muhurta_windows(
+        Datetime.fromJD(start_jd, utcoffset), Datetime.fromJD(end_jd, utcoffset),
+        location, min_score=MIN_MUHURTA_SCORE,
+        min_duration=rules.get('min_duration', 60), exclude_kalas=False
+    )
+
+    results = []
+    for window in windows:
+        start = window['start'].jd
+        bound = _get_timeline_bound(rules, timelines, start - BOUND_MARGIN,
+                                    start + BOUND_MARGIN)
+        if bound < threshold:
+            continue
+        score = scorer(window['start'], location, activity)
+        results.append({
+            'start': window['start'],
+            'end': window['end'],
+            'duration': window['duration'],
+            'activity': activity,
+            'score': score
+        })
+
+    return heapq.nlargest(top_k, results, key=_rank)
+
+
+def _rank(result):
+    """ Returns the sort key of a result: higher score, then earlier start. """
+    return result['score']['percentage'], -result['start'].jd
+
+
+def find_best_times_for_activity(start_date, end_date, location, activity, top_k=1,
+                                 chunk_days=1, max_workers=None, executor=None,
+                                 scorer=get_activity_score):
+    """
+    Find the best times for a specific activity within a date range
+
+    Auspicious windows are found in each chunk of days and scored at
+    their start with get_activity_score. Windows are split at the chunk
+    boundaries. With max_workers greater than 1, or an executor, the
+    chunks are searched in parallel (see get_executor).
+
+    This is not the search of get_best_time_for_activity. The windows
+    come from get_muhurta_windows with min_score=2 and exclude_kalas=False,
+    which rank on the Panchanga and Moon-house terms only, instead of the
+    15-minute scan of get_muhurta_quality. The candidate times, and so
+    the best times, can differ from those of get_best_time_for_activity.
+
+    Args:
+        start_date (Datetime): The start date and time
+        end_date (Datetime): The end date and time
+        location (GeoPos): The geographical location
+        activity (str): The type of activity
+        top_k (int, optional): The number of times to return
+        chunk_days (int, optional): The number of days per chunk
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the chunks on
+        scorer (callable, optional): The activity score function, with the
+            signature of get_activity_score. Its percentage must not exceed
+            get_activity_upper_bound for pruning to be exact
+
+    Returns:
+        list: Up to top_k times sorted by score, with start, end,
+            duration (minutes), activity and score information
+    """
+    utcoffset = start_date.utcoffset
+    chunks = [
+        (get_activity_upper_bound(start, end, activity), start, end)
+        for start, end in get_day_chunks(start_date, end_date, chunk_days)
+    ]
+    chunks.sort(key=lambda chunk: (-chunk[0], chunk[1]))
+
+    # Running top-k as a min-heap of (rank, sequence, result)
+    best = []
+    sequence = 0
+
+    def threshold():
+        return best[0][0][0] if len(best) == top_k else -1
+
+    def add_results(results):
+        nonlocal sequence
+        for result in results:
+            entry = (_rank(result), sequence, result)
+            sequence += 1
+            if len(best) < top_k:
+                heapq.heappush(best, entry)
+            elif entry[0] > best[0][0]:
+                heapq.heapreplace(best, entry)
+
+    with get_executor(max_workers, executor) as executor:
+        if executor is None:
+            for bound, start, end in chunks:
+                if bound < threshold():
+                    break
+                add_results(_search_chunk(start, end, location, activity, utcoffset,
+                                          top_k, threshold(), scorer))
+        else:
+            max_pending = max_workers or os.cpu_count() or 1
+            pending = set()
+            remaining = iter(chunks)
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    chunk = next(remaining, None)
+                    if chunk is None or chunk[0] < threshold():
+                        exhausted = True
+                        break
+                    pending.add(executor.submit(
+                        _search_chunk, chunk[1], chunk[2], location, activity,
+                        utcoffset, top_k, threshold(), scorer))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    add_results(future.result())
+
+    return [result for _, _, result in sorted(best, reverse=True)]
+
@@ -10,19 +10,15 @@ from astrovedic import const
 from astrovedic.chart import Chart
 from astrovedic.geopos import GeoPos
 from astrovedic.datetime import Datetime, Time, Date, dateJDN, GREGORIAN
+from astrovedic.ephem import ephem
+from astrovedic.tools import planetarytime
 from datetime import datetime
 import math
 from datetime import timedelta
 
-# Import swisseph for precise calculations
-import swisseph as swe
-
 # Import Panchanga functions
 from astrovedic.vedic.muhurta.panchanga import get_vara
 
-# Standard atmospheric pressure (mbar) and temperature (Celsius)
-ATMOS_PRES = 1013.25
-ATMOS_TEMP = 15
 
 def get_abhijit_muhurta(date, location):
     """
@@ -292,10 +288,17 @@ def get_hora(date, location):
     """
     Calculate the Hora (planetary hour) for a given time
     
-    Hora is a division of the day into 24 equal parts, each ruled by a planet.
-    The ruling planets follow the Chaldean order: Saturn, Jupiter, Mars, Sun,
+    Hora is a division of the day into 24 parts, 12 from sunrise to sunset
+    and 12 from sunset to the next sunrise, each ruled by a planet. The
+    first Hora of the day is ruled by the lord of the weekday and the
+    following ones follow the Chaldean order: Saturn, Jupiter, Mars, Sun,
     Venus, Mercury, Moon.
     
+    The night Horas continue this sequence, so the first Hora after
+    sunset is the 13th from sunrise rather than the lord of the weekday,
+    and the Horas before sunrise belong to the previous day. The weekday
+    is that of the sunrise at the UTC offset of the date.
+    
     Args:
         date (Datetime): The date and time
         location (GeoPos): The geographical location
@@ -303,85 +306,16 @@ def get_hora(date, location):
     Returns:
         dict: Dictionary with Hora information
     """
-    # Get the sunrise and sunset times
-    sunrise = get_sunrise(date, location)
-    sunset = get_sunset(date, location)
-    
-    # Calculate the duration of the day and night
-    day_duration = (sunset.datetime() - sunrise.datetime()).total_seconds()
-    night_duration = 24 * 60 * 60 - day_duration
-    
-    # Calculate the duration of one day hora and one night hora
-    day_hora_duration = day_duration / 12
-    night_hora_duration = night_duration / 12
-    
-    # Get the weekday
-    chart = Chart(date, location, hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
-    vara = get_vara(chart)
-    weekday = vara['num']
-    
-    # Determine the ruling planet of the first hora of the day based on the weekday
-    # Sunday: Sun, Monday: Moon, Tuesday: Mars, Wednesday: Mercury,
-    # Thursday: Jupiter, Friday: Venus, Saturday: Saturn
-    first_hora_lords = {1: 'Sun', 2: 'Moon', 3: 'Mars', 4: 'Mercury', 5: 'Jupiter', 6: 'Venus', 7: 'Saturn'}
-    first_hora_lord = first_hora_lords.get(weekday, 'Sun')
-    
-    # Chaldean order of planets
-    chaldean_order = ['Saturn', 'Jupiter', 'Mars', 'Sun', 'Venus', 'Mercury', 'Moon']
-    
-    # Find the index of the first hora lord in the Chaldean order
-    first_hora_index = chaldean_order.index(first_hora_lord)
-    
-    # Check if the given time is during the day or night
-    is_day = sunrise.datetime() <= date.datetime() < sunset.datetime()
-    
-    # Calculate the elapsed time since sunrise or sunset
-    if is_day:
-        elapsed_time = (date.datetime() - sunrise.datetime()).total_seconds()
-        hora_duration = day_hora_duration
-    else:
-        if date.datetime() < sunrise.datetime():
-            # Previous day's sunset
-            prev_day = date.datetime() - timedelta(days=1)
-            prev_date = Datetime.fromDatetime(prev_day)
-            prev_sunset = get_sunset(prev_date, location)
-            elapsed_time = (date.datetime() - prev_sunset.datetime()).total_seconds()
-        else:
-            elapsed_time = (date.datetime() - sunset.datetime()).total_seconds()
-        hora_duration = night_hora_duration
-    
-    # Calculate the current hora number (0-11)
-    hora_num = int(elapsed_time / hora_duration)
-    
-    # Calculate the elapsed portion of the current hora
-    elapsed = (elapsed_time % hora_duration) / hora_duration
-    
-    # Calculate the ruling planet of the current hora
-    hora_index = (first_hora_index + hora_num) % 7
-    hora_lord = chaldean_order[hora_index]
-    
-    # Calculate the start and end times of the current hora
-    if is_day:
-        hora_start = sunrise.datetime() + timedelta(seconds=hora_num * hora_duration)
-        hora_end = hora_start + timedelta(seconds=hora_duration)
-    else:
-        if date.datetime() < sunrise.datetime():
-            # Previous day's sunset
-            prev_day = date.datetime() - timedelta(days=1)
-            prev_date = Datetime.fromDatetime(prev_day)
-            prev_sunset = get_sunset(prev_date, location)
-            hora_start = prev_sunset.datetime() + timedelta(seconds=hora_num * hora_duration)
-        else:
-            hora_start = sunset.datetime() + timedelta(seconds=hora_num * hora_duration)
-        hora_end = hora_start + timedelta(seconds=hora_duration)
+    hora = planetarytime.getHora(date.jd, location, date.utcoffset)
+    hora_duration = hora['end'] - hora['start']
     
     return {
-        'lord': hora_lord,
-        'start': Datetime.fromDatetime(hora_start),
-        'end': Datetime.fromDatetime(hora_end),
-        'duration': hora_duration / 60,  # in minutes
-        'elapsed': elapsed,
-        'is_day': is_day
+        'lord': hora['hourRuler'],
+        'start': Datetime.fromJD(hora['start'], date.utcoffset),
+        'end': Datetime.fromJD(hora['end'], date.utcoffset),
+        'duration': hora_duration * 24 * 60,  # in minutes
+        'elapsed': (date.jd - hora['start']) / hora_duration,
+        'is_day': hora['mode'] == 'Day'
     }
 
 
@@ -523,99 +457,30 @@ def get_amrita_siddha_yoga(chart):
 
 def get_sunrise(date: Datetime, location: GeoPos) -> Datetime:
     """
-    Calculate the sunrise time for a given date and location using swisseph.
+    Calculate the next sunrise after a date at a location.
     
     Args:
-        date (Datetime): The date (UT is derived from this).
-        location (GeoPos): The geographical location.
+        date (Datetime): The date and time
+        location (GeoPos): The geographical location
     
     Returns:
-        Datetime: The sunrise time in the original date's timezone.
-        
-    Raises:
-        RuntimeError: If swisseph calculation fails.
+        Datetime: The sunrise time in the original date's timezone
     """
-    # Get Julian Day UT from input Datetime
-    jd_ut = date.jd
-    
-    # Get geographic coordinates
-    lon = location.lon
-    lat = location.lat
-    alt = location.alt # Use altitude if available, default 0
-    
-    # Prepare arguments for swisseph
-    ipl = swe.SUN
-    starname = ''
-    epheflag = swe.FLG_SWIEPH # Use Swiss Ephemeris
-    # Calculate sunrise (apparent rise of the disc center)
-    risetrans_flag = swe.RISE_TRANS | swe.BIT_DISC_CENTER
-    geopos = (lon, lat, alt)
-    atpress = ATMOS_PRES
-    attemp = ATMOS_TEMP
-    
-    # Call swisseph
-    try:
-        ret, jd_et, err = swe.rise_trans(jd_ut, ipl, starname, epheflag, risetrans_flag, geopos, atpress, attemp)
-    except Exception as e:
-        raise RuntimeError(f"Swisseph error during sunrise calculation: {e}") from e
-
-    if ret < 0:
-        raise RuntimeError(f"Swisseph calculation failed for sunrise: {err}")
-
-    # Convert result JD ET back to Datetime, preserving original timezone
-    # Note: rise_trans returns JD ET (Ephemeris Time), which is close enough to UT for this purpose
-    # without complex Delta T corrections for historical dates.
-    # Use the original date's utcoffset for conversion.
-    sunrise_dt = Datetime.fromJD(jd_et, date.utcoffset)
-    
-    return sunrise_dt
+    return ephem.nextSunrise(date, location)
 
 
 def get_sunset(date: Datetime, location: GeoPos) -> Datetime:
     """
-    Calculate the sunset time for a given date and location using swisseph.
+    Calculate the next sunset after a date at a location.
     
     Args:
-        date (Datetime): The date (UT is derived from this).
-        location (GeoPos): The geographical location.
+        date (Datetime): The date and time
+        location (GeoPos): The geographical location
     
     Returns:
-        Datetime: The sunset time in the original date's timezone.
-        
-    Raises:
-        RuntimeError: If swisseph calculation fails.
+        Datetime: The sunset time in the original date's timezone
     """
-    # Get Julian Day UT from input Datetime
-    jd_ut = date.jd
-    
-    # Get geographic coordinates
-    lon = location.lon
-    lat = location.lat
-    alt = location.alt # Use altitude if available, default 0
-    
-    # Prepare arguments for swisseph
-    ipl = swe.SUN
-    starname = ''
-    epheflag = swe.FLG_SWIEPH # Use Swiss Ephemeris
-    # Calculate sunset (apparent set of the disc center)
-    risetrans_flag = swe.SET_TRANS | swe.BIT_DISC_CENTER 
-    geopos = (lon, lat, alt)
-    atpress = ATMOS_PRES
-    attemp = ATMOS_TEMP
-    
-    # Call swisseph
-    try:
-        ret, jd_et, err = swe.rise_trans(jd_ut, ipl, starname, epheflag, risetrans_flag, geopos, atpress, attemp)
-    except Exception as e:
-        raise RuntimeError(f"Swisseph error during sunset calculation: {e}") from e
-
-    if ret < 0:
-        raise RuntimeError(f"Swisseph calculation failed for sunset: {err}")
-
-    # Convert result JD ET back to Datetime, preserving original timezone
-    sunset_dt = Datetime.fromJD(jd_et, date.utcoffset)
-    
-    return sunset_dt
+    return ephem.nextSunset(date, location)
 
 
 def get_house_number(chart, planet_id):
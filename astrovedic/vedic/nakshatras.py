@@ -6,6 +6,8 @@
     for Vedic astrology.
 """
 
+from array import array
+
 from astrovedic import const
 from astrovedic import angle
 
@@ -163,49 +165,85 @@ NAKSHATRA_SPAN = 13.33333333333333  # 360 / 27
 PADA_SPAN = NAKSHATRA_SPAN / 4  # 3.33333333333333
 
 
-def get_nakshatra(longitude):
-    """
-    Get nakshatra information from longitude
+# Nakshatra lords by index (0-26)
+NAKSHATRA_LORD_LIST = tuple(NAKSHATRA_LORDS[nakshatra] for nakshatra in LIST_NAKSHATRAS)
 
-    Args:
-        longitude (float): The longitude in degrees (0-360)
 
-    Returns:
-        dict: Dictionary with nakshatra information
+def get_nakshatra_index(longitude):
     """
-    # Calculate nakshatra index (0-26)
-    nakshatra_index = int(longitude / NAKSHATRA_SPAN) % 27
-
-    # Get nakshatra name
-    nakshatra = LIST_NAKSHATRAS[nakshatra_index]
+    Get the nakshatra index, pada and degree within the nakshatra
 
-    # Calculate position within nakshatra (0-13.33333 degrees)
-    pos_in_nakshatra = longitude % NAKSHATRA_SPAN
+    This is the canonical nakshatra lookup. It works on plain numbers
+    and does not build any dictionaries. A sequence of longitudes
+    returns three compact arrays, and a NumPy array returns three
+    NumPy arrays computed element-wise.
 
-    # Calculate pada (quarter) (1-4)
-    pada = int(pos_in_nakshatra / PADA_SPAN) + 1
-
-    # Calculate percentage through nakshatra
-    percentage = (pos_in_nakshatra / NAKSHATRA_SPAN) * 100
+    Args:
+        longitude (float or sequence): The longitude(s) in degrees (0-360)
 
-    # Get nakshatra lord
-    lord = NAKSHATRA_LORDS[nakshatra]
+    Returns:
+        tuple: (nakshatra index 0-26, pada 1-4, degree within the nakshatra)
+    """
+    if not hasattr(longitude, '__iter__'):
+        nakshatra_index = int(longitude / NAKSHATRA_SPAN) % 27
+        degree = longitude % NAKSHATRA_SPAN
+        return nakshatra_index, int(degree / PADA_SPAN) + 1, degree
+
+    if hasattr(longitude, 'astype'):
+        # NumPy arrays truncate like int() when cast
+        indexes = (longitude / NAKSHATRA_SPAN).astype(int) % 27
+        degrees = longitude % NAKSHATRA_SPAN
+        padas = (degrees / PADA_SPAN).astype(int) + 1
+        return indexes, padas, degrees
+
+    indexes = array('B')
+    padas = array('B')
+    degrees = array('d')
+    for lon in longitude:
+        degree = lon % NAKSHATRA_SPAN
+        indexes.append(int(lon / NAKSHATRA_SPAN) % 27)
+        padas.append(int(degree / PADA_SPAN) + 1)
+        degrees.append(degree)
+    return indexes, padas, degrees
+
+
+def get_nakshatra_details(nakshatra_index, pada, degree):
+    """
+    Build the nakshatra information dictionary from an index lookup
 
-    # Get nakshatra element and dosha
-    element = NAKSHATRA_ELEMENTS[nakshatra]
-    dosha = NAKSHATRA_DOSHAS[nakshatra]
+    Args:
+        nakshatra_index (int): The nakshatra index (0-26)
+        pada (int): The pada (1-4)
+        degree (float): The degree within the nakshatra
 
+    Returns:
+        dict: Dictionary with nakshatra information
+    """
+    nakshatra = LIST_NAKSHATRAS[nakshatra_index]
     return {
         'index': nakshatra_index,
         'name': nakshatra,
-        'lord': lord,
+        'lord': NAKSHATRA_LORD_LIST[nakshatra_index],
         'pada': pada,
-        'percentage': percentage,
-        'element': element,
-        'dosha': dosha
+        'percentage': (degree / NAKSHATRA_SPAN) * 100,
+        'element': NAKSHATRA_ELEMENTS[nakshatra],
+        'dosha': NAKSHATRA_DOSHAS[nakshatra]
     }
 
 
+def get_nakshatra(longitude):
+    """
+    Get nakshatra information from longitude
+
+    Args:
+        longitude (float): The longitude in degrees (0-360)
+
+    Returns:
+        dict: Dictionary with nakshatra information
+    """
+    return get_nakshatra_details(*get_nakshatra_index(longitude))
+
+
 def get_nakshatra_lord(longitude):
     """
     Get nakshatra lord from longitude
@@ -216,8 +254,7 @@ def get_nakshatra_lord(longitude):
     Returns:
         str: Nakshatra lord (planet name)
     """
-    nakshatra_info = get_nakshatra(longitude)
-    return nakshatra_info['lord']
+    return NAKSHATRA_LORD_LIST[int(longitude / NAKSHATRA_SPAN) % 27]
 
 
 def get_nakshatra_span(nakshatra_index):
@@ -262,8 +299,7 @@ def get_nakshatra_pada(longitude):
     Returns:
         int: Pada (1-4)
     """
-    nakshatra_info = get_nakshatra(longitude)
-    return nakshatra_info['pada']
+    return get_nakshatra_index(longitude)[1]
 
 
 def get_nakshatra_degree(longitude):
@@ -276,9 +312,7 @@ def get_nakshatra_degree(longitude):
     Returns:
         float: Degree within the nakshatra
     """
-    nakshatra_index = int(longitude / NAKSHATRA_SPAN)
-    nakshatra_start = nakshatra_index * NAKSHATRA_SPAN
-    return longitude - nakshatra_start
+    return get_nakshatra_index(longitude)[2]
 
 
 def get_nakshatra_qualities(nakshatra):
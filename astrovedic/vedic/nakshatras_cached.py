@@ -8,6 +8,7 @@
 
 from astrovedic import const
 from astrovedic.cache import reference_cache, calculation_cache
+from astrovedic.vedic.nakshatras import get_nakshatra_index, get_nakshatra_details
 
 # List of 27 nakshatras
 LIST_NAKSHATRAS = [
@@ -145,33 +146,7 @@ def get_nakshatra(longitude):
     Returns:
         dict: Dictionary with nakshatra information
     """
-    # Calculate nakshatra index (0-26) - use integer division for better performance
-    nakshatra_index = int(longitude / NAKSHATRA_SPAN) % 27
-
-    # Get nakshatra name
-    nakshatra = LIST_NAKSHATRAS[nakshatra_index]
-
-    # Calculate position within nakshatra (0-13.33333 degrees)
-    pos_in_nakshatra = longitude % NAKSHATRA_SPAN
-
-    # Calculate pada (quarter) (1-4)
-    pada = int(pos_in_nakshatra / PADA_SPAN) + 1
-
-    # Get nakshatra lord, element, and dosha directly
-    lord = NAKSHATRA_LORDS[nakshatra]
-    element = NAKSHATRA_ELEMENTS[nakshatra]
-    dosha = NAKSHATRA_DOSHAS[nakshatra]
-
-    # Return a pre-constructed dictionary for better performance
-    return {
-        'index': nakshatra_index,
-        'name': nakshatra,
-        'lord': lord,
-        'pada': pada,
-        'percentage': (pos_in_nakshatra / NAKSHATRA_SPAN) * 100,
-        'element': element,
-        'dosha': dosha
-    }
+    return get_nakshatra_details(*get_nakshatra_index(longitude))
 
 
 @calculation_cache()
@@ -192,8 +167,7 @@ def get_nakshatra_lord(longitude):
         return NAKSHATRA_LORDS[longitude]
 
     # Otherwise, calculate the nakshatra index and return the lord
-    nakshatra_index = int(longitude / NAKSHATRA_SPAN) % 27
-    nakshatra = LIST_NAKSHATRAS[nakshatra_index]
+    nakshatra = LIST_NAKSHATRAS[get_nakshatra_index(longitude)[0]]
     return NAKSHATRA_LORDS[nakshatra]
 
 
@@ -208,11 +182,7 @@ def get_nakshatra_pada(longitude):
     Returns:
         int: The pada (1-4)
     """
-    # Calculate position within nakshatra (0-13.33333 degrees)
-    pos_in_nakshatra = longitude % NAKSHATRA_SPAN
-
-    # Calculate pada (quarter) (1-4)
-    return int(pos_in_nakshatra / PADA_SPAN) + 1
+    return get_nakshatra_index(longitude)[1]
 
 
 @calculation_cache(maxsize=360)
@@ -226,8 +196,7 @@ def get_nakshatra_degree(longitude):
     Returns:
         float: Degree within the nakshatra
     """
-    # More efficient calculation using modulo
-    return longitude % NAKSHATRA_SPAN
+    return get_nakshatra_index(longitude)[2]
 
 
 @reference_cache()
@@ -7,11 +7,17 @@
     Vedic time elements.
 """
 
+from bisect import bisect_right
+
 from astrovedic import const
 from astrovedic import angle
 from astrovedic.datetime import Datetime
 from astrovedic.ephem import swe, ephem
 from astrovedic.geopos import GeoPos
+from astrovedic.tools import planetarytime
+from astrovedic.vedic.panchang_transitions import (
+    KARANA, get_transitions
+)
 
 # Tithi (lunar day) names
 TITHI_NAMES = [
@@ -64,11 +70,42 @@ VARA_NAMES = [
     "Shanivara"    # Saturday
 ]
 
-# Hora (planetary hour) rulers
-HORA_RULERS = [
-    const.SUN, const.VENUS, const.MERCURY, const.MOON, const.SATURN,
-    const.JUPITER, const.MARS
-]
+
+# Panchaka Dosha types by nakshatra index:
+# Dhanishta (23), Shatabhisha (24), Purva Bhadrapada (25), Uttara Bhadrapada (26), Revati (27)
+PANCHAKA_TYPES = {
+    23: "Mrityu Panchaka",  # Death
+    24: "Agni Panchaka",    # Fire
+    25: "Raja Panchaka",    # King
+    26: "Chora Panchaka",   # Thief
+    27: "Roga Panchaka"     # Disease
+}
+
+# Part of the day (1-8) of the inauspicious periods, indexed Mon=0 to Sun=6
+RAHUKALA_SEQUENCE = [1, 6, 4, 5, 3, 2, 7]
+YAMAGANDA_SEQUENCE = [5, 3, 4, 2, 6, 7, 1]
+GULIKA_SEQUENCE = [5, 4, 3, 2, 1, 7, 6]
+
+
+def get_day_segment(sunrise_jd, sunset_jd, part, parts, utcoffset):
+    """
+    Get the start and end of one equal part of the daytime
+
+    Args:
+        sunrise_jd (float): Julian day of the sunrise
+        sunset_jd (float): Julian day of the sunset
+        part (int): The part of the day (1-based)
+        parts (int): The number of parts the day is divided into
+        utcoffset (Time): UTC offset
+
+    Returns:
+        dict: Dictionary with the segment start and end times
+    """
+    day_duration = sunset_jd - sunrise_jd
+    return {
+        'start': Datetime.fromJD(sunrise_jd + ((part - 1) * day_duration / parts), utcoffset),
+        'end': Datetime.fromJD(sunrise_jd + (part * day_duration / parts), utcoffset)
+    }
 
 
 def get_tithi(jd, ayanamsa=None):
@@ -214,58 +251,32 @@ def get_vara(jd):
     }
 
 
-def get_hora(jd, lat, lon):
+def get_hora(jd, lat, lon, utcoffset=None):
     """
     Calculate hora (planetary hour) for a given Julian day
 
+    The horas are read from the planetary hour table of the location.
+    The 24 horas run from sunrise to the next sunrise in Chaldean order,
+    starting from the lord of the weekday, so the night horas carry on
+    from the day horas. The weekday of the sunrise is taken at local
+    mean time unless a UTC offset is given.
+
     Args:
         jd (float): Julian day
         lat (float): Latitude in degrees
         lon (float): Longitude in degrees
+        utcoffset (Time or str, optional): UTC offset used for the weekday
+            of the sunrise, the local mean time by default
 
     Returns:
-        dict: Dictionary with hora information
+        dict: Dictionary with the hora index (0-11) in the day or night,
+            its ruler and whether it is a day hora
     """
-    from astrovedic.ephem import ephem
-
-    # Get date from Julian day
-    date = Datetime.fromJD(jd)
-
-    # Find the previous sunrise
-    prev_sunrise = ephem.lastSunrise(date, GeoPos(lat, lon))
-
-    # Find the next sunset
-    next_sunset = ephem.nextSunset(date, GeoPos(lat, lon))
-
-    # Find the next sunrise
-    next_sunrise = ephem.nextSunrise(date, GeoPos(lat, lon))
-
-    # Determine if it's day or night
-    is_day = prev_sunrise.jd <= jd < next_sunset.jd
-
-    # Get day of week (0 = Sunday, 1 = Monday, etc.)
-    day_of_week = date.date.weekday()
-
-    if is_day:
-        # Day time calculation
-        day_duration = next_sunset.jd - prev_sunrise.jd
-        hora_duration = day_duration / 12
-        hora_index = int((jd - prev_sunrise.jd) / hora_duration)
-    else:
-        # Night time calculation
-        night_duration = next_sunrise.jd - next_sunset.jd
-        hora_duration = night_duration / 12
-        hora_index = int((jd - next_sunset.jd) / hora_duration)
-
-    # The first hora of the day is ruled by the planet of the day
-    # The sequence follows: Sun, Venus, Mercury, Moon, Saturn, Jupiter, Mars
-    hora_ruler_index = (day_of_week + hora_index) % 7
-    hora_ruler = HORA_RULERS[hora_ruler_index]
-
+    hora = planetarytime.getHora(jd, GeoPos(lat, lon), utcoffset)
     return {
-        'index': hora_index,
-        'ruler': hora_ruler,
-        'is_day': is_day
+        'index': hora['hourNumber'] - 1,
+        'ruler': hora['hourRuler'],
+        'is_day': hora['mode'] == 'Day'
     }
 
 
@@ -291,28 +302,12 @@ def get_rahukala(jd, lat, lon, utcoffset):
     prev_sunrise = ephem.lastSunrise(date, GeoPos(lat, lon))
     next_sunset = ephem.nextSunset(date, GeoPos(lat, lon))
 
-    # Calculate day duration in JD
-    day_duration = next_sunset.jd - prev_sunrise.jd
-
     # Rahu Kala sequence (Mon=0 to Sun=6)
     # Original flatlib sequence: [7, 1, 6, 4, 5, 3, 2] for Sun=0 index
     # Adjusted for Mon=0 index: [1, 6, 4, 5, 3, 2, 7]
-    rahukala_sequence = [1, 6, 4, 5, 3, 2, 7]
-    rahukala_part = rahukala_sequence[weekday]
-
-    # Calculate Rahu Kala start and end Julian Days
     # Note: Sequence parts are 1-based for calculation (1st part to 8th part)
-    rahukala_start_jd = prev_sunrise.jd + ((rahukala_part - 1) * day_duration / 8)
-    rahukala_end_jd = prev_sunrise.jd + (rahukala_part * day_duration / 8)
-
-    # Convert back to Datetime objects with the correct utcoffset
-    rahukala_start = Datetime.fromJD(rahukala_start_jd, utcoffset)
-    rahukala_end = Datetime.fromJD(rahukala_end_jd, utcoffset)
-
-    return {
-        'start': rahukala_start,
-        'end': rahukala_end
-    }
+    return get_day_segment(prev_sunrise.jd, next_sunset.jd,
+                           RAHUKALA_SEQUENCE[weekday], 8, utcoffset)
 
 
 def get_yamaganda(jd, lat, lon, utcoffset):
@@ -337,27 +332,11 @@ def get_yamaganda(jd, lat, lon, utcoffset):
     prev_sunrise = ephem.lastSunrise(date, GeoPos(lat, lon))
     next_sunset = ephem.nextSunset(date, GeoPos(lat, lon))
 
-    # Calculate day duration in JD
-    day_duration = next_sunset.jd - prev_sunrise.jd
-
     # Yamaganda sequence (Mon=0 to Sun=6)
     # Original flatlib sequence: [1, 5, 3, 4, 2, 6, 7] for Sun=0 index
     # Adjusted for Mon=0 index: [5, 3, 4, 2, 6, 7, 1]
-    yamaganda_sequence = [5, 3, 4, 2, 6, 7, 1]
-    yamaganda_part = yamaganda_sequence[weekday]
-
-    # Calculate Yamaganda start and end Julian Days
-    yamaganda_start_jd = prev_sunrise.jd + ((yamaganda_part - 1) * day_duration / 8)
-    yamaganda_end_jd = prev_sunrise.jd + (yamaganda_part * day_duration / 8)
-
-    # Convert back to Datetime objects with the correct utcoffset
-    yamaganda_start = Datetime.fromJD(yamaganda_start_jd, utcoffset)
-    yamaganda_end = Datetime.fromJD(yamaganda_end_jd, utcoffset)
-
-    return {
-        'start': yamaganda_start,
-        'end': yamaganda_end
-    }
+    return get_day_segment(prev_sunrise.jd, next_sunset.jd,
+                           YAMAGANDA_SEQUENCE[weekday], 8, utcoffset)
 
 
 def get_gulika_kala(jd, lat, lon, utcoffset):
@@ -382,27 +361,11 @@ def get_gulika_kala(jd, lat, lon, utcoffset):
     prev_sunrise = ephem.lastSunrise(date, GeoPos(lat, lon))
     next_sunset = ephem.nextSunset(date, GeoPos(lat, lon))
 
-    # Calculate day duration in JD
-    day_duration = next_sunset.jd - prev_sunrise.jd
-
     # Gulika sequence (Mon=0 to Sun=6)
     # Original flatlib sequence: [6, 5, 4, 3, 2, 1, 0] for Sun=0 index --> [6, 5, 4, 3, 2, 1, 7] 1-based
     # Adjusted for Mon=0 index: [5, 4, 3, 2, 1, 7, 6]
-    gulika_sequence = [5, 4, 3, 2, 1, 7, 6]
-    gulika_part = gulika_sequence[weekday]
-
-    # Calculate Gulika start and end Julian Days
-    gulika_start_jd = prev_sunrise.jd + ((gulika_part - 1) * day_duration / 8)
-    gulika_end_jd = prev_sunrise.jd + (gulika_part * day_duration / 8)
-
-    # Convert back to Datetime objects with the correct utcoffset
-    gulika_start = Datetime.fromJD(gulika_start_jd, utcoffset)
-    gulika_end = Datetime.fromJD(gulika_end_jd, utcoffset)
-
-    return {
-        'start': gulika_start,
-        'end': gulika_end
-    }
+    return get_day_segment(prev_sunrise.jd, next_sunset.jd,
+                           GULIKA_SEQUENCE[weekday], 8, utcoffset)
 
 
 def get_abhijit_muhurta(jd, lat, lon, utcoffset):
@@ -425,22 +388,9 @@ def get_abhijit_muhurta(jd, lat, lon, utcoffset):
     prev_sunrise = ephem.lastSunrise(date, GeoPos(lat, lon))
     next_sunset = ephem.nextSunset(date, GeoPos(lat, lon))
 
-    # Calculate day duration in JD
-    day_duration = next_sunset.jd - prev_sunrise.jd
-
     # Calculate Abhijit Muhurta (8th muhurta of the day)
     # There are 15 muhurtas in a day, so the 8th starts after 7/15 and ends after 8/15
-    abhijit_start_jd = prev_sunrise.jd + (7 * day_duration / 15)
-    abhijit_end_jd = prev_sunrise.jd + (8 * day_duration / 15)
-
-    # Convert back to Datetime objects with the correct utcoffset
-    abhijit_start = Datetime.fromJD(abhijit_start_jd, utcoffset)
-    abhijit_end = Datetime.fromJD(abhijit_end_jd, utcoffset)
-
-    return {
-        'start': abhijit_start,
-        'end': abhijit_end
-    }
+    return get_day_segment(prev_sunrise.jd, next_sunset.jd, 8, 15, utcoffset)
 
 
 def get_bhadra_karana(jd, utcoffset, ayanamsa=None):
@@ -458,99 +408,46 @@ def get_bhadra_karana(jd, utcoffset, ayanamsa=None):
     Returns:
         dict: Dictionary with Bhadra Karana information
     """
-    # Get karana information for the current time
-    karana_info = get_karana(jd, ayanamsa)
-
-    # Check if current karana is Vishti (Bhadra)
-    is_vishti = (karana_info['name'] == 'Vishti')
-
-    # If not Vishti, find the next Vishti karana
-    if not is_vishti:
-        # Start searching from current time
-        search_jd = jd
-        max_iterations = 60  # Maximum number of karanas to check
-        iterations = 0
-
-        while iterations < max_iterations:
-            # Add 1/60th of a day (24 minutes) to search for next karana
-            search_jd += 0.016666667  # 1/60 of a day
-            temp_karana = get_karana(search_jd, ayanamsa)
-
-            if temp_karana['name'] == 'Vishti':
-                # Found the next Vishti karana
-                karana_info = temp_karana
-                is_vishti = True
-                break
-
-            iterations += 1
-
-    # If we found Vishti, calculate its start and end times
-    if is_vishti:
-        # Get the phase angle at the current time
-        phase_angle = angle.norm(swe.sweObjectLon(const.MOON, jd) - swe.sweObjectLon(const.SUN, jd))
-
-        # Calculate the karana index (0-59)
-        karana_index = int(phase_angle / 6)
-
-        # Calculate the start of the current karana
-        karana_start_angle = karana_index * 6
+    # The karana periods from the given time until one day later
+    periods = get_transitions(KARANA, jd, jd + 1)
+    return get_vishti_period(periods, jd, utcoffset)
 
-        # Find the Julian day when the phase angle was at the start of the karana
-        # Use binary search to find the exact time
-        start_jd = jd - (phase_angle - karana_start_angle) * 0.0175  # Approximate conversion
 
-        # Refine the start time using binary search
-        lower_jd = start_jd - 0.1
-        upper_jd = start_jd + 0.1
-
-        for _ in range(10):  # 10 iterations should be enough for precision
-            mid_jd = (lower_jd + upper_jd) / 2
-            mid_angle = angle.norm(swe.sweObjectLon(const.MOON, mid_jd) - swe.sweObjectLon(const.SUN, mid_jd))
-
-            if mid_angle < karana_start_angle:
-                lower_jd = mid_jd
-            else:
-                upper_jd = mid_jd
-
-        karana_start_jd = upper_jd
-
-        # Calculate the end of the current karana (start + 6 degrees)
-        karana_end_angle = karana_start_angle + 6
-
-        # Find the Julian day when the phase angle will be at the end of the karana
-        end_jd = jd + (karana_end_angle - phase_angle) * 0.0175  # Approximate conversion
-
-        # Refine the end time using binary search
-        lower_jd = end_jd - 0.1
-        upper_jd = end_jd + 0.1
-
-        for _ in range(10):  # 10 iterations should be enough for precision
-            mid_jd = (lower_jd + upper_jd) / 2
-            mid_angle = angle.norm(swe.sweObjectLon(const.MOON, mid_jd) - swe.sweObjectLon(const.SUN, mid_jd))
-
-            if mid_angle < karana_end_angle:
-                lower_jd = mid_jd
-            else:
-                upper_jd = mid_jd
-
-        karana_end_jd = upper_jd
+def get_vishti_period(karana_periods, jd, utcoffset):
+    """
+    Find the Vishti karana active at a Julian day or starting within one day
 
-        # Convert to Datetime objects
-        karana_start = Datetime.fromJD(karana_start_jd, utcoffset)
-        karana_end = Datetime.fromJD(karana_end_jd, utcoffset)
+    Args:
+        karana_periods (dict): Karana periods covering the search range
+            (see panchang_transitions.get_transitions)
+        jd (float): Julian day
+        utcoffset (Time): UTC offset
 
-        return {
-            'is_vishti': True,
-            'start': karana_start,
-            'end': karana_end,
-            'karana_index': karana_index
-        }
-    else:
-        # Couldn't find Vishti karana in the search range
-        return {
-            'is_vishti': False,
-            'karana_index': karana_info['index']
-        }
+    Returns:
+        dict: Dictionary with Bhadra Karana information
+    """
+    indexes = karana_periods['index']
+    starts = karana_periods['start']
+    ends = karana_periods['end']
+
+    # Start with the karana active at the given time
+    first = bisect_right(starts, jd) - 1
+    for i in range(first, len(starts)):
+        if starts[i] > jd + 1:
+            break
+        if KARANA_NAMES[indexes[i]] == 'Vishti':
+            return {
+                'is_vishti': True,
+                'start': Datetime.fromJD(starts[i], utcoffset),
+                'end': Datetime.fromJD(ends[i], utcoffset),
+                'karana_index': indexes[i]
+            }
+
+    # No Vishti karana in the search range
+    return {
+        'is_vishti': False,
+        'karana_index': indexes[first]
+    }
 
 
 def get_panchaka_dosha(jd, ayanamsa=None):
@@ -569,38 +466,28 @@ def get_panchaka_dosha(jd, ayanamsa=None):
     """
     # Get nakshatra information
     nakshatra_info = get_nakshatra(jd, ayanamsa)
-    nakshatra_index = nakshatra_info['index']
+    return get_panchaka_from_nakshatra(nakshatra_info['index'], nakshatra_info['name'])
 
-    # Panchaka Dosha occurs in the following nakshatras (0-based index):
-    # Dhanishta (23), Shatabhisha (24), Purva Bhadrapada (25), Uttara Bhadrapada (26), Revati (27)
-    panchaka_nakshatras = [23, 24, 25, 26, 27]
 
+def get_panchaka_from_nakshatra(nakshatra_index, nakshatra_name):
+    """
+    Get Panchaka Dosha information for a Moon nakshatra
+
+    Args:
+        nakshatra_index (int): The nakshatra index
+        nakshatra_name (str): The nakshatra name
+
+    Returns:
+        dict: Dictionary with Panchaka Dosha information
+    """
     # Check if current nakshatra is in the Panchaka Dosha list
-    is_panchaka_dosha = nakshatra_index in panchaka_nakshatras
-
-    # Determine the type of Panchaka Dosha
-    panchaka_type = None
-    if is_panchaka_dosha:
-        # Mrityu (Death) - Dhanishta
-        if nakshatra_index == 23:
-            panchaka_type = "Mrityu Panchaka"
-        # Agni (Fire) - Shatabhisha
-        elif nakshatra_index == 24:
-            panchaka_type = "Agni Panchaka"
-        # Raja (King) - Purva Bhadrapada
-        elif nakshatra_index == 25:
-            panchaka_type = "Raja Panchaka"
-        # Chora (Thief) - Uttara Bhadrapada
-        elif nakshatra_index == 26:
-            panchaka_type = "Chora Panchaka"
-        # Roga (Disease) - Revati
-        elif nakshatra_index == 27:
-            panchaka_type = "Roga Panchaka"
+    panchaka_type = PANCHAKA_TYPES.get(nakshatra_index)
+    is_panchaka_dosha = panchaka_type is not None
 
     return {
         'is_panchaka_dosha': is_panchaka_dosha,
         'type': panchaka_type,
-        'nakshatra': nakshatra_info['name'] if is_panchaka_dosha else None
+        'nakshatra': nakshatra_name if is_panchaka_dosha else None
     }
 
 
@@ -630,6 +517,20 @@ def get_chandra_bala(jd, natal_moon_house, ayanamsa=None):
     # Calculate the current house of the Moon (1-12)
     current_moon_house = (int(moon_lon / 30) + 1)
 
+    return get_chandra_bala_from_houses(current_moon_house, natal_moon_house)
+
+
+def get_chandra_bala_from_houses(current_moon_house, natal_moon_house):
+    """
+    Get Chandra Bala information for a Moon house
+
+    Args:
+        current_moon_house (int): The house (1-12) of the current Moon
+        natal_moon_house (int): The house (1-12) of the natal Moon
+
+    Returns:
+        dict: Dictionary with Chandra Bala information
+    """
     # Calculate the distance from natal Moon's house (1-12)
     house_distance = ((current_moon_house - natal_moon_house) % 12) + 1
 
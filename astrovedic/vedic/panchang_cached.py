@@ -195,63 +195,27 @@ def get_vara(jd):
 
 
 @calculation_cache()
-def get_hora(jd):
+def get_hora(jd, lat=0, lon=0, utcoffset=None):
     """
     Calculate hora (planetary hour) for a given Julian day
 
     Args:
         jd (float): Julian day
+        lat (float): Latitude in degrees
+        lon (float): Longitude in degrees
+        utcoffset (str, optional): UTC offset used for the weekday of the
+            sunrise, the local mean time by default
 
     Returns:
         dict: Dictionary with hora information
     """
-    from astrovedic.ephem import ephem
-
-    # Get date from Julian day
-    date = Datetime.fromJD(jd)
-
-    # Find the previous sunrise and sunset
-    prev_sunrise = ephem.lastSunrise(date, (0, 0))  # Using default location
-    prev_sunset = ephem.lastSunset(date, (0, 0))    # Using default location
-
-    # Determine if it's day or night
-    is_day = prev_sunrise.jd > prev_sunset.jd
-
-    # Get the day of week (0 = Sunday, 6 = Saturday)
-    day_of_week = int(jd + 1.5) % 7
-
-    # Calculate the hora index
-    if is_day:
-        # Day hora sequence starts with the lord of the day
-        hora_start = day_of_week
-        day_duration = ephem.nextSunset(date, (0, 0)).jd - prev_sunrise.jd
-        elapsed = jd - prev_sunrise.jd
-    else:
-        # Night hora sequence starts with the 5th lord from the day lord
-        hora_start = (day_of_week + 5) % 7
-        next_sunrise = ephem.nextSunrise(date, (0, 0))
-        night_duration = next_sunrise.jd - prev_sunset.jd
-        elapsed = jd - prev_sunset.jd
-
-    # Calculate which hora it is (0-11 for day, 0-11 for night)
-    hora_index = int(elapsed * 12 / (day_duration if is_day else night_duration))
-
-    # Calculate the lord of the hora
-    hora_sequence = [0, 4, 1, 5, 2, 6, 3]  # Sun, Venus, Mercury, Moon, Saturn, Jupiter, Mars
-    hora_lord_index = (hora_start + hora_index) % 7
-    hora_lord = hora_sequence[hora_lord_index]
-
-    # Get the lord name
-    lord_names = [
-        const.SUN, const.MOON, const.MARS, const.MERCURY,
-        const.JUPITER, const.VENUS, const.SATURN
-    ]
-    hora_lord_name = lord_names[hora_lord]
+    from astrovedic.vedic.panchang import get_hora as get_panchang_hora
 
+    hora = get_panchang_hora(jd, lat, lon, utcoffset)
     return {
-        'index': hora_index,
-        'is_day': is_day,
-        'lord': hora_lord_name
+        'index': hora['index'],
+        'is_day': hora['is_day'],
+        'lord': hora['ruler']
     }
 
 
@@ -275,7 +239,9 @@ def get_panchang(jd, lat, lon, ayanamsa=None):
     yoga_info = get_yoga(jd, ayanamsa)
     karana_info = get_karana(jd, ayanamsa)
     vara_info = get_vara(jd)
-    hora_info = get_hora(jd)
+
+    # The hora weekday is taken at the local mean time of the location
+    hora_info = get_hora(jd, lat, lon, None)
 
     return {
         'tithi': tithi_info,
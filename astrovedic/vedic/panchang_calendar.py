@@ -0,0 +1,264 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements a streaming Panchang calendar generator.
+    Days are processed in chunks: the sunrises and sunsets of a chunk are
+    computed once, the tithi, nakshatra, yoga and karana periods are read
+    from the shared transition tables, and one record is yielded per day.
+    Records can be written to CSV, or to Arrow when pyarrow is installed.
+"""
+
+import csv
+from array import array
+from bisect import bisect_right
+
+from astrovedic.datetime import Datetime, Date
+from astrovedic.ephem import eph
+from astrovedic.vedic.nakshatras import LIST_NAKSHATRAS
+from astrovedic.vedic.panchang import (
+    TITHI_NAMES, KARANA_NAMES, YOGA_NAMES, VARA_NAMES,
+    SHUKLA_PAKSHA, KRISHNA_PAKSHA,
+    RAHUKALA_SEQUENCE, YAMAGANDA_SEQUENCE, GULIKA_SEQUENCE,
+    get_day_segment, get_vishti_period, get_panchaka_from_nakshatra
+)
+from astrovedic.vedic.panchang_transitions import (
+    TITHI, KARANA, NAKSHATRA, YOGA, get_transition_table
+)
+
+# Number of days computed at a time
+CHUNK_DAYS = 32
+
+# Element names by index
+ELEMENT_NAMES = {
+    TITHI: TITHI_NAMES,
+    KARANA: KARANA_NAMES,
+    NAKSHATRA: LIST_NAKSHATRAS,
+    YOGA: YOGA_NAMES
+}
+
+# Columns of the flat calendar rows with their types
+PANCHANG_COLUMNS = (
+    ('date', 'str'), ('vara', 'str'), ('sunrise', 'str'), ('sunset', 'str'),
+    ('tithi_index', 'int'), ('tithi', 'str'), ('paksha', 'str'), ('tithi_end', 'str'),
+    ('nakshatra_index', 'int'), ('nakshatra', 'str'), ('nakshatra_end', 'str'),
+    ('yoga_index', 'int'), ('yoga', 'str'), ('yoga_end', 'str'),
+    ('karana_index', 'int'), ('karana', 'str'), ('karana_end', 'str'),
+    ('rahukala_start', 'str'), ('rahukala_end', 'str'),
+    ('yamaganda_start', 'str'), ('yamaganda_end', 'str'),
+    ('gulika_kala_start', 'str'), ('gulika_kala_end', 'str'),
+    ('abhijit_start', 'str'), ('abhijit_end', 'str'),
+    ('bhadra_start', 'str'), ('bhadra_end', 'str'),
+    ('panchaka', 'str')
+)
+
+
+def get_sunrise_table(location, start_jd, days):
+    """
+    Calculate the sunrises and sunsets of consecutive days
+
+    Args:
+        location (GeoPos): The location
+        start_jd (float): Julian day of the local midnight starting the first day
+        days (int): The number of days
+
+    Returns:
+        tuple: (array of days + 1 sunrises, array of days sunsets), so that
+            the day i lasts from sunrises[i] to sunrises[i + 1]
+    """
+    sunrises = array('d')
+    sunsets = array('d')
+    for day in range(days + 1):
+        sunrise = eph.nextSunrise(start_jd + day, location.lat, location.lon)
+        sunrises.append(sunrise)
+        if day < days:
+            sunsets.append(eph.nextSunset(sunrise, location.lat, location.lon))
+    return sunrises, sunsets
+
+
+def _get_element_at(element, periods, jd, utcoffset):
+    """
+    Get the element active at a Julian day from its periods
+
+    Args:
+        element (str): TITHI, KARANA, NAKSHATRA or YOGA
+        periods (dict): The element periods
+        jd (float): Julian day
+        utcoffset (Time): UTC offset
+
+    Returns:
+        dict: Dictionary with the element index, name and end time
+    """
+    i = bisect_right(periods['start'], jd) - 1
+    index = periods['index'][i]
+    return {
+        'index': index,
+        'name': ELEMENT_NAMES[element][index],
+        'end': Datetime.fromJD(periods['end'][i], utcoffset)
+    }
+
+
+def iter_panchang(location, start, end, ayanamsa=None):
+    """
+    Generate the daily Panchang of a location between two dates
+
+    Each day lasts from its sunrise to the next sunrise, and the tithi,
+    nakshatra, yoga and karana are the ones active at sunrise. Memory use
+    does not depend on the number of days.
+
+    Args:
+        location (GeoPos): The location
+        start (Datetime): The first day (its UTC offset is used for all times)
+        end (Datetime): The last day (inclusive)
+        ayanamsa (str, optional): Ayanamsa to use for sidereal calculations
+
+    Yields:
+        dict: Dictionary with the Panchang of one day
+    """
+    utcoffset = start.utcoffset
+    first_jdn = start.date.jdn
+    days = end.date.jdn - first_jdn + 1
+
+    for chunk_start in range(0, days, CHUNK_DAYS):
+        chunk_days = min(CHUNK_DAYS, days - chunk_start)
+        midnight = Datetime(Date(first_jdn + chunk_start), 0, utcoffset)
+        sunrises, sunsets = get_sunrise_table(location, midnight.jd, chunk_days)
+
+        # Transitions until one day after the last sunrise, for Bhadra
+        table = get_transition_table(sunrises[0], sunrises[-1] + 1, ayanamsa)
+
+        for day in range(chunk_days):
+            date = Date(first_jdn + chunk_start + day)
+            sunrise = sunrises[day]
+            sunset = sunsets[day]
+
+            tithi = _get_element_at(TITHI, table[TITHI], sunrise, utcoffset)
+            tithi['paksha'] = SHUKLA_PAKSHA if tithi['index'] < 15 else KRISHNA_PAKSHA
+            nakshatra = _get_element_at(NAKSHATRA, table[NAKSHATRA], sunrise, utcoffset)
+
+            # Day of week (Sun=0) and Python weekday (Mon=0)
+            day_of_week = date.dayofweek()
+            weekday = (day_of_week - 1) % 7
+
+            yield {
+                'date': Datetime(date, 0, utcoffset),
+                'sunrise': Datetime.fromJD(sunrise, utcoffset),
+                'sunset': Datetime.fromJD(sunset, utcoffset),
+                'next_sunrise': Datetime.fromJD(sunrises[day + 1], utcoffset),
+                'vara': {'index': day_of_week, 'name': VARA_NAMES[day_of_week]},
+                'tithi': tithi,
+                'nakshatra': nakshatra,
+                'yoga': _get_element_at(YOGA, table[YOGA], sunrise, utcoffset),
+                'karana': _get_element_at(KARANA, table[KARANA], sunrise, utcoffset),
+                'rahukala': get_day_segment(sunrise, sunset, RAHUKALA_SEQUENCE[weekday], 8, utcoffset),
+                'yamaganda': get_day_segment(sunrise, sunset, YAMAGANDA_SEQUENCE[weekday], 8, utcoffset),
+                'gulika_kala': get_day_segment(sunrise, sunset, GULIKA_SEQUENCE[weekday], 8, utcoffset),
+                'abhijit_muhurta': get_day_segment(sunrise, sunset, 8, 15, utcoffset),
+                'bhadra_karana': get_vishti_period(table[KARANA], sunrise, utcoffset),
+                'panchaka_dosha': get_panchaka_from_nakshatra(nakshatra['index'], nakshatra['name'])
+            }
+
+
+def _format_time(date):
+    """ Returns a Datetime as a 'yyyy/mm/dd hh:mm:ss' string. """
+    return f"{date.date.toString()} {date.time.toString()}"
+
+
+def panchang_record_to_row(record):
+    """
+    Flatten a daily Panchang record into a row
+
+    Args:
+        record (dict): A record from iter_panchang
+
+    Returns:
+        dict: Mapping of PANCHANG_COLUMNS names to values
+    """
+    bhadra = record['bhadra_karana']
+    row = {
+        'date': record['date'].date.toString(),
+        'vara': record['vara']['name'],
+        'sunrise': _format_time(record['sunrise']),
+        'sunset': _format_time(record['sunset']),
+        'paksha': record['tithi']['paksha'],
+        'bhadra_start': _format_time(bhadra['start']) if bhadra['is_vishti'] else None,
+        'bhadra_end': _format_time(bhadra['end']) if bhadra['is_vishti'] else None,
+        'panchaka': record['panchaka_dosha']['type']
+    }
+    for element in ('tithi', 'nakshatra', 'yoga', 'karana'):
+        row[f'{element}_index'] = record[element]['index']
+        row[element] = record[element]['name']
+        row[f'{element}_end'] = _format_time(record[element]['end'])
+    for period, column in [('rahukala', 'rahukala'), ('yamaganda', 'yamaganda'),
+                           ('gulika_kala', 'gulika_kala'), ('abhijit_muhurta', 'abhijit')]:
+        row[f'{column}_start'] = _format_time(record[period]['start'])
+        row[f'{column}_end'] = _format_time(record[period]['end'])
+    return row
+
+
+def write_panchang_csv(records, file):
+    """
+    Write daily Panchang records to CSV, one row at a time
+
+    Args:
+        records (iterable): Records from iter_panchang
+        file (str or file): A path or an open text file
+
+    Returns:
+        int: The number of rows written
+    """
+    if isinstance(file, str):
+        with open(file, 'w', newline='') as handle:
+            return write_panchang_csv(records, handle)
+
+    writer = csv.DictWriter(file, fieldnames=[name for name, _ in PANCHANG_COLUMNS])
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow(panchang_record_to_row(record))
+        count += 1
+    return count
+
+
+def write_panchang_arrow(records, path, batch_size=CHUNK_DAYS):
+    """
+    Write daily Panchang records to an Arrow IPC file in record batches
+
+    Requires the optional pyarrow package.
+
+    Args:
+        records (iterable): Records from iter_panchang
+        path (str): The output file path
+        batch_size (int): The number of rows per record batch
+
+    Returns:
+        int: The number of rows written
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("pyarrow is required to write Arrow files") from e
+
+    types = {'str': pa.string(), 'int': pa.int16()}
+    schema = pa.schema([(name, types[kind]) for name, kind in PANCHANG_COLUMNS])
+
+    def to_batch(rows):
+        return pa.RecordBatch.from_pydict(
+            {name: [row[name] for row in rows] for name, _ in PANCHANG_COLUMNS},
+            schema=schema
+        )
+
+    count = 0
+    with pa.OSFile(path, 'wb') as sink:
+        with pa.ipc.new_file(sink, schema) as writer:
+            rows = []
+            for record in records:
+                rows.append(panchang_record_to_row(record))
+                if len(rows) == batch_size:
+                    writer.write_batch(to_batch(rows))
+                    count += len(rows)
+                    rows = []
+            if rows:
+                writer.write_batch(to_batch(rows))
+                count += len(rows)
+    return count
@@ -0,0 +1,278 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements the Panchang transition engine. It finds the
+    exact start and end times of every tithi, karana, nakshatra and yoga
+    by root-finding on the Moon-Sun elongation, the Moon longitude and the
+    Moon+Sun longitude. Transitions do not depend on the location, so they
+    are computed once in fixed blocks of days, cached, and shared by the
+    Panchang of every place.
+"""
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+
+from astrovedic import const
+from astrovedic import angle
+from astrovedic.ephem import swe
+from astrovedic.cache import reference_cache
+
+# Panchang elements
+TITHI = 'tithi'
+KARANA = 'karana'
+NAKSHATRA = 'nakshatra'
+YOGA = 'yoga'
+
+# Number of divisions of the circle and mean daily motion (degrees)
+# of the angle behind each element
+TRANSITION_ELEMENTS = {
+    TITHI: (30, 12.19),
+    KARANA: (60, 12.19),
+    NAKSHATRA: (27, 13.18),
+    YOGA: (27, 14.17)
+}
+
+# Elements that only depend on the Moon-Sun elongation
+ELONGATION_ELEMENTS = (TITHI, KARANA)
+
+# Transitions are computed and cached in blocks of this many days
+BLOCK_DAYS = 30
+
+# Root-finding tolerance in days (about 10 milliseconds)
+TOLERANCE = 1e-7
+MAX_ITERATIONS = 20
+
+
+def get_element_angle(element, jd, ayanamsa=None):
+    """
+    Get the angle that defines a Panchang element
+
+    Args:
+        element (str): TITHI, KARANA, NAKSHATRA or YOGA
+        jd (float): Julian day
+        ayanamsa (str, optional): Ayanamsa to use for sidereal calculations
+
+    Returns:
+        float: The angle in degrees (0-360)
+    """
+    moon_lon = swe.sweObjectLon(const.MOON, jd)
+
+    if element in ELONGATION_ELEMENTS:
+        return angle.norm(moon_lon - swe.sweObjectLon(const.SUN, jd))
+
+    ayanamsa_val = swe.get_ayanamsa(jd, ayanamsa) if ayanamsa else 0
+    if element == NAKSHATRA:
+        return angle.norm(moon_lon - ayanamsa_val)
+    if element == YOGA:
+        return angle.norm(moon_lon + swe.sweObjectLon(const.SUN, jd) - 2 * ayanamsa_val)
+
+    raise ValueError(f"Unknown Panchang element: {element}")
+
+
+def find_angle_crossing(angle_func, target, jd, rate):
+    """
+    Find the time closest to a Julian day when an increasing angle reaches a target
+
+    The signed distance to the target is solved with the secant method,
+    starting from an estimate based on the mean motion.
+
+    Args:
+        angle_func (callable): Function of the Julian day returning the angle
+        target (float): The target angle in degrees
+        jd (float): The Julian day to search from
+        rate (float): The mean motion of the angle in degrees per day
+
+    Returns:
+        float: The Julian day of the crossing
+    """
+    def distance(t):
+        return angle.closestdistance(target, angle_func(t))
+
+    jd0, dist0 = jd, distance(jd)
+    jd1 = jd0 - dist0 / rate
+    dist1 = distance(jd1)
+
+    for _ in range(MAX_ITERATIONS):
+        if abs(jd1 - jd0) < TOLERANCE or dist1 == dist0:
+            break
+        jd0, dist0, jd1 = jd1, dist1, jd1 - dist1 * (jd1 - jd0) / (dist1 - dist0)
+        dist1 = distance(jd1)
+
+    return jd1
+
+
+def find_transition(element, target, jd, ayanamsa=None):
+    """
+    Find the first time after a Julian day when an element angle reaches a target
+
+    Args:
+        element (str): TITHI, KARANA, NAKSHATRA or YOGA
+        target (float): The target angle in degrees
+        jd (float): The Julian day to search from (before the target is reached)
+        ayanamsa (str, optional): Ayanamsa to use for sidereal calculations
+
+    Returns:
+        float: The Julian day of the transition
+    """
+    return find_angle_crossing(
+        lambda t: get_element_angle(element, t, ayanamsa),
+        target, jd, TRANSITION_ELEMENTS[element][1]
+    )
+
+
+def get_angle_periods(angle_func, count, rate, start_jd, end_jd):
+    """
+    Get the periods of an increasing angle divided into equal parts
+
+    This is the uncached counterpart of get_transitions for angles that
+    depend on the location, such as the Ascendant.
+
+    Args:
+        angle_func (callable): Function of the Julian day returning the angle
+        count (int): The number of equal divisions of the circle
+        rate (float): The mean motion of the angle in degrees per day
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+
+    Returns:
+        dict: Sorted arrays 'index' (division indexes), 'start' and 'end'
+            (Julian days) with one entry per period
+    """
+    span = 360 / count
+    index = int(angle_func(start_jd) / span) % count
+
+    indexes = array('B', [index])
+    starts = array('d', [find_angle_crossing(angle_func, index * span, start_jd, rate)])
+    ends = array('d')
+
+    jd = start_jd
+    while True:
+        index = (index + 1) % count
+        jd = find_angle_crossing(angle_func, index * span, jd, rate)
+        ends.append(jd)
+        if jd >= end_jd:
+            break
+        indexes.append(index)
+        starts.append(jd)
+
+    return {'index': indexes, 'start': starts, 'end': ends}
+
+
+def _normalize_ayanamsa(element, ayanamsa):
+    """ Returns the ayanamsa that the element transitions depend on. """
+    if element not in TRANSITION_ELEMENTS:
+        raise ValueError(f"Unknown Panchang element: {element}")
+    return None if element in ELONGATION_ELEMENTS else ayanamsa
+
+
+@reference_cache()
+def _get_block(element, block, ayanamsa):
+    """
+    Calculate the transitions of an element in one block of days
+
+    Args:
+        element (str): TITHI, KARANA, NAKSHATRA or YOGA
+        block (int): The block number (Julian day // BLOCK_DAYS)
+        ayanamsa (str): Ayanamsa to use for sidereal calculations
+
+    Returns:
+        tuple: (index of the element active at the block start,
+            array of transition Julian days in the block)
+    """
+    count = TRANSITION_ELEMENTS[element][0]
+    span = 360 / count
+    block_start = block * BLOCK_DAYS
+    block_end = block_start + BLOCK_DAYS
+
+    first_index = int(get_element_angle(element, block_start, ayanamsa) / span) % count
+    transitions = array('d')
+
+    index = first_index
+    jd = block_start
+    while True:
+        index = (index + 1) % count
+        jd = find_transition(element, index * span, jd, ayanamsa)
+        if jd >= block_end:
+            break
+        transitions.append(jd)
+
+    return first_index, transitions
+
+
+def get_transitions(element, start_jd, end_jd, ayanamsa=None):
+    """
+    Get all periods of an element between two Julian days
+
+    The first period is the one active at start_jd and the last one is
+    the one active just before end_jd, so the periods cover the whole range.
+
+    Args:
+        element (str): TITHI, KARANA, NAKSHATRA or YOGA
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        ayanamsa (str, optional): Ayanamsa to use for sidereal calculations
+
+    Returns:
+        dict: Sorted arrays 'index' (element indexes), 'start' and 'end'
+            (Julian days) with one entry per period
+    """
+    ayanamsa = _normalize_ayanamsa(element, ayanamsa)
+    count = TRANSITION_ELEMENTS[element][0]
+
+    # One extra block on each side provides the surrounding transitions
+    first_block = math.floor(start_jd / BLOCK_DAYS) - 1
+    last_block = math.floor(end_jd / BLOCK_DAYS) + 1
+    first_index, transitions = _get_block(element, first_block, ayanamsa)
+    transitions = array('d', transitions)
+    for block in range(first_block + 1, last_block + 1):
+        transitions.extend(_get_block(element, block, ayanamsa)[1])
+
+    first = bisect_right(transitions, start_jd) - 1
+    last = max(bisect_left(transitions, end_jd), first + 1)
+
+    return {
+        'index': array('B', [(first_index + i + 1) % count for i in range(first, last)]),
+        'start': transitions[first:last],
+        'end': transitions[first + 1:last + 1]
+    }
+
+
+def get_element_period(element, jd, ayanamsa=None):
+    """
+    Get the element active at a Julian day with its start and end times
+
+    Args:
+        element (str): TITHI, KARANA, NAKSHATRA or YOGA
+        jd (float): Julian day
+        ayanamsa (str, optional): Ayanamsa to use for sidereal calculations
+
+    Returns:
+        dict: Dictionary with the element 'index' and the 'start' and
+            'end' Julian days
+    """
+    periods = get_transitions(element, jd, jd, ayanamsa)
+    return {
+        'index': periods['index'][0],
+        'start': periods['start'][0],
+        'end': periods['end'][0]
+    }
+
+
+def get_transition_table(start_jd, end_jd, ayanamsa=None):
+    """
+    Get the periods of all Panchang elements between two Julian days
+
+    Args:
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        ayanamsa (str, optional): Ayanamsa to use for sidereal calculations
+
+    Returns:
+        dict: Mapping of element to its periods (see get_transitions)
+    """
+    return {
+        element: get_transitions(element, start_jd, end_jd, ayanamsa)
+        for element in TRANSITION_ELEMENTS
+    }
@@ -0,0 +1,189 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements a planetary state kernel. The longitudes and
+    speeds of the planets are read from a chart once, and the Baladi,
+    Jagradadi and Lajjitadi Avasthas, the combustion state and the
+    dignity of all planets are computed from them as columns in planet
+    order, so many charts can be processed at once.
+"""
+
+from astrovedic import const
+from astrovedic import angle
+from astrovedic.parallel import map_blocks
+from astrovedic.vedic.avasthas import (
+    LAJJITADI_AGITATED, get_baladi_state, get_jagradadi_state,
+    get_lajjitadi_state, is_lajjitadi_combust
+)
+from astrovedic.vedic.combustion import (
+    DEEP_COMBUSTION_ORBS, get_combustion_orb, get_strength_reduction
+)
+from astrovedic.vedic.dignities import (
+    DIGNITY_NAME_CLASSES, DIGNITY_NAME_SCORES, get_dignity_name, get_sign_relationship
+)
+
+# Planets of the kernel, in column order
+STATE_PLANETS = (
+    const.SUN, const.MOON, const.MERCURY, const.VENUS,
+    const.MARS, const.JUPITER, const.SATURN, const.RAHU, const.KETU
+)
+SUN_INDEX = STATE_PLANETS.index(const.SUN)
+
+# Speeds below this are stationary, as in GenericObject.movement
+STATIONARY_SPEED = 0.0003
+
+# Columns of the kernel result
+STATE_COLUMNS = (
+    'signs', 'sign_lons', 'retrograde',
+    'baladi', 'baladi_strength', 'jagradadi', 'jagradadi_strength',
+    'lajjitadi', 'lajjitadi_strength', 'lajjitadi_combust',
+    'orb', 'combustion_orb', 'deep_combustion_orb',
+    'is_combust', 'is_deeply_combust', 'strength_reduction',
+    'dignity', 'dignity_class', 'dignity_score'
+)
+
+# Default number of charts evaluated per task
+DEFAULT_BLOCK_SIZE = 256
+
+# Lajjitadi Avastha of each planet in each sign when not combust,
+# indexed by [planet][sign]
+LAJJITADI_TABLE = tuple(
+    tuple(get_lajjitadi_state(planet_id, sign, False) for sign in const.LIST_SIGNS)
+    for planet_id in STATE_PLANETS
+)
+
+# Relationship of each planet with the ruler of each sign, indexed by [planet][sign]
+RELATIONSHIP_TABLE = tuple(
+    tuple(get_sign_relationship(planet_id, sign) for sign in const.LIST_SIGNS)
+    for planet_id in STATE_PLANETS
+)
+
+# Combustion orbs of each planet when direct and retrograde
+COMBUSTION_ORB_TABLE = tuple(
+    (get_combustion_orb(planet_id, False), get_combustion_orb(planet_id, True))
+    for planet_id in STATE_PLANETS
+)
+
+# Combustion state of the Sun, as in combustion.get_combustion_details
+SUN_COMBUSTION = (0, 0, 0, False, False, 0)
+
+
+def get_state_facts(chart):
+    """
+    Get the longitudes and speeds of the planets of a chart
+
+    Args:
+        chart (Chart): The chart
+
+    Returns:
+        dict: Dictionary with the 'lons' and 'speeds' of the planets in
+            STATE_PLANETS order
+    """
+    planets = [chart.getObject(planet_id) for planet_id in STATE_PLANETS]
+    return {
+        'lons': tuple(planet.lon for planet in planets),
+        'speeds': tuple(getattr(planet, 'lonspeed', 0.0) for planet in planets)
+    }
+
+
+def _get_planet_state(index, lon, speed, sun_lon):
+    """ Returns the state of a planet in STATE_COLUMNS order. """
+    planet_id = STATE_PLANETS[index]
+    sign_index = int(lon / 30.0)
+    sign = const.LIST_SIGNS[sign_index]
+    sign_lon = lon % 30
+    is_retrograde = speed <= -STATIONARY_SPEED
+
+    # Avasthas
+    baladi, baladi_strength = get_baladi_state(sign_lon)
+    jagradadi, jagradadi_strength = get_jagradadi_state(sign_lon)
+    orb = abs(angle.closestdistance(lon, sun_lon))
+    lajjitadi_combust = is_lajjitadi_combust(planet_id, orb)
+    if lajjitadi_combust:
+        lajjitadi, lajjitadi_strength = LAJJITADI_AGITATED, 20
+    else:
+        lajjitadi, lajjitadi_strength = LAJJITADI_TABLE[index][sign_index]
+
+    # Combustion
+    if index == SUN_INDEX:
+        combustion = SUN_COMBUSTION
+    else:
+        combustion_orb = COMBUSTION_ORB_TABLE[index][is_retrograde]
+        deep_combustion_orb = DEEP_COMBUSTION_ORBS.get(planet_id, 3)
+        combustion = (orb, combustion_orb, deep_combustion_orb,
+                      orb <= combustion_orb, orb <= deep_combustion_orb,
+                      get_strength_reduction(orb, combustion_orb, deep_combustion_orb))
+
+    # Dignity
+    dignity = get_dignity_name(planet_id, sign, sign_lon)
+    dignity_class = DIGNITY_NAME_CLASSES.get(dignity) or RELATIONSHIP_TABLE[index][sign_index]
+
+    return (sign_index, sign_lon, is_retrograde,
+            baladi, baladi_strength, jagradadi, jagradadi_strength,
+            lajjitadi, lajjitadi_strength, lajjitadi_combust) + combustion + (
+            dignity, dignity_class, DIGNITY_NAME_SCORES[dignity])
+
+
+def evaluate_planet_states(facts):
+    """
+    Compute the states of all planets of a chart
+
+    Args:
+        facts (dict): The chart facts (see get_state_facts)
+
+    Returns:
+        dict: Dictionary with the 'planets' and a tuple in planet order
+            for each of STATE_COLUMNS: the sign index and longitude in
+            the sign, whether the planet is retrograde, the Avasthas and
+            their strengths, the combustion state (see
+            combustion.get_combustion_details) and the dignity name,
+            class and score
+    """
+    lons = facts['lons']
+    sun_lon = lons[SUN_INDEX]
+    rows = [_get_planet_state(index, lon, speed, sun_lon)
+            for index, (lon, speed) in enumerate(zip(lons, facts['speeds']))]
+
+    states = {'planets': STATE_PLANETS}
+    states.update(zip(STATE_COLUMNS, zip(*rows)))
+    return states
+
+
+def get_planet_states(chart):
+    """
+    Compute the states of all planets of a chart
+
+    Args:
+        chart (Chart): The chart
+
+    Returns:
+        dict: The planet states (see evaluate_planet_states)
+    """
+    return evaluate_planet_states(get_state_facts(chart))
+
+
+def _evaluate_block(facts):
+    """ Returns the planet states of a block of charts. """
+    return [evaluate_planet_states(chart_facts) for chart_facts in facts]
+
+
+def iter_planet_states(facts, block_size=DEFAULT_BLOCK_SIZE, max_workers=None,
+                       executor=None):
+    """
+    Compute the planet states of many charts
+
+    Charts are processed in blocks with map_blocks.
+
+    Args:
+        facts (list): The facts of all charts (see get_state_facts)
+        block_size (int): The number of charts per block
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
+
+    Yields:
+        tuple: (chart index, states) in chart order, where states is the
+            result of evaluate_planet_states
+    """
+    return map_blocks(_evaluate_block, facts, block_size, max_workers=max_workers,
+                      executor=executor)
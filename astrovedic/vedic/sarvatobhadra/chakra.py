@@ -7,11 +7,120 @@
 """
 
 from astrovedic import const
+from astrovedic.cache import reference_cache
 from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
 from astrovedic.geopos import GeoPos
 
 
+# Filling order of the cells, starting from the center with the birth nakshatra
+CHAKRA_PATTERN = (
+    (4, 4), (4, 5), (3, 5), (3, 4), (3, 3), (4, 3), (5, 3), (5, 4), (5, 5),
+    (5, 6), (4, 6), (3, 6), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (3, 2),
+    (4, 2), (5, 2), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (5, 7),
+    (4, 7), (3, 7), (2, 7), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2),
+    (1, 1), (2, 1), (3, 1), (4, 1), (5, 1), (6, 1), (7, 1), (7, 2), (7, 3),
+    (7, 4), (7, 5), (7, 6), (7, 7), (7, 8), (6, 8), (5, 8), (4, 8), (3, 8),
+    (2, 8), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2),
+    (0, 1), (0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (5, 0), (6, 0), (7, 0),
+    (8, 0), (8, 1), (8, 2), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8)
+)
+
+# Directions of the chakra
+DIRECTIONS = (
+    'North', 'Northeast', 'East', 'Southeast', 'South',
+    'Southwest', 'West', 'Northwest', 'Center'
+)
+
+# Cells of each direction, from the edge towards the center
+DIRECTION_CELLS = {
+    'North': ((0, 4), (1, 4), (2, 4), (3, 4)),
+    'Northeast': ((0, 8), (1, 7), (2, 6), (3, 5)),
+    'East': ((4, 8), (4, 7), (4, 6), (4, 5)),
+    'Southeast': ((8, 8), (7, 7), (6, 6), (5, 5)),
+    'South': ((8, 4), (7, 4), (6, 4), (5, 4)),
+    'Southwest': ((8, 0), (7, 1), (6, 2), (5, 3)),
+    'West': ((4, 0), (4, 1), (4, 2), (4, 3)),
+    'Northwest': ((0, 0), (1, 1), (2, 2), (3, 3)),
+    'Center': ((4, 4),)
+}
+
+
+def get_cell_bit(row, col):
+    """
+    Get the bit of a cell in a cell bitmask
+    
+    Args:
+        row (int): The row in the chakra (0-8)
+        col (int): The column in the chakra (0-8)
+    
+    Returns:
+        int: The bit of the cell (bit row * 9 + col)
+    """
+    return 1 << (row * 9 + col)
+
+
+# Cell bitmask of each direction
+DIRECTION_MASKS = {
+    direction: sum(get_cell_bit(row, col) for row, col in cells)
+    for direction, cells in DIRECTION_CELLS.items()
+}
+
+# Vedha lines of each cell: the cells on its row, column and diagonals
+VEDHA_LINES = tuple(
+    sum(get_cell_bit(other_row, other_col)
+        for other_row in range(9) for other_col in range(9)
+        if (other_row, other_col) != (row, col) and
+        (other_row == row or other_col == col or
+         other_row - other_col == row - col or other_row + other_col == row + col))
+    for row in range(9) for col in range(9)
+)
+
+
+@reference_cache()
+def get_chakra_template(janma_nakshatra):
+    """
+    Get the template of the Sarvatobhadra Chakra of a birth nakshatra
+    
+    The template is shared by every chakra with the same birth nakshatra
+    and must not be modified.
+    
+    Args:
+        janma_nakshatra (int): The birth nakshatra number
+    
+    Returns:
+        dict: Dictionary with the 'grid' (tuple of rows), the first
+            'positions' of each nakshatra (indexed by nakshatra number,
+            scanning row by row), the 'direction_nakshatras' and the
+            'direction_masks' (nakshatra number bitmasks) of each direction
+    """
+    grid = [[0] * 9 for _ in range(9)]
+    for i, (row, col) in enumerate(CHAKRA_PATTERN):
+        grid[row][col] = ((janma_nakshatra - 1 + i) % 27) + 1
+    
+    positions = [None] * 28
+    for row in range(9):
+        for col in range(9):
+            if positions[grid[row][col]] is None:
+                positions[grid[row][col]] = (row, col)
+    
+    direction_nakshatras = {
+        direction: tuple(grid[row][col] for row, col in cells)
+        for direction, cells in DIRECTION_CELLS.items()
+    }
+    
+    return {
+        'janma_nakshatra': janma_nakshatra,
+        'grid': tuple(tuple(row) for row in grid),
+        'positions': tuple(positions),
+        'direction_nakshatras': direction_nakshatras,
+        'direction_masks': {
+            direction: sum(1 << nakshatra for nakshatra in set(nakshatras))
+            for direction, nakshatras in direction_nakshatras.items()
+        }
+    }
+
+
 def create_chakra(janma_nakshatra):
     """
     Create the Sarvatobhadra Chakra based on the birth nakshatra
@@ -22,11 +131,9 @@ def create_chakra(janma_nakshatra):
     Returns:
         dict: Dictionary with Sarvatobhadra Chakra information
     """
-    # Initialize the 9x9 grid
-    grid = [[0 for _ in range(9)] for _ in range(9)]
-    
-    # Fill the grid with nakshatras
-    grid = fill_chakra_grid(grid, janma_nakshatra)
+    # Copy the grid of the template
+    template = get_chakra_template(janma_nakshatra)
+    grid = [list(row) for row in template['grid']]
     
     # Create the chakra dictionary
     chakra = {
@@ -48,29 +155,10 @@ def fill_chakra_grid(grid, janma_nakshatra):
     Returns:
         list: The filled 9x9 grid
     """
-    # The Sarvatobhadra Chakra is filled in a specific pattern
-    # Starting from the center (4, 4) with the birth nakshatra
-    
-    # Define the filling pattern
-    pattern = [
-        (4, 4), (4, 5), (3, 5), (3, 4), (3, 3), (4, 3), (5, 3), (5, 4), (5, 5),
-        (5, 6), (4, 6), (3, 6), (2, 6), (2, 5), (2, 4), (2, 3), (2, 2), (3, 2),
-        (4, 2), (5, 2), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (5, 7),
-        (4, 7), (3, 7), (2, 7), (1, 7), (1, 6), (1, 5), (1, 4), (1, 3), (1, 2),
-        (1, 1), (2, 1), (3, 1), (4, 1), (5, 1), (6, 1), (7, 1), (7, 2), (7, 3),
-        (7, 4), (7, 5), (7, 6), (7, 7), (7, 8), (6, 8), (5, 8), (4, 8), (3, 8),
-        (2, 8), (1, 8), (0, 8), (0, 7), (0, 6), (0, 5), (0, 4), (0, 3), (0, 2),
-        (0, 1), (0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (5, 0), (6, 0), (7, 0),
-        (8, 0), (8, 1), (8, 2), (8, 3), (8, 4), (8, 5), (8, 6), (8, 7), (8, 8)
-    ]
-    
-    # Fill the grid according to the pattern
-    for i, (row, col) in enumerate(pattern):
-        # Calculate the nakshatra for this position
-        nakshatra = ((janma_nakshatra - 1 + i) % 27) + 1
-        
-        # Fill the grid
-        grid[row][col] = nakshatra
+    # The grid is filled in a fixed pattern from the center, so it is
+    # copied from the template of the birth nakshatra
+    for row, values in enumerate(get_chakra_template(janma_nakshatra)['grid']):
+        grid[row][:] = values
     
     return grid
 
@@ -162,21 +250,8 @@ def get_direction_cells(chakra, direction):
     Returns:
         list: The cells in the direction
     """
-    # Define the cells for each direction
-    direction_cells = {
-        'North': [(0, 4), (1, 4), (2, 4), (3, 4)],
-        'Northeast': [(0, 8), (1, 7), (2, 6), (3, 5)],
-        'East': [(4, 8), (4, 7), (4, 6), (4, 5)],
-        'Southeast': [(8, 8), (7, 7), (6, 6), (5, 5)],
-        'South': [(8, 4), (7, 4), (6, 4), (5, 4)],
-        'Southwest': [(8, 0), (7, 1), (6, 2), (5, 3)],
-        'West': [(4, 0), (4, 1), (4, 2), (4, 3)],
-        'Northwest': [(0, 0), (1, 1), (2, 2), (3, 3)],
-        'Center': [(4, 4)]
-    }
-    
     # Return the cells for the specified direction
-    return direction_cells.get(direction, [])
+    return list(DIRECTION_CELLS.get(direction, ()))
 
 
 def get_nakshatras_in_direction(chakra, direction):
@@ -210,19 +285,51 @@ def get_planets_in_direction(chakra, direction):
     Returns:
         list: The planets in the direction
     """
-    # Get the cells in the direction
-    cells = get_direction_cells(chakra, direction)
+    # Get the cell bitmask of the direction
+    mask = DIRECTION_MASKS.get(direction, 0)
     
     # Get the planets in the cells
     planets = []
     for planet_id, planet_info in chakra['planets'].items():
         position = planet_info['position']
-        if position and position in cells:
+        if position and mask >> (position[0] * 9 + position[1]) & 1:
             planets.append(planet_id)
     
     return planets
 
 
+def get_vedha_cells(row, col):
+    """
+    Get the cells in Vedha with a cell of the Sarvatobhadra Chakra
+    
+    Args:
+        row (int): The row in the chakra (0-8)
+        col (int): The column in the chakra (0-8)
+    
+    Returns:
+        list: The (row, column) cells on the row, column and diagonals
+            of the cell
+    """
+    mask = VEDHA_LINES[row * 9 + col]
+    return [(i // 9, i % 9) for i in range(81) if mask >> i & 1]
+
+
+def get_vedha_nakshatras(chakra, row, col):
+    """
+    Get the nakshatras in Vedha with a cell of the Sarvatobhadra Chakra
+    
+    Args:
+        chakra (dict): The Sarvatobhadra Chakra
+        row (int): The row in the chakra (0-8)
+        col (int): The column in the chakra (0-8)
+    
+    Returns:
+        list: The nakshatras in the cells in Vedha, in row order
+    """
+    return [chakra['grid'][other_row][other_col]
+            for other_row, other_col in get_vedha_cells(row, col)]
+
+
 def get_nakshatra_name(nakshatra_num):
     """
     Get the name of a nakshatra
@@ -10,6 +10,8 @@ from astrovedic import const
 from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
 from astrovedic.geopos import GeoPos
+from astrovedic.vedic.nakshatras import get_nakshatra_index
+from astrovedic.vedic.sarvatobhadra.chakra import DIRECTIONS, get_chakra_template
 
 # Import Panchanga functions
 from astrovedic.vedic.muhurta.panchanga import get_panchanga
@@ -104,13 +106,8 @@ def get_planet_position_in_chakra(planet, chakra):
     # Get the planet's nakshatra
     nakshatra = get_nakshatra_from_longitude(planet.lon)
     
-    # Find the position of the nakshatra in the chakra
-    for row in range(9):
-        for col in range(9):
-            if chakra['grid'][row][col] == nakshatra:
-                return (row, col)
-    
-    return None
+    # Find the first position of the nakshatra in the chakra template
+    return get_chakra_template(chakra['janma_nakshatra'])['positions'][nakshatra]
 
 
 def get_nakshatra_from_longitude(longitude):
@@ -123,10 +120,7 @@ def get_nakshatra_from_longitude(longitude):
     Returns:
         int: The nakshatra number (1-27)
     """
-    # Calculate the nakshatra number
-    nakshatra_num = int(longitude / (360 / 27)) + 1
-    
-    return nakshatra_num
+    return get_nakshatra_index(longitude)[0] + 1
 
 
 def get_chakra_quality(chakra):
@@ -272,7 +266,7 @@ def get_auspicious_directions(chakra):
     from astrovedic.vedic.sarvatobhadra.directions import get_direction_quality
     
     # Check each direction
-    for direction in ['North', 'Northeast', 'East', 'Southeast', 'South', 'Southwest', 'West', 'Northwest', 'Center']:
+    for direction in DIRECTIONS:
         # Get the quality of the direction
         quality = get_direction_quality(chakra, direction)
         
@@ -305,7 +299,7 @@ def get_inauspicious_directions(chakra):
     from astrovedic.vedic.sarvatobhadra.directions import get_direction_quality
     
     # Check each direction
-    for direction in ['North', 'Northeast', 'East', 'Southeast', 'South', 'Southwest', 'West', 'Northwest', 'Center']:
+    for direction in DIRECTIONS:
         # Get the quality of the direction
         quality = get_direction_quality(chakra, direction)
         
@@ -11,11 +11,60 @@ from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
 from astrovedic.geopos import GeoPos
 
+from astrovedic.cache import reference_cache
+
 # Import chakra functions
 from astrovedic.vedic.sarvatobhadra.chakra import (
-    get_direction_cells, get_nakshatras_in_direction,
-    get_planets_in_direction, get_nakshatra_lord
+    DIRECTIONS, get_chakra_template, get_direction_cells,
+    get_nakshatras_in_direction, get_planets_in_direction, get_nakshatra_lord
+)
+
+# Favorable and unfavorable Taras with their Tara Bala keys
+FAVORABLE_TARAS = (
+    ('Sampath Tara', 'sampath_tara'),
+    ('Kshema Tara', 'kshema_tara'),
+    ('Sadhaka Tara', 'sadhaka_tara'),
+    ('Mitra Tara', 'mitra_tara'),
+    ('Ati Mitra Tara', 'ati_mitra_tara')
 )
+UNFAVORABLE_TARAS = (
+    ('Vipat Tara', 'vipat_tara'),
+    ('Pratyak Tara', 'pratyak_tara'),
+    ('Vadha Tara', 'vadha_tara')
+)
+
+
+@reference_cache()
+def get_nakshatra_lord_score(janma_nakshatra, direction):
+    """
+    Get the score of the nakshatra lords in a direction of a chakra template
+    
+    Args:
+        janma_nakshatra (int): The birth nakshatra number
+        direction (str): The direction ('North', 'Northeast', etc.)
+    
+    Returns:
+        tuple: (score, factors) of the benefic and malefic nakshatra lords
+    """
+    nakshatras = get_chakra_template(janma_nakshatra)['direction_nakshatras'].get(direction, ())
+    
+    score = 0.0
+    factors = []
+    for nakshatra in nakshatras:
+        # Get the lord of the nakshatra
+        lord = get_nakshatra_lord(nakshatra)
+        
+        # Check if the lord is a benefic
+        if lord in ['Moon', 'Mercury', 'Jupiter', 'Venus']:
+            score += 0.5
+            factors.append(f"Nakshatra {nakshatra} with benefic lord {lord} is in this direction")
+        
+        # Check if the lord is a malefic
+        elif lord in ['Sun', 'Mars', 'Saturn', 'Rahu', 'Ketu']:
+            score -= 0.5
+            factors.append(f"Nakshatra {nakshatra} with malefic lord {lord} is in this direction")
+    
+    return score, tuple(factors)
 
 
 def get_direction_quality(chakra, direction):
@@ -33,8 +82,9 @@ def get_direction_quality(chakra, direction):
     score = 0
     factors = []
     
-    # Get the nakshatras in the direction
-    nakshatras = get_nakshatras_in_direction(chakra, direction)
+    # Get the nakshatra bitmask of the direction from the chakra template
+    janma_nakshatra = chakra['janma_nakshatra']
+    mask = get_chakra_template(janma_nakshatra)['direction_masks'].get(direction, 0)
     
     # Get the planets in the direction
     planets = get_planets_in_direction(chakra, direction)
@@ -58,24 +108,14 @@ def get_direction_quality(chakra, direction):
         score += 2
         factors.append("Ascendant is in this direction")
     
-    # Check the nakshatras in the direction
-    for nakshatra in nakshatras:
-        # Get the lord of the nakshatra
-        lord = get_nakshatra_lord(nakshatra)
-        
-        # Check if the lord is a benefic
-        if lord in ['Moon', 'Mercury', 'Jupiter', 'Venus']:
-            score += 0.5
-            factors.append(f"Nakshatra {nakshatra} with benefic lord {lord} is in this direction")
-        
-        # Check if the lord is a malefic
-        elif lord in ['Sun', 'Mars', 'Saturn', 'Rahu', 'Ketu']:
-            score -= 0.5
-            factors.append(f"Nakshatra {nakshatra} with malefic lord {lord} is in this direction")
+    # Check the lords of the nakshatras in the direction
+    lord_score, lord_factors = get_nakshatra_lord_score(janma_nakshatra, direction)
+    if lord_factors:
+        score += lord_score
+        factors.extend(lord_factors)
     
     # Check if the direction is the same as the birth nakshatra
-    janma_nakshatra = chakra['janma_nakshatra']
-    if janma_nakshatra in nakshatras:
+    if mask >> janma_nakshatra & 1:
         score += 1
         factors.append(f"Birth nakshatra {janma_nakshatra} is in this direction")
     
@@ -83,26 +123,14 @@ def get_direction_quality(chakra, direction):
     tara_bala = chakra['tara_bala']
     
     # Check if favorable Taras are in the direction
-    favorable_taras = {
-        'Sampath Tara': 'sampath_tara',
-        'Kshema Tara': 'kshema_tara',
-        'Sadhaka Tara': 'sadhaka_tara',
-        'Mitra Tara': 'mitra_tara',
-        'Ati Mitra Tara': 'ati_mitra_tara'
-    }
-    for tara_name, tara_key in favorable_taras.items():
-        if tara_key in tara_bala and tara_bala[tara_key] in nakshatras:
+    for tara_name, tara_key in FAVORABLE_TARAS:
+        if tara_key in tara_bala and mask >> tara_bala[tara_key] & 1:
             score += 1
             factors.append(f"{tara_name} is in this direction")
     
     # Check if unfavorable Taras are in the direction
-    unfavorable_taras = {
-        'Vipat Tara': 'vipat_tara',
-        'Pratyak Tara': 'pratyak_tara',
-        'Vadha Tara': 'vadha_tara'
-    }
-    for tara_name, tara_key in unfavorable_taras.items():
-        if tara_key in tara_bala and tara_bala[tara_key] in nakshatras:
+    for tara_name, tara_key in UNFAVORABLE_TARAS:
+        if tara_key in tara_bala and mask >> tara_bala[tara_key] & 1:
             score -= 1
             factors.append(f"{tara_name} is in this direction")
     
@@ -141,7 +169,7 @@ def get_best_direction(chakra):
     best_direction = None
     
     # Check each direction
-    for direction in ['North', 'Northeast', 'East', 'Southeast', 'South', 'Southwest', 'West', 'Northwest', 'Center']:
+    for direction in DIRECTIONS:
         # Get the quality of the direction
         quality = get_direction_quality(chakra, direction)
         
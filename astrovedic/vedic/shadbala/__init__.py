@@ -21,6 +21,7 @@ from astrovedic.vedic.shadbala.kala_bala import calculate_kala_bala, calculate_y
 from astrovedic.vedic.shadbala.cheshta_bala import calculate_cheshta_bala
 from astrovedic.vedic.shadbala.naisargika_bala import calculate_naisargika_bala
 from astrovedic.vedic.shadbala.drig_bala import calculate_drig_bala
+from astrovedic.vedic.aspects import get_drishti_matrix
 from astrovedic.vedic.shadbala.advanced import (
     calculate_ishta_phala, calculate_kashta_phala,
     calculate_vimsopaka_bala, calculate_bhava_bala
@@ -59,13 +60,15 @@ MINIMUM_SHADBALA = {
 }
 
 
-def get_shadbala(chart, planet_id):
+def get_shadbala(chart, planet_id, drishti=None):
     """
     Calculate Shadbala (six-fold strength) for a planet
 
     Args:
         chart (Chart): The birth chart
         planet_id (str): The ID of the planet to analyze
+        drishti (dict, optional): Precomputed matrices from
+            vedic.aspects.get_drishti_matrix
 
     Returns:
         dict: Dictionary with Shadbala information
@@ -79,7 +82,7 @@ def get_shadbala(chart, planet_id):
     kala_bala = calculate_kala_bala(chart, planet_id)
     cheshta_bala = calculate_cheshta_bala(chart, planet_id)
     naisargika_bala = calculate_naisargika_bala(planet_id)
-    drig_bala = calculate_drig_bala(chart, planet_id)
+    drig_bala = calculate_drig_bala(chart, planet_id, drishti)
 
     # Calculate Yuddha Bala (planetary war) separately
     # This is now a correction applied after summing the six main components
@@ -184,8 +187,11 @@ def get_all_shadbala(chart):
     """
     shadbala_results = {}
 
+    # The aspects between the planets are shared by their Drig Bala
+    drishti = get_drishti_matrix(chart)
+
     for planet_id in const.LIST_OBJECTS_VEDIC:
-        shadbala_results[planet_id] = get_shadbala(chart, planet_id)
+        shadbala_results[planet_id] = get_shadbala(chart, planet_id, drishti)
 
     # Add summary information
     shadbala_results['summary'] = get_shadbala_summary(shadbala_results)
@@ -11,7 +11,7 @@ from astrovedic import angle
 from astrovedic.vedic import aspects as vedic_aspects
 
 
-def calculate_drig_bala(chart, planet_id):
+def calculate_drig_bala(chart, planet_id, drishti=None):
     """
     Calculate Drig Bala (aspectual strength) for a planet
 
@@ -24,12 +24,14 @@ def calculate_drig_bala(chart, planet_id):
     Args:
         chart (Chart): The birth chart
         planet_id (str): The ID of the planet to analyze
+        drishti (dict, optional): Precomputed matrices from
+            vedic.aspects.get_drishti_matrix, shared by all planets
 
     Returns:
         dict: Dictionary with Drig Bala information
     """
-    # Get the planet from the chart
-    planet = chart.getObject(planet_id)
+    if drishti is None:
+        drishti = vedic_aspects.get_drishti_matrix(chart)
 
     # Maximum value (in Virupas)
     max_value = 60.0
@@ -38,11 +40,11 @@ def calculate_drig_bala(chart, planet_id):
     net_value = 0.0
 
     # Calculate aspects received
-    aspects_received = calculate_aspects_received(chart, planet_id)
+    aspects_received = calculate_aspects_received(chart, planet_id, drishti)
     net_value += aspects_received['value']
 
     # Calculate aspects cast (for information only, not used in net value)
-    aspects_cast = calculate_aspects_cast(chart, planet_id)
+    aspects_cast = calculate_aspects_cast(chart, planet_id, drishti)
 
     # Include Rashi Drishti (sign aspects)
     rashi_drishti = calculate_rashi_drishti(chart, planet_id)
@@ -70,7 +72,7 @@ def calculate_drig_bala(chart, planet_id):
     }
 
 
-def calculate_aspects_received(chart, planet_id):
+def calculate_aspects_received(chart, planet_id, drishti=None):
     """
     Calculate the aspects received by a planet using standard Virupa points
     for Drig Bala calculations.
@@ -78,12 +80,14 @@ def calculate_aspects_received(chart, planet_id):
     Args:
         chart (Chart): The birth chart
         planet_id (str): The ID of the planet
+        drishti (dict, optional): Precomputed matrices from
+            vedic.aspects.get_drishti_matrix
 
     Returns:
         dict: Dictionary with aspect information
     """
-    # Get the planet from the chart
-    planet = chart.getObject(planet_id)
+    if drishti is None:
+        drishti = vedic_aspects.get_drishti_matrix(chart)
 
     # Initialize the aspect value
     aspect_value = 0.0
@@ -91,34 +95,26 @@ def calculate_aspects_received(chart, planet_id):
     # List of aspects received
     aspects = []
 
-    # Check aspects from each planet
-    for other_id in const.LIST_OBJECTS_VEDIC:
-        if other_id != planet_id:
-            other = chart.getObject(other_id)
-
-            # Get aspect information from the Vedic aspects module
-            aspect_info = vedic_aspects.get_graha_drishti_strength(other_id, other.lon, planet.lon)
+    # Check the aspects from each planet in the matrix
+    for aspect in vedic_aspects.get_matrix_aspects(drishti, planet_id, received=True):
+        other_id = aspect['from_planet']
 
-            if aspect_info['has_aspect']:
-                # Calculate Virupa points using the standard system
-                virupa_points = get_drig_bala_virupa_points(
-                    aspecting_planet_id=other_id,
-                    aspect_type=aspect_info['type']
-                )
+        # Calculate Virupa points using the standard system
+        virupa_points = get_drig_bala_virupa_points(
+            aspecting_planet_id=other_id,
+            aspect_type=aspect['type']
+        )
 
-                # Add to the total aspect value
-                aspect_value += virupa_points
+        # Add to the total aspect value
+        aspect_value += virupa_points
 
-                # Determine if the aspect is benefic or malefic
-                is_benefic = is_benefic_planet(other_id)
-
-                # Add to the list of aspects
-                aspects.append({
-                    'planet': other_id,
-                    'virupa_points': virupa_points,
-                    'aspect_type': aspect_info['type'],
-                    'is_benefic': is_benefic
-                })
+        # Add to the list of aspects
+        aspects.append({
+            'planet': other_id,
+            'virupa_points': virupa_points,
+            'aspect_type': aspect['type'],
+            'is_benefic': is_benefic_planet(other_id)
+        })
 
     return {
         'value': aspect_value,
@@ -126,7 +122,7 @@ def calculate_aspects_received(chart, planet_id):
     }
 
 
-def calculate_aspects_cast(chart, planet_id):
+def calculate_aspects_cast(chart, planet_id, drishti=None):
     """
     Calculate the aspects cast by a planet using standard Virupa points
     for Drig Bala calculations.
@@ -134,12 +130,14 @@ def calculate_aspects_cast(chart, planet_id):
     Args:
         chart (Chart): The birth chart
         planet_id (str): The ID of the planet
+        drishti (dict, optional): Precomputed matrices from
+            vedic.aspects.get_drishti_matrix
 
     Returns:
         dict: Dictionary with aspect information
     """
-    # Get the planet from the chart
-    planet = chart.getObject(planet_id)
+    if drishti is None:
+        drishti = vedic_aspects.get_drishti_matrix(chart)
 
     # Initialize the aspect value
     aspect_value = 0.0
@@ -147,34 +145,26 @@ def calculate_aspects_cast(chart, planet_id):
     # List of aspects cast
     aspects = []
 
-    # Check aspects to each planet
-    for other_id in const.LIST_OBJECTS_VEDIC:
-        if other_id != planet_id:
-            other = chart.getObject(other_id)
-
-            # Get aspect information from the Vedic aspects module
-            aspect_info = vedic_aspects.get_graha_drishti_strength(planet_id, planet.lon, other.lon)
-
-            if aspect_info['has_aspect']:
-                # Calculate Virupa points using the standard system
-                virupa_points = get_drig_bala_virupa_points(
-                    aspecting_planet_id=planet_id,
-                    aspect_type=aspect_info['type']
-                )
-
-                # Add to the total aspect value
-                aspect_value += virupa_points
-
-                # Determine if the aspect is benefic or malefic
-                is_benefic = is_benefic_planet(planet_id)
-
-                # Add to the list of aspects
-                aspects.append({
-                    'planet': other_id,
-                    'virupa_points': virupa_points,
-                    'aspect_type': aspect_info['type'],
-                    'is_benefic': is_benefic
-                })
+    # Check the aspects to each planet in the matrix
+    for aspect in vedic_aspects.get_matrix_aspects(drishti, planet_id):
+        other_id = aspect['to_planet']
+
+        # Calculate Virupa points using the standard system
+        virupa_points = get_drig_bala_virupa_points(
+            aspecting_planet_id=planet_id,
+            aspect_type=aspect['type']
+        )
+
+        # Add to the total aspect value
+        aspect_value += virupa_points
+
+        # Add to the list of aspects
+        aspects.append({
+            'planet': other_id,
+            'virupa_points': virupa_points,
+            'aspect_type': aspect['type'],
+            'is_benefic': is_benefic_planet(planet_id)
+        })
 
     return {
         'value': aspect_value,
@@ -55,6 +55,30 @@ from astrovedic.vedic.transits.calculator import (
     next_station
 )
 
+from astrovedic.vedic.transits.batch import (
+    get_transit_state, get_gochara_features, score_gochara,
+    iter_gochara_scores
+)
+
+from astrovedic.vedic.transits.aspect_timing import (
+    iter_aspect_events, find_aspect_events
+)
+
+from astrovedic.vedic.transits.ingress import (
+    IngressCatalog, find_body_ingresses, get_body_catalog,
+    get_division_periods
+)
+
+from astrovedic.vedic.transits.sade_sati import (
+    get_saturn_sign_periods, get_saturn_cycle_timeline,
+    get_sade_sati_timeline
+)
+
+from astrovedic.vedic.transits.lunar_calendar import (
+    get_tara_bala_periods, get_chandra_bala_periods,
+    get_lunar_strength_calendar, get_lunar_calendar
+)
+
 # Note: For detailed analysis, use the astroved_extension package
 
 # Constants for transit quality
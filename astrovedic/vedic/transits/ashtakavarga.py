@@ -71,11 +71,14 @@ def get_transit_bindus(natal_chart, transit_chart, planet_id, ashtakavarga):
     # Get the sign of the transit planet
     transit_sign = transit_planet.sign
     
-    # Get the Ashtakavarga for the planet
-    planet_ashtakavarga = ashtakavarga.get(planet_id, {})
+    # Get the Bhinnashtakavarga for the planet
+    planet_ashtakavarga = ashtakavarga['bhinnashtakavarga'].get(planet_id)
     
     # Get the bindus for the transit sign
-    bindus = planet_ashtakavarga.get(transit_sign, 0)
+    if planet_ashtakavarga is None:
+        bindus = 0
+    else:
+        bindus = planet_ashtakavarga['points'][const.LIST_SIGNS.index(transit_sign)]
     
     # Get the house position of the transit planet in the natal chart
     house_num = get_house_number(natal_chart, transit_planet.lon)
@@ -119,7 +122,7 @@ def get_transit_sarvashtakavarga(natal_chart, transit_chart, sarvashtakavarga):
         transit_sign = transit_planet.sign
         
         # Get the bindus for the transit sign
-        bindus = sarvashtakavarga.get(transit_sign, 0)
+        bindus = sarvashtakavarga['points'][const.LIST_SIGNS.index(transit_sign)]
         
         # Get the house position of the transit planet in the natal chart
         house_num = get_house_number(natal_chart, transit_planet.lon)
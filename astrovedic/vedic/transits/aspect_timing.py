@@ -0,0 +1,246 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements a multi-pair aspect timing engine. The moving
+    bodies are sampled once on a shared time grid, and every sampled step
+    of a body (or of the angle between two bodies) is split at the points
+    where its motion turns, so that the angle is monotonic on each piece.
+    The exact aspect angles swept by a piece are then found with a binary
+    search over the sorted targets and solved exactly, so repeated passes
+    over a natal point around a retrograde station are all found.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from itertools import combinations
+
+from astrovedic import const
+from astrovedic import angle
+from astrovedic.vedic.transits.ingress import (
+    SWEEP_STEPS, get_body_position, find_station, find_crossing
+)
+
+# Aspect target types
+NATAL = 'natal'
+TRANSIT = 'transit'
+
+# Default aspect angles in degrees
+DEFAULT_ASPECTS = (0, 60, 90, 120, 180)
+
+# Events are computed and yielded in blocks of this many days
+BLOCK_DAYS = 30
+
+
+def _get_targets(base_angles, aspects):
+    """
+    Get the sorted target angles of the aspects to a set of base angles
+
+    Args:
+        base_angles (dict): Mapping of target name to its angle
+        aspects (iterable): The aspect angles in degrees
+
+    Returns:
+        tuple: (sorted list of target angles, list of (name, aspect) labels)
+    """
+    targets = set()
+    for name, base in base_angles.items():
+        for aspect in aspects:
+            # Both sides of the target, once for conjunction and opposition
+            for side in {aspect % 360, (-aspect) % 360}:
+                targets.add((angle.norm(base + side), name, aspect))
+    targets = sorted(targets)
+    return [target[0] for target in targets], [target[1:] for target in targets]
+
+
+def _targets_in_arc(angles, start, moved):
+    """
+    Get the indexes of the sorted target angles swept by a monotonic move
+
+    Forward moves include the end of the arc and backward moves include
+    the start, so a target reached exactly at a grid time is counted once.
+
+    Args:
+        angles (list): Sorted target angles (0-360)
+        start (float): The angle at the start of the move
+        moved (float): The signed movement in degrees
+
+    Returns:
+        list: Indexes of the target angles crossed, in the order of the move
+    """
+    if moved >= 0:
+        low, high, search_low, search_high = start, start + moved, bisect_right, bisect_right
+    else:
+        low, high, search_low, search_high = start + moved, start, bisect_left, bisect_left
+
+    offset = math.floor(low / 360) * 360
+    low -= offset
+    high -= offset
+    indexes = list(range(search_low(angles, low), search_high(angles, min(high, 360))))
+    if high >= 360:
+        # A target at 0 lies inside the wrapped arc (at 360)
+        indexes += range(0, search_high(angles, high - 360))
+    return indexes if moved >= 0 else indexes[::-1]
+
+
+class _Mover:
+    """ An angle moving over time: a body longitude or the distance between two bodies. """
+
+    def __init__(self, body, target, target_type, mode, angles, labels):
+        self.body = body
+        self.target = target
+        self.target_type = target_type
+        self.mode = mode
+        self.angles = angles
+        self.labels = labels
+
+    def position(self, jd):
+        """ Returns the angle and its speed at a Julian day. """
+        lon, speed = get_body_position(self.body, jd, self.mode)
+        if self.target_type == TRANSIT:
+            other_lon, other_speed = get_body_position(self.target, jd, self.mode)
+            return angle.norm(lon - other_lon), speed - other_speed
+        return lon, speed
+
+    def sample(self, positions, i):
+        """ Returns the angle and speed at grid time i from the sampled positions. """
+        lon, speed = positions[self.body][i]
+        if self.target_type == TRANSIT:
+            other_lon, other_speed = positions[self.target][i]
+            return angle.norm(lon - other_lon), speed - other_speed
+        return lon, speed
+
+
+def _add_piece_events(mover, jd0, angle0, jd1, angle1, forward, events):
+    """
+    Add the exact aspects of a monotonic piece of a mover
+
+    Args:
+        mover (_Mover): The mover
+        jd0 (float): The start Julian day of the piece
+        angle0 (float): The angle at jd0
+        jd1 (float): The end Julian day of the piece
+        angle1 (float): The angle at jd1
+        forward (bool): True if the angle increases on the piece
+        events (list): List of events to append to
+    """
+    moved = angle.closestdistance(angle0, angle1)
+    moved = max(moved, 0) if forward else min(moved, 0)
+    for index in _targets_in_arc(mover.angles, angle0, moved):
+        name, aspect = mover.labels[index]
+        events.append({
+            'jd': find_crossing(mover.position, mover.angles[index], jd0, jd1, forward),
+            'body': mover.body,
+            'target': name,
+            'target_type': mover.target_type,
+            'aspect': aspect,
+            'retrograde': not forward
+        })
+
+
+def _get_block_events(movers, bodies, start_jd, end_jd, step, mode):
+    """
+    Find the exact aspects of all movers in one block of days
+
+    Args:
+        movers (list): The movers
+        bodies (list): The bodies to sample
+        start_jd (float): The start Julian day of the block
+        end_jd (float): The end Julian day of the block
+        step (float): The grid step in days
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        list: The events of the block sorted by time
+    """
+    count = max(1, math.ceil((end_jd - start_jd) / step))
+    times = [start_jd + (end_jd - start_jd) * i / count for i in range(count + 1)]
+    positions = {
+        body: [get_body_position(body, jd, mode) for jd in times] for body in bodies
+    }
+
+    events = []
+    for mover in movers:
+        angle0, speed0 = mover.sample(positions, 0)
+        for i in range(1, count + 1):
+            angle1, speed1 = mover.sample(positions, i)
+            jd0, jd1 = times[i - 1], times[i]
+            if (speed0 > 0) != (speed1 > 0):
+                # Split the step where the motion turns
+                station = find_station(lambda jd: mover.position(jd)[1], jd0, jd1)
+                station_angle = mover.position(station)[0]
+                _add_piece_events(mover, jd0, angle0, station, station_angle, speed0 > 0, events)
+                _add_piece_events(mover, station, station_angle, jd1, angle1, speed1 > 0, events)
+            else:
+                _add_piece_events(mover, jd0, angle0, jd1, angle1, speed0 > 0, events)
+            angle0, speed0 = angle1, speed1
+
+    events.sort(key=lambda event: event['jd'])
+    return events
+
+
+def iter_aspect_events(start_jd, end_jd, bodies, natal=None, aspects=DEFAULT_ASPECTS,
+                       transit_pairs=None, mode=const.AY_LAHIRI):
+    """
+    Find all exact aspect times in a range as a sorted event stream
+
+    Args:
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        bodies (list): The moving bodies
+        natal (dict, optional): Mapping of natal point name to its fixed
+            longitude, for transit to natal aspects
+        aspects (iterable): The aspect angles in degrees (0-180)
+        transit_pairs (list or bool, optional): (body, body) pairs for
+            transit to transit aspects, or True for all pairs of bodies
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Yields:
+        dict: Events sorted by time, with the Julian day, moving body,
+            target name and type (NATAL or TRANSIT), aspect angle, and
+            whether the angle is decreasing (retrograde pass)
+    """
+    bodies = list(bodies)
+    if transit_pairs is True:
+        transit_pairs = list(combinations(bodies, 2))
+    transit_pairs = transit_pairs or []
+
+    movers = []
+    if natal:
+        angles, labels = _get_targets(natal, aspects)
+        movers += [_Mover(body, None, NATAL, mode, angles, labels) for body in bodies]
+    for body, other in transit_pairs:
+        angles, labels = _get_targets({other: 0}, aspects)
+        movers.append(_Mover(body, other, TRANSIT, mode, angles, labels))
+
+    sampled = set(bodies).union(*transit_pairs) if transit_pairs else set(bodies)
+    step = min(SWEEP_STEPS.get(body, 1) for body in sampled)
+
+    block_start = start_jd
+    while block_start < end_jd:
+        block_end = min(block_start + BLOCK_DAYS, end_jd)
+        yield from _get_block_events(movers, sampled, block_start, block_end, step, mode)
+        block_start = block_end
+
+
+def find_aspect_events(start_jd, end_jd, bodies, natal=None, aspects=DEFAULT_ASPECTS,
+                       transit_pairs=None, mode=const.AY_LAHIRI):
+    """
+    Find all exact aspect times in a range
+
+    Args:
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        bodies (list): The moving bodies
+        natal (dict, optional): Mapping of natal point name to its fixed
+            longitude, for transit to natal aspects
+        aspects (iterable): The aspect angles in degrees (0-180)
+        transit_pairs (list or bool, optional): (body, body) pairs for
+            transit to transit aspects, or True for all pairs of bodies
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        list: Events sorted by time (see iter_aspect_events)
+    """
+    return list(iter_aspect_events(start_jd, end_jd, bodies, natal, aspects,
+                                   transit_pairs, mode))
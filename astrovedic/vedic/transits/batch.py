@@ -0,0 +1,197 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements batch Gochara scoring for many natal charts.
+    The transit positions of a date are the same for every natal chart,
+    so they are computed once into a transit state. Each natal chart is
+    reduced to its Ascendant, Moon sign and Ashtakavarga bindus, and is
+    then scored against the transit state with table lookups: the houses
+    of all transit bodies are counted once per chart, which gives the
+    Vedha and Argala counts of every body without looping over pairs.
+"""
+
+from astrovedic import const
+from astrovedic.chart import Chart
+from astrovedic.geopos import GeoPos
+from astrovedic.cache import reference_cache
+from astrovedic.parallel import map_blocks
+
+from astrovedic.vedic.ashtakavarga import get_ashtakavarga
+from astrovedic.vedic.transits.gochara import (
+    get_effect_from_moon, get_gochara_strength
+)
+from astrovedic.vedic.transits.ashtakavarga import (
+    get_transit_ashtakavarga_strength, get_transit_sarvashtakavarga_strength
+)
+
+# Transit bodies, as in get_gochara_effects
+GOCHARA_OBJECTS = tuple(const.LIST_OBJECTS_VEDIC)
+
+# Vedha house of each house (1-12), as in get_vedha_effects
+VEDHA_HOUSES = {
+    1: 7, 2: 12, 3: 11, 4: 10, 5: 9, 6: 8,
+    7: 1, 8: 6, 9: 5, 10: 4, 11: 3, 12: 2
+}
+
+# Argala houses of each house (1-12), as in get_argala_effects
+ARGALA_HOUSES = {
+    house: ((house % 12) + 1, ((house + 2) % 12) + 1, ((house + 9) % 12) + 1)
+    for house in range(1, 13)
+}
+
+# Transit strengths by number of bindus (at most 8 per planet and 56 in total)
+BINDU_STRENGTHS = tuple(get_transit_ashtakavarga_strength(bindus) for bindus in range(9))
+SAV_STRENGTHS = tuple(get_transit_sarvashtakavarga_strength(bindus) for bindus in range(57))
+
+# Number of charts scored per task
+DEFAULT_BLOCK_SIZE = 1024
+
+
+def get_transit_state(transit_date, mode=const.AY_LAHIRI):
+    """
+    Calculate the transit positions of a date once for all natal charts
+
+    Args:
+        transit_date (Datetime): The transit date
+        mode (str): Ayanamsa mode of the natal charts
+
+    Returns:
+        dict: Dictionary with the transit date, mode, and the longitude
+            and sign index (0-11) of each transit body
+    """
+    # Planet positions do not depend on the location
+    transit_chart = Chart(transit_date, GeoPos(0, 0), hsys=const.HOUSES_WHOLE_SIGN, mode=mode)
+    lons = tuple(transit_chart.getObject(obj).lon for obj in GOCHARA_OBJECTS)
+    return {
+        'date': transit_date,
+        'mode': mode,
+        'lon': lons,
+        'sign': tuple(int(lon / 30) % 12 for lon in lons)
+    }
+
+
+def get_gochara_features(natal_chart):
+    """
+    Extract the natal features used for Gochara scoring
+
+    Args:
+        natal_chart (Chart): The natal chart
+
+    Returns:
+        dict: Dictionary with the Ascendant longitude, the Moon sign index
+            (0-11), the Bhinnashtakavarga bindus of each planet by sign
+            and the Sarvashtakavarga bindus by sign
+    """
+    ashtakavarga = get_ashtakavarga(natal_chart)
+    bhinna = ashtakavarga['bhinnashtakavarga']
+    return {
+        'asc_lon': natal_chart.getAngle(const.ASC).lon,
+        'moon_sign': const.LIST_SIGNS.index(natal_chart.getObject(const.MOON).sign),
+        'bindus': {
+            obj: tuple(bhinna[obj]['points']) for obj in GOCHARA_OBJECTS if obj in bhinna
+        },
+        'sav': tuple(ashtakavarga['sarvashtakavarga']['points'])
+    }
+
+
+@reference_cache()
+def _get_effect(planet_id, moon_house):
+    """ Returns the Gochara effect of a planet in a house from the Moon. """
+    return get_effect_from_moon(planet_id, moon_house)
+
+
+@reference_cache()
+def _get_strength(effect, vedha_count, argala_count):
+    """ Returns the Gochara strength from the Vedha and Argala counts. """
+    return get_gochara_strength({'effect': effect}, [None] * vedha_count, [None] * argala_count)
+
+
+def score_gochara(state, features):
+    """
+    Score the transits of a date for one natal chart
+
+    The results match get_gochara_effects and get_transit_ashtakavarga
+    for a transit chart of the same date.
+
+    Args:
+        state (dict): The transit state (see get_transit_state)
+        features (dict): The natal features (see get_gochara_features)
+
+    Returns:
+        dict: Dictionary with, for each transit body, the 'gochara' house,
+            house from the Moon, effect, Vedha and Argala counts and
+            strength, and the 'ashtakavarga' and 'sarvashtakavarga' bindus
+            and strength
+    """
+    asc_lon = features['asc_lon']
+    moon_sign = features['moon_sign']
+    bindus = features['bindus']
+    sav = features['sav']
+
+    # Houses as in core.get_house_number, counted once for all bodies
+    houses = [1 + int(((asc_lon - lon) % 360) / 30) % 12 for lon in state['lon']]
+    counts = [0] * 13
+    for house in houses:
+        counts[house] += 1
+
+    gochara = {}
+    ashtakavarga = {}
+    sarvashtakavarga = {}
+    for obj, house, sign in zip(GOCHARA_OBJECTS, houses, state['sign']):
+        moon_house = ((sign - moon_sign) % 12) + 1
+        effect = _get_effect(obj, moon_house)
+        vedha_count = counts[VEDHA_HOUSES[house]]
+        argala_count = sum(counts[argala] for argala in ARGALA_HOUSES[house])
+        gochara[obj] = {
+            'house': house,
+            'moon_house': moon_house,
+            'effect': effect,
+            'vedha_count': vedha_count,
+            'argala_count': argala_count,
+            'strength': _get_strength(effect['effect'], vedha_count, argala_count)
+        }
+
+        planet_bindus = bindus[obj][sign] if obj in bindus else 0
+        ashtakavarga[obj] = {
+            'bindus': planet_bindus,
+            'strength': BINDU_STRENGTHS[planet_bindus]
+        }
+        sarvashtakavarga[obj] = {
+            'bindus': sav[sign],
+            'strength': SAV_STRENGTHS[sav[sign]]
+        }
+
+    return {
+        'gochara': gochara,
+        'ashtakavarga': ashtakavarga,
+        'sarvashtakavarga': sarvashtakavarga
+    }
+
+
+def _score_block(state, features):
+    """ Returns the Gochara scores of a block of natal charts. """
+    return [score_gochara(state, chart_features) for chart_features in features]
+
+
+def iter_gochara_scores(state, features, block_size=DEFAULT_BLOCK_SIZE,
+                        max_workers=None, executor=None):
+    """
+    Score the transits of a date for many natal charts
+
+    Charts are scored in blocks with map_blocks, and the transit state
+    is shared by all blocks.
+
+    Args:
+        state (dict): The transit state (see get_transit_state)
+        features (list): The natal features of all charts
+        block_size (int): The number of charts per block
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
+
+    Yields:
+        tuple: (chart index, scores) in chart order, where scores is the
+            result of score_gochara
+    """
+    return map_blocks(_score_block, features, block_size, max_workers=max_workers,
+                      executor=executor, shared=state)
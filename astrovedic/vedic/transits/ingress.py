@@ -0,0 +1,547 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements a global ingress catalog. Each body is swept
+    once over a date range, the sweep is split at the stations so that the
+    longitude is monotonic on every piece, and every crossing of a pada
+    boundary (3°20') is solved exactly. Sign and nakshatra boundaries are
+    pada boundaries too, so the pada crossings give all sign, nakshatra
+    and pada ingresses, including retrograde re-entries. Ingresses do not
+    depend on the natal chart, so one catalog serves every chart.
+"""
+
+import json
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+
+from astrovedic import const
+from astrovedic import angle
+from astrovedic.ephem import swe
+from astrovedic.cache import reference_cache
+from astrovedic.vedic.nakshatras import LIST_NAKSHATRAS
+
+# Ingress kinds
+SIGN = 'sign'
+NAKSHATRA = 'nakshatra'
+PADA = 'pada'
+
+# Number of padas in one division of each kind
+PADAS_PER_DIVISION = {SIGN: 9, NAKSHATRA: 4, PADA: 1}
+
+# Number of padas in the zodiac and their span in degrees
+PADA_COUNT = 108
+PADA_SPAN = 360 / PADA_COUNT
+
+# Bodies of the catalog
+INGRESS_OBJECTS = [
+    const.SUN, const.MOON, const.MERCURY, const.VENUS, const.MARS,
+    const.JUPITER, const.SATURN, const.RAHU, const.KETU
+]
+
+# Sweep step in days, shorter than any retrograde or direct period
+SWEEP_STEPS = {
+    const.SUN: 5,
+    const.MOON: 0.5,
+    const.MERCURY: 1,
+    const.VENUS: 2,
+    const.MARS: 2,
+    const.JUPITER: 5,
+    const.SATURN: 5,
+    const.URANUS: 10,
+    const.NEPTUNE: 10,
+    const.PLUTO: 10,
+    const.RAHU: 10,
+    const.KETU: 10
+}
+
+# Ingresses are computed and cached in blocks of this many days
+BLOCK_DAYS = 360
+
+# Root-finding tolerance in days (about 10 milliseconds)
+TOLERANCE = 1e-7
+
+
+def get_body_position(obj, jd, mode=const.AY_LAHIRI):
+    """
+    Get the sidereal longitude and speed of a body
+
+    Args:
+        obj (str): Object ID (planet)
+        jd (float): Julian day
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        tuple: (longitude in degrees, speed in degrees per day)
+    """
+    if obj == const.KETU:
+        rahu = swe.swe_object(const.RAHU, jd, mode=mode)
+        return angle.norm(rahu['lon'] + 180), rahu['lonspeed']
+    position = swe.swe_object(obj, jd, mode=mode)
+    return position['lon'], position['lonspeed']
+
+
+def find_station(speed_func, jd0, jd1):
+    """
+    Find when a speed changes sign between two Julian days
+
+    Args:
+        speed_func (callable): Function of the Julian day returning the speed
+        jd0 (float): Julian day before the station
+        jd1 (float): Julian day after the station
+
+    Returns:
+        float: The Julian day of the station
+    """
+    forward = speed_func(jd0) > 0
+    while jd1 - jd0 > TOLERANCE:
+        middle = (jd0 + jd1) / 2
+        if (speed_func(middle) > 0) == forward:
+            jd0 = middle
+        else:
+            jd1 = middle
+    return (jd0 + jd1) / 2
+
+
+def find_crossing(position_func, target, jd0, jd1, forward):
+    """
+    Find when a monotonic angle crosses a target between two Julian days
+
+    Newton steps on the speed are used while they stay inside the
+    bracket, with bisection as a fallback.
+
+    Args:
+        position_func (callable): Function of the Julian day returning
+            the angle and its speed in degrees per day
+        target (float): The target angle in degrees
+        jd0 (float): Julian day before the crossing
+        jd1 (float): Julian day after the crossing
+        forward (bool): True if the angle increases
+
+    Returns:
+        float: The Julian day of the crossing
+    """
+    jd = (jd0 + jd1) / 2
+    while jd1 - jd0 > TOLERANCE:
+        lon, speed = position_func(jd)
+        distance = angle.closestdistance(target, lon)
+        if (distance >= 0) == forward:
+            jd1 = jd
+        else:
+            jd0 = jd
+
+        next_jd = jd - distance / speed if speed else jd0
+        if abs(next_jd - jd) < TOLERANCE:
+            return next_jd
+        jd = next_jd if jd0 < next_jd < jd1 else (jd0 + jd1) / 2
+    return (jd0 + jd1) / 2
+
+
+def _add_crossings(obj, jd0, lon0, jd1, lon1, forward, mode, result):
+    """
+    Add the pada crossings of a monotonic piece of the sweep
+
+    Args:
+        obj (str): Object ID (planet)
+        jd0 (float): The start Julian day of the piece
+        lon0 (float): The longitude at jd0
+        jd1 (float): The end Julian day of the piece
+        lon1 (float): The longitude at jd1
+        forward (bool): True if the body moves forward on the piece
+        mode (str): Ayanamsa mode for sidereal calculations
+        result (dict): Arrays 'jd', 'pada' and 'direction' to append to
+    """
+    moved = angle.closestdistance(lon0, lon1)
+    if forward:
+        first = math.floor(lon0 / PADA_SPAN) + 1
+        last = math.floor((lon0 + max(moved, 0)) / PADA_SPAN)
+        boundaries = range(first, last + 1)
+    else:
+        first = math.ceil(lon0 / PADA_SPAN) - 1
+        last = math.ceil((lon0 + min(moved, 0)) / PADA_SPAN)
+        boundaries = range(first, last - 1, -1)
+
+    def position(jd):
+        return get_body_position(obj, jd, mode)
+
+    for boundary in boundaries:
+        result['jd'].append(find_crossing(position, boundary * PADA_SPAN, jd0, jd1, forward))
+        # Forward crossings enter the pada after the boundary
+        result['pada'].append((boundary if forward else boundary - 1) % PADA_COUNT)
+        result['direction'].append(1 if forward else -1)
+
+
+def find_body_ingresses(obj, start_jd, end_jd, mode=const.AY_LAHIRI):
+    """
+    Find every pada ingress of a body between two Julian days
+
+    Args:
+        obj (str): Object ID (planet)
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        dict: 'initial' (the pada at start_jd) and the sorted arrays 'jd',
+            'pada' (the pada entered, 0-107) and 'direction' (1 for direct
+            and -1 for retrograde ingresses)
+    """
+    step = SWEEP_STEPS.get(obj, 1)
+    result = {'jd': array('d'), 'pada': array('B'), 'direction': array('b')}
+
+    jd0 = start_jd
+    lon0, speed0 = get_body_position(obj, jd0, mode)
+    result['initial'] = int(lon0 / PADA_SPAN) % PADA_COUNT
+
+    while jd0 < end_jd:
+        jd1 = min(jd0 + step, end_jd)
+        lon1, speed1 = get_body_position(obj, jd1, mode)
+
+        if (speed0 > 0) != (speed1 > 0):
+            # Split the step at the station
+            station = find_station(lambda jd: get_body_position(obj, jd, mode)[1], jd0, jd1)
+            station_lon = get_body_position(obj, station, mode)[0]
+            _add_crossings(obj, jd0, lon0, station, station_lon, speed0 > 0, mode, result)
+            _add_crossings(obj, station, station_lon, jd1, lon1, speed1 > 0, mode, result)
+        else:
+            _add_crossings(obj, jd0, lon0, jd1, lon1, speed0 > 0, mode, result)
+
+        jd0, lon0, speed0 = jd1, lon1, speed1
+
+    return result
+
+
+@reference_cache()
+def _get_block(obj, block, mode):
+    """ Returns the pada ingresses of a body in one block of days. """
+    block_start = block * BLOCK_DAYS
+    return find_body_ingresses(obj, block_start, block_start + BLOCK_DAYS, mode)
+
+
+def _get_division_name(kind, index):
+    """ Returns the name of a sign, nakshatra or pada. """
+    if kind == SIGN:
+        return const.LIST_SIGNS[index]
+    if kind == NAKSHATRA:
+        return LIST_NAKSHATRAS[index]
+    return f"{LIST_NAKSHATRAS[index // 4]} {index % 4 + 1}"
+
+
+class IngressCatalog:
+    """
+    Sorted sign, nakshatra and pada ingresses of several bodies
+
+    The catalog holds the pada ingresses of each body. Sign and nakshatra
+    ingresses are the pada ingresses across their boundaries, and are
+    extracted once per body and kind for the range queries.
+    """
+
+    def __init__(self, start_jd, end_jd, mode, tables):
+        """
+        Create a catalog from pada ingress tables
+
+        Args:
+            start_jd (float): The start Julian day of the catalog
+            end_jd (float): The end Julian day of the catalog
+            mode (str): Ayanamsa mode of the catalog
+            tables (dict): Mapping of object to its pada ingresses
+                (see find_body_ingresses)
+        """
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self.mode = mode
+        self.tables = tables
+        self._kinds = {}
+
+    @classmethod
+    def build(cls, start_jd, end_jd, objects=None, mode=const.AY_LAHIRI):
+        """
+        Build the catalog of a date range
+
+        The ingresses are computed in cached blocks of days, so catalogs
+        of overlapping ranges share the work.
+
+        Args:
+            start_jd (float): The start Julian day
+            end_jd (float): The end Julian day
+            objects (list, optional): The bodies (defaults to INGRESS_OBJECTS)
+            mode (str): Ayanamsa mode for sidereal calculations
+
+        Returns:
+            IngressCatalog: The catalog
+        """
+        first_block = math.floor(start_jd / BLOCK_DAYS)
+        last_block = math.floor(end_jd / BLOCK_DAYS)
+
+        tables = {}
+        for obj in objects or INGRESS_OBJECTS:
+            first = _get_block(obj, first_block, mode)
+            table = {
+                'initial': first['initial'],
+                'jd': array('d'), 'pada': array('B'), 'direction': array('b')
+            }
+            for block in range(first_block, last_block + 1):
+                ingresses = _get_block(obj, block, mode)
+                for key in ('jd', 'pada', 'direction'):
+                    table[key].extend(ingresses[key])
+
+            # Clip the ingresses to the range
+            first_ingress = bisect_left(table['jd'], start_jd)
+            last_ingress = bisect_right(table['jd'], end_jd)
+            if first_ingress > 0:
+                table['initial'] = table['pada'][first_ingress - 1]
+            for key in ('jd', 'pada', 'direction'):
+                table[key] = table[key][first_ingress:last_ingress]
+            tables[obj] = table
+
+        return cls(start_jd, end_jd, mode, tables)
+
+    def _get_kind(self, obj, kind):
+        """
+        Get the ingresses of one kind for a body
+
+        Args:
+            obj (str): Object ID (planet)
+            kind (str): SIGN, NAKSHATRA or PADA
+
+        Returns:
+            dict: 'initial' and the arrays 'jd', 'index' and 'direction'
+        """
+        key = (obj, kind)
+        if key not in self._kinds:
+            if kind not in PADAS_PER_DIVISION:
+                raise ValueError(f"Unknown ingress kind: {kind}")
+            padas = PADAS_PER_DIVISION[kind]
+            table = self.tables[obj]
+            result = {
+                'initial': table['initial'] // padas,
+                'jd': array('d'), 'index': array('B'), 'direction': array('b')
+            }
+            for jd, pada, direction in zip(table['jd'], table['pada'], table['direction']):
+                # The crossed boundary starts the pada entered forward
+                # and ends the pada entered backward
+                boundary = pada if direction > 0 else pada + 1
+                if boundary % padas == 0:
+                    result['jd'].append(jd)
+                    result['index'].append(pada // padas)
+                    result['direction'].append(direction)
+            self._kinds[key] = result
+        return self._kinds[key]
+
+    def _to_ingress(self, obj, kind, ingresses, i):
+        """ Returns ingress i of a kind as a dictionary. """
+        index = ingresses['index'][i]
+        return {
+            'object': obj,
+            'jd': ingresses['jd'][i],
+            'index': index,
+            'name': _get_division_name(kind, index),
+            'retrograde': ingresses['direction'][i] < 0
+        }
+
+    def get_ingresses(self, obj, kind=SIGN, start_jd=None, end_jd=None):
+        """
+        Get the ingresses of a body in a date range
+
+        Args:
+            obj (str): Object ID (planet)
+            kind (str): SIGN, NAKSHATRA or PADA
+            start_jd (float, optional): The start Julian day
+            end_jd (float, optional): The end Julian day
+
+        Returns:
+            list: Ingresses sorted by time, each with the object, Julian
+                day, index (0-based) and name of the division entered and
+                whether the body is retrograde
+        """
+        ingresses = self._get_kind(obj, kind)
+        first = 0 if start_jd is None else bisect_left(ingresses['jd'], start_jd)
+        last = len(ingresses['jd']) if end_jd is None else bisect_right(ingresses['jd'], end_jd)
+        return [self._to_ingress(obj, kind, ingresses, i) for i in range(first, last)]
+
+    def get_index_at(self, obj, jd, kind=SIGN):
+        """
+        Get the division occupied by a body at a Julian day
+
+        Args:
+            obj (str): Object ID (planet)
+            jd (float): Julian day within the catalog range
+            kind (str): SIGN, NAKSHATRA or PADA
+
+        Returns:
+            int: The index (0-based) of the sign, nakshatra or pada
+        """
+        ingresses = self._get_kind(obj, kind)
+        i = bisect_right(ingresses['jd'], jd)
+        return ingresses['index'][i - 1] if i > 0 else ingresses['initial']
+
+    def next_ingress(self, obj, jd, kind=SIGN, index=None):
+        """
+        Get the first ingress of a body after a Julian day
+
+        Args:
+            obj (str): Object ID (planet)
+            jd (float): Julian day
+            kind (str): SIGN, NAKSHATRA or PADA
+            index (int, optional): Only consider ingresses into this division
+
+        Returns:
+            dict: The ingress, or None if there is none in the catalog
+        """
+        ingresses = self._get_kind(obj, kind)
+        for i in range(bisect_right(ingresses['jd'], jd), len(ingresses['jd'])):
+            if index is None or ingresses['index'][i] == index:
+                return self._to_ingress(obj, kind, ingresses, i)
+        return None
+
+    def last_ingress(self, obj, jd, kind=SIGN, index=None):
+        """
+        Get the last ingress of a body before a Julian day
+
+        Args:
+            obj (str): Object ID (planet)
+            jd (float): Julian day
+            kind (str): SIGN, NAKSHATRA or PADA
+            index (int, optional): Only consider ingresses into this division
+
+        Returns:
+            dict: The ingress, or None if there is none in the catalog
+        """
+        ingresses = self._get_kind(obj, kind)
+        for i in range(bisect_left(ingresses['jd'], jd) - 1, -1, -1):
+            if index is None or ingresses['index'][i] == index:
+                return self._to_ingress(obj, kind, ingresses, i)
+        return None
+
+    def to_dict(self):
+        """
+        Convert the catalog to a JSON serializable dictionary
+
+        Returns:
+            dict: The catalog range, mode and pada ingress tables
+        """
+        return {
+            'start_jd': self.start_jd,
+            'end_jd': self.end_jd,
+            'mode': self.mode,
+            'tables': {
+                obj: {
+                    'initial': table['initial'],
+                    'jd': table['jd'].tolist(),
+                    'pada': table['pada'].tolist(),
+                    'direction': table['direction'].tolist()
+                }
+                for obj, table in self.tables.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a catalog from a dictionary made by to_dict
+
+        Args:
+            data (dict): The catalog dictionary
+
+        Returns:
+            IngressCatalog: The catalog
+        """
+        tables = {
+            obj: {
+                'initial': table['initial'],
+                'jd': array('d', table['jd']),
+                'pada': array('B', table['pada']),
+                'direction': array('b', table['direction'])
+            }
+            for obj, table in data['tables'].items()
+        }
+        return cls(data['start_jd'], data['end_jd'], data['mode'], tables)
+
+    def save(self, path):
+        """
+        Save the catalog to a JSON file
+
+        Args:
+            path (str): The file path
+        """
+        with open(path, 'w') as handle:
+            json.dump(self.to_dict(), handle)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a catalog from a JSON file made by save
+
+        Args:
+            path (str): The file path
+
+        Returns:
+            IngressCatalog: The catalog
+        """
+        with open(path) as handle:
+            return cls.from_dict(json.load(handle))
+
+
+@reference_cache()
+def _get_block_catalog(obj, first_block, last_block, mode):
+    """ Returns the ingress catalog of one body over a range of blocks. """
+    return IngressCatalog.build(first_block * BLOCK_DAYS, (last_block + 1) * BLOCK_DAYS,
+                                [obj], mode)
+
+
+def get_body_catalog(obj, start_jd, end_jd, mode=const.AY_LAHIRI):
+    """
+    Get the cached ingress catalog of one body covering a date range
+
+    The catalog spans whole blocks of days, so queries over nearby ranges
+    share the same catalog.
+
+    Args:
+        obj (str): Object ID (planet)
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        IngressCatalog: The catalog
+    """
+    return _get_block_catalog(obj, math.floor(start_jd / BLOCK_DAYS),
+                              math.floor(end_jd / BLOCK_DAYS), mode)
+
+
+def get_division_periods(obj, start_jd, end_jd, kind=SIGN, mode=const.AY_LAHIRI):
+    """
+    Get the periods a body spends in each sign, nakshatra or pada
+
+    Args:
+        obj (str): Object ID (planet)
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        kind (str): SIGN, NAKSHATRA or PADA
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        list: (start, end, index, retrograde entry) tuples covering the
+            range, clipped to it
+    """
+    catalog = get_body_catalog(obj, start_jd, end_jd, mode)
+    ingresses = catalog.get_ingresses(obj, kind, start_jd, end_jd)
+
+    # The period active at start_jd began with the last ingress up to it
+    index = catalog.get_index_at(obj, start_jd, kind)
+    if ingresses and ingresses[0]['jd'] == start_jd:
+        previous = ingresses.pop(0)
+    else:
+        previous = catalog.last_ingress(obj, start_jd, kind)
+    retrograde = previous is not None and previous['retrograde']
+
+    periods = []
+    start = start_jd
+    for ingress in ingresses:
+        periods.append((start, ingress['jd'], index, retrograde))
+        start = ingress['jd']
+        index = ingress['index']
+        retrograde = ingress['retrograde']
+    periods.append((start, end_jd, index, retrograde))
+    return periods
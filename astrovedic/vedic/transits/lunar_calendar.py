@@ -0,0 +1,149 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements Tara Bala and Chandra Bala calendars. The
+    Tara of the transiting Moon only changes when it enters a nakshatra,
+    and its Chandra Bala only changes when it enters a sign, so the exact
+    intervals of both are read from the cached Moon ingress catalog
+    without building a chart for each day.
+"""
+
+from astrovedic import const
+from astrovedic.vedic.nakshatras import LIST_NAKSHATRAS, get_nakshatra_index
+from astrovedic.vedic.panchang import get_chandra_bala_from_houses
+from astrovedic.vedic.sarvatobhadra.tara import (
+    get_current_tara, get_tara_bala_score, is_tara_favorable
+)
+from astrovedic.vedic.transits.ingress import SIGN, NAKSHATRA, get_division_periods
+
+
+def get_tara_bala_periods(janma_nakshatra, start_jd, end_jd, mode=const.AY_LAHIRI):
+    """
+    Get the Tara of the transiting Moon between two Julian days
+
+    Args:
+        janma_nakshatra (int or str): The natal Moon nakshatra index (0-26)
+            or name
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        list: Intervals covering the range, each with its start and end
+            Julian days, the Moon nakshatra, the Tara, its score and
+            whether it is favorable
+    """
+    if isinstance(janma_nakshatra, str):
+        janma_nakshatra = LIST_NAKSHATRAS.index(janma_nakshatra)
+
+    periods = []
+    for start, end, nakshatra, _ in get_division_periods(const.MOON, start_jd, end_jd,
+                                                         NAKSHATRA, mode):
+        tara = get_current_tara(janma_nakshatra, nakshatra)
+        periods.append({
+            'start': start,
+            'end': end,
+            'nakshatra': LIST_NAKSHATRAS[nakshatra],
+            'tara': tara,
+            'score': get_tara_bala_score(tara),
+            'is_favorable': is_tara_favorable(tara)
+        })
+    return periods
+
+
+def get_chandra_bala_periods(moon_sign, start_jd, end_jd, mode=const.AY_LAHIRI):
+    """
+    Get the Chandra Bala of the transiting Moon between two Julian days
+
+    Args:
+        moon_sign (int or str): The natal Moon sign index (0-11) or name
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        list: Intervals covering the range, each with its start and end
+            Julian days, the Moon sign and the Chandra Bala information
+            (see panchang.get_chandra_bala)
+    """
+    if isinstance(moon_sign, str):
+        moon_sign = const.LIST_SIGNS.index(moon_sign)
+
+    periods = []
+    for start, end, sign, _ in get_division_periods(const.MOON, start_jd, end_jd,
+                                                    SIGN, mode):
+        period = {'start': start, 'end': end, 'sign': const.LIST_SIGNS[sign]}
+        period.update(get_chandra_bala_from_houses(sign + 1, moon_sign + 1))
+        periods.append(period)
+    return periods
+
+
+def get_lunar_strength_calendar(janma_nakshatra, moon_sign, start_jd, end_jd,
+                                mode=const.AY_LAHIRI):
+    """
+    Get the Tara Bala and Chandra Bala calendar between two Julian days
+
+    Args:
+        janma_nakshatra (int or str): The natal Moon nakshatra index (0-26)
+            or name
+        moon_sign (int or str): The natal Moon sign index (0-11) or name
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        dict: Dictionary with the 'tara_bala' and 'chandra_bala' periods
+            and the 'intervals' where both are constant, each with its
+            Tara, Chandra Bala strength and whether both are favorable
+    """
+    tara_periods = get_tara_bala_periods(janma_nakshatra, start_jd, end_jd, mode)
+    chandra_periods = get_chandra_bala_periods(moon_sign, start_jd, end_jd, mode)
+
+    # Intersect the two sorted partitions of the range
+    intervals = []
+    i = j = 0
+    start = start_jd
+    while i < len(tara_periods) and j < len(chandra_periods):
+        tara = tara_periods[i]
+        chandra = chandra_periods[j]
+        end = min(tara['end'], chandra['end'])
+        if end > start or not intervals:
+            intervals.append({
+                'start': start,
+                'end': end,
+                'nakshatra': tara['nakshatra'],
+                'sign': chandra['sign'],
+                'tara': tara['tara'],
+                'tara_score': tara['score'],
+                'chandra_bala': chandra['strength'],
+                'is_favorable': tara['is_favorable'] and chandra['is_strong']
+            })
+        start = end
+        if tara['end'] == end:
+            i += 1
+        if chandra['end'] == end:
+            j += 1
+
+    return {
+        'tara_bala': tara_periods,
+        'chandra_bala': chandra_periods,
+        'intervals': intervals
+    }
+
+
+def get_lunar_calendar(chart, start_jd, end_jd):
+    """
+    Get the Tara Bala and Chandra Bala calendar of a natal chart
+
+    Args:
+        chart (Chart): The natal chart
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+
+    Returns:
+        dict: The calendar (see get_lunar_strength_calendar)
+    """
+    moon = chart.getObject(const.MOON)
+    return get_lunar_strength_calendar(get_nakshatra_index(moon.lon)[0], moon.sign,
+                                       start_jd, end_jd, chart.mode)
@@ -0,0 +1,114 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements Sade Sati and Saturn cycle timelines. The
+    sidereal sign periods of Saturn, including retrograde re-entries,
+    are read from a cached Saturn ingress catalog, so the timeline of a
+    natal Moon sign only needs one pass over these periods. Timelines
+    depend on nothing but the Moon sign and the date range, so they are
+    shared by every chart with the same Moon sign.
+"""
+
+from astrovedic import const
+from astrovedic.vedic.transits.ingress import SIGN, get_division_periods
+
+# Saturn periods
+SADE_SATI = 'Sade Sati'
+DHAIYA = 'Dhaiya'
+ASHTAMA_SHANI = 'Ashtama Shani'
+
+# Saturn periods by sign distance from the natal Moon (0 = Moon sign)
+SATURN_PERIODS = {
+    11: (SADE_SATI, 'First phase (Rising)'),
+    0: (SADE_SATI, 'Second phase (Peak)'),
+    1: (SADE_SATI, 'Third phase (Setting)'),
+    3: (DHAIYA, 'Kantaka Shani (4th from Moon)'),
+    7: (ASHTAMA_SHANI, 'Ashtama Shani (8th from Moon)')
+}
+
+# Default length of a lifetime timeline in years
+DEFAULT_YEARS = 120
+
+
+def get_saturn_sign_periods(start_jd, end_jd, mode=const.AY_LAHIRI):
+    """
+    Get the sidereal sign periods of Saturn between two Julian days
+
+    Args:
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        list: (start, end, sign index, retrograde entry) tuples covering
+            the range, clipped to it
+    """
+    return get_division_periods(const.SATURN, start_jd, end_jd, SIGN, mode)
+
+
+def get_saturn_cycle_timeline(moon_sign, start_jd, end_jd, mode=const.AY_LAHIRI):
+    """
+    Get the Sade Sati, Dhaiya and Ashtama Shani periods of a Moon sign
+
+    Args:
+        moon_sign (int or str): The natal Moon sign index (0-11) or name
+        start_jd (float): The start Julian day
+        end_jd (float): The end Julian day
+        mode (str): Ayanamsa mode for sidereal calculations
+
+    Returns:
+        dict: Dictionary with the 'periods' of Saturn in the signs that
+            matter, each with its type, phase, Saturn sign, start and end
+            Julian days and whether Saturn entered the sign retrograde,
+            and the 'sade_sati' spans merging consecutive Sade Sati phases
+    """
+    if isinstance(moon_sign, str):
+        moon_sign = const.LIST_SIGNS.index(moon_sign)
+
+    periods = []
+    sade_sati = []
+    for start, end, sign, retrograde in get_saturn_sign_periods(start_jd, end_jd, mode):
+        distance = (sign - moon_sign) % 12
+        if distance not in SATURN_PERIODS:
+            continue
+
+        period_type, phase = SATURN_PERIODS[distance]
+        period = {
+            'type': period_type,
+            'phase': phase,
+            'sign': const.LIST_SIGNS[sign],
+            'start': start,
+            'end': end,
+            'retrograde_entry': retrograde
+        }
+        periods.append(period)
+
+        if period_type == SADE_SATI:
+            if sade_sati and sade_sati[-1]['end'] == start:
+                sade_sati[-1]['end'] = end
+                sade_sati[-1]['phases'].append(period)
+            else:
+                sade_sati.append({'start': start, 'end': end, 'phases': [period]})
+
+    return {
+        'moon_sign': const.LIST_SIGNS[moon_sign],
+        'periods': periods,
+        'sade_sati': sade_sati
+    }
+
+
+def get_sade_sati_timeline(chart, years=DEFAULT_YEARS):
+    """
+    Get the lifetime Saturn cycle timeline of a natal chart
+
+    Args:
+        chart (Chart): The natal chart
+        years (int, optional): The length of the timeline in years
+
+    Returns:
+        dict: The timeline from birth (see get_saturn_cycle_timeline)
+    """
+    start_jd = chart.date.jd
+    moon_sign = chart.getObject(const.MOON).sign
+    return get_saturn_cycle_timeline(moon_sign, start_jd, start_jd + years * 365.25, chart.mode)
@@ -24,15 +24,7 @@ def calculate_gulika(jd, lat=None, lon=None):
     Returns:
         float: Longitude of Gulika in degrees
     """
-    from astrovedic.ephem import swe
-
-    # Get Saturn's longitude
-    saturn_lon = swe.sweObjectLon(const.SATURN, jd)
-
-    # Calculate Gulika as Saturn + 40°
-    gulika_lon = angle.norm(saturn_lon + 40)
-
-    return gulika_lon
+    return get_upagrah_longitudes(jd)[const.GULIKA]
 
 
 def calculate_mandi(jd, lat=None, lon=None):
@@ -50,15 +42,7 @@ def calculate_mandi(jd, lat=None, lon=None):
     Returns:
         float: Longitude of Mandi in degrees
     """
-    from astrovedic.ephem import swe
-
-    # Get Saturn's longitude
-    saturn_lon = swe.sweObjectLon(const.SATURN, jd)
-
-    # Calculate Mandi as Saturn + 30°
-    mandi_lon = angle.norm(saturn_lon + 30)
-
-    return mandi_lon
+    return get_upagrah_longitudes(jd)[const.MANDI]
 
 
 def calculate_dhuma(jd):
@@ -74,15 +58,7 @@ def calculate_dhuma(jd):
     Returns:
         float: Longitude of Dhuma in degrees
     """
-    from astrovedic.ephem import swe
-
-    # Get Sun's longitude
-    sun_lon = swe.sweObjectLon(const.SUN, jd)
-
-    # Calculate Dhuma
-    dhuma_lon = angle.norm(360 - (sun_lon + 133 + (20/60)))
-
-    return dhuma_lon
+    return get_upagrah_longitudes(jd)[const.DHUMA]
 
 
 def calculate_vyatipata(jd):
@@ -98,10 +74,7 @@ def calculate_vyatipata(jd):
     Returns:
         float: Longitude of Vyatipata in degrees
     """
-    dhuma_lon = calculate_dhuma(jd)
-    vyatipata_lon = angle.norm(360 - dhuma_lon)
-
-    return vyatipata_lon
+    return get_upagrah_longitudes(jd)[const.VYATIPATA]
 
 
 def calculate_parivesha(jd):
@@ -117,10 +90,7 @@ def calculate_parivesha(jd):
     Returns:
         float: Longitude of Parivesha in degrees
     """
-    vyatipata_lon = calculate_vyatipata(jd)
-    parivesha_lon = angle.norm(vyatipata_lon + 180)
-
-    return parivesha_lon
+    return get_upagrah_longitudes(jd)[const.PARIVESHA]
 
 
 def calculate_indrachapa(jd):
@@ -136,10 +106,7 @@ def calculate_indrachapa(jd):
     Returns:
         float: Longitude of Indrachapa in degrees
     """
-    parivesha_lon = calculate_parivesha(jd)
-    indrachapa_lon = angle.norm(parivesha_lon + 180)
-
-    return indrachapa_lon
+    return get_upagrah_longitudes(jd)[const.INDRACHAPA]
 
 
 def calculate_upaketu(jd):
@@ -155,15 +122,7 @@ def calculate_upaketu(jd):
     Returns:
         float: Longitude of Upaketu in degrees
     """
-    from astrovedic.ephem import swe
-
-    # Get Sun's longitude
-    sun_lon = swe.sweObjectLon(const.SUN, jd)
-
-    # Calculate Upaketu
-    upaketu_lon = angle.norm(sun_lon + 30)
-
-    return upaketu_lon
+    return get_upagrah_longitudes(jd)[const.UPAKETU]
 
 
 def calculate_kala(jd):
@@ -179,15 +138,7 @@ def calculate_kala(jd):
     Returns:
         float: Longitude of Kala in degrees
     """
-    from astrovedic.ephem import swe
-
-    # Get Sun's longitude
-    sun_lon = swe.sweObjectLon(const.SUN, jd)
-
-    # Calculate Kala
-    kala_lon = angle.norm(sun_lon + 45)
-
-    return kala_lon
+    return get_upagrah_longitudes(jd)[const.KALA]
 
 
 def calculate_mrityu(jd):
@@ -203,15 +154,7 @@ def calculate_mrityu(jd):
     Returns:
         float: Longitude of Mrityu in degrees
     """
-    from astrovedic.ephem import swe
-
-    # Get Sun's longitude
-    sun_lon = swe.sweObjectLon(const.SUN, jd)
-
-    # Calculate Mrityu
-    mrityu_lon = angle.norm(sun_lon + 255)
-
-    return mrityu_lon
+    return get_upagrah_longitudes(jd)[const.MRITYU]
 
 
 def calculate_artha_prahara(jd):
@@ -227,15 +170,104 @@ def calculate_artha_prahara(jd):
     Returns:
         float: Longitude of Artha Prahara in degrees
     """
+    return get_upagrah_longitudes(jd)[const.ARTHA_PRAHARA]
+
+
+def calculate_upagrah_longitudes(sun_lon, saturn_lon):
+    """
+    Calculate the longitudes of all Upagrahas at once
+
+    All Upagrahas are derived from the Sun and Saturn, so they only need
+    one longitude of each. The calculate_* functions read their Upagrah
+    from here.
+
+    Args:
+        sun_lon (float): Longitude of the Sun in degrees
+        saturn_lon (float): Longitude of Saturn in degrees
+
+    Returns:
+        dict: Longitude of each Upagrah in degrees, in const.LIST_SHADOW_PLANETS order
+    """
+    # Dhuma = 360 - (Sun + 133°20'), and each of Vyatipata, Parivesha
+    # and Indrachapa is derived from the previous one
+    dhuma_lon = angle.norm(360 - (sun_lon + 133 + (20/60)))
+    vyatipata_lon = angle.norm(360 - dhuma_lon)
+    parivesha_lon = angle.norm(vyatipata_lon + 180)
+
+    return {
+        const.GULIKA: angle.norm(saturn_lon + 40),  # Saturn + 40°
+        const.MANDI: angle.norm(saturn_lon + 30),  # Saturn + 30°
+        const.DHUMA: dhuma_lon,
+        const.VYATIPATA: vyatipata_lon,  # 360 - Dhuma
+        const.PARIVESHA: parivesha_lon,  # Vyatipata + 180°
+        const.INDRACHAPA: angle.norm(parivesha_lon + 180),  # Parivesha + 180°
+        const.UPAKETU: angle.norm(sun_lon + 30),  # Sun + 30°
+        const.KALA: angle.norm(sun_lon + 45),  # Sun + 45°
+        const.MRITYU: angle.norm(sun_lon + 255),  # Sun + 255°
+        const.ARTHA_PRAHARA: angle.norm(sun_lon + 165)  # Sun + 165°
+    }
+
+
+def get_upagrah_longitudes(jd):
+    """
+    Get the longitudes of all Upagrahas for a Julian day
+
+    Args:
+        jd (float): Julian day
+
+    Returns:
+        dict: Longitude of each Upagrah in degrees, in const.LIST_SHADOW_PLANETS order
+    """
     from astrovedic.ephem import swe
 
-    # Get Sun's longitude
-    sun_lon = swe.sweObjectLon(const.SUN, jd)
+    return calculate_upagrah_longitudes(swe.sweObjectLon(const.SUN, jd),
+                                        swe.sweObjectLon(const.SATURN, jd))
+
+
+def get_upagrah_series(jds):
+    """
+    Get the longitudes of all Upagrahas for many Julian days
+
+    Args:
+        jds (list): Julian days
+
+    Returns:
+        dict: Dictionary with the 'jd' and, for each Upagrah, a tuple of
+            its longitudes in Julian day order
+    """
+    jds = tuple(jds)
+    rows = [get_upagrah_longitudes(jd) for jd in jds]
 
-    # Calculate Artha Prahara
-    artha_prahara_lon = angle.norm(sun_lon + 165)
+    series = {'jd': jds}
+    for upagrah_id in const.LIST_SHADOW_PLANETS:
+        series[upagrah_id] = tuple(row[upagrah_id] for row in rows)
+    return series
 
-    return artha_prahara_lon
+
+def get_upagrah_object(upagrah_id, longitude):
+    """
+    Build the object of an Upagrah at a longitude
+
+    Args:
+        upagrah_id (str): The ID of the upagrah (e.g., const.GULIKA)
+        longitude (float): Longitude of the upagrah in degrees
+
+    Returns:
+        dict: Dictionary with upagrah information
+    """
+    # Calculate sign and sign longitude
+    sign_num = int(longitude / 30)
+    sign = const.LIST_SIGNS[sign_num]
+    sign_lon = longitude % 30
+
+    return {
+        'id': upagrah_id,
+        'lon': longitude,
+        'lat': 0.0,  # Upagrah are calculated without latitude
+        'sign': sign,
+        'signlon': sign_lon,
+        'type': const.OBJ_SHADOW_PLANET
+    }
 
 
 def get_upagrah(upagrah_id, jd, lat=None, lon=None):
@@ -279,19 +311,7 @@ def get_upagrah(upagrah_id, jd, lat=None, lon=None):
     else:
         raise ValueError(f"Unknown upagrah: {upagrah_id}")
 
-    # Calculate sign and sign longitude
-    sign_num = int(longitude / 30)
-    sign = const.LIST_SIGNS[sign_num]
-    sign_lon = longitude % 30
-
-    return {
-        'id': upagrah_id,
-        'lon': longitude,
-        'lat': 0.0,  # Upagrah are calculated without latitude
-        'sign': sign,
-        'signlon': sign_lon,
-        'type': const.OBJ_SHADOW_PLANET
-    }
+    return get_upagrah_object(upagrah_id, longitude)
 
 
 def get_gulika(chart):
@@ -330,11 +350,7 @@ def get_upagrah_positions(chart):
     Returns:
         dict: Dictionary with all Upagrah positions
     """
-    positions = {}
-
-    for upagrah_id in [const.GULIKA, const.MANDI, const.DHUMA, const.VYATIPATA,
-                      const.PARIVESHA, const.INDRACHAPA, const.UPAKETU,
-                      const.KALA, const.MRITYU, const.ARTHA_PRAHARA]:
-        positions[upagrah_id] = get_upagrah(upagrah_id, chart.date.jd, chart.pos.lat, chart.pos.lon)
+    longitudes = get_upagrah_longitudes(chart.date.jd)
 
-    return positions
+    return {upagrah_id: get_upagrah_object(upagrah_id, longitude)
+            for upagrah_id, longitude in longitudes.items()}
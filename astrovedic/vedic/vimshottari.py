@@ -10,10 +10,13 @@ from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
 from astrovedic.vedic.dashas import (
     calculate_dasha_balance as calculate_actual_dasha_balance,
-    calculate_dasha_periods as calculate_actual_dasha_periods,
-    get_current_dasha as get_actual_current_dasha
+    get_dasha_timeline, get_dashas_at
 )
-from typing import Dict, Optional, Any
+from astrovedic.vedic.dasha_engine import date_converter
+from typing import Dict, Optional, Any, List, Sequence
+
+# Names of the three resolved Dasha levels
+DASHA_LEVELS = ['mahadasha', 'antardasha', 'pratyantardasha']
 
 
 def get_dasha_balance(chart: Chart) -> float:
@@ -67,17 +70,53 @@ def get_current_dasha(chart: Chart, date: Optional[Datetime] = None) -> Optional
 
     target_date = date if date else chart.date
 
-    # Calculate all dasha periods starting from birth
-    # Note: calculate_actual_dasha_periods requires a datetime.datetime object
-    all_periods = calculate_actual_dasha_periods(chart.date.to_datetime(), moon.lon)
-    
-    # Find the specific dasha for the target date
-    # Note: get_actual_current_dasha also requires datetime.datetime
-    current_dasha_info = get_actual_current_dasha(all_periods, target_date.to_datetime())
+    # Resolve the three levels on the lazily expanded timeline instead
+    # of building every period from birth
+    timeline = get_dasha_timeline(chart.date.jd, moon.lon)
+    path = timeline.locate(target_date.jd, depth=3)
+    if not path:
+        return None
+
+    to_date = date_converter(chart.date.to_datetime(), chart.date.jd)
+    current_dasha_info = {}
+    for name, (level, i) in zip(DASHA_LEVELS, path):
+        current_dasha_info[name] = level.lord(i)
+    for name, (level, i) in zip(DASHA_LEVELS, path):
+        current_dasha_info[name + '_start'] = to_date(level.bounds[i])
+        current_dasha_info[name + '_end'] = to_date(level.bounds[i + 1])
 
     return current_dasha_info
 
 
+def get_current_dashas(chart: Chart, jds: Sequence[float]) -> Dict[str, List[Any]]:
+    """
+    Get the running Vimshottari Dasha lords for a chart at many dates.
+
+    This is the batch form of get_current_dasha for timelines: the period
+    tree is built once and each query is resolved by bisection.
+
+    Args:
+        chart (Chart): The chart object containing birth details.
+        jds (list): Sorted Julian Days to query.
+
+    Returns:
+        dict: Dictionary with 'mahadasha', 'antardasha' and 'pratyantardasha'
+              lists of lords (one per query) and a 'next_change' list with
+              the Julian Day of the next dasha change after each query.
+
+    Raises:
+        ValueError: If the Moon object or birth date is not found in the chart.
+    """
+    moon = chart.getObject(const.MOON)
+    if moon is None:
+        raise ValueError("Moon object not found in the chart.")
+
+    if chart.date is None:
+         raise ValueError("Birth date not found in the chart.")
+
+    return get_dashas_at(moon.lon, chart.date.jd, jds)
+
+
 def get_mahadasha(chart: Chart, date: Optional[Datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Get the current Mahadasha (major period) for a chart at a specific date.
@@ -53,6 +53,10 @@ from astrovedic.vedic.yogas.surya import (
 from astrovedic.vedic.yogas.basic_analysis import (
     get_basic_yoga_analysis, get_basic_yoga_data
 )
+from astrovedic.vedic.yogas.rules import (
+    YOGA_RULES, yoga_rule, compile_rules, get_chart_facts,
+    evaluate_yogas, iter_yogas
+)
 
 # Note: For detailed analysis, use the astroved_extension package
 
@@ -83,22 +87,8 @@ def get_all_yogas(chart):
     Returns:
         dict: Dictionary with all Yoga information
     """
-    # Initialize the result
-    result = {
-        'mahapurusha_yogas': get_mahapurusha_yogas(chart),
-        'raja_yogas': get_raja_yogas(chart),
-        'dhana_yogas': get_dhana_yogas(chart),
-        'nabhasa_yogas': get_nabhasa_yogas(chart),
-        'dosha_yogas': get_dosha_yogas(chart),
-        'chandra_yogas': get_chandra_yogas(chart),
-        'surya_yogas': get_surya_yogas(chart),
-        'summary': None
-    }
-
-    # Generate summary information
-    result['summary'] = get_yoga_summary(result)
-
-    return result
+    # Evaluate the compiled rules of all the Yoga families in one pass
+    return evaluate_yogas(get_chart_facts(chart))
 
 
 def get_yoga_analysis(chart):
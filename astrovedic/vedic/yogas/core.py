@@ -75,47 +75,69 @@ def get_yoga_strength(chart, yoga):
     # Get the planets involved in the Yoga
     planets = yoga.get('planets', [])
     
+    # Calculate the strength based on the planets' positions
+    points = [get_planet_strength_points(chart.getObject(planet_id)) for planet_id in planets]
+    
+    return get_strength_from_points(points, yoga.get('type', ''))
+
+
+def get_planet_strength_points(planet):
+    """
+    Get the strength points of a planet in a Yoga from its dignity
+    
+    Args:
+        planet (Object): The planet
+    
+    Returns:
+        float: The strength points of the planet (0-20)
+    """
+    # Check if the planet is in its own sign
+    if is_in_own_sign(planet):
+        return 20.0
+    
+    # Check if the planet is exalted
+    elif is_exalted(planet):
+        return 15.0
+    
+    # Check if the planet is in a friendly sign
+    elif is_in_friendly_sign(planet):
+        return 10.0
+    
+    # Check if the planet is in an enemy sign
+    elif is_in_enemy_sign(planet):
+        return 5.0
+    
+    # Check if the planet is debilitated
+    elif is_debilitated(planet):
+        return 0.0
+    
+    # Default case
+    return 7.5
+
+
+def get_strength_from_points(points, yoga_type):
+    """
+    Calculate the strength of a Yoga from the strength points of its planets
+    
+    Args:
+        points (list): The strength points of the planets involved
+        yoga_type (str): The type of the Yoga
+    
+    Returns:
+        float: The strength of the Yoga (0-100)
+    """
     # If no planets are specified, return a default strength
-    if not planets:
+    if not points:
         return 50.0
     
-    # Calculate the strength based on the planets' positions
     strength = 0.0
-    
-    for planet_id in planets:
-        # Get the planet from the chart
-        planet = chart.getObject(planet_id)
-        
-        # Check if the planet is in its own sign
-        if is_in_own_sign(planet):
-            strength += 20.0
-        
-        # Check if the planet is exalted
-        elif is_exalted(planet):
-            strength += 15.0
-        
-        # Check if the planet is in a friendly sign
-        elif is_in_friendly_sign(planet):
-            strength += 10.0
-        
-        # Check if the planet is in an enemy sign
-        elif is_in_enemy_sign(planet):
-            strength += 5.0
-        
-        # Check if the planet is debilitated
-        elif is_debilitated(planet):
-            strength += 0.0
-        
-        # Default case
-        else:
-            strength += 7.5
+    for planet_points in points:
+        strength += planet_points
     
     # Calculate the average strength
-    avg_strength = strength / len(planets) if planets else 0.0
+    avg_strength = strength / len(points)
     
     # Adjust based on the Yoga type
-    yoga_type = yoga.get('type', '')
-    
     if yoga_type == 'Mahapurusha Yoga':
         avg_strength *= 1.2
     elif yoga_type == 'Raja Yoga':
@@ -0,0 +1,795 @@
+"""
+    This file is part of astrovedic - (C) FlatAngle
+    Modified for Vedic Astrology
+
+    This module implements a compiled Yoga rule engine. The Yogas found
+    by get_all_yogas are declared as rules over a chart fact table (the
+    signs and houses of the planets, the house lords, the dignities and
+    the separation and aspect matrices). The rules are compiled once into
+    closures; a chart is reduced to its facts once and all the rules are
+    then evaluated from the facts in a single pass, alone or in batch
+    over many charts. The functions of the Yoga family modules evaluate
+    the same rules, one family or one Yoga at a time.
+"""
+
+from astrovedic import const
+from astrovedic import angle
+from astrovedic.parallel import map_blocks
+from astrovedic.vedic.utils import get_sign_lord
+from astrovedic.vedic.yogas.core import (
+    get_planet_strength_points,
+    get_strength_from_points, get_yoga_summary
+)
+
+# Orbs in degrees, as in are_planets_conjunct and are_planets_in_aspect
+CONJUNCTION_ORB = 10
+ASPECT_ORB = 10
+ASPECT_ANGLES = (0, 60, 90, 120, 180)
+
+# Yoga families in the order of get_all_yogas
+YOGA_FAMILIES = (
+    'mahapurusha_yogas', 'raja_yogas', 'dhana_yogas', 'nabhasa_yogas',
+    'dosha_yogas', 'chandra_yogas', 'surya_yogas'
+)
+
+# Groups of planets and houses used by the rules
+SEVEN_PLANETS = (
+    const.SUN, const.MOON, const.MERCURY, const.VENUS,
+    const.MARS, const.JUPITER, const.SATURN
+)
+NON_LUMINARIES = (const.MERCURY, const.VENUS, const.MARS, const.JUPITER, const.SATURN)
+NON_MOON = (const.SUN,) + NON_LUMINARIES
+MALEFICS = (const.SUN, const.MARS, const.SATURN, const.RAHU, const.KETU)
+KENDRAS = (1, 4, 7, 10)
+
+# Objects in the fact table, with the matrices between the seven planets
+FACT_OBJECTS = SEVEN_PLANETS + (const.RAHU, const.KETU)
+DUSTHANAS = (6, 8, 12)
+
+# Lord of each sign
+SIGN_LORDS = {sign: get_sign_lord(sign) for sign in const.LIST_SIGNS}
+
+# Default number of charts evaluated per task
+DEFAULT_BLOCK_SIZE = 256
+
+
+# Chart facts
+
+def _get_matrices(lons):
+    """
+    Get the separation and aspect matrices between the seven planets
+
+    Separations are the absolute closest distances, as in
+    are_planets_conjunct, and aspects are tested as in
+    are_planets_in_aspect, which is not symmetric.
+
+    Args:
+        lons (dict): The longitude of each object
+
+    Returns:
+        tuple: (separation matrix, aspect matrix) as nested dictionaries
+    """
+    separation = {}
+    aspect = {}
+    for obj in SEVEN_PLANETS:
+        lon = lons[obj]
+        separation[obj] = obj_separation = {}
+        aspect[obj] = obj_aspect = {}
+        for other in SEVEN_PLANETS:
+            dist = (lons[other] - lon) % 360
+            obj_separation[other] = dist if dist <= 180 else 360 - dist
+            in_aspect = False
+            for aspect_angle in ASPECT_ANGLES:
+                # The remainder is positive, so this is the same test without abs
+                remainder = (dist - aspect_angle) % 360
+                if remainder <= ASPECT_ORB or remainder >= 360 - ASPECT_ORB:
+                    in_aspect = True
+                    break
+            obj_aspect[other] = in_aspect
+    return separation, aspect
+
+
+def get_chart_facts(chart):
+    """
+    Reduce a chart to the fact table used by the Yoga rules
+
+    Args:
+        chart (Chart): The birth chart
+
+    Returns:
+        dict: Dictionary with the sign, longitude, house (from the
+            Ascendant and from the first house cusp), dignity and Yoga
+            strength points of the nine grahas, the lord of each house,
+            and the separation and aspect matrices between the planets
+    """
+    asc_lon = chart.getAngle(const.ASC).lon
+    cusp_lon = chart.getHouse(const.HOUSE1).lon
+    objects = [chart.getObject(obj) for obj in FACT_OBJECTS]
+    lons = {obj.id: obj.lon for obj in objects}
+    points = {obj.id: get_planet_strength_points(obj) for obj in objects}
+    separation, aspect = _get_matrices(lons)
+
+    return {
+        'sign': {obj.id: obj.sign for obj in objects},
+        'lon': lons,
+        # Houses as in core.get_house_number and surya.get_house_number
+        'house': {obj: 1 + int(((asc_lon - lon) % 360) / 30) % 12 for obj, lon in lons.items()},
+        'cusp_house': {obj: 1 + int(((cusp_lon - lon) % 360) / 30) % 12
+                       for obj, lon in lons.items()},
+        'lord': {house: SIGN_LORDS[chart.getHouse(f"House{house}").sign]
+                 for house in range(1, 13)},
+        # Own sign scores 20 and exaltation 15 points
+        'dignified': {obj: obj_points >= 15.0 for obj, obj_points in points.items()},
+        'points': points,
+        'separation': separation,
+        'aspect': aspect
+    }
+
+
+# Rule compiler
+#
+# Expressions are tuples whose first item names an operator, with their
+# arguments as nested expressions. Any other tuple is a sequence of
+# expressions, and any other value is a literal. Compiled expressions
+# are functions of the facts and of the variables bound by the rule.
+
+def _is_literal(expr):
+    """ Returns True if an expression contains no operator. """
+    if isinstance(expr, tuple):
+        if expr and isinstance(expr[0], str) and expr[0] in OPERATORS:
+            return False
+        return all(_is_literal(item) for item in expr)
+    return True
+
+
+def _compile(expr):
+    """ Compiles an expression into a function of the facts and bindings. """
+    if _is_literal(expr):
+        return lambda facts, env: expr
+    if isinstance(expr[0], str) and expr[0] in OPERATORS:
+        return OPERATORS[expr[0]](*expr[1:])
+    items = [_compile(item) for item in expr]
+    return lambda facts, env: [item(facts, env) for item in items]
+
+
+def _compile_list(items):
+    """ Compiles a sequence of expressions into a function returning a list. """
+    items = [_compile(item) for item in items]
+    return lambda facts, env: [item(facts, env) for item in items]
+
+
+def _fact(table):
+    """ Returns the operator looking up an object or house in a fact table. """
+    def compile_fact(key):
+        if _is_literal(key):
+            return lambda facts, env: facts[table][key]
+        key = _compile(key)
+        return lambda facts, env: facts[table][key(facts, env)]
+    return compile_fact
+
+
+def _op_var(name):
+    return lambda facts, env: env[name]
+
+
+def _op_lord_of_sign(sign):
+    sign = _compile(sign)
+    return lambda facts, env: SIGN_LORDS[sign(facts, env)]
+
+
+def _op_nth(house, n):
+    house = _compile(house)
+    # The n-th house counted from a house
+    return lambda facts, env: ((house(facts, env) + n - 2) % 12) + 1
+
+
+def _op_distance(start, end):
+    start, end = _compile(start), _compile(end)
+    return lambda facts, env: (end(facts, env) - start(facts, env)) % 12
+
+
+def _op_eq(left, right):
+    left = _compile(left)
+    if _is_literal(right):
+        return lambda facts, env: left(facts, env) == right
+    right = _compile(right)
+    return lambda facts, env: left(facts, env) == right(facts, env)
+
+
+def _op_ne(left, right):
+    left, right = _compile(left), _compile(right)
+    return lambda facts, env: left(facts, env) != right(facts, env)
+
+
+def _op_in(value, values):
+    value = _compile(value)
+    if _is_literal(values):
+        return lambda facts, env: value(facts, env) in values
+    values = _compile(values)
+    return lambda facts, env: value(facts, env) in values(facts, env)
+
+
+def _op_and(*terms):
+    terms = [_compile(term) for term in terms]
+
+    def and_(facts, env):
+        for term in terms:
+            if not term(facts, env):
+                return False
+        return True
+    return and_
+
+
+def _op_or(*terms):
+    terms = [_compile(term) for term in terms]
+
+    def or_(facts, env):
+        for term in terms:
+            if term(facts, env):
+                return True
+        return False
+    return or_
+
+
+def _op_not(term):
+    term = _compile(term)
+    return lambda facts, env: not term(facts, env)
+
+
+def _op_conjunct(planet1, planet2, orb=CONJUNCTION_ORB):
+    planet1, planet2 = _compile(planet1), _compile(planet2)
+    return lambda facts, env: facts['separation'][planet1(facts, env)][planet2(facts, env)] <= orb
+
+
+def _op_aspect(planet1, planet2):
+    planet1, planet2 = _compile(planet1), _compile(planet2)
+    return lambda facts, env: facts['aspect'][planet1(facts, env)][planet2(facts, env)]
+
+
+def _op_any_conjunct(planet, planets):
+    planet, planets = _compile(planet), _compile(planets)
+
+    def any_conjunct(facts, env):
+        separations = facts['separation'][planet(facts, env)]
+        return any(separations[other] <= CONJUNCTION_ORB for other in planets(facts, env))
+    return any_conjunct
+
+
+def _op_houses_in(planets, houses):
+    planets, houses = _compile(planets), _compile(houses)
+
+    def houses_in(facts, env):
+        allowed = houses(facts, env)
+        return all(facts['house'][planet] in allowed for planet in planets(facts, env))
+    return houses_in
+
+
+def _op_signs_in(planets, signs):
+    planets = _compile(planets)
+    return lambda facts, env: all(facts['sign'][planet] in signs for planet in planets(facts, env))
+
+
+def _op_occupied(planets, house):
+    planets, house = _compile(planets), _compile(house)
+
+    def occupied(facts, env):
+        target = house(facts, env)
+        return any(facts['house'][planet] == target for planet in planets(facts, env))
+    return occupied
+
+
+def _op_congruent(modulus, values):
+    values = _compile(values)
+
+    def congruent(facts, env):
+        remainders = {value % modulus for value in values(facts, env)}
+        return len(remainders) <= 1
+    return congruent
+
+
+def _op_consecutive_signs(planets):
+    planets = _compile(planets)
+
+    def consecutive_signs(facts, env):
+        # Sorted sign numbers, each one after the previous
+        numbers = sorted(const.LIST_SIGNS.index(facts['sign'][planet])
+                         for planet in planets(facts, env))
+        return all((numbers[i] - numbers[i - 1]) % 12 == 1 for i in range(1, len(numbers)))
+    return consecutive_signs
+
+
+def _op_between_nodes(planets):
+    planets = _compile(planets)
+
+    def between_nodes(facts, env):
+        # Every planet within the arc from Rahu to Ketu
+        lons = facts['lon']
+        span = angle.distance(lons[const.RAHU], lons[const.KETU])
+        return all(angle.distance(lons[const.RAHU], lons[planet]) <= span
+                   for planet in planets(facts, env))
+    return between_nodes
+
+
+def _op_let(name, value):
+    value = _compile(value)
+
+    def let(facts, env):
+        env[name] = value(facts, env)
+        return True
+    return let
+
+
+def _op_find(name, candidates, term):
+    candidates, term = _compile(candidates), _compile(term)
+
+    def find(facts, env):
+        # Bind the first candidate for which the term holds
+        for candidate in candidates(facts, env):
+            env[name] = candidate
+            if term(facts, env):
+                return True
+        env.pop(name, None)
+        return False
+    return find
+
+
+def _op_find_pair(name1, name2, candidates, term):
+    candidates, term = _compile(candidates), _compile(term)
+
+    def find_pair(facts, env):
+        # Bind the first pair of candidates for which the term holds
+        items = candidates(facts, env)
+        for i in range(len(items)):
+            for j in range(i + 1, len(items)):
+                env[name1], env[name2] = items[i], items[j]
+                if term(facts, env):
+                    return True
+        env.pop(name1, None)
+        env.pop(name2, None)
+        return False
+    return find_pair
+
+
+OPERATORS = {
+    'var': _op_var,
+    'house': _fact('house'),
+    'cusp_house': _fact('cusp_house'),
+    'sign': _fact('sign'),
+    'lord': _fact('lord'),
+    'lord_of_sign': _op_lord_of_sign,
+    'dignified': _fact('dignified'),
+    'nth': _op_nth,
+    'distance': _op_distance,
+    'eq': _op_eq,
+    'ne': _op_ne,
+    'in': _op_in,
+    'and': _op_and,
+    'or': _op_or,
+    'not': _op_not,
+    'conjunct': _op_conjunct,
+    'aspect': _op_aspect,
+    'any_conjunct': _op_any_conjunct,
+    'houses_in': _op_houses_in,
+    'signs_in': _op_signs_in,
+    'occupied': _op_occupied,
+    'congruent': _op_congruent,
+    'consecutive_signs': _op_consecutive_signs,
+    'between_nodes': _op_between_nodes,
+    'let': _op_let,
+    'find': _op_find,
+    'find_pair': _op_find_pair
+}
+
+
+def yoga_rule(family, name, yoga_type, when, planets, houses, description,
+              is_beneficial=True, strength=None):
+    """
+    Declare a Yoga rule
+
+    Args:
+        family (str): The key of the Yoga family in the result
+        name (str): The name of the Yoga, which may use bound variables
+        yoga_type (str): The type of the Yoga
+        when (tuple): The condition expression
+        planets (tuple): Expressions of the planets involved
+        houses (tuple): Expressions of the houses involved
+        description (str): The description, which may use bound variables
+        is_beneficial (bool): Whether the Yoga is beneficial
+        strength (float, optional): A fixed strength instead of the one
+            from the dignities of the planets
+
+    Returns:
+        dict: The rule declaration
+    """
+    return {
+        'family': family,
+        'name': name,
+        'type': yoga_type,
+        'when': when,
+        'planets': planets,
+        'houses': houses,
+        'description': description,
+        'is_beneficial': is_beneficial,
+        'strength': strength
+    }
+
+
+# Rule declarations
+#
+# Rules are evaluated in order. A Yoga with several rules of the same
+# family and name takes the first rule that holds. These rules are the
+# only definition of the Yogas: the has_* and get_*_yogas functions of
+# the family modules evaluate them through get_yoga and get_family_yogas.
+
+MAHAPURUSHA = 'Mahapurusha Yoga'
+RAJA = 'Raja Yoga'
+DHANA = 'Dhana Yoga'
+NABHASA = 'Nabhasa Yoga'
+DOSHA = 'Dosha Yoga'
+CHANDRA = 'Chandra Yoga'
+SURYA = 'Surya Yoga'
+
+MOON_HOUSE = ('house', const.MOON)
+SUN_CUSP_HOUSE = ('cusp_house', const.SUN)
+MOON_CUSP_HOUSE = ('cusp_house', const.MOON)
+
+YOGA_RULES = tuple(
+    yoga_rule('mahapurusha_yogas', name, MAHAPURUSHA,
+              ('and', ('dignified', planet), ('in', ('house', planet), KENDRAS)),
+              (planet,), (('house', planet),),
+              f'Formed when {planet} is in its own sign or exaltation and placed in a Kendra house')
+    for name, planet in (
+        ('Ruchaka Yoga', const.MARS), ('Bhadra Yoga', const.MERCURY),
+        ('Hamsa Yoga', const.JUPITER), ('Malavya Yoga', const.VENUS),
+        ('Sasa Yoga', const.SATURN)
+    )
+) + (
+    # Raja Yogas
+    yoga_rule('raja_yogas', 'Dharmakarmaadhipati Yoga', RAJA,
+              ('eq', ('lord', 9), ('lord', 10)),
+              (('lord', 9),), (9, 10),
+              'Formed when the same planet is the lord of both the 9th and 10th houses'),
+    yoga_rule('raja_yogas', 'Dharmakarmaadhipati Yoga', RAJA,
+              ('conjunct', ('lord', 9), ('lord', 10)),
+              (('lord', 9), ('lord', 10)), (9, 10),
+              'Formed when the lords of the 9th and 10th houses are conjunct'),
+    yoga_rule('raja_yogas', 'Dharmakarmaadhipati Yoga', RAJA,
+              ('aspect', ('lord', 9), ('lord', 10)),
+              (('lord', 9), ('lord', 10)), (9, 10),
+              'Formed when the lords of the 9th and 10th houses aspect each other'),
+    yoga_rule('raja_yogas', 'Gajakesari Yoga', RAJA,
+              ('in', ('distance', MOON_HOUSE, ('house', const.JUPITER)), (0, 3, 6, 9)),
+              (const.MOON, const.JUPITER), (MOON_HOUSE, ('house', const.JUPITER)),
+              'Formed when Jupiter is in a Kendra house from the Moon'),
+    yoga_rule('raja_yogas', 'Amala Yoga', RAJA,
+              ('or', ('not', ('occupied', MALEFICS, 10)),
+                     ('not', ('occupied', MALEFICS, ('nth', MOON_HOUSE, 10)))),
+              (), (10, ('nth', MOON_HOUSE, 10)),
+              'Formed when there are no malefic planets in the 10th house from the Moon or the Ascendant',
+              strength=75.0),
+    yoga_rule('raja_yogas', 'Sreenatha Yoga', RAJA,
+              ('and', ('eq', ('house', const.VENUS), 9), ('in', ('house', ('lord', 9)), KENDRAS)),
+              (const.VENUS, ('lord', 9)), (9, ('house', ('lord', 9))),
+              'Formed when Venus is in the 9th house and the lord of the 9th house is in a Kendra house'),
+    yoga_rule('raja_yogas', 'Chandra Mangala Yoga', RAJA,
+              ('conjunct', const.MOON, const.MARS),
+              (const.MOON, const.MARS), (MOON_HOUSE, ('house', const.MARS)),
+              'Formed when the Moon and Mars are conjunct'),
+    yoga_rule('raja_yogas', 'Chandra Mangala Yoga', RAJA,
+              ('aspect', const.MOON, const.MARS),
+              (const.MOON, const.MARS), (MOON_HOUSE, ('house', const.MARS)),
+              'Formed when the Moon and Mars aspect each other'),
+
+    # Dhana Yogas
+    yoga_rule('dhana_yogas', 'Lakshmi Yoga', DHANA,
+              ('or', ('and', ('eq', ('house', const.VENUS), 9), ('eq', ('house', const.JUPITER), 1)),
+                     ('and', ('eq', ('house', const.JUPITER), 9), ('eq', ('house', const.VENUS), 1))),
+              (const.VENUS, const.JUPITER), (('house', const.VENUS), ('house', const.JUPITER)),
+              'Formed when Venus is in the 9th house and Jupiter is in the Ascendant, or vice versa'),
+    yoga_rule('dhana_yogas', 'Kubera Yoga', DHANA,
+              ('eq', ('lord', 2), ('lord', 11)),
+              (('lord', 2),), (2, 11),
+              'Formed when the same planet is the lord of both the 2nd and 11th houses'),
+    yoga_rule('dhana_yogas', 'Kubera Yoga', DHANA,
+              ('conjunct', ('lord', 2), ('lord', 11)),
+              (('lord', 2), ('lord', 11)), (2, 11),
+              'Formed when the lords of the 2nd and 11th houses are conjunct'),
+    yoga_rule('dhana_yogas', 'Kubera Yoga', DHANA,
+              ('aspect', ('lord', 2), ('lord', 11)),
+              (('lord', 2), ('lord', 11)), (2, 11),
+              'Formed when the lords of the 2nd and 11th houses aspect each other'),
+    yoga_rule('dhana_yogas', 'Kalanidhi Yoga', DHANA,
+              ('or', ('eq', ('house', ('lord', 2)), 5), ('eq', ('house', ('lord', 5)), 2)),
+              (('lord', 2), ('lord', 5)), (2, 5),
+              'Formed when the lord of the 2nd house is in the 5th house, or the lord of the 5th house is in the 2nd house'),
+    yoga_rule('dhana_yogas', 'Vasumati Yoga', DHANA,
+              ('or', ('eq', ('house', ('lord', 2)), 11), ('eq', ('house', ('lord', 11)), 2)),
+              (('lord', 2), ('lord', 11)), (2, 11),
+              'Formed when the lord of the 2nd house is in the 11th house, or the lord of the 11th house is in the 2nd house'),
+    yoga_rule('dhana_yogas', 'Mridanga Yoga', DHANA,
+              ('congruent', 3, (('house', ('lord', 1)), ('house', ('lord', 4)), ('house', ('lord', 10)))),
+              (('lord', 1), ('lord', 4), ('lord', 10)), (1, 4, 10),
+              'Formed when the lords of the 1st, 4th, and 10th houses are in mutual angles from each other'),
+
+    # Nabhasa Yogas
+    yoga_rule('nabhasa_yogas', 'Rajju Yoga', NABHASA,
+              ('signs_in', SEVEN_PLANETS, (const.ARIES, const.CANCER, const.LIBRA, const.CAPRICORN)),
+              SEVEN_PLANETS, (),
+              'Formed when all planets are in movable signs (Aries, Cancer, Libra, Capricorn)'),
+    yoga_rule('nabhasa_yogas', 'Musala Yoga', NABHASA,
+              ('signs_in', SEVEN_PLANETS, (const.TAURUS, const.LEO, const.SCORPIO, const.AQUARIUS)),
+              SEVEN_PLANETS, (),
+              'Formed when all planets are in fixed signs (Taurus, Leo, Scorpio, Aquarius)'),
+    yoga_rule('nabhasa_yogas', 'Nala Yoga', NABHASA,
+              ('signs_in', SEVEN_PLANETS, (const.GEMINI, const.VIRGO, const.SAGITTARIUS, const.PISCES)),
+              SEVEN_PLANETS, (),
+              'Formed when all planets are in dual signs (Gemini, Virgo, Sagittarius, Pisces)'),
+    yoga_rule('nabhasa_yogas', 'Mala Yoga', NABHASA,
+              ('consecutive_signs', SEVEN_PLANETS),
+              SEVEN_PLANETS, (),
+              'Formed when all planets are in consecutive signs'),
+    yoga_rule('nabhasa_yogas', 'Sarpa Yoga', NABHASA,
+              ('houses_in', SEVEN_PLANETS, (6, 7, 8)),
+              SEVEN_PLANETS, (6, 7, 8),
+              'Formed when all planets are in the 6th, 7th, and 8th houses from the Ascendant',
+              is_beneficial=False),
+
+    # Dosha Yogas
+    yoga_rule('dosha_yogas', 'Kemadruma Yoga', DOSHA,
+              ('and', ('not', ('occupied', NON_MOON, ('nth', MOON_HOUSE, 2))),
+                      ('not', ('occupied', NON_MOON, ('nth', MOON_HOUSE, 12))),
+                      ('not', ('any_conjunct', const.MOON, NON_MOON))),
+              (const.MOON,), (MOON_HOUSE,),
+              'Formed when there are no planets in the 2nd and 12th houses from the Moon, and the Moon is not conjunct with any planet',
+              is_beneficial=False),
+    yoga_rule('dosha_yogas', 'Daridra Yoga', DOSHA,
+              ('houses_in', (('lord', 1), ('lord', 5), ('lord', 9)), DUSTHANAS),
+              (('lord', 1), ('lord', 5), ('lord', 9)), (1, 5, 9),
+              'Formed when the lords of the 1st, 5th, and 9th houses are all in the 6th, 8th, or 12th houses',
+              is_beneficial=False),
+    # The houses from Jupiter are counted from zero
+    yoga_rule('dosha_yogas', 'Shakat Yoga', DOSHA,
+              ('in', ('distance', ('house', const.JUPITER), MOON_HOUSE), (0, 6, 8)),
+              (const.MOON, const.JUPITER), (MOON_HOUSE, ('house', const.JUPITER)),
+              'Formed when the Moon is in the 6th, 8th, or 12th house from Jupiter',
+              is_beneficial=False),
+    yoga_rule('dosha_yogas', 'Kalasarpa Yoga', DOSHA,
+              ('between_nodes', SEVEN_PLANETS),
+              (const.RAHU, const.KETU), (('house', const.RAHU), ('house', const.KETU)),
+              'Formed when all planets are between Rahu and Ketu',
+              is_beneficial=False),
+    yoga_rule('dosha_yogas', 'Graha Yuddha', DOSHA,
+              ('find_pair', 'planet1', 'planet2', NON_LUMINARIES,
+               ('conjunct', ('var', 'planet1'), ('var', 'planet2'), 1.0)),
+              (('var', 'planet1'), ('var', 'planet2')),
+              (('house', ('var', 'planet1')), ('house', ('var', 'planet2'))),
+              'Formed when {planet1} and {planet2} are within 1 degree of each other',
+              is_beneficial=False),
+
+    # Chandra Yogas
+    yoga_rule('chandra_yogas', 'Adhi Yoga', CHANDRA,
+              ('houses_in', (const.MERCURY, const.VENUS, const.JUPITER),
+               (('nth', MOON_HOUSE, 6), ('nth', MOON_HOUSE, 7), ('nth', MOON_HOUSE, 8))),
+              (const.MOON, const.MERCURY, const.VENUS, const.JUPITER),
+              (MOON_HOUSE, ('house', const.MERCURY), ('house', const.VENUS), ('house', const.JUPITER)),
+              'Formed when Mercury, Venus, and Jupiter are in the 6th, 7th, and 8th houses from the Moon'),
+    yoga_rule('chandra_yogas', 'Sunapha Yoga', CHANDRA,
+              ('find', 'planet', NON_LUMINARIES,
+               ('eq', ('house', ('var', 'planet')), ('nth', MOON_HOUSE, 2))),
+              (const.MOON, ('var', 'planet')), (MOON_HOUSE, ('nth', MOON_HOUSE, 2)),
+              'Formed when {planet} is in the 2nd house from the Moon'),
+    yoga_rule('chandra_yogas', 'Anapha Yoga', CHANDRA,
+              ('find', 'planet', NON_LUMINARIES,
+               ('eq', ('house', ('var', 'planet')), ('nth', MOON_HOUSE, 12))),
+              (const.MOON, ('var', 'planet')), (MOON_HOUSE, ('nth', MOON_HOUSE, 12)),
+              'Formed when {planet} is in the 12th house from the Moon'),
+    yoga_rule('chandra_yogas', 'Durudhura Yoga', CHANDRA,
+              ('and', ('find', 'planet_2', NON_LUMINARIES,
+                       ('eq', ('house', ('var', 'planet_2')), ('nth', MOON_HOUSE, 2))),
+                      ('find', 'planet_12', NON_LUMINARIES,
+                       ('and', ('ne', ('var', 'planet_12'), ('var', 'planet_2')),
+                               ('eq', ('house', ('var', 'planet_12')), ('nth', MOON_HOUSE, 12))))),
+              (const.MOON, ('var', 'planet_2'), ('var', 'planet_12')),
+              (MOON_HOUSE, ('nth', MOON_HOUSE, 2), ('nth', MOON_HOUSE, 12)),
+              'Formed when {planet_2} is in the 2nd house and {planet_12} is in the 12th house from the Moon'),
+    yoga_rule('chandra_yogas', 'Kemadruma Yoga', CHANDRA,
+              ('and', ('not', ('occupied', NON_MOON, ('nth', MOON_HOUSE, 2))),
+                      ('not', ('occupied', NON_MOON, ('nth', MOON_HOUSE, 12))),
+                      ('not', ('any_conjunct', const.MOON, NON_MOON))),
+              (const.MOON,), (MOON_HOUSE,),
+              'Formed when there are no planets in the 2nd and 12th houses from the Moon, and the Moon is not conjunct with any planet',
+              is_beneficial=False),
+
+    # Surya Yogas, with houses counted from the first house cusp
+    yoga_rule('surya_yogas', 'Vasi Yoga', SURYA,
+              ('eq', SUN_CUSP_HOUSE, ('nth', MOON_CUSP_HOUSE, 12)),
+              (const.SUN, const.MOON), (SUN_CUSP_HOUSE, MOON_CUSP_HOUSE),
+              'Formed when the Sun is in the 12th house from the Moon, giving control over emotions and mind'),
+    yoga_rule('surya_yogas', 'Vesi Yoga', SURYA,
+              ('eq', SUN_CUSP_HOUSE, ('nth', MOON_CUSP_HOUSE, 2)),
+              (const.SUN, const.MOON), (SUN_CUSP_HOUSE, MOON_CUSP_HOUSE),
+              'Formed when the Sun is in the 2nd house from the Moon, giving wealth, good speech, and material comforts'),
+    yoga_rule('surya_yogas', 'Ubhayachari Yoga', SURYA,
+              ('and', ('eq', SUN_CUSP_HOUSE, ('nth', MOON_CUSP_HOUSE, 12)),
+                      ('eq', SUN_CUSP_HOUSE, ('nth', MOON_CUSP_HOUSE, 2))),
+              (const.SUN, const.MOON), (SUN_CUSP_HOUSE, MOON_CUSP_HOUSE),
+              'Formed when the Sun and Moon are in the 2nd and 12th houses from each other, combining the benefits of Vasi and Vesi Yogas'),
+    yoga_rule('surya_yogas', 'Budha-Aditya Yoga', SURYA,
+              ('and', ('eq', SUN_CUSP_HOUSE, ('cusp_house', const.MERCURY)),
+                      ('conjunct', const.SUN, const.MERCURY)),
+              (const.SUN, const.MERCURY), (SUN_CUSP_HOUSE,),
+              'Formed when Mercury is conjunct with the Sun, giving intelligence, education, and communication skills'),
+    yoga_rule('surya_yogas', 'Sun-{lord} Parivartana Yoga', SURYA,
+              ('and', ('let', 'lord', ('lord_of_sign', ('sign', const.SUN))),
+                      ('ne', ('var', 'lord'), const.SUN),
+                      ('eq', ('sign', ('var', 'lord')), const.LEO),
+                      ('let', 'sun_sign', ('sign', const.SUN))),
+              (const.SUN, ('var', 'lord')), (SUN_CUSP_HOUSE, ('cusp_house', ('var', 'lord'))),
+              'Formed when the Sun is in {sun_sign} and {lord} is in Leo, giving authority, leadership, and recognition')
+)
+
+
+def compile_rules(rules):
+    """
+    Compile Yoga rule declarations into evaluable rules
+
+    Consecutive rules of the same family and name are compiled into one
+    Yoga whose rules are tried in turn.
+
+    Args:
+        rules (iterable): The rule declarations (see YOGA_RULES)
+
+    Returns:
+        list: The compiled Yogas as (family, list of compiled rules) tuples
+    """
+    compiled = []
+    for rule in rules:
+        variant = (
+            _compile(rule['when']),
+            _compile_list(rule['planets']),
+            _compile_list(rule['houses']),
+            rule['name'],
+            rule['type'],
+            rule['description'],
+            rule['is_beneficial'],
+            rule['strength'],
+            '{' in rule['name'] + rule['description']
+        )
+        key = (rule['family'], rule['name'])
+        if compiled and compiled[-1][0] == key:
+            compiled[-1][2].append(variant)
+        else:
+            compiled.append((key, rule['family'], [variant]))
+    return [(family, variants) for _, family, variants in compiled]
+
+
+def _evaluate_variants(facts, variants):
+    """
+    Evaluate the rules of one Yoga, which takes the first rule that holds
+
+    Args:
+        facts (dict): The chart facts (see get_chart_facts)
+        variants (list): The compiled rules of the Yoga
+
+    Returns:
+        dict: Dictionary with the Yoga information, or None if not present
+    """
+    for (when, get_planets, get_houses, name, yoga_type, description,
+         is_beneficial, strength, templated) in variants:
+        env = {}
+        if not when(facts, env):
+            continue
+
+        planets = get_planets(facts, env)
+        if templated:
+            name = name.format(**env)
+            description = description.format(**env)
+        if strength is None:
+            strength = get_strength_from_points([facts['points'][planet] for planet in planets],
+                                                yoga_type)
+        return {
+            'name': name,
+            'type': yoga_type,
+            'planets': planets,
+            'houses': get_houses(facts, env),
+            'description': description,
+            'is_beneficial': is_beneficial,
+            'strength': strength
+        }
+    return None
+
+
+def evaluate_yogas(facts, rules=None):
+    """
+    Evaluate all the Yoga rules over the facts of a chart in one pass
+
+    The result matches get_all_yogas for the chart of the facts.
+
+    Args:
+        facts (dict): The chart facts (see get_chart_facts)
+        rules (list, optional): Compiled rules, the Yogas of
+            get_all_yogas by default
+
+    Returns:
+        dict: Dictionary with the list of Yogas of each family and the
+            summary
+    """
+    if rules is None:
+        rules = COMPILED_RULES
+
+    result = {family: [] for family in YOGA_FAMILIES}
+    for family, variants in rules:
+        yoga = _evaluate_variants(facts, variants)
+        if yoga:
+            result.setdefault(family, []).append(yoga)
+
+    result['summary'] = get_yoga_summary(result)
+    return result
+
+
+def get_family_yogas(chart, family):
+    """
+    Identify the Yogas of one family in a chart from the compiled rules
+
+    Args:
+        chart (Chart): The birth chart
+        family (str): The key of the Yoga family (see YOGA_FAMILIES)
+
+    Returns:
+        list: List of the Yogas of the family in the chart
+    """
+    facts = get_chart_facts(chart)
+    yogas = []
+    for yoga_family, variants in COMPILED_RULES:
+        if yoga_family == family:
+            yoga = _evaluate_variants(facts, variants)
+            if yoga:
+                yogas.append(yoga)
+    return yogas
+
+
+def get_yoga(chart, family, name):
+    """
+    Check if a chart has a Yoga, from its compiled rules
+
+    Args:
+        chart (Chart): The birth chart
+        family (str): The key of the Yoga family (see YOGA_FAMILIES)
+        name (str): The name of the Yoga as declared in YOGA_RULES
+
+    Returns:
+        dict: Dictionary with the Yoga information, or None if not present
+    """
+    return _evaluate_variants(get_chart_facts(chart), COMPILED_YOGAS[(family, name)])
+
+
+def _evaluate_block(facts):
+    """ Returns the Yogas of a block of charts. """
+    return [evaluate_yogas(chart_facts) for chart_facts in facts]
+
+
+def iter_yogas(facts, block_size=DEFAULT_BLOCK_SIZE, max_workers=None, executor=None):
+    """
+    Evaluate the Yogas of many charts
+
+    The Yogas are evaluated in blocks of charts with map_blocks.
+
+    Args:
+        facts (list): The facts of all charts (see get_chart_facts)
+        block_size (int): The number of charts per block
+        max_workers (int, optional): The number of worker processes
+        executor (Executor, optional): An executor to run the blocks on
+
+    Yields:
+        tuple: (chart index, yogas) in chart order, where yogas is the
+            result of evaluate_yogas
+    """
+    return map_blocks(_evaluate_block, facts, block_size, max_workers=max_workers,
+                      executor=executor)
+
+
+# Compiled Yogas of get_all_yogas
+COMPILED_RULES = compile_rules(YOGA_RULES)
+
+# Compiled rules of each Yoga by family and declared name
+COMPILED_YOGAS = {(family, variants[0][3]): variants for family, variants in COMPILED_RULES}
@@ -10,7 +10,12 @@ from astrovedic import const
 from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
 from astrovedic.vedic.nakshatras import get_nakshatra
-from datetime import datetime, timedelta
+from astrovedic.vedic.dasha_engine import (
+    DashaSystem, DashaTimeline, years_to_days, add_years_to_date,
+    date_converter, get_current_period, format_current_dasha,
+    current_dasha_info
+)
+from datetime import datetime
 from typing import Dict, Optional, Any, List, Tuple
 
 # Yogini Dasha periods (in years)
@@ -65,15 +70,18 @@ NAKSHATRA_TO_YOGINI = {
     27: const.JUPITER # Revati -> Dhanya
 }
 
-def calculate_yogini_dasha_balance(moon_longitude: float) -> float:
+# Yogini Dasha system table
+YOGINI_DASHA = DashaSystem('Yogini', YOGINI_SEQUENCE, YOGINI_PERIODS)
+
+def _get_yogini_start(moon_longitude: float) -> Tuple[int, float]:
     """
-    Calculate the balance of the current Yogini Dasha at birth
+    Get the Yogini running at birth and the balance of its Dasha
 
     Args:
         moon_longitude (float): The Moon's longitude in degrees (0-360)
 
     Returns:
-        float: The balance of the current Yogini Dasha in years
+        tuple: (index in YOGINI_SEQUENCE, balance in years)
     """
     # Get nakshatra information
     nakshatra_info = get_nakshatra(moon_longitude)
@@ -89,7 +97,19 @@ def calculate_yogini_dasha_balance(moon_longitude: float) -> float:
     years_of_dasha = YOGINI_PERIODS[yogini_planet]
     balance = years_of_dasha * (1 - pos_in_nakshatra)
     
-    return balance
+    return YOGINI_DASHA.index(yogini_planet), balance
+
+def calculate_yogini_dasha_balance(moon_longitude: float) -> float:
+    """
+    Calculate the balance of the current Yogini Dasha at birth
+
+    Args:
+        moon_longitude (float): The Moon's longitude in degrees (0-360)
+
+    Returns:
+        float: The balance of the current Yogini Dasha in years
+    """
+    return _get_yogini_start(moon_longitude)[1]
 
 def get_yogini_sequence(moon_longitude: float) -> List[Dict[str, Any]]:
     """
@@ -101,38 +121,8 @@ def get_yogini_sequence(moon_longitude: float) -> List[Dict[str, Any]]:
     Returns:
         list: List of dictionaries with Yogini Dasha information
     """
-    # Get nakshatra information
-    nakshatra_info = get_nakshatra(moon_longitude)
-    nakshatra_index = nakshatra_info['index'] + 1  # Convert to 1-based index
-    
-    # Get the Yogini planet for this nakshatra
-    yogini_planet = NAKSHATRA_TO_YOGINI[nakshatra_index]
-    
-    # Calculate the balance of the current Yogini Dasha
-    balance = calculate_yogini_dasha_balance(moon_longitude)
-    
-    # Find the starting index in the Yogini sequence
-    start_idx = YOGINI_SEQUENCE.index(yogini_planet)
-    
-    # Create the sequence of Yogini Dashas
-    yogini_sequence = []
-    
-    # Add the current Yogini Dasha with its balance
-    yogini_sequence.append({
-        'planet': yogini_planet,
-        'years': balance
-    })
-    
-    # Add the remaining Yogini Dashas in sequence
-    for i in range(1, 8):
-        idx = (start_idx + i) % 8
-        planet = YOGINI_SEQUENCE[idx]
-        yogini_sequence.append({
-            'planet': planet,
-            'years': YOGINI_PERIODS[planet]
-        })
-    
-    return yogini_sequence
+    start_idx, balance = _get_yogini_start(moon_longitude)
+    return YOGINI_DASHA.sequence_info(start_idx, balance)
 
 def get_yogini_antardasha_sequence(mahadasha_planet: str, mahadasha_years: float) -> List[Dict[str, Any]]:
     """
@@ -145,52 +135,21 @@ def get_yogini_antardasha_sequence(mahadasha_planet: str, mahadasha_years: float
     Returns:
         list: List of dictionaries with Antardasha information
     """
-    # Find the starting index in the Yogini sequence
-    start_idx = YOGINI_SEQUENCE.index(mahadasha_planet)
-    
-    # Create the sequence of Antardashas
-    antardasha_sequence = []
-    
-    # Add all Antardashas in sequence
-    for i in range(8):
-        idx = (start_idx + i) % 8
-        planet = YOGINI_SEQUENCE[idx]
-        
-        # Calculate the duration of the Antardasha
-        years = (YOGINI_PERIODS[planet] / TOTAL_YOGINI_YEARS) * mahadasha_years
-        
-        antardasha_sequence.append({
-            'planet': planet,
-            'years': years
-        })
-    
-    return antardasha_sequence
-
-def years_to_days(years: float) -> float:
-    """
-    Convert years to days
-
-    Args:
-        years (float): Number of years
-
-    Returns:
-        float: Number of days
-    """
-    return years * 365.25
+    return YOGINI_DASHA.subperiod_info(mahadasha_planet, mahadasha_years)
 
-def add_years_to_date(date: datetime, years: float) -> datetime:
+def get_yogini_timeline(birth_jd: float, moon_longitude: float) -> DashaTimeline:
     """
-    Add a number of years to a date
+    Get the Yogini Mahadasha timeline with lazily expanded sub-periods
 
     Args:
-        date (datetime): The starting date
-        years (float): Number of years to add
+        birth_jd (float): The Julian Day of birth
+        moon_longitude (float): The Moon's longitude in degrees (0-360)
 
     Returns:
-        datetime: The resulting date
+        DashaTimeline: The Mahadasha timeline
     """
-    days = years_to_days(years)
-    return date + timedelta(days=days)
+    start_idx, balance = _get_yogini_start(moon_longitude)
+    return YOGINI_DASHA.timeline(birth_jd, start_idx, balance)
 
 def calculate_yogini_dasha_periods(birth_date: datetime, moon_longitude: float) -> Dict[str, Any]:
     """
@@ -205,66 +164,13 @@ def calculate_yogini_dasha_periods(birth_date: datetime, moon_longitude: float)
     """
     # Convert flatlib Datetime to Python datetime if needed
     if isinstance(birth_date, Datetime):
-        # Create a Python datetime from the components
-        date_parts = str(birth_date.date).strip('<>').split('/')
-        time_parts = str(birth_date.time).strip('<>').split(':')
-        
-        year = int(date_parts[0])
-        month = int(date_parts[1])
-        day = int(date_parts[2])
-        hour = int(time_parts[0])
-        minute = int(time_parts[1])
-        
-        birth_dt = datetime(year, month, day, hour, minute)
+        birth_dt = birth_date.to_datetime()
     else:
         birth_dt = birth_date
     
-    # Get the Yogini Dasha sequence
-    yogini_sequence = get_yogini_sequence(moon_longitude)
-    
-    # Calculate start and end dates for each Mahadasha
-    current_date = birth_dt
-    mahadashas = []
-    
-    for mahadasha in yogini_sequence:
-        planet = mahadasha['planet']
-        years = mahadasha['years']
-        
-        start_date = current_date
-        end_date = add_years_to_date(start_date, years)
-        
-        # Get Antardashas for this Mahadasha
-        antardasha_sequence = get_yogini_antardasha_sequence(planet, years)
-        antardashas = []
-        
-        # Calculate start and end dates for each Antardasha
-        antardasha_date = start_date
-        
-        for antardasha in antardasha_sequence:
-            ad_planet = antardasha['planet']
-            ad_years = antardasha['years']
-            
-            ad_start_date = antardasha_date
-            ad_end_date = add_years_to_date(ad_start_date, ad_years)
-            
-            antardashas.append({
-                'planet': ad_planet,
-                'start_date': ad_start_date,
-                'end_date': ad_end_date,
-                'years': ad_years
-            })
-            
-            antardasha_date = ad_end_date
-        
-        mahadashas.append({
-            'planet': planet,
-            'start_date': start_date,
-            'end_date': end_date,
-            'years': years,
-            'antardashas': antardashas
-        })
-        
-        current_date = end_date
+    # Build the timeline relative to birth and materialize two levels
+    timeline = get_yogini_timeline(0.0, moon_longitude)
+    mahadashas = timeline.to_list(date_converter(birth_dt, 0.0), depth=2)
     
     return {
         'mahadashas': mahadashas,
@@ -286,37 +192,7 @@ def get_current_yogini_dasha(dasha_periods: Dict[str, Any], date: Optional[datet
     if date is None:
         date = datetime.now()
     
-    # Find the current Mahadasha
-    current_mahadasha = None
-    for mahadasha in dasha_periods['mahadashas']:
-        if mahadasha['start_date'] <= date < mahadasha['end_date']:
-            current_mahadasha = mahadasha
-            break
-    
-    if not current_mahadasha:
-        return None
-    
-    # Find the current Antardasha
-    current_antardasha = None
-    for antardasha in current_mahadasha['antardashas']:
-        if antardasha['start_date'] <= date < antardasha['end_date']:
-            current_antardasha = antardasha
-            break
-    
-    if not current_antardasha:
-        return {
-            'mahadasha': current_mahadasha,
-            'antardasha': None
-        }
-    
-    return {
-        'mahadasha': current_mahadasha,
-        'antardasha': current_antardasha,
-        'mahadasha_start': current_mahadasha['start_date'],
-        'mahadasha_end': current_mahadasha['end_date'],
-        'antardasha_start': current_antardasha['start_date'],
-        'antardasha_end': current_antardasha['end_date']
-    }
+    return format_current_dasha(get_current_period(dasha_periods, date))
 
 def get_dasha_balance(chart: Chart) -> float:
     """
@@ -362,13 +238,11 @@ def get_current_dasha(chart: Chart, date: Optional[Datetime] = None) -> Optional
 
     target_date = date if date else chart.date
 
-    # Calculate all dasha periods starting from birth
-    all_periods = calculate_yogini_dasha_periods(chart.date.to_datetime(), moon.lon)
-    
-    # Find the specific dasha for the target date
-    current_dasha_info = get_current_yogini_dasha(all_periods, target_date.to_datetime())
+    # Only the running Mahadasha is expanded
+    timeline = get_yogini_timeline(chart.date.jd, moon.lon)
+    to_date = date_converter(chart.date.to_datetime(), chart.date.jd)
 
-    return current_dasha_info
+    return current_dasha_info(timeline, target_date.jd, to_date)
 
 def get_mahadasha(chart: Chart, date: Optional[Datetime] = None) -> Optional[Dict[str, Any]]:
     """
@@ -0,0 +1,50 @@
+"""
+    Tests for block mapping of batch calculations
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from astrovedic.parallel import map_blocks
+
+
+def _square_block(block):
+    return [item * item for item in block]
+
+
+def _offset_block(offsets, block):
+    return [offsets[item] + item for item in block]
+
+
+class TestParallel(unittest.TestCase):
+    """Test case for map_blocks"""
+
+    def setUp(self):
+        """Set up test case"""
+        self.items = list(range(11))
+        self.offsets = {item: 100 * item for item in self.items}
+
+    def test_serial(self):
+        """Test results are yielded with their item index in order"""
+        results = list(map_blocks(_square_block, iter(self.items), 3))
+        self.assertEqual(results, [(i, i * i) for i in self.items])
+        self.assertEqual(list(map_blocks(_square_block, [], 3)), [])
+
+    def test_shared(self):
+        """Test shared data serially, on an executor and in a process pool"""
+        expected = [(i, 101 * i) for i in self.items]
+        self.assertEqual(list(map_blocks(_offset_block, self.items, 4,
+                                         shared=self.offsets)), expected)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(list(map_blocks(_offset_block, self.items, 4, executor=executor,
+                                             shared=self.offsets)), expected)
+        self.assertEqual(list(map_blocks(_offset_block, self.items, 4, max_workers=2,
+                                         shared=self.offsets)), expected)
+
+    def test_process_pool(self):
+        """Test blocks in a process pool"""
+        self.assertEqual(list(map_blocks(_square_block, self.items, 2, max_workers=2)),
+                         [(i, i * i) for i in self.items])
+
+
+if __name__ == '__main__':
+    unittest.main()
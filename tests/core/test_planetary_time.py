@@ -300,6 +300,59 @@ class TestPlanetaryTime(unittest.TestCase):
                 # Some extreme locations might cause errors
                 print(f"Error for location {pos.lat}°, {pos.lon}°: {str(e)}")
 
+    def test_hora_table(self):
+        """Test the hora service"""
+        start = self.date.jd - 3
+        end = self.date.jd + 40
+        table = planetarytime.getHoraTable(self.pos, start, end, self.date.utcoffset)
+
+        # Whole days of contiguous hours covering the range
+        self.assertEqual(len(table) % 24, 0)
+        self.assertEqual(len(table.starts), len(table) + 1)
+        self.assertLessEqual(table.starts[0], start)
+        self.assertGreater(table.starts[-1], end)
+        for i in range(len(table)):
+            self.assertLess(table.starts[i], table.starts[i + 1])
+
+        # Hours of each day follow the round list from the day ruler
+        for i in range(0, len(table), 24):
+            dow = planetarytime.DAY_RULERS.index(table.hourRuler(i))
+            for n in range(24):
+                self.assertEqual(table.hourRuler(i + n), planetarytime.nthRuler(n, dow))
+
+        # The hour tables are read from the hora service
+        hour_table = planetarytime.getHourTable(self.date, self.pos)
+        index = table.index(self.date.jd)
+        self.assertEqual(hour_table.table[index % 24],
+                         [table.starts[index], table.starts[index + 1],
+                          table.hourRuler(index)])
+        self.assertIsNone(table.index(start - 2))
+
+    def test_hora_at_jd(self):
+        """Test the hora at a Julian day"""
+        for hours in range(0, 48, 5):
+            date = Datetime.fromJD(self.date.jd + hours / 24.0, self.date.utcoffset)
+            info = planetarytime.getHora(date.jd, self.pos, date.utcoffset)
+            curr_info = planetarytime.getHourTable(date, self.pos).currInfo()
+            for key in ('mode', 'ruler', 'dayRuler', 'nightRuler', 'hourRuler',
+                        'hourNumber', 'tableIndex'):
+                self.assertEqual(info[key], curr_info[key])
+            self.assertLessEqual(info['start'], date.jd)
+            self.assertLess(date.jd, info['end'])
+
+    def test_iter_horas(self):
+        """Test the iterator over the horas of a range"""
+        start = self.date.jd
+        end = self.date.jd + 2
+        horas = list(planetarytime.iterHoras(self.pos, start, end, self.date.utcoffset))
+
+        self.assertLessEqual(horas[0]['start'], start)
+        self.assertLess(start, horas[0]['end'])
+        self.assertLessEqual(horas[-1]['start'], end)
+        self.assertLess(end, horas[-1]['end'])
+        for previous, hora in zip(horas, horas[1:]):
+            self.assertEqual(previous['end'], hora['start'])
+
 
 if __name__ == '__main__':
     unittest.main()
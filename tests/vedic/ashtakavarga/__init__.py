@@ -0,0 +1,3 @@
+"""
+Tests for Ashtakavarga modules in astrovedic.vedic
+"""
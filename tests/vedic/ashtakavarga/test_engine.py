@@ -0,0 +1,67 @@
+"""
+    Tests for the bitmask Ashtakavarga engine
+"""
+
+import unittest
+from astrovedic.chart import Chart
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic import const
+from astrovedic.vedic.ashtakavarga import (
+    calculate_bhinnashtakavarga, calculate_sarvashtakavarga,
+    get_sodhita_sarvashtakavarga, get_kaksha_strengths
+)
+from astrovedic.vedic.ashtakavarga.core import (
+    get_benefic_positions, get_benefic_mask, rotate_mask, mask_to_points
+)
+from astrovedic.vedic.ashtakavarga.engine import (
+    ASHTAKAVARGA_PLANETS, get_chart_signs, calculate_bhinna_matrix,
+    calculate_ashtakavarga_batch
+)
+
+
+class TestAshtakavargaEngine(unittest.TestCase):
+    """Test the bitmask Ashtakavarga engine"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.charts = [
+            Chart(Datetime(date, '12:00', '+00:00'), GeoPos('51n30', '0w10'),
+                  hsys=const.HOUSES_WHOLE_SIGN, ayanamsa=const.AY_LAHIRI)
+            for date in ['2000/1/1', '1985/7/14', '2024/3/20']
+        ]
+
+    def test_masks(self):
+        """Test benefic masks and rotation"""
+        positions = get_benefic_positions(const.SUN, const.MOON)
+        mask = get_benefic_mask(const.SUN, const.MOON)
+        self.assertEqual(bin(mask).count('1'), len(positions))
+        points = mask_to_points(rotate_mask(mask, 10))
+        self.assertEqual([i for i in range(12) if points[i]],
+                         sorted((p + 10) % 12 for p in positions))
+        self.assertEqual(rotate_mask(mask, 0), mask)
+        self.assertEqual(rotate_mask(mask, 12), mask)
+
+    def test_bhinna_matrix(self):
+        """Test that the engine matches Bhinnashtakavarga"""
+        chart = self.charts[0]
+        matrix = calculate_bhinna_matrix(get_chart_signs(chart))
+        for planet_id, points in zip(ASHTAKAVARGA_PLANETS, matrix):
+            self.assertEqual(points, calculate_bhinnashtakavarga(chart, planet_id)['points'])
+
+    def test_batch(self):
+        """Test batch calculation across charts"""
+        result = calculate_ashtakavarga_batch([get_chart_signs(chart) for chart in self.charts])
+        self.assertEqual(len(result['sarva']), len(self.charts))
+        for i, chart in enumerate(self.charts):
+            sarva = calculate_sarvashtakavarga(chart)['points']
+            self.assertEqual(result['sarva'][i], sarva)
+            self.assertEqual(sum(result['sarva'][i]), 337)
+            self.assertEqual(result['sodhita'][i], get_sodhita_sarvashtakavarga(sarva))
+            kaksha = get_kaksha_strengths(chart)
+            self.assertEqual(result['kaksha'][i],
+                             [kaksha[planet_id]['kaksha_bala'] for planet_id in ASHTAKAVARGA_PLANETS])
+
+
+if __name__ == '__main__':
+    unittest.main()
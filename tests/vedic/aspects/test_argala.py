@@ -11,6 +11,7 @@ from astrovedic.vedic.argala import (
     get_house_planets, get_argala_houses, get_argala_for_house,
     get_argala_for_planet, get_all_house_argalas, get_all_planet_argalas,
     get_virodhargala_for_house, get_all_house_virodhargalas,
+    get_house_occupancy, get_all_argalas, NATURAL_BENEFICS,
     ARGALA_PRIMARY, ARGALA_SECONDARY, ARGALA_NEUTRALIZED, ARGALA_NONE
 )
 
@@ -274,5 +275,45 @@ class TestVedicArgala(unittest.TestCase):
         is_neutralized = len(second_virodhargala_planets) >= len(second_planets) and len(second_planets) > 0
         self.assertEqual(argala['net_argala'][second_house]['is_neutralized'], is_neutralized)
 
+    def test_house_occupancy(self):
+        """Test the house occupancy vector"""
+        occupancy = get_house_occupancy(self.chart)
+        
+        for house_num in range(1, 13):
+            # Check the planets against a scan of the house sign
+            house_sign = self.chart.getHouse(f'House{house_num}').sign
+            expected = [planet_id for planet_id in const.LIST_SEVEN_PLANETS + [const.RAHU, const.KETU]
+                        if self.chart.getObject(planet_id).sign == house_sign]
+            self.assertEqual(list(occupancy['planets'][house_num - 1]), expected)
+            self.assertEqual(occupancy['counts'][house_num - 1], len(expected))
+            
+            # Check the benefic and malefic counts
+            benefics = [planet_id for planet_id in expected if planet_id in NATURAL_BENEFICS]
+            self.assertEqual(occupancy['benefics'][house_num - 1], len(benefics))
+            self.assertEqual(occupancy['malefics'][house_num - 1], len(expected) - len(benefics))
+        
+        # Each planet is in exactly one house of the default Whole Sign chart
+        self.assertEqual(sum(occupancy['counts']), 9)
+        self.assertEqual(len(occupancy['planet_houses']), 9)
+    
+    def test_get_all_argalas(self):
+        """Test the single pass over all houses and planets"""
+        occupancy = get_house_occupancy(self.chart)
+        all_argalas = get_all_argalas(self.chart)
+        
+        self.assertEqual(all_argalas['occupancy'], occupancy)
+        for house_num in range(1, 13):
+            self.assertEqual(all_argalas['houses'][house_num],
+                             get_argala_for_house(self.chart, house_num))
+            self.assertEqual(all_argalas['virodhargala'][house_num],
+                             get_virodhargala_for_house(self.chart, house_num, occupancy))
+        for planet_id in const.LIST_SEVEN_PLANETS + [const.RAHU, const.KETU]:
+            self.assertEqual(all_argalas['planets'][planet_id],
+                             get_argala_for_planet(self.chart, planet_id, occupancy))
+        
+        # Results do not share the planet lists of the occupancy
+        all_argalas['houses'][1]['argala'][3]['planets'].append(const.SUN)
+        self.assertEqual(all_argalas['occupancy'], occupancy)
+
 if __name__ == '__main__':
     unittest.main()
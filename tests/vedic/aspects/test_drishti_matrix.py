@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test Drishti Matrix
+
+This script tests the chart-wide Graha and Rashi Drishti matrices in astrovedic.
+"""
+
+import unittest
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.chart import Chart
+from astrovedic import const
+from astrovedic.vedic import aspects as vedic_aspects
+from astrovedic.vedic.shadbala import drig_bala
+
+
+class TestDrishtiMatrix(unittest.TestCase):
+    """Test case for the Drishti matrices"""
+
+    def setUp(self):
+        """Set up test case"""
+        date = Datetime('2025/04/09', '20:51', '+05:30')
+        pos = GeoPos(12.9716, 77.5946)  # Bangalore, India
+        self.chart = Chart(date, pos, hsys=const.HOUSES_PLACIDUS, mode=const.AY_LAHIRI)
+        self.drishti = vedic_aspects.get_drishti_matrix(self.chart)
+
+    def test_planet_matrix(self):
+        """Test that the matrix matches the Graha Drishti of each pair"""
+        objects = self.drishti['objects']
+        self.assertEqual(objects, const.LIST_OBJECTS_VEDIC)
+        for i, from_id in enumerate(objects):
+            from_lon = self.chart.getObject(from_id).lon
+            for j, to_id in enumerate(objects):
+                to_lon = self.chart.getObject(to_id).lon
+                info = vedic_aspects.get_graha_drishti_strength(from_id, from_lon, to_lon)
+                self.assertEqual(self.drishti['strength'][i][j], info['strength'])
+                self.assertEqual(self.drishti['type'][i][j], info['type'])
+                self.assertEqual(self.drishti['house_distance'][i][j], info['house_distance'])
+
+    def test_house_matrix(self):
+        """Test the aspects onto the house cusps"""
+        for house_num in range(1, 13):
+            house_lon = self.chart.getHouse(f'House{house_num}').lon
+            expected = []
+            for planet_id in const.LIST_OBJECTS_VEDIC:
+                lon = self.chart.getObject(planet_id).lon
+                info = vedic_aspects.get_graha_drishti_strength(planet_id, lon, house_lon)
+                if info['has_aspect']:
+                    expected.append((planet_id, info['strength'], info['type']))
+            self.assertEqual(vedic_aspects.get_house_aspects_received(self.drishti, house_num),
+                             expected)
+
+    def test_rashi_table(self):
+        """Test the static Rashi Drishti table"""
+        for i, from_sign in enumerate(const.LIST_SIGNS):
+            for j, to_sign in enumerate(const.LIST_SIGNS):
+                info = vedic_aspects.get_rashi_drishti_strength(from_sign, to_sign)
+                self.assertEqual(self.drishti['rashi'][i][j], (info['strength'], info['type']))
+
+    def test_aspect_lists(self):
+        """Test that the aspect lists do not depend on the matrix"""
+        for planet_id in const.LIST_OBJECTS_VEDIC:
+            self.assertEqual(vedic_aspects.get_planet_aspects(self.chart, planet_id, self.drishti),
+                             vedic_aspects.get_planet_aspects(self.chart, planet_id))
+            self.assertEqual(
+                vedic_aspects.get_planet_aspects_received(self.chart, planet_id, self.drishti),
+                vedic_aspects.get_planet_aspects_received(self.chart, planet_id))
+
+        # The static sign aspects are copied for each chart
+        all_aspects = vedic_aspects.get_all_aspects(self.chart, self.drishti)
+        self.assertEqual(all_aspects['sign_aspects'][const.ARIES]['aspects_cast'],
+                         vedic_aspects.get_sign_aspects(const.ARIES))
+        all_aspects['sign_aspects'][const.ARIES]['aspects_cast'][0]['strength'] = 0.0
+        self.assertNotEqual(vedic_aspects.SIGN_ASPECTS[const.ARIES]['aspects_cast'][0]['strength'],
+                            0.0)
+
+    def test_drig_bala(self):
+        """Test that Drig Bala gives the same result with a shared matrix"""
+        for planet_id in const.LIST_SEVEN_PLANETS:
+            self.assertEqual(drig_bala.calculate_drig_bala(self.chart, planet_id, self.drishti),
+                             drig_bala.calculate_drig_bala(self.chart, planet_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+    Tests for batch compatibility analysis
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.chart import Chart
+from astrovedic import const
+from astrovedic.vedic.compatibility.core import get_compatibility_score
+from astrovedic.vedic.compatibility.batch import (
+    get_compatibility_features_batch, calculate_pair_compatibility,
+    iter_compatibility_rows, get_top_matches
+)
+
+
+class TestCompatibilityBatch(unittest.TestCase):
+    """Test case for batch compatibility analysis"""
+
+    def setUp(self):
+        """Set up test case"""
+        pos = GeoPos(12.9716, 77.5946)  # Bangalore, India
+        self.charts = [
+            Chart(Datetime(date, '10:30', '+05:30'), pos, hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
+            for date in ['2025/04/09', '1990/06/15', '1987/11/02', '1995/02/27', '1979/08/21']
+        ]
+        self.date = Datetime('2024/01/01', '00:00', '+00:00')
+        self.features = get_compatibility_features_batch(self.charts, self.date)
+
+    def test_pair_score(self):
+        """Test that feature based scores match get_compatibility_score"""
+        features = get_compatibility_features_batch(self.charts)
+        for i, chart1 in enumerate(self.charts):
+            for j, chart2 in enumerate(self.charts):
+                result = calculate_pair_compatibility(features[i], features[j])
+                self.assertEqual(result['score'], get_compatibility_score(chart1, chart2))
+
+    def test_rows(self):
+        """Test streaming full rows"""
+        rows = list(iter_compatibility_rows(self.features, block_size=2))
+        self.assertEqual([i for i, _ in rows], list(range(len(self.charts))))
+        for i, row in rows:
+            self.assertIsNone(row[i])
+            for j, score in enumerate(row):
+                if j != i:
+                    expected = calculate_pair_compatibility(self.features[i], self.features[j])
+                    self.assertEqual(score, expected['score'])
+
+    def test_top_matches(self):
+        """Test top-k matches, serially, on an executor and in a process pool"""
+        top = get_top_matches(self.features, top_k=2, block_size=2)
+        rows = dict(iter_compatibility_rows(self.features))
+        for i, matches in enumerate(top):
+            expected = sorted(((score, j) for j, score in enumerate(rows[i]) if j != i),
+                              reverse=True)[:2]
+            self.assertEqual(matches, expected)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(get_top_matches(self.features, top_k=2, block_size=2,
+                                             executor=executor), top)
+        self.assertEqual(get_top_matches(self.features, top_k=2, block_size=2,
+                                         max_workers=2), top)
+
+
+if __name__ == '__main__':
+    unittest.main()
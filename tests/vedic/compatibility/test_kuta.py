@@ -16,6 +16,11 @@ from astrovedic.vedic.compatibility.kuta import (
     get_bhakoot_kuta, get_nadi_kuta
 )
 from astrovedic.vedic.compatibility.kuta.total import get_total_kuta_score
+from astrovedic.vedic.compatibility.kuta import get_all_kuta_scores
+from astrovedic.vedic.compatibility.kuta.table import (
+    get_kuta_table, get_pada_index, calculate_pada_kuta_scores,
+    get_kuta_scores_for_candidates, PADA_COUNT, KUTA_NAMES
+)
 
 
 class TestKuta(unittest.TestCase):
@@ -291,5 +296,44 @@ class TestKuta(unittest.TestCase):
             print(f"Description: {total_kuta_score['description']}")
 
 
+class TestKutaTable(unittest.TestCase):
+    """Test case for the precomputed Ashtakoota table"""
+
+    def setUp(self):
+        """Set up test case"""
+        pos = GeoPos(12.9716, 77.5946)  # Bangalore, India
+        self.charts = [
+            Chart(Datetime(date, '10:30', '+05:30'), pos, hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
+            for date in ['2025/04/09', '1990/06/15', '1987/11/02', '1995/02/27']
+        ]
+
+    def test_table_matches_rules(self):
+        """Test that the table matches the Kuta rules for every pada pair"""
+        table = get_kuta_table()
+        for pada1 in range(0, PADA_COUNT, 5):
+            for pada2 in range(PADA_COUNT):
+                scores = calculate_pada_kuta_scores(pada1, pada2)
+                self.assertEqual(table.scores(pada1, pada2), dict(zip(KUTA_NAMES, scores)))
+                self.assertEqual(table.score(pada1, pada2), sum(scores))
+
+    def test_table_matches_charts(self):
+        """Test that the table matches the chart based Kuta functions"""
+        table = get_kuta_table()
+        for chart1 in self.charts:
+            for chart2 in self.charts:
+                pada1 = get_pada_index(chart1.getObject(const.MOON).lon)
+                pada2 = get_pada_index(chart2.getObject(const.MOON).lon)
+                kuta_scores = get_all_kuta_scores(chart1, chart2)['kuta_scores']
+                self.assertEqual(table.scores(pada1, pada2),
+                                 {name: kuta['score'] for name, kuta in kuta_scores.items()})
+
+    def test_one_to_many(self):
+        """Test scoring one Moon against many candidates"""
+        moon_lons = [chart.getObject(const.MOON).lon for chart in self.charts]
+        scores = get_kuta_scores_for_candidates(moon_lons[0], moon_lons)
+        self.assertEqual(scores, [get_total_kuta_score(self.charts[0], chart)['score']
+                                  for chart in self.charts])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,131 @@
+"""
+    Tests for the table-driven dasha engine
+"""
+
+import unittest
+from datetime import datetime
+from astrovedic import const
+from astrovedic.vedic import dasha_engine
+from astrovedic.vedic.dasha_engine import DashaSystem, date_converter
+from astrovedic.vedic import yogini, kalachakra, chara, ashtottari, dashas
+from astrovedic.vedic.jaimini import sthira
+
+
+class TestDashaEngine(unittest.TestCase):
+    """Test the generic dasha engine"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.system = yogini.YOGINI_DASHA
+        self.birth_jd = 2451545.0
+
+    def test_timeline_bounds(self):
+        """Test that Mahadasha boundaries accumulate the periods"""
+        timeline = self.system.timeline(self.birth_jd, 0, 0.5)
+        self.assertEqual(len(timeline), 8)
+        self.assertEqual(timeline.start, self.birth_jd)
+        total_years = 0.5 + sum(self.system.years[1:])
+        self.assertAlmostEqual(timeline.end, self.birth_jd + total_years * 365.25)
+
+    def test_subperiods_fill_parent(self):
+        """Test that sub-periods exactly cover their parent period"""
+        timeline = self.system.timeline(self.birth_jd, 3, 2.0)
+        for i in range(len(timeline)):
+            children = timeline.subperiods(i)
+            self.assertEqual(children.start, timeline.bounds[i])
+            self.assertEqual(children.end, timeline.bounds[i + 1])
+            self.assertEqual(children.lord(0), timeline.lord(i))
+            self.assertAlmostEqual(sum(children.years), timeline.years[i])
+
+    def test_subperiods_are_lazy(self):
+        """Test that sub-periods are expanded once and reused"""
+        timeline = self.system.timeline(self.birth_jd, 0, 1.0)
+        self.assertIs(timeline.subperiods(2), timeline.subperiods(2))
+
+    def test_locate(self):
+        """Test bisect lookup against a linear scan"""
+        timeline = self.system.timeline(self.birth_jd, 5, 3.0)
+        for offset in [0.0, 100.0, 2000.0, 9000.0]:
+            jd = self.birth_jd + offset
+            path = timeline.locate(jd, 2)
+            self.assertEqual(len(path), 2)
+            for level, index in path:
+                self.assertLessEqual(level.bounds[index], jd)
+                self.assertLess(jd, level.bounds[index + 1])
+
+    def test_locate_outside(self):
+        """Test lookup outside the timeline"""
+        timeline = self.system.timeline(self.birth_jd, 0, 1.0)
+        self.assertEqual(timeline.locate(self.birth_jd - 1), [])
+        self.assertEqual(timeline.locate(timeline.end + 1), [])
+
+    def test_lookup(self):
+        """Test batch lookup and next change boundaries"""
+        timeline = self.system.timeline(self.birth_jd, 2, 1.5)
+        jds = [self.birth_jd + i * 45.0 for i in range(300)]
+        result = timeline.lookup(jds, depth=2)
+        for jd, lords, next_change in zip(jds, result['lords'], result['next_change']):
+            path = timeline.locate(jd, 2)
+            if not path:
+                self.assertEqual(lords, (None, None))
+                self.assertIsNone(next_change)
+                continue
+            self.assertEqual(lords, tuple(level.lord(i) for level, i in path))
+            level, i = path[-1]
+            self.assertEqual(next_change, level.bounds[i + 1])
+
+    def test_reverse_direction(self):
+        """Test a reverse running sequence"""
+        system = DashaSystem('Test', ['A', 'B', 'C'], {'A': 1, 'B': 2, 'C': 3})
+        timeline = system.timeline(0.0, 0, 1.0, forward=False)
+        self.assertEqual([timeline.lord(i) for i in range(3)], ['A', 'C', 'B'])
+        children = timeline.subperiods(1)
+        self.assertEqual([children.lord(i) for i in range(3)], ['C', 'B', 'A'])
+
+    def test_to_list(self):
+        """Test materialization as nested dictionaries"""
+        birth = datetime(2000, 1, 1, 12, 0)
+        timeline = chara.CHARA_DASHA.timeline(0.0, 0, 10.0)
+        periods = timeline.to_list(date_converter(birth, 0.0), depth=2)
+        self.assertEqual(periods[0]['sign'], const.ARIES)
+        self.assertEqual(periods[0]['start_date'], birth)
+        self.assertEqual(len(periods[0]['antardashas']), 12)
+        self.assertEqual(periods[1]['start_date'], periods[0]['end_date'])
+
+
+class TestDashaSystems(unittest.TestCase):
+    """Test the dasha systems built on the engine"""
+
+    def test_kalachakra_direction(self):
+        """Test that Kalachakra keeps its direction in sub-periods"""
+        periods = kalachakra.calculate_kalachakra_dasha_periods(
+            datetime(2000, 1, 1), 20.0)
+        sequence = kalachakra.get_kalachakra_antardasha_sequence(
+            periods['mahadashas'][0]['planet'], periods['mahadashas'][0]['years'],
+            periods['is_forward'])
+        antardashas = periods['mahadashas'][0]['antardashas']
+        self.assertEqual([ad['planet'] for ad in antardashas],
+                         [ad['planet'] for ad in sequence])
+
+    def test_current_period_lookup(self):
+        """Test lookup in materialized periods"""
+        birth = datetime(1990, 6, 15, 6, 30)
+        periods = sthira.calculate_sthira_dasha_periods(birth, const.LEO, 12.0)
+        date = datetime(2030, 1, 1)
+        current = sthira.get_current_sthira_dasha(periods, date)
+        self.assertLessEqual(current['mahadasha_start'], date)
+        self.assertLess(date, current['mahadasha_end'])
+        self.assertLessEqual(current['antardasha_start'], date)
+        self.assertLess(date, current['antardasha_end'])
+
+        self.assertIsNone(sthira.get_current_sthira_dasha(periods, datetime(1980, 1, 1)))
+
+    def test_date_helpers(self):
+        """Test that the dasha modules still provide the date helpers"""
+        for module in (yogini, kalachakra, chara, ashtottari, dashas, sthira):
+            self.assertIs(module.years_to_days, dasha_engine.years_to_days)
+            self.assertIs(module.add_years_to_date, dasha_engine.add_years_to_date)
+
+
+if __name__ == '__main__':
+    unittest.main()
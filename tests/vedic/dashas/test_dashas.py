@@ -44,6 +44,26 @@ class TestVimshottariDasha(unittest.TestCase):
         if antardasha:
             self.assertIn(antardasha, const.LIST_OBJECTS_TRADITIONAL)
 
+    def test_current_dashas_batch(self):
+        """Test batch lookup against single date lookups"""
+        jds = [self.date.jd + i * 97.5 for i in range(-2, 400)]
+        result = vimshottari.get_current_dashas(self.chart, jds)
+        self.assertEqual(len(result['mahadasha']), len(jds))
+
+        for i, jd in enumerate(jds):
+            dasha = vimshottari.get_current_dasha(self.chart, Datetime.fromJD(jd, '+00:00'))
+            if dasha is None:
+                self.assertIsNone(result['mahadasha'][i])
+                continue
+            self.assertEqual(result['mahadasha'][i], dasha['mahadasha'])
+            self.assertEqual(result['antardasha'][i], dasha['antardasha'])
+            self.assertEqual(result['pratyantardasha'][i], dasha['pratyantardasha'])
+            self.assertGreater(result['next_change'][i], jd)
+
+        # Queries before birth point to the start of the first Mahadasha
+        self.assertIsNone(result['mahadasha'][0])
+        self.assertEqual(result['next_change'][0], self.date.jd)
+
 class TestYoginiDasha(unittest.TestCase):
     """Test Yogini Dasha calculations"""
 
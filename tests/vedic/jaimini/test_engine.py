@@ -0,0 +1,84 @@
+"""
+    Tests for the Jaimini engine
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from astrovedic.chart import Chart
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic import const
+from astrovedic.vedic.jaimini.arudha import get_lagna_pada, get_upapada_lagna, LAGNA_PADA
+from astrovedic.vedic.jaimini.drishti import (
+    JAIMINI_PLANETS, get_jaimini_rashi_drishti_info, get_all_jaimini_sign_aspects,
+    get_jaimini_planet_aspects, get_jaimini_planet_aspects_received
+)
+from astrovedic.vedic.jaimini.karakas import calculate_chara_karakas
+from astrovedic.vedic.jaimini.engine import (
+    DRISHTI_TABLES, evaluate_jaimini, get_jaimini, get_jaimini_facts, iter_jaimini
+)
+
+
+class TestJaiminiEngine(unittest.TestCase):
+    """Test the Jaimini engine"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.charts = [
+            Chart(Datetime('2025/04/09', '20:51', '+05:30'), GeoPos(12.9716, 77.5946),
+                  hsys=const.HOUSES_PLACIDUS, mode=const.AY_LAHIRI),
+            Chart(Datetime('1987/11/23', '04:10', '+01:00'), GeoPos(59.91, 10.75),
+                  hsys=const.HOUSES_PLACIDUS, mode=const.AY_LAHIRI),
+            Chart(Datetime('2000/1/1', '12:00', '+00:00'), GeoPos('51n30', '0w10'))
+        ]
+
+    def test_drishti_tables(self):
+        """Test the static Jaimini Rashi Drishti tables"""
+        for include in (True, False):
+            for i, from_sign in enumerate(const.LIST_SIGNS):
+                for j, to_sign in enumerate(const.LIST_SIGNS):
+                    info = get_jaimini_rashi_drishti_info(from_sign, to_sign, include)
+                    entry = DRISHTI_TABLES[include][i][j]
+                    if i == j or not info['has_aspect']:
+                        self.assertIsNone(entry)
+                    else:
+                        self.assertEqual(entry, (info['type'], info['sign_distance'],
+                                                 info['is_mutual']))
+
+        # The sign aspects are copied for each call
+        aspects = get_all_jaimini_sign_aspects()
+        aspects[const.ARIES]['aspects_cast'].clear()
+        self.assertTrue(get_all_jaimini_sign_aspects()[const.ARIES]['aspects_cast'])
+
+    def test_evaluate(self):
+        """Test that the engine matches the per-factor functions"""
+        for chart in self.charts:
+            factors = get_jaimini(chart)
+            self.assertEqual(factors['arudha_padas'][LAGNA_PADA], get_lagna_pada(chart))
+            self.assertEqual(factors['upapada'], get_upapada_lagna(chart))
+            self.assertEqual(factors['chara_karakas'], calculate_chara_karakas(chart))
+            self.assertEqual(set(factors['graha_padas']), set(JAIMINI_PLANETS))
+
+            for include in (True, False):
+                planet_aspects = get_jaimini(chart, include)['planet_aspects']
+                for planet_id in JAIMINI_PLANETS:
+                    self.assertEqual(planet_aspects[planet_id]['aspects_cast'],
+                                     get_jaimini_planet_aspects(chart, planet_id, include))
+                    self.assertEqual(planet_aspects[planet_id]['aspects_received'],
+                                     get_jaimini_planet_aspects_received(chart, planet_id,
+                                                                         include))
+
+    def test_iter_jaimini(self):
+        """Test the batch evaluation of many charts"""
+        facts = [get_jaimini_facts(chart) for chart in self.charts]
+        expected = [(i, evaluate_jaimini(chart_facts, False))
+                    for i, chart_facts in enumerate(facts)]
+
+        self.assertEqual(list(iter_jaimini(facts, False, block_size=2)), expected)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(list(iter_jaimini(facts, False, block_size=1,
+                                               executor=executor)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -441,5 +441,60 @@ class TestKP(unittest.TestCase):
                 delattr(Datetime, 'dayofweek')
 
 
+class TestKPTables(unittest.TestCase):
+    """Test case for the static KP boundary tables"""
+
+    def test_table_sizes(self):
+        """Test the number of sub and sub-sub divisions"""
+        self.assertEqual(len(kp.KP_SUB_TABLE), 249)
+        self.assertEqual(len(kp.KP_SUB_SUB_TABLE), 2193)
+
+    def test_divisions_within_one_sign(self):
+        """Test that no division crosses a sign boundary"""
+        for table in (kp.KP_SUB_TABLE, kp.KP_SUB_SUB_TABLE):
+            starts = list(table.starts) + [360.0]
+            for i in range(len(table)):
+                self.assertLess(starts[i], starts[i + 1])
+                self.assertEqual(int(starts[i] // 30), table.sign[i])
+                self.assertLessEqual(starts[i + 1], (table.sign[i] + 1) * 30 + 1e-9)
+
+    def test_known_sublords(self):
+        """Test sub lords at known positions"""
+        # The first sub of Ashwini belongs to Ketu, the second to Venus
+        self.assertEqual(kp.get_kp_sublord(0.5)['sub_lord'], const.KETU)
+        self.assertEqual(kp.get_kp_sublord(1.0)['sub_lord'], const.VENUS)
+
+        # Krittika's Rahu sub is split by the Aries/Taurus boundary
+        before = kp.get_kp_lords(29.9)
+        after = kp.get_kp_lords(30.1)
+        self.assertEqual(before['sub_lord'], const.RAHU)
+        self.assertEqual(after['sub_lord'], const.RAHU)
+        self.assertNotEqual(before['sign_lord'], after['sign_lord'])
+
+    def test_horary_numbers(self):
+        """Test KP horary number lookup"""
+        self.assertEqual(kp.get_kp_horary_number(0.0), 1)
+        self.assertEqual(kp.get_kp_horary_number(359.99), 249)
+
+        position = kp.get_kp_horary_position(1)
+        self.assertEqual(position['start_longitude'], 0.0)
+        self.assertEqual(position['sub_lord'], const.KETU)
+
+        for number in (1, 10, 100, 249):
+            position = kp.get_kp_horary_position(number)
+            middle = (position['start_longitude'] + position['end_longitude']) / 2
+            self.assertEqual(kp.get_kp_horary_number(middle), number)
+
+        with self.assertRaises(ValueError):
+            kp.get_kp_horary_position(250)
+
+    def test_batch_lookup(self):
+        """Test batch lookup against scalar lookup"""
+        longitudes = [i * 0.37 for i in range(973)]
+        batch = kp.get_kp_lords_batch(longitudes)
+        for lon, lords in zip(longitudes, batch):
+            self.assertEqual(lords, kp.get_kp_lords(lon))
+
+
 if __name__ == '__main__':
     unittest.main()
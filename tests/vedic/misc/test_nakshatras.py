@@ -0,0 +1,75 @@
+"""
+    Tests for the canonical nakshatra index lookup
+"""
+
+import random
+import unittest
+from astrovedic import const
+from astrovedic.vedic import nakshatras, nakshatras_cached
+from astrovedic.vedic.nakshatras import (
+    get_nakshatra, get_nakshatra_index, get_nakshatra_lord,
+    NAKSHATRA_SPAN, PADA_SPAN
+)
+from astrovedic.vedic.sarvatobhadra.core import get_nakshatra_from_longitude
+
+
+class TestNakshatraIndex(unittest.TestCase):
+    """Test the nakshatra index lookup"""
+
+    def setUp(self):
+        """Set up test data"""
+        rng = random.Random(29)
+        self.longitudes = [rng.uniform(0, 360) for _ in range(500)]
+        self.longitudes += [0.0, NAKSHATRA_SPAN, PADA_SPAN * 3.5, 359.999]
+
+    def test_scalar(self):
+        """Test a scalar lookup"""
+        self.assertEqual(get_nakshatra_index(0.0), (0, 1, 0.0))
+        index, pada, degree = get_nakshatra_index(125.5)
+        self.assertEqual(index, 9)
+        self.assertEqual(pada, 2)
+        self.assertAlmostEqual(degree, 125.5 - 9 * NAKSHATRA_SPAN)
+
+    def test_sequence(self):
+        """Test that a sequence matches scalar lookups"""
+        indexes, padas, degrees = get_nakshatra_index(self.longitudes)
+        self.assertEqual(len(indexes), len(self.longitudes))
+        for i, lon in enumerate(self.longitudes):
+            self.assertEqual((indexes[i], padas[i], degrees[i]),
+                             get_nakshatra_index(lon))
+
+    def test_numpy_array(self):
+        """Test element-wise lookup on a NumPy array"""
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest('numpy is not installed')
+        indexes, padas, degrees = get_nakshatra_index(numpy.array(self.longitudes))
+        expected = get_nakshatra_index(self.longitudes)
+        self.assertEqual(list(indexes), list(expected[0]))
+        self.assertEqual(list(padas), list(expected[1]))
+        self.assertEqual(list(degrees), list(expected[2]))
+
+    def test_shared_lookups(self):
+        """Test that all nakshatra lookups agree"""
+        for lon in self.longitudes:
+            index, pada, _ = get_nakshatra_index(lon)
+            info = get_nakshatra(lon)
+            self.assertEqual(info['index'], index)
+            self.assertEqual(info['pada'], pada)
+            self.assertEqual(info, nakshatras_cached.get_nakshatra(lon))
+            self.assertEqual(get_nakshatra_lord(lon), info['lord'])
+            self.assertEqual(nakshatras.get_nakshatra_pada(lon), pada)
+            self.assertEqual(get_nakshatra_from_longitude(lon), index + 1)
+
+    def test_details(self):
+        """Test the materialized nakshatra dictionary"""
+        info = get_nakshatra(0.5)
+        self.assertEqual(info['name'], nakshatras.ASHWINI)
+        self.assertEqual(info['lord'], const.KETU)
+        self.assertEqual(info['element'], const.FIRE)
+        self.assertEqual(info['dosha'], const.VATA)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+    Tests for the planetary state kernel
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from astrovedic.chart import Chart
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic import const
+from astrovedic.vedic.avasthas import get_all_avasthas, get_all_planets_avasthas
+from astrovedic.vedic.combustion import get_combustion_details, get_all_combustion_details
+from astrovedic.vedic.dignities import (
+    get_dignity_class, get_dignity_name, get_dignity_score,
+    DIGNITY_EXALTED, DIGNITY_MOOLATRIKONA, DIGNITY_OWN_SIGN, DIGNITY_FRIEND,
+    DIGNITY_NEUTRAL, DIGNITY_ENEMY, DIGNITY_DEBILITATED
+)
+from astrovedic.vedic.planet_states import (
+    STATE_PLANETS, evaluate_planet_states, get_planet_states, get_state_facts,
+    iter_planet_states
+)
+
+class TestPlanetStates(unittest.TestCase):
+    """Test the planetary state kernel"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.charts = [
+            Chart(Datetime('2000/1/1', '12:00', '+00:00'), GeoPos('51n30', '0w10')),
+            # Retrograde Mercury close to the Sun
+            Chart(Datetime('2025/03/24', '12:00', '+00:00'), GeoPos(12.9716, 77.5946),
+                  mode=const.AY_LAHIRI),
+            Chart(Datetime('1987/11/23', '04:10', '+01:00'), GeoPos(59.91, 10.75),
+                  mode=const.AY_LAHIRI)
+        ]
+
+    def test_planet_states(self):
+        """Test that the kernel matches the per-planet functions"""
+        for chart in self.charts:
+            states = get_planet_states(chart)
+            self.assertEqual(states['planets'], STATE_PLANETS)
+
+            for i, planet_id in enumerate(STATE_PLANETS):
+                planet = chart.getObject(planet_id)
+
+                # Avasthas
+                avasthas = get_all_avasthas(chart, planet_id)
+                self.assertEqual(states['baladi'][i], avasthas['baladi']['avastha'])
+                self.assertEqual(states['jagradadi'][i], avasthas['jagradadi']['avastha'])
+                self.assertEqual(states['lajjitadi'][i], avasthas['lajjitadi']['avastha'])
+                self.assertEqual(states['lajjitadi_combust'][i], avasthas['lajjitadi']['is_combust'])
+
+                # Combustion
+                details = get_combustion_details(chart, planet_id)
+                for column, value in details.items():
+                    self.assertEqual(states[column][i], value)
+
+                # Dignity
+                self.assertEqual(states['dignity'][i],
+                                 get_dignity_name(planet_id, planet.sign, planet.signlon))
+                self.assertEqual(states['dignity_score'][i],
+                                 get_dignity_score(planet_id, planet.sign, planet.signlon)['score'])
+                self.assertEqual(states['dignity_class'][i],
+                                 get_dignity_class(planet_id, planet.sign, planet.signlon))
+
+            # The chart-wide functions can share the states
+            self.assertEqual(get_all_planets_avasthas(chart, states),
+                             get_all_planets_avasthas(chart))
+            self.assertEqual(get_all_combustion_details(chart, states),
+                             get_all_combustion_details(chart))
+
+        # Retrograde Mercury has a smaller combustion orb
+        states = get_planet_states(self.charts[1])
+        mercury = STATE_PLANETS.index(const.MERCURY)
+        self.assertTrue(states['retrograde'][mercury])
+        self.assertEqual(states['combustion_orb'][mercury], 12)
+
+    def test_dignity_classes(self):
+        """Test the dignity classes"""
+        self.assertEqual(get_dignity_class(const.SUN, const.ARIES, 20), DIGNITY_EXALTED)
+        self.assertEqual(get_dignity_class(const.SUN, const.LEO, 10), DIGNITY_MOOLATRIKONA)
+        self.assertEqual(get_dignity_class(const.SUN, const.LEO, 25), DIGNITY_OWN_SIGN)
+        self.assertEqual(get_dignity_class(const.SUN, const.SCORPIO, 10), DIGNITY_FRIEND)
+        self.assertEqual(get_dignity_class(const.SUN, const.GEMINI, 10), DIGNITY_NEUTRAL)
+        self.assertEqual(get_dignity_class(const.SUN, const.TAURUS, 10), DIGNITY_ENEMY)
+        self.assertEqual(get_dignity_class(const.SUN, const.LIBRA, 10), DIGNITY_DEBILITATED)
+
+    def test_iter_planet_states(self):
+        """Test the batch evaluation of many charts"""
+        facts = [get_state_facts(chart) for chart in self.charts]
+        expected = [(i, evaluate_planet_states(chart_facts))
+                    for i, chart_facts in enumerate(facts)]
+
+        self.assertEqual(list(iter_planet_states(facts, block_size=2)), expected)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(list(iter_planet_states(facts, block_size=1, executor=executor)),
+                             expected)
+
+if __name__ == '__main__':
+    unittest.main()
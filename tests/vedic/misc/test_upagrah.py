@@ -13,7 +13,8 @@ from astrovedic import const
 from astrovedic.vedic.upagrah import (
     calculate_gulika, calculate_mandi, calculate_dhuma,
     calculate_vyatipata, calculate_parivesha, calculate_indrachapa,
-    calculate_upaketu, get_upagrah, get_upagrah_positions
+    calculate_upaketu, get_upagrah, get_upagrah_positions,
+    calculate_upagrah_longitudes, get_upagrah_longitudes, get_upagrah_series
 )
 
 
@@ -218,6 +219,33 @@ class TestUpagrah(unittest.TestCase):
         # Indrachapa = Parivesha + 180
         self.assertAlmostEqual(indrachapa_lon, (parivesha_lon + 180) % 360, places=2)
 
+    
+    def test_upagrah_longitudes(self):
+        """Test the longitudes of all Upagrah at once"""
+        # The engine matches the individual calculations
+        longitudes = get_upagrah_longitudes(self.jd)
+        self.assertEqual(list(longitudes), const.LIST_SHADOW_PLANETS)
+        for upagrah_id, longitude in longitudes.items():
+            self.assertEqual(longitude, get_upagrah(upagrah_id, self.jd, self.lat, self.lon)['lon'])
+        
+        # Upagrah are derived from the Sun and Saturn only
+        longitudes = calculate_upagrah_longitudes(100.0, 200.0)
+        self.assertEqual(longitudes[const.GULIKA], 240.0)
+        self.assertEqual(longitudes[const.MANDI], 230.0)
+        self.assertEqual(longitudes[const.UPAKETU], 130.0)
+        self.assertEqual(longitudes[const.MRITYU], 355.0)
+        self.assertAlmostEqual(longitudes[const.DHUMA], 126 + 40/60)
+    
+    def test_upagrah_series(self):
+        """Test the Upagrah longitudes for many Julian days"""
+        jds = [self.jd + hour / 24 for hour in range(24)]
+        series = get_upagrah_series(jds)
+        
+        self.assertEqual(series['jd'], tuple(jds))
+        for i, jd in enumerate(jds):
+            for upagrah_id, longitude in get_upagrah_longitudes(jd).items():
+                self.assertEqual(series[upagrah_id][i], longitude)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,48 @@
+"""
+    Tests for the Muhurta activity search
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.vedic.muhurta.core import get_auspicious_times
+from astrovedic.vedic.muhurta.activities import (
+    get_activity_rules, get_activity_score, get_best_time_for_activity
+)
+
+
+class ActivitiesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.start = Datetime('2025/04/20', '00:00', '+05:30')
+        self.end = Datetime('2025/04/22', '00:00', '+05:30')
+        self.location = GeoPos('12n58', '77e35')
+        self.activity = 'travel'
+
+    def test_best_time(self):
+        """Test that the best time is the best scored auspicious period"""
+        best = get_best_time_for_activity(self.start, self.end, self.location, self.activity)
+        min_duration = get_activity_rules(self.activity)['min_duration']
+        periods = get_auspicious_times(self.start, self.end, self.location, min_duration)
+        percentages = [get_activity_score(period['start'], self.location, self.activity)['percentage']
+                       for period in periods]
+        self.assertEqual(best['score']['percentage'], max(percentages))
+        self.assertEqual(best['start'].jd, periods[percentages.index(max(percentages))]['start'].jd)
+
+    def test_parallel(self):
+        """Test that the executor modes give the serial result"""
+        serial = get_best_time_for_activity(self.start, self.end, self.location, self.activity)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = get_best_time_for_activity(self.start, self.end, self.location,
+                                                  self.activity, executor=executor)
+        pooled = get_best_time_for_activity(self.start, self.end, self.location,
+                                            self.activity, max_workers=2)
+        for result in (threaded, pooled):
+            self.assertEqual(result['start'].jd, serial['start'].jd)
+            self.assertEqual(result['end'].jd, serial['end'].jd)
+            self.assertEqual(result['score']['percentage'], serial['score']['percentage'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ This script tests the core Muhurta (electional astrology) calculations in astrov
 
 import unittest
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from astrovedic.datetime import Datetime
 from astrovedic.geopos import GeoPos
 from astrovedic.chart import Chart
@@ -185,6 +186,22 @@ class TestMuhurtaCore(unittest.TestCase):
         for i, period in enumerate(auspicious_times):
             print(f"{i+1}. {period['start'].strftime()} to {period['end'].strftime()} - {period['quality']} (Duration: {period['duration']} minutes)")
 
+    def test_get_auspicious_times_parallel(self):
+        """Test get_auspicious_times with day blocks on an executor"""
+        start_date = Datetime('2025/04/20', '00:00', '+05:30')
+        end_date = Datetime('2025/04/22', '00:00', '+05:30')
+
+        serial = get_auspicious_times(start_date, end_date, self.location)
+        self.assertGreater(len(serial), 1)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = get_auspicious_times(start_date, end_date, self.location,
+                                            executor=executor)
+        pooled = get_auspicious_times(start_date, end_date, self.location, max_workers=2)
+        for periods in (threaded, pooled):
+            self.assertEqual([(p['start'].jd, p['end'].jd, p['duration'], p['quality']) for p in periods],
+                             [(p['start'].jd, p['end'].jd, p['duration'], p['quality']) for p in serial])
+
     def test_get_inauspicious_times(self):
         """Test get_inauspicious_times function"""
         # Define a date range (24 hours)
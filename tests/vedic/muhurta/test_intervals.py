@@ -0,0 +1,81 @@
+"""
+    Tests for the interval based Muhurta engine
+"""
+
+import unittest
+from astrovedic import const
+from astrovedic.chart import Chart
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.vedic.muhurta.core import get_house_number, get_muhurta_quality
+from astrovedic.vedic.muhurta.panchanga import get_panchanga
+from astrovedic.vedic.muhurta.intervals import (
+    union_intervals, intersect_intervals, subtract_intervals,
+    get_factor_timelines, get_kala_intervals, merge_timelines,
+    get_segment_score, get_muhurta_windows, CHART_SCORE_MARGIN
+)
+
+
+class TestMuhurtaIntervals(unittest.TestCase):
+    """Test the interval based Muhurta engine"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.location = GeoPos(12.9716, 77.5946)  # Bangalore, India
+        self.start = Datetime('2025/04/09', '00:00', '+05:30')
+        self.end = Datetime('2025/04/12', '00:00', '+05:30')
+
+    def test_interval_algebra(self):
+        """Test union, intersection and subtraction of intervals"""
+        self.assertEqual(union_intervals([(3, 4), (0, 1), (1, 2)]), [(0, 2), (3, 4)])
+        self.assertEqual(intersect_intervals([(0, 2), (3, 5)], [(1, 4)]), [(1, 2), (3, 4)])
+        self.assertEqual(subtract_intervals([(0, 10)], [(1, 2), (4, 5), (9, 11)]),
+                         [(0, 1), (2, 4), (5, 9)])
+
+    def test_segments_match_charts(self):
+        """Test that segment factors match charts built inside the segments"""
+        segments = merge_timelines(get_factor_timelines(self.start.jd, self.end.jd, self.location))
+        self.assertEqual(segments[0][0], self.start.jd)
+        self.assertEqual(segments[-1][1], self.end.jd)
+
+        for start, end, values in segments[::5]:
+            date = Datetime.fromJD((start + end) / 2, self.start.utcoffset)
+            chart = Chart(date, self.location, hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
+            panchanga = get_panchanga(chart)
+            for factor in ('tithi', 'nakshatra', 'yoga', 'karana', 'vara'):
+                self.assertEqual(values[factor], panchanga[factor]['num'])
+            self.assertEqual(values['lagna'], chart.getAngle(const.ASC).sign)
+            self.assertEqual(values['moon_house'], get_house_number(chart, const.MOON))
+
+    def test_segment_score_margin(self):
+        """Test that chart scores are within the margin of the segment scores"""
+        segments = merge_timelines(get_factor_timelines(self.start.jd, self.end.jd, self.location))
+        for start, end, values in segments[::5]:
+            date = Datetime.fromJD((start + end) / 2, self.start.utcoffset)
+            chart = Chart(date, self.location, hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
+            difference = get_muhurta_quality(chart)['score'] - get_segment_score(values)
+            self.assertLessEqual(abs(difference), CHART_SCORE_MARGIN)
+
+    def test_windows(self):
+        """Test that windows meet the score, filters and Kala exclusion"""
+        filters = {'vara': [2, 4, 5, 6]}
+        windows = get_muhurta_windows(self.start, self.end, self.location,
+                                      min_score=2, min_duration=30, filters=filters)
+        self.assertTrue(windows)
+
+        kalas = get_kala_intervals(self.start.jd, self.end.jd, self.location, self.start.utcoffset)
+        segments = merge_timelines(get_factor_timelines(self.start.jd, self.end.jd, self.location))
+        for window in windows:
+            start, end = window['start'].jd, window['end'].jd
+            self.assertGreaterEqual(window['duration'], 30)
+            self.assertGreaterEqual(window['score'], 2)
+            for intervals in kalas.values():
+                self.assertEqual(intersect_intervals([(start, end)], intervals), [])
+            for seg_start, seg_end, values in segments:
+                if seg_start < end and seg_end > start:
+                    self.assertIn(values['vara'], filters['vara'])
+                    self.assertGreaterEqual(get_segment_score(values), window['score'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+    Tests for the streaming Panchang calendar
+"""
+
+import io
+import csv
+import unittest
+from unittest.mock import patch
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.vedic.panchang import get_panchang
+from astrovedic.vedic.panchang_calendar import (
+    PANCHANG_COLUMNS, iter_panchang, write_panchang_csv, write_panchang_arrow
+)
+
+
+class TestPanchangCalendar(unittest.TestCase):
+    """Test the streaming Panchang calendar"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.pos = GeoPos(12.9716, 77.5946)  # Bangalore, India
+        self.start = Datetime('2024/01/01', '00:00', '+05:30')
+        self.end = Datetime('2024/02/10', '00:00', '+05:30')
+        self.ayanamsa = 'Ayanamsa Lahiri'
+
+    def test_records(self):
+        """Test that daily records match get_panchang after sunrise"""
+        records = list(iter_panchang(self.pos, self.start, self.end, self.ayanamsa))
+        self.assertEqual(len(records), 41)
+
+        for record in records:
+            self.assertEqual(record['date'].date.jdn, record['sunrise'].date.jdn)
+            jd = record['sunrise'].jd + 0.01
+            panchang = get_panchang(jd, self.pos.lat, self.pos.lon,
+                                    self.start.utcoffset, self.ayanamsa)
+
+            for element in ('tithi', 'nakshatra', 'yoga', 'karana'):
+                if record[element]['end'].jd > jd:
+                    self.assertEqual(record[element]['index'], panchang[element]['index'])
+            self.assertEqual(record['vara']['index'], panchang['vara']['index'])
+            for period in ('rahukala', 'yamaganda', 'gulika_kala', 'abhijit_muhurta'):
+                self.assertAlmostEqual(record[period]['start'].jd, panchang[period]['start'].jd, places=6)
+                self.assertAlmostEqual(record[period]['end'].jd, panchang[period]['end'].jd, places=6)
+
+    def test_csv(self):
+        """Test CSV output"""
+        output = io.StringIO()
+        records = iter_panchang(self.pos, self.start, self.end, self.ayanamsa)
+        self.assertEqual(write_panchang_csv(records, output), 41)
+
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        self.assertEqual(len(rows), 41)
+        self.assertEqual(list(rows[0].keys()), [name for name, _ in PANCHANG_COLUMNS])
+        self.assertEqual(rows[0]['date'], '2024/01/01')
+
+    def test_arrow_without_pyarrow(self):
+        """Test that a missing pyarrow keeps the original import error"""
+        with patch.dict('sys.modules', {'pyarrow': None}):
+            with self.assertRaises(ImportError) as context:
+                write_panchang_arrow([], 'panchang.arrow')
+        self.assertIsInstance(context.exception.__cause__, ImportError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+    Tests for the Panchang transition engine
+"""
+
+import unittest
+from astrovedic.datetime import Datetime
+from astrovedic.vedic.panchang import (
+    get_tithi, get_karana, get_yoga, get_nakshatra, get_bhadra_karana
+)
+from astrovedic.vedic.panchang_transitions import (
+    TITHI, KARANA, NAKSHATRA, YOGA, get_transitions, get_element_period,
+    get_transition_table
+)
+
+
+class TestPanchangTransitions(unittest.TestCase):
+    """Test Panchang transition calculations"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.date = Datetime('2000/1/1', '12:00', '+00:00')
+        self.jd = self.date.jd
+        self.ayanamsa = 'Ayanamsa Lahiri'
+        self.functions = {
+            TITHI: get_tithi,
+            KARANA: get_karana,
+            NAKSHATRA: get_nakshatra,
+            YOGA: get_yoga
+        }
+
+    def test_transitions(self):
+        """Test that transitions match the instantaneous elements"""
+        table = get_transition_table(self.jd, self.jd + 30, self.ayanamsa)
+        for element, function in self.functions.items():
+            periods = table[element]
+            self.assertLessEqual(periods['start'][0], self.jd)
+            self.assertGreaterEqual(periods['end'][-1], self.jd + 30)
+            self.assertEqual(list(periods['start'][1:]), list(periods['end'][:-1]))
+            for index, start, end in zip(periods['index'], periods['start'], periods['end']):
+                self.assertLess(start, end)
+                self.assertEqual(function(start + 1e-5, self.ayanamsa)['index'], index)
+                self.assertEqual(function(end - 1e-5, self.ayanamsa)['index'], index)
+
+    def test_counts(self):
+        """Test the number of periods in a synodic month"""
+        periods = get_transitions(TITHI, self.jd, self.jd + 29.5)
+        self.assertIn(len(periods['index']), (30, 31))
+        periods = get_transitions(KARANA, self.jd, self.jd + 29.5)
+        self.assertIn(len(periods['index']), (60, 61))
+
+    def test_element_period(self):
+        """Test the period active at an instant"""
+        period = get_element_period(NAKSHATRA, self.jd, self.ayanamsa)
+        self.assertLessEqual(period['start'], self.jd)
+        self.assertGreater(period['end'], self.jd)
+        self.assertEqual(period['index'], get_nakshatra(self.jd, self.ayanamsa)['index'])
+
+    def test_bhadra_karana(self):
+        """Test that Bhadra Karana timings are Vishti karana boundaries"""
+        for offset in range(10):
+            bhadra_info = get_bhadra_karana(self.jd + offset, self.date.utcoffset)
+            if bhadra_info['is_vishti']:
+                middle = (bhadra_info['start'].jd + bhadra_info['end'].jd) / 2
+                self.assertEqual(get_karana(middle)['name'], 'Vishti')
+                self.assertLessEqual(bhadra_info['start'].jd, self.jd + offset + 1)
+                self.assertGreater(bhadra_info['end'].jd, self.jd + offset)
+
+
+if __name__ == '__main__':
+    unittest.main()
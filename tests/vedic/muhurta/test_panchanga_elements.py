@@ -8,8 +8,11 @@ from astrovedic.geopos import GeoPos
 from astrovedic.vedic.panchang import (
     get_tithi, get_karana, get_yoga, get_vara, get_nakshatra,
     get_bhadra_karana, get_panchaka_dosha, get_chandra_bala,
-    get_panchang
+    get_panchang, get_hora
 )
+from astrovedic.tools import planetarytime
+from astrovedic.vedic.muhurta import get_hora as get_muhurta_hora
+from astrovedic.vedic import panchang_cached
 
 class TestPanchangaElements(unittest.TestCase):
     """Test Panchanga elements calculations"""
@@ -175,5 +178,71 @@ class TestPanchangaElements(unittest.TestCase):
         self.assertIn('panchaka_dosha', panchang_info)
         self.assertIn('abhijit_muhurta', panchang_info)
 
+    def test_get_hora(self):
+        """Test hora calculation"""
+        hora_info = get_hora(self.jd, self.lat, self.lon, self.utcoffset)
+        hour_info = planetarytime.getHourTable(self.date, self.pos).currInfo()
+
+        # Saturday noon is in the day horas
+        self.assertTrue(hora_info['is_day'])
+        self.assertEqual(hora_info['index'], hour_info['hourNumber'] - 1)
+        self.assertEqual(hora_info['ruler'], hour_info['hourRuler'])
+
+        # The Muhurta hora is read from the same table
+        muhurta_hora = get_muhurta_hora(self.date, self.pos)
+        self.assertEqual(muhurta_hora['lord'], hora_info['ruler'])
+        self.assertTrue(muhurta_hora['is_day'])
+        self.assertLessEqual(muhurta_hora['start'].jd, self.jd)
+        self.assertLess(self.jd, muhurta_hora['end'].jd)
+        self.assertGreaterEqual(muhurta_hora['elapsed'], 0)
+        self.assertLess(muhurta_hora['elapsed'], 1)
+
+    def test_get_hora_east(self):
+        """Test hora calculation at an eastern longitude"""
+        date = Datetime('2024/06/15', '12:00', '+09:00')
+        pos = GeoPos('35n41', '139e42')
+
+        # Tokyo sunrise is on the previous UTC date, but the hora day
+        # is Saturday, so the 7th day hora is ruled by the Moon
+        hora_info = get_hora(date.jd, pos.lat, pos.lon, date.utcoffset)
+        self.assertTrue(hora_info['is_day'])
+        self.assertEqual(hora_info['index'], 6)
+        self.assertEqual(hora_info['ruler'], 'Moon')
+
+        # Without an offset the local mean time gives the same day
+        self.assertEqual(get_hora(date.jd, pos.lat, pos.lon), hora_info)
+        cached_hora = panchang_cached.get_panchang(date.jd, pos.lat, pos.lon)['hora']
+        self.assertEqual(cached_hora['lord'], 'Moon')
+
+    def test_hora_reference(self):
+        """Test day and night hora lords against the Chaldean sequence"""
+        # (date, time, UTC offset, location, index, is_day, lord). The
+        # night horas continue the day sequence from the 13th hora, and
+        # the hours before sunrise belong to the previous day.
+        tokyo = GeoPos('35n41', '139e42')
+        new_york = GeoPos('40n43', '74w00')
+        references = [
+            # Saturday 2024/06/15 in Tokyo
+            ('2024/06/15', '05:00', '+09:00', tokyo, 0, True, 'Saturn'),
+            ('2024/06/15', '12:00', '+09:00', tokyo, 6, True, 'Moon'),
+            ('2024/06/15', '22:00', '+09:00', tokyo, 3, False, 'Jupiter'),
+            ('2024/06/16', '03:00', '+09:00', tokyo, 10, False, 'Jupiter'),
+            # Sunday 2024/06/16 in Tokyo
+            ('2024/06/16', '06:00', '+09:00', tokyo, 1, True, 'Venus'),
+            # Tuesday 2024/06/18 in New York
+            ('2024/06/18', '12:00', '-04:00', new_york, 5, True, 'Saturn'),
+            ('2024/06/18', '23:00', '-04:00', new_york, 3, False, 'Sun'),
+            ('2024/06/19', '04:00', '-04:00', new_york, 10, False, 'Sun'),
+        ]
+        for date_str, time_str, offset, pos, index, is_day, lord in references:
+            date = Datetime(date_str, time_str, offset)
+            expected = {'index': index, 'ruler': lord, 'is_day': is_day}
+            self.assertEqual(get_hora(date.jd, pos.lat, pos.lon, offset), expected)
+            self.assertEqual(get_hora(date.jd, pos.lat, pos.lon), expected)
+
+            muhurta_hora = get_muhurta_hora(date, pos)
+            self.assertEqual(muhurta_hora['lord'], lord)
+            self.assertEqual(muhurta_hora['is_day'], is_day)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+"""
+    Tests for the day partitioned Muhurta search
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from astrovedic import const
+from astrovedic.chart import Chart
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.vedic.muhurta.panchanga import get_panchanga
+from astrovedic.vedic.muhurta.activities import get_activity_rules
+from astrovedic.vedic.muhurta.intervals import get_panchanga_timelines
+from astrovedic.vedic.muhurta.search import (
+    ACTIVITY_FACTORS, PERIOD_POINTS, BOUND_MARGIN, get_activity_upper_bound,
+    get_day_chunks, find_best_times_for_activity, _get_timeline_bound, _search_chunk
+)
+
+
+def panchanga_scorer(date, location, activity):
+    """Score the Panchanga factors like get_activity_score, with varying planet points"""
+    chart = Chart(date, location, hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
+    panchanga = get_panchanga(chart)
+    rules = get_activity_rules(activity)
+
+    score = len(rules['important_planets']) * (int(date.jd * 24) % 3) / 2
+    max_score = len(rules['important_planets']) + PERIOD_POINTS
+    for factor, name, weight in ACTIVITY_FACTORS:
+        max_score += weight
+        value = panchanga[factor]['num']
+        if value in rules[f'auspicious_{name}']:
+            score += weight
+        elif value not in rules[f'inauspicious_{name}']:
+            score += weight / 2
+    return {'percentage': (score / max_score) * 100}
+
+
+class TestMuhurtaSearch(unittest.TestCase):
+    """Test the day partitioned Muhurta search"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.location = GeoPos(12.9716, 77.5946)  # Bangalore, India
+        self.start = Datetime('2025/04/09', '06:00', '+05:30')
+        self.end = Datetime('2025/04/19', '00:00', '+05:30')
+        self.activity = 'travel'
+
+    def test_day_chunks(self):
+        """Test that chunks cover the range and split at local midnights"""
+        chunks = get_day_chunks(self.start, self.end, chunk_days=3)
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(chunks[0][0], self.start.jd)
+        self.assertEqual(chunks[-1][1], self.end.jd)
+        self.assertAlmostEqual(chunks[0][1], Datetime('2025/04/12', '00:00', '+05:30').jd)
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+
+    def test_window_bound(self):
+        """Test that bounds from the chunk timelines match get_activity_upper_bound"""
+        start, end = get_day_chunks(self.start, self.end)[0]
+        rules = get_activity_rules(self.activity)
+        timelines = get_panchanga_timelines(start - BOUND_MARGIN, end + BOUND_MARGIN)
+        for i in range(0, 25):
+            jd = start + i * (end - start) / 24
+            bound = _get_timeline_bound(rules, timelines, jd - BOUND_MARGIN, jd + BOUND_MARGIN)
+            self.assertEqual(bound, get_activity_upper_bound(jd, jd, self.activity))
+
+    def test_search_matches_exhaustive(self):
+        """Test that pruned searches return the exhaustive top-k"""
+        expected = []
+        for start, end in get_day_chunks(self.start, self.end):
+            results = _search_chunk(start, end, self.location, self.activity,
+                                    self.start.utcoffset, 1000, -1, panchanga_scorer)
+            for result in results:
+                bound = get_activity_upper_bound(start, end, self.activity)
+                self.assertLessEqual(result['score']['percentage'], bound)
+            expected.extend(results)
+        expected.sort(key=lambda result: (-result['score']['percentage'], result['start'].jd))
+        expected = [result['start'].jd for result in expected[:3]]
+
+        serial = find_best_times_for_activity(
+            self.start, self.end, self.location, self.activity, top_k=3,
+            scorer=panchanga_scorer)
+        self.assertEqual(len(serial), 3)
+        for result, start in zip(serial, expected):
+            self.assertAlmostEqual(result['start'].jd, start, places=5)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = find_best_times_for_activity(
+                self.start, self.end, self.location, self.activity, top_k=3,
+                executor=executor, scorer=panchanga_scorer)
+        self.assertEqual(len(threaded), 3)
+        for result, start in zip(threaded, expected):
+            self.assertAlmostEqual(result['start'].jd, start, places=5)
+
+    def test_activity_score_search(self):
+        """Test the search with get_activity_score at a real location"""
+        end = Datetime('2025/04/12', '00:00', '+05:30')
+        serial = find_best_times_for_activity(
+            self.start, end, self.location, self.activity, top_k=3)
+        self.assertEqual(len(serial), 3)
+        for result in serial:
+            self.assertIn('factors', result['score'])
+
+        pooled = find_best_times_for_activity(
+            self.start, end, self.location, self.activity, top_k=3, max_workers=2)
+        self.assertEqual([result['start'].jd for result in pooled],
+                         [result['start'].jd for result in serial])
+        self.assertEqual([result['score']['percentage'] for result in pooled],
+                         [result['score']['percentage'] for result in serial])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test Sarvatobhadra Chakra Templates
+
+This script tests the Sarvatobhadra Chakra templates and Vedha lines in astrovedic.
+"""
+
+import unittest
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.chart import Chart
+from astrovedic import const
+from astrovedic.vedic.sarvatobhadra.chakra import (
+    CHAKRA_PATTERN, DIRECTIONS, DIRECTION_CELLS, create_chakra,
+    get_chakra_template, get_vedha_cells, get_vedha_nakshatras,
+    get_nakshatras_in_direction, get_planets_in_direction
+)
+from astrovedic.vedic.sarvatobhadra.core import get_sarvatobhadra_chakra
+from astrovedic.vedic.sarvatobhadra.directions import get_direction_quality
+
+
+class TestSarvatobhadraChakra(unittest.TestCase):
+    """Test case for the Sarvatobhadra Chakra templates"""
+
+    def setUp(self):
+        """Set up test case"""
+        date = Datetime('2025/04/09', '20:51', '+05:30')
+        pos = GeoPos(12.9716, 77.5946)  # Bangalore, India
+        self.chart = Chart(date, pos, hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
+
+    def test_templates(self):
+        """Test the grids and positions of the templates"""
+        for janma_nakshatra in range(1, 28):
+            template = get_chakra_template(janma_nakshatra)
+            grid = create_chakra(janma_nakshatra)['grid']
+            self.assertEqual(grid, [list(row) for row in template['grid']])
+            self.assertEqual(grid[4][4], janma_nakshatra)
+            for i, (row, col) in enumerate(CHAKRA_PATTERN):
+                self.assertEqual(grid[row][col], (janma_nakshatra - 1 + i) % 27 + 1)
+
+            # Each nakshatra is placed at its first cell in row order
+            for nakshatra in range(1, 28):
+                cells = [(row, col) for row in range(9) for col in range(9)
+                         if grid[row][col] == nakshatra]
+                self.assertEqual(template['positions'][nakshatra], cells[0])
+
+            for direction in DIRECTIONS:
+                self.assertEqual(list(template['direction_nakshatras'][direction]),
+                                 get_nakshatras_in_direction({'grid': grid}, direction))
+
+        # The grid of a chakra is a copy of the template
+        chakra = create_chakra(1)
+        chakra['grid'][0][0] = 0
+        self.assertNotEqual(get_chakra_template(1)['grid'][0][0], 0)
+
+    def test_vedha_lines(self):
+        """Test the Vedha lines of the cells"""
+        self.assertEqual(len(get_vedha_cells(4, 4)), 32)
+        self.assertEqual(len(get_vedha_cells(0, 0)), 24)
+        self.assertIn((8, 8), get_vedha_cells(0, 0))
+        self.assertIn((0, 8), get_vedha_cells(8, 0))
+        self.assertNotIn((1, 2), get_vedha_cells(0, 0))
+        self.assertNotIn((4, 4), get_vedha_cells(4, 4))
+
+        chakra = create_chakra(1)
+        self.assertEqual(get_vedha_nakshatras(chakra, 4, 4)[:8], chakra['grid'][0][:1] +
+                         chakra['grid'][0][4:5] + chakra['grid'][0][8:9] +
+                         chakra['grid'][1][1:2] + chakra['grid'][1][4:5] +
+                         chakra['grid'][1][7:8] + chakra['grid'][2][2:3] +
+                         chakra['grid'][2][4:5])
+
+    def test_directions(self):
+        """Test the planets and quality of the directions"""
+        chakra = get_sarvatobhadra_chakra(self.chart)
+        for direction in DIRECTIONS:
+            expected = [planet_id for planet_id, planet in chakra['planets'].items()
+                        if planet['position'] in DIRECTION_CELLS[direction]]
+            self.assertEqual(get_planets_in_direction(chakra, direction), expected)
+
+            quality = get_direction_quality(chakra, direction)
+            self.assertEqual(quality['direction'], direction)
+            self.assertIn(quality['quality'], ['Excellent', 'Good', 'Neutral',
+                                               'Inauspicious', 'Highly Inauspicious'])
+
+        # Unknown directions have no cells
+        quality = get_direction_quality(chakra, 'Up')
+        self.assertEqual(quality['factors'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
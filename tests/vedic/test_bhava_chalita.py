@@ -3,6 +3,7 @@
 """
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from astrovedic.chart import Chart
 from astrovedic.datetime import Datetime
 from astrovedic.geopos import GeoPos
@@ -10,7 +11,9 @@ from astrovedic import const
 from astrovedic.vedic.bhava_chalita import (
     get_bhava_chalita_chart, get_bhava_chalita_house_for_planet,
     get_bhava_chalita_planets_in_house, get_bhava_chalita_house_lord,
-    get_bhava_chalita_house_strength
+    get_bhava_chalita_house_strength, get_chalita_cusps, get_chalita_houses,
+    get_chalita_facts, evaluate_bhava_chalita, iter_bhava_chalita,
+    get_bhava_chalita_timeline, is_in_range, CHALITA_PLANETS
 )
 
 class TestBhavaChalita(unittest.TestCase):
@@ -166,5 +169,63 @@ class TestBhavaChalita(unittest.TestCase):
             # Allow for a small floating-point error
             self.assertAlmostEqual(next_cusp, expected_next_cusp, places=10)
 
+    def test_chalita_houses(self):
+        """Test the binary search placement against the house ranges"""
+        for asc_lon in [0.0, 17.25, 29.999999999, 345.5, 359.9999999999]:
+            cusps = get_chalita_cusps(asc_lon)
+            lons = list(cusps) + [cusp + 15 for cusp in cusps] + [0.0, 359.99999999999994]
+            for lon, house_num in zip(lons, get_chalita_houses(cusps, lons)):
+                expected = [num for num in range(1, 13)
+                            if is_in_range(lon, cusps[num - 1], cusps[num % 12])]
+                self.assertEqual(expected, [house_num])
+
+    def test_iter_bhava_chalita(self):
+        """Test the placement of many charts"""
+        charts = [self.chart] + [
+            Chart(Datetime('2025/04/09', f'{hour:02d}:00', '+05:30'), GeoPos(12.9716, 77.5946),
+                  hsys=const.HOUSES_PLACIDUS, mode=const.AY_LAHIRI)
+            for hour in range(0, 24, 6)
+        ]
+        facts = [get_chalita_facts(chart) for chart in charts]
+        expected = [(i, evaluate_bhava_chalita(chart_facts))
+                    for i, chart_facts in enumerate(facts)]
+
+        for (i, placement), chart in zip(expected, charts):
+            houses = [get_bhava_chalita_house_for_planet(chart, planet_id)
+                      for planet_id in CHALITA_PLANETS]
+            self.assertEqual(list(placement['houses']), houses)
+
+        self.assertEqual(list(iter_bhava_chalita(facts, block_size=2)), expected)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(list(iter_bhava_chalita(facts, block_size=1, executor=executor)),
+                             expected)
+
+    def test_bhava_chalita_timeline(self):
+        """Test the Bhava Chalita timeline at a location"""
+        start_jd = self.chart.date.jd
+        periods = get_bhava_chalita_timeline(self.pos, start_jd, start_jd + 1, step=1 / 24)
+
+        # The Ascendant moves through all houses in a day
+        self.assertGreater(len(periods), 1)
+        self.assertEqual(periods[0]['start'], start_jd)
+        self.assertEqual(periods[-1]['end'], start_jd + 1)
+        for period, next_period in zip(periods, periods[1:]):
+            self.assertEqual(period['end'], next_period['start'])
+            self.assertNotEqual(period['houses'], next_period['houses'])
+
+        # The first period matches the chart at the start
+        for planet_id, house_num in periods[0]['houses'].items():
+            self.assertEqual(house_num, get_bhava_chalita_house_for_planet(self.chart, planet_id))
+
+    def test_bhava_chalita_timeline_workers(self):
+        """Test that the timeline charts calculated in workers match"""
+        start_jd = self.chart.date.jd
+        expected = get_bhava_chalita_timeline(self.pos, start_jd, start_jd + 2)
+        self.assertEqual(get_bhava_chalita_timeline(self.pos, start_jd, start_jd + 2,
+                                                    max_workers=2), expected)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(get_bhava_chalita_timeline(self.pos, start_jd, start_jd + 2,
+                                                        executor=executor), expected)
+
 if __name__ == '__main__':
     unittest.main()
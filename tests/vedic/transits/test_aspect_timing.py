@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Tests for the aspect timing engine.
+"""
+
+import unittest
+from collections import Counter
+from astrovedic import const
+from astrovedic import angle
+from astrovedic.datetime import Datetime
+from astrovedic.vedic.transits.ingress import get_body_position
+from astrovedic.vedic.transits.aspect_timing import (
+    NATAL, DEFAULT_ASPECTS, iter_aspect_events, find_aspect_events
+)
+
+
+class TestAspectTiming(unittest.TestCase):
+    """Test cases for the aspect timing engine."""
+
+    def setUp(self):
+        self.start = Datetime('2025/01/01', '00:00', '+00:00').jd
+        self.natal = {const.SUN: 100.0, const.MOON: 200.5, const.ASC: 10.2}
+        self.bodies = [const.SUN, const.MOON, const.MERCURY, const.MARS, const.SATURN]
+
+    def test_exact_aspects(self):
+        """Test that every event is an exact aspect and the stream is sorted."""
+        events = list(iter_aspect_events(self.start, self.start + 120, self.bodies,
+                                         self.natal, transit_pairs=True))
+        self.assertEqual([event['jd'] for event in events],
+                         sorted(event['jd'] for event in events))
+        for event in events:
+            lon = get_body_position(event['body'], event['jd'])[0]
+            if event['target_type'] == NATAL:
+                base = self.natal[event['target']]
+            else:
+                base = get_body_position(event['target'], event['jd'])[0]
+            separation = abs(angle.closestdistance(base, lon))
+            self.assertAlmostEqual(separation, event['aspect'], places=4)
+
+    def test_moon_aspects(self):
+        """Test fast Moon aspects against a fine sampling."""
+        end = self.start + 30
+        events = find_aspect_events(self.start, end, [const.MOON], self.natal)
+        counts = Counter((event['target'], event['aspect']) for event in events)
+
+        for name, base in self.natal.items():
+            for aspect in DEFAULT_ASPECTS:
+                targets = sorted({aspect % 360, (-aspect) % 360})
+                crossings = 0
+                previous = None
+                for step in range(3001):
+                    lon = get_body_position(const.MOON, self.start + step * 0.01)[0]
+                    distances = [angle.closestdistance(base + target, lon) for target in targets]
+                    if previous:
+                        for d0, d1 in zip(previous, distances):
+                            if (d0 < 0) != (d1 < 0) and abs(d1 - d0) < 180:
+                                crossings += 1
+                    previous = distances
+                self.assertEqual(counts[(name, aspect)], crossings)
+
+    def test_transit_pair_aspects(self):
+        """Test Moon to Sun conjunctions and oppositions against a fine sampling."""
+        end = self.start + 90
+        events = find_aspect_events(self.start, end, [const.MOON], aspects=(0, 180),
+                                    transit_pairs=[(const.MOON, const.SUN)])
+        counts = Counter(event['aspect'] for event in events)
+
+        crossings = Counter()
+        previous = None
+        for step in range(9001):
+            jd = self.start + step * 0.01
+            elongation = get_body_position(const.MOON, jd)[0] - get_body_position(const.SUN, jd)[0]
+            distances = [angle.closestdistance(aspect, elongation) for aspect in (0, 180)]
+            if previous:
+                for aspect, d0, d1 in zip((0, 180), previous, distances):
+                    if (d0 < 0) != (d1 < 0) and abs(d1 - d0) < 180:
+                        crossings[aspect] += 1
+            previous = distances
+        self.assertEqual(crossings[0], 3)
+        self.assertEqual(counts, crossings)
+
+    def test_zero_natal_point(self):
+        """Test forward passes over a natal point at 0 degrees."""
+        events = find_aspect_events(self.start, self.start + 60, [const.MOON],
+                                    {const.ASC: 0.0}, aspects=[0])
+        self.assertEqual(len(events), 2)
+        for event in events:
+            lon = get_body_position(const.MOON, event['jd'])[0]
+            self.assertAlmostEqual(abs(angle.closestdistance(0, lon)), 0, places=4)
+
+    def test_retrograde_passes(self):
+        """Test the triple pass of Mercury over a natal point."""
+        events = find_aspect_events(self.start, self.start + 365, [const.MERCURY],
+                                    {const.ASC: 10.2}, aspects=[90])
+        retrograde = [event for event in events if event['retrograde']]
+        self.assertEqual(len(retrograde), 1)
+        index = events.index(retrograde[0])
+        self.assertFalse(events[index - 1]['retrograde'])
+        self.assertFalse(events[index + 1]['retrograde'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Tests for batch Gochara scoring.
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from astrovedic import const
+from astrovedic.chart import Chart
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.vedic.transits.core import get_transit_chart
+from astrovedic.vedic.transits.gochara import get_gochara_effects
+from astrovedic.vedic.transits.ashtakavarga import get_transit_ashtakavarga
+from astrovedic.vedic.transits.batch import (
+    GOCHARA_OBJECTS, get_transit_state, get_gochara_features,
+    score_gochara, iter_gochara_scores
+)
+
+
+class TestGocharaBatch(unittest.TestCase):
+    """Test cases for batch Gochara scoring."""
+
+    def setUp(self):
+        self.transit_date = Datetime('2025/04/09', '20:51', '+05:30')
+        self.charts = [
+            Chart(Datetime('1985/03/12', '06:30', '+05:30'), GeoPos(12.97, 77.59),
+                  hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI),
+            Chart(Datetime('1992/11/03', '22:10', '+01:00'), GeoPos(48.85, 2.35),
+                  hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI),
+            Chart(Datetime('2001/07/21', '13:45', '-05:00'), GeoPos(40.71, -74.0),
+                  hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
+        ]
+        self.state = get_transit_state(self.transit_date)
+
+    def test_matches_single_chart(self):
+        """Test that batch scores match the per chart Gochara analysis."""
+        for chart in self.charts:
+            scores = score_gochara(self.state, get_gochara_features(chart))
+            transit_chart = get_transit_chart(chart, self.transit_date)
+            gochara = get_gochara_effects(chart, transit_chart)
+            ashtakavarga = get_transit_ashtakavarga(chart, transit_chart)
+
+            for planet_id in GOCHARA_OBJECTS:
+                score = scores['gochara'][planet_id]
+                expected = gochara[planet_id]
+                self.assertEqual(score['house'], expected['house'])
+                self.assertEqual(score['moon_house'], expected['moon_house'])
+                self.assertEqual(score['effect'], expected['effect'])
+                self.assertEqual(score['vedha_count'], len(expected['vedha_effects']))
+                self.assertEqual(score['argala_count'], len(expected['argala_effects']))
+                self.assertEqual(score['strength'], expected['strength'])
+                self.assertEqual(scores['ashtakavarga'][planet_id]['bindus'],
+                                 ashtakavarga[planet_id]['bindus'])
+                self.assertEqual(scores['sarvashtakavarga'][planet_id]['bindus'],
+                                 ashtakavarga['sarvashtakavarga'][planet_id]['bindus'])
+
+    def test_iter_scores(self):
+        """Test scoring many charts in blocks on an executor."""
+        features = [get_gochara_features(chart) for chart in self.charts] * 5
+        serial = list(iter_gochara_scores(self.state, features, block_size=4))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = list(iter_gochara_scores(self.state, features, block_size=4,
+                                                executor=executor))
+        self.assertEqual([index for index, _ in serial], list(range(15)))
+        self.assertEqual(serial, threaded)
+        self.assertEqual(serial[3][1], serial[0][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
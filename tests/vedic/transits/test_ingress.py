@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Tests for the ingress catalog.
+"""
+
+import os
+import tempfile
+import unittest
+from astrovedic import const
+from astrovedic.datetime import Datetime
+from astrovedic.vedic.transits.ingress import (
+    SIGN, NAKSHATRA, PADA, PADA_SPAN, INGRESS_OBJECTS,
+    IngressCatalog, get_body_position
+)
+
+
+class TestIngressCatalog(unittest.TestCase):
+    """Test cases for the ingress catalog."""
+
+    def setUp(self):
+        self.start = Datetime('2025/01/01', '00:00', '+00:00').jd
+        self.end = self.start + 365
+        self.catalog = IngressCatalog.build(self.start, self.end)
+
+    def test_pada_ingresses(self):
+        """Test that every pada ingress changes the pada of the body."""
+        for obj in INGRESS_OBJECTS:
+            table = self.catalog.tables[obj]
+            self.assertEqual(list(table['jd']), sorted(table['jd']))
+            for jd, pada in zip(table['jd'], table['pada']):
+                self.assertEqual(int(get_body_position(obj, jd + 1e-5)[0] / PADA_SPAN), pada)
+
+    def test_index_at(self):
+        """Test the division occupied at sampled times."""
+        for obj in INGRESS_OBJECTS:
+            for day in range(0, 365, 3):
+                jd = self.start + day + 0.3
+                lon = get_body_position(obj, jd)[0]
+                self.assertEqual(self.catalog.get_index_at(obj, jd, SIGN), int(lon / 30))
+                self.assertEqual(self.catalog.get_index_at(obj, jd, NAKSHATRA), int(lon / (360 / 27)))
+                self.assertEqual(self.catalog.get_index_at(obj, jd, PADA), int(lon / PADA_SPAN))
+
+    def test_retrograde_ingresses(self):
+        """Test sign re-entries of retrograde planets."""
+        ingresses = self.catalog.get_ingresses(const.MERCURY, SIGN)
+        self.assertTrue(any(ingress['retrograde'] for ingress in ingresses))
+        for previous, ingress in zip(ingresses, ingresses[1:]):
+            if ingress['retrograde']:
+                self.assertEqual(ingress['index'], (previous['index'] - 1) % 12)
+
+        # Rahu and Ketu are always retrograde
+        for ingress in self.catalog.get_ingresses(const.RAHU, SIGN):
+            self.assertTrue(ingress['retrograde'])
+
+    def test_queries(self):
+        """Test range and next/last ingress queries."""
+        ingresses = self.catalog.get_ingresses(const.SUN, SIGN, self.start, self.start + 100)
+        self.assertIn(len(ingresses), (3, 4))
+
+        ingress = self.catalog.next_ingress(const.SUN, self.start, SIGN, 1)
+        self.assertEqual(ingress['name'], const.TAURUS)
+        self.assertLess(get_body_position(const.SUN, ingress['jd'] - 1e-4)[0], 30)
+        self.assertGreaterEqual(get_body_position(const.SUN, ingress['jd'] + 1e-4)[0], 30)
+
+        last = self.catalog.last_ingress(const.SUN, ingress['jd'] + 1, SIGN)
+        self.assertEqual(last['jd'], ingress['jd'])
+        self.assertIsNone(self.catalog.next_ingress(const.SUN, self.end, SIGN))
+
+    def test_persistence(self):
+        """Test saving and loading a catalog."""
+        handle, path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        try:
+            self.catalog.save(path)
+            loaded = IngressCatalog.load(path)
+        finally:
+            os.remove(path)
+
+        self.assertEqual(loaded.start_jd, self.catalog.start_jd)
+        for obj in INGRESS_OBJECTS:
+            self.assertEqual(loaded.get_ingresses(obj, NAKSHATRA),
+                             self.catalog.get_ingresses(obj, NAKSHATRA))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Tests for the Tara Bala and Chandra Bala calendars.
+"""
+
+import unittest
+from astrovedic import const
+from astrovedic.chart import Chart
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.vedic.nakshatras import LIST_NAKSHATRAS, get_nakshatra_index
+from astrovedic.vedic.panchang import get_chandra_bala
+from astrovedic.vedic.sarvatobhadra.tara import get_current_tara
+from astrovedic.vedic.transits.ingress import get_body_position
+from astrovedic.vedic.transits.lunar_calendar import (
+    get_tara_bala_periods, get_chandra_bala_periods,
+    get_lunar_strength_calendar, get_lunar_calendar
+)
+
+
+class TestLunarCalendar(unittest.TestCase):
+    """Test cases for the lunar strength calendars."""
+
+    def setUp(self):
+        self.start = Datetime('2025/03/01', '00:00', '+00:00').jd
+        self.end = self.start + 31
+
+    def _moon_lon(self, jd):
+        return get_body_position(const.MOON, jd, const.AY_LAHIRI)[0]
+
+    def test_tara_bala_periods(self):
+        """Test that the Tara periods follow the Moon nakshatra."""
+        periods = get_tara_bala_periods('Rohini', self.start, self.end)
+        self.assertEqual(periods[0]['start'], self.start)
+        self.assertEqual(periods[-1]['end'], self.end)
+        self.assertGreaterEqual(len(periods), 27)
+        rohini = LIST_NAKSHATRAS.index('Rohini')
+        for period in periods:
+            nakshatra = get_nakshatra_index(self._moon_lon((period['start'] + period['end']) / 2))[0]
+            self.assertEqual(LIST_NAKSHATRAS[nakshatra], period['nakshatra'])
+            self.assertEqual(get_current_tara(rohini, nakshatra), period['tara'])
+
+    def test_chandra_bala_periods(self):
+        """Test that the Chandra Bala periods match get_chandra_bala."""
+        periods = get_chandra_bala_periods('Cancer', self.start, self.end)
+        for previous, period in zip(periods, periods[1:]):
+            self.assertEqual(previous['end'], period['start'])
+        for period in periods:
+            jd = (period['start'] + period['end']) / 2
+            expected = get_chandra_bala(jd, 4, const.AY_LAHIRI)
+            self.assertEqual(const.LIST_SIGNS[expected['current_moon_house'] - 1], period['sign'])
+            for key in expected:
+                self.assertEqual(period[key], expected[key])
+
+    def test_calendar(self):
+        """Test that the intervals intersect both calendars."""
+        calendar = get_lunar_strength_calendar(3, 3, self.start, self.end)
+        intervals = calendar['intervals']
+        self.assertEqual(intervals[0]['start'], self.start)
+        self.assertEqual(intervals[-1]['end'], self.end)
+        boundaries = {period['end'] for period in calendar['tara_bala']}
+        boundaries |= {period['end'] for period in calendar['chandra_bala']}
+        self.assertEqual({interval['end'] for interval in intervals}, boundaries)
+        for interval in intervals:
+            self.assertLess(interval['start'], interval['end'])
+            lon = self._moon_lon((interval['start'] + interval['end']) / 2)
+            self.assertEqual(const.LIST_SIGNS[int(lon / 30)], interval['sign'])
+            self.assertEqual(get_current_tara(3, get_nakshatra_index(lon)[0]), interval['tara'])
+        self.assertTrue(any(interval['is_favorable'] for interval in intervals))
+
+    def test_chart_calendar(self):
+        """Test the calendar of a natal chart."""
+        chart = Chart(Datetime('1990/01/01', '12:00', '+05:30'), GeoPos(12.9716, 77.5946),
+                      hsys=const.HOUSES_WHOLE_SIGN, mode=const.AY_LAHIRI)
+        moon = chart.getObject(const.MOON)
+        self.assertEqual(get_lunar_calendar(chart, self.start, self.end),
+                         get_lunar_strength_calendar(get_nakshatra_index(moon.lon)[0], moon.sign,
+                                                     self.start, self.end))
+
+
+if __name__ == '__main__':
+    unittest.main()
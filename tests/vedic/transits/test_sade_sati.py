@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Tests for the Sade Sati and Saturn cycle timelines.
+"""
+
+import unittest
+from astrovedic import const
+from astrovedic.chart import Chart
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.vedic.transits.ingress import get_body_position
+from astrovedic.vedic.transits.sade_sati import (
+    SADE_SATI, DHAIYA, ASHTAMA_SHANI, SATURN_PERIODS,
+    get_saturn_sign_periods, get_saturn_cycle_timeline, get_sade_sati_timeline
+)
+
+
+class TestSadeSati(unittest.TestCase):
+    """Test cases for the Saturn cycle timelines."""
+
+    def setUp(self):
+        self.start = Datetime('1990/01/01', '00:00', '+00:00').jd
+        self.end = self.start + 60 * 365.25
+
+    def _saturn_sign(self, jd):
+        lon = get_body_position(const.SATURN, jd, const.AY_LAHIRI)[0]
+        return int(lon / 30) % 12
+
+    def test_sign_periods(self):
+        """Test that the sign periods cover the range and match Saturn."""
+        periods = get_saturn_sign_periods(self.start, self.end)
+        self.assertEqual(periods[0][0], self.start)
+        self.assertEqual(periods[-1][1], self.end)
+        for (_, end, _, _), (start, _, _, _) in zip(periods, periods[1:]):
+            self.assertEqual(end, start)
+        for start, end, sign, _ in periods:
+            self.assertEqual(self._saturn_sign((start + end) / 2), sign)
+
+    def test_timeline(self):
+        """Test that the periods follow the sign distance from the Moon."""
+        timeline = get_saturn_cycle_timeline('Aries', self.start, self.end)
+        types = {period['type'] for period in timeline['periods']}
+        self.assertEqual(types, {SADE_SATI, DHAIYA, ASHTAMA_SHANI})
+        for period in timeline['periods']:
+            sign = self._saturn_sign((period['start'] + period['end']) / 2)
+            self.assertEqual(const.LIST_SIGNS[sign], period['sign'])
+            self.assertEqual(SATURN_PERIODS[sign % 12][1], period['phase'])
+
+        # Saturn re-enters Pisces retrograde during the 2025 Sade Sati
+        spans = timeline['sade_sati']
+        self.assertTrue(any(period['retrograde_entry']
+                            for span in spans for period in span['phases']))
+        for span in spans:
+            self.assertEqual(span['start'], span['phases'][0]['start'])
+            self.assertEqual(span['end'], span['phases'][-1]['end'])
+        self.assertTrue(all(span['phases'][0]['start'] < span['phases'][-1]['end']
+                            for span in spans))
+
+    def test_chart_timeline(self):
+        """Test the lifetime timeline of a natal chart."""
+        date = Datetime('1990/01/01', '12:00', '+05:30')
+        chart = Chart(date, GeoPos(12.9716, 77.5946), hsys=const.HOUSES_WHOLE_SIGN,
+                      mode=const.AY_LAHIRI)
+        timeline = get_sade_sati_timeline(chart, years=60)
+        moon_sign = chart.getObject(const.MOON).sign
+        self.assertEqual(timeline['moon_sign'], moon_sign)
+        self.assertEqual(timeline, get_saturn_cycle_timeline(
+            moon_sign, date.jd, date.jd + 60 * 365.25))
+        self.assertGreaterEqual(len(timeline['sade_sati']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
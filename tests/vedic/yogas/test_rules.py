@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test Yoga Rule Engine
+
+This script tests the compiled Yoga rule engine in astrovedic.
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from astrovedic.datetime import Datetime
+from astrovedic.geopos import GeoPos
+from astrovedic.chart import Chart
+from astrovedic import const
+from astrovedic.vedic.yogas import (
+    get_mahapurusha_yogas, get_raja_yogas, get_dhana_yogas,
+    get_nabhasa_yogas, get_dosha_yogas, get_chandra_yogas,
+    get_surya_yogas, get_yoga_summary, has_ruchaka_yoga,
+    has_kubera_yoga, has_graha_yuddha, has_sun_parivartana_yoga
+)
+from astrovedic.vedic.yogas.core import get_house_lord, get_house_number
+from astrovedic.vedic.yogas.rules import (
+    get_chart_facts, evaluate_yogas, compile_rules, iter_yogas, yoga_rule
+)
+
+
+def get_family_yogas(chart):
+    """Identify all Yogas with the family functions"""
+    result = {
+        'mahapurusha_yogas': get_mahapurusha_yogas(chart),
+        'raja_yogas': get_raja_yogas(chart),
+        'dhana_yogas': get_dhana_yogas(chart),
+        'nabhasa_yogas': get_nabhasa_yogas(chart),
+        'dosha_yogas': get_dosha_yogas(chart),
+        'chandra_yogas': get_chandra_yogas(chart),
+        'surya_yogas': get_surya_yogas(chart)
+    }
+    result['summary'] = get_yoga_summary(result)
+    return result
+
+
+class TestYogaRules(unittest.TestCase):
+    """Test case for the compiled Yoga rules"""
+
+    def setUp(self):
+        """Set up test case"""
+        pos = GeoPos(12.9716, 77.5946)  # Bangalore, India
+        self.charts = []
+        for year in range(1950, 2030, 4):
+            date = Datetime(f'{year}/{year % 12 + 1:02d}/{year % 28 + 1:02d}', '20:51', '+05:30')
+            for hsys in (const.HOUSES_WHOLE_SIGN, const.HOUSES_PLACIDUS):
+                self.charts.append(Chart(date, pos, hsys=hsys, mode=const.AY_LAHIRI))
+
+    def test_chart_facts(self):
+        """Test that the facts match the core functions"""
+        chart = self.charts[0]
+        facts = get_chart_facts(chart)
+        for house in range(1, 13):
+            self.assertEqual(facts['lord'][house], get_house_lord(chart, house))
+        for planet in (const.SUN, const.MOON, const.MARS, const.RAHU):
+            self.assertEqual(facts['house'][planet], get_house_number(chart, planet))
+
+    def test_matches_family_functions(self):
+        """Test that the family functions find the Yogas of the one pass evaluation"""
+        for chart in self.charts:
+            yogas = evaluate_yogas(get_chart_facts(chart))
+            self.assertEqual(yogas, get_family_yogas(chart))
+
+            found = {(yoga['type'], yoga['name']): yoga
+                     for family, family_yogas in yogas.items() if family != 'summary'
+                     for yoga in family_yogas}
+            for has_yoga, name in ((has_ruchaka_yoga, 'Ruchaka Yoga'),
+                                   (has_kubera_yoga, 'Kubera Yoga'),
+                                   (has_graha_yuddha, None),
+                                   (has_sun_parivartana_yoga, None)):
+                yoga = has_yoga(chart)
+                if yoga is None:
+                    self.assertNotIn(name, [key[1] for key in found])
+                else:
+                    self.assertEqual(found[(yoga['type'], yoga['name'])], yoga)
+
+    def test_reference_yogas(self):
+        """Test the Yogas found in reference charts"""
+        expected = [
+            {'raja_yogas': ['Dharmakarmaadhipati Yoga', 'Gajakesari Yoga', 'Amala Yoga'],
+             'dhana_yogas': ['Kubera Yoga'],
+             'dosha_yogas': ['Shakat Yoga'],
+             'chandra_yogas': ['Sunapha Yoga', 'Anapha Yoga', 'Durudhura Yoga'],
+             'surya_yogas': ['Vesi Yoga', 'Budha-Aditya Yoga', 'Sun-Moon Parivartana Yoga']},
+            {'raja_yogas': ['Gajakesari Yoga', 'Amala Yoga'],
+             'dhana_yogas': ['Mridanga Yoga'],
+             'dosha_yogas': ['Graha Yuddha'],
+             'chandra_yogas': ['Anapha Yoga'],
+             'surya_yogas': ['Vasi Yoga']},
+            {'mahapurusha_yogas': ['Ruchaka Yoga'],
+             'raja_yogas': ['Dharmakarmaadhipati Yoga', 'Amala Yoga', 'Sreenatha Yoga'],
+             'dhana_yogas': ['Lakshmi Yoga', 'Kubera Yoga'],
+             'dosha_yogas': ['Kemadruma Yoga'],
+             'chandra_yogas': ['Kemadruma Yoga']}
+        ]
+        # Whole sign charts of 1950, 1954 and 1958
+        for chart, names in zip(self.charts[0:6:2], expected):
+            yogas = evaluate_yogas(get_chart_facts(chart))
+            found = {family: [yoga['name'] for yoga in family_yogas]
+                     for family, family_yogas in yogas.items()
+                     if family != 'summary' and family_yogas}
+            self.assertEqual(found, names)
+
+    def test_custom_rules(self):
+        """Test compiling a custom rule with bound variables"""
+        rules = compile_rules([
+            yoga_rule('test_yogas', 'Test {planet} Yoga', 'Test Yoga',
+                      ('find', 'planet', (const.MARS, const.SATURN, const.SUN),
+                       ('in', ('house', ('var', 'planet')), tuple(range(1, 13)))),
+                      (('var', 'planet'),), (('house', ('var', 'planet')),),
+                      'Formed by {planet}', strength=10.0)
+        ])
+        facts = get_chart_facts(self.charts[0])
+        yogas = evaluate_yogas(facts, rules)['test_yogas']
+        self.assertEqual(len(yogas), 1)
+        self.assertEqual(yogas[0]['name'], 'Test Mars Yoga')
+        self.assertEqual(yogas[0]['houses'], [facts['house'][const.MARS]])
+        self.assertEqual(yogas[0]['strength'], 10.0)
+
+    def test_batch(self):
+        """Test evaluating the Yogas of many charts"""
+        facts = [get_chart_facts(chart) for chart in self.charts]
+        expected = [evaluate_yogas(chart_facts) for chart_facts in facts]
+        serial = [yogas for _, yogas in iter_yogas(facts, block_size=7)]
+        self.assertEqual(serial, expected)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = list(iter_yogas(facts, block_size=7, executor=executor))
+        self.assertEqual([index for index, _ in threaded], list(range(len(facts))))
+        self.assertEqual([yogas for _, yogas in threaded], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()